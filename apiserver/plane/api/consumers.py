@@ -0,0 +1,115 @@
+# Python imports
+import asyncio
+import json
+
+# Django imports
+from django.conf import settings
+
+# Third party imports
+from channels.db import database_sync_to_async
+from channels.generic.websocket import AsyncWebsocketConsumer
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+
+# Module imports
+from plane.db.models import ProjectMember, WorkspaceMember
+from plane.utils.live_updates import hub, project_channel, user_channel
+
+# Subprotocol of the live updates socket, the access token is sent as the
+# second one since browsers cannot set headers on a websocket
+LIVE_UPDATES_PROTOCOL = "plane.live"
+
+
+@database_sync_to_async
+def get_user(token):
+    authentication = JWTAuthentication()
+    try:
+        return authentication.get_user(authentication.get_validated_token(token))
+    except (InvalidToken, AuthenticationFailed):
+        return None
+
+
+@database_sync_to_async
+def get_project_ids(user, slug):
+    if not WorkspaceMember.objects.filter(workspace__slug=slug, member=user).exists():
+        return None
+    return list(
+        ProjectMember.objects.filter(
+            workspace__slug=slug, member=user, project__deleted_at__isnull=True
+        ).values_list("project_id", flat=True)
+    )
+
+
+class LiveUpdatesConsumer(AsyncWebsocketConsumer):
+    """
+    Pushes the change events of the projects of a workspace the user is a
+    member of, and the notifications of the user, instead of clients
+    polling the lists. Events only name what changed, clients fetch it
+    through the sync endpoint. The projects are read again whenever the
+    memberships of the user change.
+    """
+
+    live_channels = None
+    sender = None
+
+    async def connect(self):
+        subprotocols = self.scope.get("subprotocols", [])
+        if len(subprotocols) != 2 or subprotocols[0] != LIVE_UPDATES_PROTOCOL:
+            await self.close()
+            return
+
+        self.user = await get_user(subprotocols[1])
+        if self.user is None:
+            await self.close()
+            return
+
+        project_ids = await get_project_ids(
+            self.user, self.scope["url_route"]["kwargs"]["slug"]
+        )
+        if project_ids is None:
+            await self.close()
+            return
+
+        await self.accept(LIVE_UPDATES_PROTOCOL)
+        self.queue = asyncio.Queue(maxsize=settings.LIVE_UPDATES_QUEUE_SIZE)
+        await self.follow(project_ids)
+        self.sender = asyncio.create_task(self.send_events())
+
+    async def follow(self, project_ids):
+        """Listen to the channels of the projects, and only to them"""
+        live_channels = {user_channel(self.user.id)} | {
+            project_channel(project_id) for project_id in project_ids
+        }
+        if self.live_channels is not None:
+            await hub.unsubscribe(self.live_channels - live_channels, self.queue)
+            await hub.subscribe(live_channels - self.live_channels, self.queue)
+        else:
+            await hub.subscribe(live_channels, self.queue)
+        self.live_channels = live_channels
+
+    async def send_events(self):
+        while True:
+            channel, data = await self.queue.get()
+            # Events queued before the user left the project are dropped
+            if channel not in self.live_channels:
+                continue
+
+            if (
+                channel == user_channel(self.user.id)
+                and json.loads(data).get("event") == "memberships.changed"
+            ):
+                project_ids = await get_project_ids(
+                    self.user, self.scope["url_route"]["kwargs"]["slug"]
+                )
+                if project_ids is None:
+                    await self.close()
+                    return
+                await self.follow(project_ids)
+
+            await self.send(text_data=data)
+
+    async def disconnect(self, code):
+        if self.sender is not None:
+            self.sender.cancel()
+        if self.live_channels is not None:
+            await hub.unsubscribe(self.live_channels, self.queue)
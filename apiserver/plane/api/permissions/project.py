@@ -2,7 +2,7 @@
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
 # Module import
-from plane.db.models import WorkspaceMember, ProjectMember
+from plane.db.models import WorkspaceMember, ProjectMember, Project
 
 # Permission Mappings
 Admin = 20
@@ -11,6 +11,16 @@ Viewer = 10
 Guest = 5
 
 
+def is_project_deleted(view):
+    """Whether the project of the request is being deleted"""
+    return (
+        view.project_id is not None
+        and Project.objects.filter(
+            pk=view.project_id, deleted_at__isnull=False
+        ).exists()
+    )
+
+
 class ProjectBasePermission(BasePermission):
     def has_permission(self, request, view):
 
@@ -25,11 +35,14 @@ class ProjectBasePermission(BasePermission):
 
         ## Only workspace owners or admins can create the projects
         if request.method == "POST":
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                role__in=[Admin, Member],
-            ).exists()
+            return (
+                WorkspaceMember.objects.filter(
+                    workspace__slug=view.workspace_slug,
+                    member=request.user,
+                    role__in=[Admin, Member],
+                ).exists()
+                and not is_project_deleted(view)
+            )
 
         ## Only Project Admins can update project attributes
         return ProjectMember.objects.filter(
@@ -37,6 +50,7 @@ class ProjectBasePermission(BasePermission):
             member=request.user,
             role=Admin,
             project_id=view.project_id,
+            project__deleted_at__isnull=True,
         ).exists()
 
 
@@ -53,11 +67,14 @@ class ProjectMemberPermission(BasePermission):
             ).exists()
         ## Only workspace owners or admins can create the projects
         if request.method == "POST":
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                role__in=[Admin, Member],
-            ).exists()
+            return (
+                WorkspaceMember.objects.filter(
+                    workspace__slug=view.workspace_slug,
+                    member=request.user,
+                    role__in=[Admin, Member],
+                ).exists()
+                and not is_project_deleted(view)
+            )
 
         ## Only Project Admins can update project attributes
         return ProjectMember.objects.filter(
@@ -65,6 +82,7 @@ class ProjectMemberPermission(BasePermission):
             member=request.user,
             role__in=[Admin, Member],
             project_id=view.project_id,
+            project__deleted_at__isnull=True,
         ).exists()
 
 
@@ -80,6 +98,7 @@ class ProjectEntityPermission(BasePermission):
                 workspace__slug=view.workspace_slug,
                 member=request.user,
                 project_id=view.project_id,
+                project__deleted_at__isnull=True,
             ).exists()
 
         ## Only project members or admins can create and edit the project attributes
@@ -88,6 +107,7 @@ class ProjectEntityPermission(BasePermission):
             member=request.user,
             role__in=[Admin, Member],
             project_id=view.project_id,
+            project__deleted_at__isnull=True,
         ).exists()
 
 
@@ -101,4 +121,5 @@ class ProjectLitePermission(BasePermission):
             workspace__slug=view.workspace_slug,
             member=request.user,
             project_id=view.project_id,
+            project__deleted_at__isnull=True,
         ).exists()
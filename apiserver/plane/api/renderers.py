@@ -0,0 +1,31 @@
+# Third party imports
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# uuid, datetime, date and time are written by orjson itself, the encoder
+# covers the rest of what the JSONRenderer accepts (Decimal, lazy strings,
+# querysets, timedelta, ...)
+_default = JSONEncoder().default
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer writing with orjson. Datetimes keep their microseconds
+    and UTC is written as Z. Data orjson refuses, like integers over 64
+    bits, is rendered by the JSONRenderer.
+    """
+
+    options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        options = self.options
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            options |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, default=_default, option=options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
@@ -0,0 +1,12 @@
+from django.urls import path
+
+from plane.api.consumers import LiveUpdatesConsumer
+
+
+websocket_urlpatterns = [
+    path(
+        "api/workspaces/<str:slug>/live/",
+        LiveUpdatesConsumer.as_asgi(),
+        name="workspace-live-updates",
+    ),
+]
@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from .compiled import get_compiled_serializer
+
 
 class BaseSerializer(serializers.ModelSerializer):
     id = serializers.PrimaryKeyRelatedField(read_only=True)
@@ -56,3 +58,33 @@ class DynamicBaseSerializer(BaseSerializer):
             self.fields.pop(field_name)
 
         return self.fields
+
+    @classmethod
+    def serialize_queryset(cls, queryset, fields=None, relations=None):
+        """
+        Serialize the queryset restricted to `fields`, querying only what
+        they need. `relations` maps a serializer field to the function
+        adding its select_related, prefetch or annotation to the queryset,
+        only the ones of the requested fields are applied. The compiled
+        serializer reads just the columns of the fields, the serializer
+        itself is only used when a field cannot be compiled.
+        """
+        relations = relations or {}
+        serializer_fields = cls(fields=fields).fields if fields else None
+        for field_name, apply in relations.items():
+            if serializer_fields is None or field_name in serializer_fields:
+                queryset = apply(queryset)
+
+        compiled = get_compiled_serializer(cls, queryset, fields)
+        if compiled is not None:
+            return compiled.serialize(queryset)
+        if not fields:
+            return cls(queryset, many=True).data
+
+        columns = {field.name for field in queryset.model._meta.concrete_fields}
+        only = {queryset.model._meta.pk.name} | {
+            field.source.split(".")[0]
+            for field in serializer_fields.values()
+            if field.source.split(".")[0] in columns
+        }
+        return cls(queryset.only(*only), many=True, fields=fields).data
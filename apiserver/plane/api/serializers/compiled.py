@@ -0,0 +1,250 @@
+# Python imports
+from functools import lru_cache
+
+# Django imports
+from django.core.exceptions import FieldDoesNotExist
+
+# Third party imports
+from rest_framework import serializers
+from rest_framework.fields import empty
+
+
+class NotCompilable(Exception):
+    pass
+
+
+VALUE, NESTED, MANY = range(3)
+
+# Compiled serializers kept, one per serializer, field set and annotations
+COMPILED_CACHE_SIZE = 256
+
+
+class CompiledSerializer:
+    """
+    Read-only serialization of a serializer built once, instead of a
+    serializer instance per object. The rows are read with values(), the
+    nested serializers of foreign keys become joined columns and the many
+    related ones a single query per relation grouped by their owner. Every
+    value still goes through the to_representation of its field, so the
+    data is the one of the serializer.
+    """
+
+    def __init__(self, serializer, model, annotations=(), prefix="", nested=False):
+        self.pk_column = prefix + model._meta.pk.name
+        self.columns = {self.pk_column: None}
+        self.steps = []
+        self.relations = {}
+
+        for field in serializer.fields.values():
+            if field.write_only:
+                continue
+            source = field.source
+            if source == "*" or "." in source:
+                raise NotCompilable(field.field_name)
+
+            if isinstance(field, (serializers.ListSerializer, serializers.ManyRelatedField)):
+                if nested:
+                    raise NotCompilable(field.field_name)
+                self.add_many(field, model, source)
+            elif isinstance(field, serializers.BaseSerializer):
+                model_field = self.get_model_field(model, source)
+                if model_field is None or not (
+                    model_field.is_relation and model_field.concrete
+                ):
+                    raise NotCompilable(field.field_name)
+                child = CompiledSerializer(
+                    field,
+                    model_field.related_model,
+                    prefix=f"{prefix}{source}__",
+                    nested=True,
+                )
+                self.columns[prefix + source] = None
+                self.columns.update(child.columns)
+                self.steps.append((field.field_name, NESTED, prefix + source, child))
+            elif isinstance(
+                field,
+                (
+                    serializers.SerializerMethodField,
+                    serializers.FileField,
+                    serializers.HiddenField,
+                ),
+            ) or (
+                isinstance(field, serializers.RelatedField)
+                and not isinstance(field, serializers.PrimaryKeyRelatedField)
+            ):
+                raise NotCompilable(field.field_name)
+            else:
+                model_field = self.get_model_field(model, source)
+                if model_field is not None and model_field.concrete:
+                    column = prefix + source
+                elif not nested and source in annotations:
+                    column = source
+                elif field.required or field.default is not empty or field.allow_null:
+                    raise NotCompilable(field.field_name)
+                else:
+                    # Not annotated, the serializer skips it as well
+                    continue
+                self.columns[column] = None
+                convert = (
+                    None
+                    if isinstance(field, serializers.PrimaryKeyRelatedField)
+                    and field.pk_field is None
+                    else field.to_representation
+                )
+                self.steps.append((field.field_name, VALUE, column, convert))
+
+    @staticmethod
+    def get_model_field(model, source):
+        try:
+            model_field = model._meta.get_field(source)
+        except FieldDoesNotExist:
+            return None
+        if model_field.many_to_many or model_field.one_to_many:
+            return None
+        return model_field
+
+    def add_many(self, field, model, source):
+        try:
+            model_field = model._meta.get_field(source)
+        except FieldDoesNotExist:
+            raise NotCompilable(field.field_name)
+
+        if model_field.many_to_many and not model_field.auto_created:
+            # Read through the m2m table, ordered like the related manager
+            related_model = model_field.related_model
+            queryset = model_field.remote_field.through._default_manager.all()
+            owner = model_field.m2m_field_name()
+            prefix = f"{model_field.m2m_reverse_field_name()}__"
+        elif model_field.one_to_many:
+            related_model = model_field.related_model
+            queryset = related_model._default_manager.all()
+            owner = model_field.field.name
+            prefix = ""
+        else:
+            raise NotCompilable(field.field_name)
+
+        # A manager filtering its rows would have to be applied to the join
+        if related_model._default_manager.get_queryset().query.where:
+            raise NotCompilable(field.field_name)
+        ordering = []
+        for order in related_model._meta.ordering:
+            if not isinstance(order, str) or order == "?":
+                raise NotCompilable(field.field_name)
+            descending = order.startswith("-")
+            ordering.append(
+                ("-" if descending else "") + prefix + order.lstrip("-")
+            )
+
+        relation = self.relations.setdefault(
+            source,
+            {
+                "queryset": queryset.order_by(*ordering),
+                "owner": owner,
+                "columns": {owner: None},
+            },
+        )
+        if isinstance(field, serializers.ManyRelatedField):
+            if not isinstance(field.child_relation, serializers.PrimaryKeyRelatedField):
+                raise NotCompilable(field.field_name)
+            column = prefix + related_model._meta.pk.name
+            relation["columns"][column] = None
+            pk_field = field.child_relation.pk_field
+            self.steps.append(
+                (
+                    field.field_name,
+                    MANY,
+                    source,
+                    lambda rows: [
+                        row[column]
+                        if pk_field is None
+                        else pk_field.to_representation(row[column])
+                        for row in rows
+                    ],
+                )
+            )
+        else:
+            child = CompiledSerializer(
+                field.child, related_model, prefix=prefix, nested=True
+            )
+            relation["columns"].update(child.columns)
+            self.steps.append(
+                (
+                    field.field_name,
+                    MANY,
+                    source,
+                    lambda rows: [child.build(row) for row in rows],
+                )
+            )
+
+    def build(self, row, related=None):
+        data = {}
+        for field_name, kind, column, arg in self.steps:
+            if kind is MANY:
+                data[field_name] = arg(related[column].get(row[self.pk_column], ()))
+                continue
+            value = row[column]
+            if value is None:
+                data[field_name] = None
+            elif kind is NESTED:
+                data[field_name] = arg.build(row)
+            else:
+                data[field_name] = value if arg is None else arg(value)
+        return data
+
+    def serialize(self, queryset):
+        rows = list(queryset.prefetch_related(None).values(*self.columns))
+        ids = [row[self.pk_column] for row in rows]
+
+        related = {}
+        for source, relation in self.relations.items():
+            owner = relation["owner"]
+            grouped = related[source] = {}
+            for row in relation["queryset"].filter(**{f"{owner}__in": ids}).values(
+                *relation["columns"]
+            ):
+                grouped.setdefault(row[owner], []).append(row)
+
+        return [self.build(row, related) for row in rows]
+
+
+@lru_cache(maxsize=None)
+def get_field_names(serializer_class):
+    return frozenset(serializer_class().fields)
+
+
+@lru_cache(maxsize=COMPILED_CACHE_SIZE)
+def compile_serializer(serializer_class, fields, annotations):
+    serializer = (
+        serializer_class(fields=list(fields))
+        if fields is not None
+        else serializer_class()
+    )
+    try:
+        return CompiledSerializer(serializer, serializer_class.Meta.model, annotations)
+    except NotCompilable:
+        return None
+
+
+def get_compiled_serializer(serializer_class, queryset, fields=None):
+    """
+    The compiled serializer of serializer_class for the annotations of the
+    queryset, None when one of its fields cannot be compiled. The requested
+    fields come from the query string, they are reduced to the fields of
+    the serializer so that unknown or reordered names share an entry.
+    """
+    fields = (
+        get_field_names(serializer_class).intersection(fields) if fields else None
+    )
+    return compile_serializer(
+        serializer_class, fields, frozenset(queryset.query.annotations)
+    )
+
+
+def serialize_compiled(serializer_class, queryset, fields=None):
+    """serializer_class(queryset, many=True).data, compiled when possible"""
+    compiled = get_compiled_serializer(serializer_class, queryset, fields)
+    if compiled is not None:
+        return compiled.serialize(queryset)
+    if fields:
+        return serializer_class(queryset, many=True, fields=fields).data
+    return serializer_class(queryset, many=True).data
@@ -103,6 +103,19 @@ class ProjectListSerializer(DynamicBaseSerializer):
     members = serializers.SerializerMethodField()
 
     def get_members(self, obj):
+        # The list view prefetches the members of every project
+        project_members = getattr(obj, "members_list", None)
+        if project_members is not None:
+            return [
+                {
+                    "id": project_member.id,
+                    "member_id": project_member.member_id,
+                    "member__display_name": project_member.member.display_name,
+                    "member__avatar": project_member.member.avatar,
+                }
+                for project_member in project_members
+            ]
+
         project_members = ProjectMember.objects.filter(project_id=obj.id).values(
             "id",
             "member_id",
@@ -5,9 +5,12 @@ from plane.api.views import (
     IssueViewSet,
     IssueListEndpoint,
     IssueListGroupedEndpoint,
+    IssueSyncEndpoint,
+    WorkspaceIssueSyncEndpoint,
     LabelViewSet,
     BulkCreateIssueLabelsEndpoint,
     BulkDeleteIssuesEndpoint,
+    BulkUpdateIssuesEndpoint,
     BulkImportIssuesEndpoint,
     UserWorkSpaceIssues,
     SubIssuesEndpoint,
@@ -47,6 +50,16 @@ urlpatterns = [
         IssueListGroupedEndpoint.as_view(),
         name="project-issue",
     ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/issues/sync/",
+        IssueSyncEndpoint.as_view(),
+        name="project-issue-sync",
+    ),
+    path(
+        "workspaces/<str:slug>/issues/sync/",
+        WorkspaceIssueSyncEndpoint.as_view(),
+        name="workspace-issue-sync",
+    ),
     path(
         "workspaces/<str:slug>/projects/<uuid:project_id>/issues/<uuid:pk>/",
         IssueViewSet.as_view(
@@ -91,6 +104,11 @@ urlpatterns = [
         BulkDeleteIssuesEndpoint.as_view(),
         name="project-issues-bulk",
     ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/bulk-update-issues/",
+        BulkUpdateIssuesEndpoint.as_view(),
+        name="project-issues-bulk-update",
+    ),
     path(
         "workspaces/<str:slug>/projects/<uuid:project_id>/bulk-import-issues/<str:service>/",
         BulkImportIssuesEndpoint.as_view(),
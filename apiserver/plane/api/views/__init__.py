@@ -72,12 +72,15 @@ from .issue import (
     IssueViewSet,
     IssueListEndpoint,
     IssueListGroupedEndpoint,
+    IssueSyncEndpoint,
+    WorkspaceIssueSyncEndpoint,
     WorkSpaceIssuesEndpoint,
     IssueActivityEndpoint,
     IssueCommentViewSet,
     IssueUserDisplayPropertyEndpoint,
     LabelViewSet,
     BulkDeleteIssuesEndpoint,
+    BulkUpdateIssuesEndpoint,
     UserWorkSpaceIssues,
     SubIssuesEndpoint,
     IssueLinkViewSet,
@@ -177,4 +180,4 @@ from .notification import (
 
 from .exporter import ExportIssuesEndpoint
 
-from .config import ConfigurationEndpoint
+from .config import ConfigurationEndpoint, QueueDepthEndpoint
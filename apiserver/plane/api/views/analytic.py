@@ -15,6 +15,7 @@ from plane.api.serializers import AnalyticViewSerializer
 from plane.utils.analytics_plot import build_graph_plot
 from plane.bgtasks.analytic_plot_export import analytic_export_task
 from plane.utils.issue_filters import issue_filters
+from plane.utils.query_fanout import run_concurrently
 
 
 class AnalyticsEndpoint(BaseAPIView):
@@ -76,17 +77,17 @@ class AnalyticsEndpoint(BaseAPIView):
         # Get the issues for the workspace with the additional filters applied
         queryset = Issue.issue_objects.filter(workspace__slug=slug, **filters)
 
-        # Get the total issue count
-        total_issues = queryset.count()
-
-        # Build the graph payload
-        distribution = build_graph_plot(
-            queryset=queryset, x_axis=x_axis, y_axis=y_axis, segment=segment
-        )
+        queries = {
+            # Get the total issue count
+            "total": queryset.count,
+            # Build the graph payload
+            "distribution": lambda: build_graph_plot(
+                queryset=queryset, x_axis=x_axis, y_axis=y_axis, segment=segment
+            ),
+        }
 
-        state_details = {}
         if x_axis in ["state_id"] or segment in ["state_id"]:
-            state_details = (
+            queries["state_details"] = (
                 Issue.issue_objects.filter(
                     workspace__slug=slug,
                     **filters,
@@ -96,9 +97,8 @@ class AnalyticsEndpoint(BaseAPIView):
                 .values("state_id", "state__name", "state__color")
             )
 
-        label_details = {}
         if x_axis in ["labels__id"] or segment in ["labels__id"]:
-            label_details = (
+            queries["label_details"] = (
                 Issue.objects.filter(
                     workspace__slug=slug, **filters, labels__id__isnull=False
                 )
@@ -107,9 +107,8 @@ class AnalyticsEndpoint(BaseAPIView):
                 .values("labels__id", "labels__color", "labels__name")
             )
 
-        assignee_details = {}
         if x_axis in ["assignees__id"] or segment in ["assignees__id"]:
-            assignee_details = (
+            queries["assignee_details"] = (
                 Issue.issue_objects.filter(
                     workspace__slug=slug, **filters, assignees__avatar__isnull=False
                 )
@@ -124,9 +123,8 @@ class AnalyticsEndpoint(BaseAPIView):
                 )
             )
 
-        cycle_details = {}
         if x_axis in ["issue_cycle__cycle_id"] or segment in ["issue_cycle__cycle_id"]:
-            cycle_details = (
+            queries["cycle_details"] = (
                 Issue.issue_objects.filter(
                     workspace__slug=slug,
                     **filters,
@@ -140,11 +138,10 @@ class AnalyticsEndpoint(BaseAPIView):
                 )
             )
 
-        module_details = {}
         if x_axis in ["issue_module__module_id"] or segment in [
             "issue_module__module_id"
         ]:
-            module_details = (
+            queries["module_details"] = (
                 Issue.issue_objects.filter(
                     workspace__slug=slug,
                     **filters,
@@ -158,16 +155,18 @@ class AnalyticsEndpoint(BaseAPIView):
                 )
             )
 
+        # The count, the graph and the details run concurrently
+        results = run_concurrently(queries)
         return Response(
             {
-                "total": total_issues,
-                "distribution": distribution,
+                "total": results["total"],
+                "distribution": results["distribution"],
                 "extras": {
-                    "state_details": state_details,
-                    "assignee_details": assignee_details,
-                    "label_details": label_details,
-                    "cycle_details": cycle_details,
-                    "module_details": module_details,
+                    "state_details": results.get("state_details", {}),
+                    "assignee_details": results.get("assignee_details", {}),
+                    "label_details": results.get("label_details", {}),
+                    "cycle_details": results.get("cycle_details", {}),
+                    "module_details": results.get("module_details", {}),
                 },
             },
             status=status.HTTP_200_OK,
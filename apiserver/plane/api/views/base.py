@@ -16,12 +16,14 @@ from rest_framework.response import Response
 from rest_framework.exceptions import APIException
 from rest_framework.views import APIView
 from rest_framework.filters import SearchFilter
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAuthenticated, SAFE_METHODS
 from sentry_sdk import capture_exception
 from django_filters.rest_framework import DjangoFilterBackend
 
 # Module imports
+from plane.db.models import ProjectBaseModel
 from plane.utils.paginator import BasePaginator
+from plane.utils.project_version import bump_project_version
 
 
 class TimezoneMixin:
@@ -37,7 +39,23 @@ class TimezoneMixin:
             timezone.deactivate()
 
 
-class BaseViewSet(TimezoneMixin, ModelViewSet, BasePaginator):
+class ProjectVersionMixin:
+    """
+    Successful writes under a project bump its version, which the ETags
+    of the project lists are computed from
+    """
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if (
+            request.method not in SAFE_METHODS
+            and response.status_code < 400
+            and self.project_id
+        ):
+            bump_project_version(self.project_id)
+        return response
+
+
+class BaseViewSet(TimezoneMixin, ProjectVersionMixin, ModelViewSet, BasePaginator):
 
     model = None
 
@@ -56,7 +74,11 @@ class BaseViewSet(TimezoneMixin, ModelViewSet, BasePaginator):
 
     def get_queryset(self):
         try:
-            return self.model.objects.all()
+            queryset = self.model.objects.all()
+            # Nothing of a project being deleted is served
+            if issubclass(self.model, ProjectBaseModel):
+                queryset = queryset.filter(project__deleted_at__isnull=True)
+            return queryset
         except Exception as e:
             capture_exception(e)
             raise APIException("Please check the view", status.HTTP_400_BAD_REQUEST)
@@ -92,13 +114,6 @@ class BaseViewSet(TimezoneMixin, ModelViewSet, BasePaginator):
     def dispatch(self, request, *args, **kwargs):
         try:
             response = super().dispatch(request, *args, **kwargs)
-
-            if settings.DEBUG:
-                from django.db import connection
-
-                print(
-                    f"{request.method} - {request.get_full_path()} of Queries: {len(connection.queries)}"
-                )
             return response
 
         except Exception as exc:
@@ -119,7 +134,7 @@ class BaseViewSet(TimezoneMixin, ModelViewSet, BasePaginator):
             return self.kwargs.get("pk", None)
 
 
-class BaseAPIView(TimezoneMixin, APIView, BasePaginator):
+class BaseAPIView(TimezoneMixin, ProjectVersionMixin, APIView, BasePaginator):
 
     permission_classes = [
         IsAuthenticated,
@@ -170,13 +185,6 @@ class BaseAPIView(TimezoneMixin, APIView, BasePaginator):
     def dispatch(self, request, *args, **kwargs):
         try:
             response = super().dispatch(request, *args, **kwargs)
-
-            if settings.DEBUG:
-                from django.db import connection
-
-                print(
-                    f"{request.method} - {request.get_full_path()} of Queries: {len(connection.queries)}"
-                )
             return response
 
         except Exception as exc:
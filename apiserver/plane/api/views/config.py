@@ -5,13 +5,14 @@ import os
 from django.conf import settings
 
 # Third party imports
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAdminUser
 from rest_framework import status
 from rest_framework.response import Response
 from sentry_sdk import capture_exception
 
 # Module imports
 from .base import BaseAPIView
+from plane.utils.task_queues import get_queue_depths
 
 
 class ConfigurationEndpoint(BaseAPIView):
@@ -35,3 +36,14 @@ class ConfigurationEndpoint(BaseAPIView):
         data["posthog_host"] = os.environ.get("POSTHOG_HOST", None)
         data["has_unsplash_configured"] = bool(settings.UNSPLASH_ACCESS_KEY)
         return Response(data, status=status.HTTP_200_OK)
+
+
+class QueueDepthEndpoint(BaseAPIView):
+    """Messages waiting in each celery queue, for the monitoring of staff"""
+
+    permission_classes = [
+        IsAdminUser,
+    ]
+
+    def get(self, request):
+        return Response({"queues": get_queue_depths()}, status=status.HTTP_200_OK)
@@ -15,7 +15,7 @@ from django.db.models import (
 from django.core import serializers
 from django.utils import timezone
 from django.utils.decorators import method_decorator
-from django.views.decorators.gzip import gzip_page
+from django.views.decorators.http import condition
 
 # Third party imports
 from rest_framework.response import Response
@@ -46,6 +46,8 @@ from plane.bgtasks.issue_activites_task import issue_activity
 from plane.utils.grouper import group_results
 from plane.utils.issue_filters import issue_filters
 from plane.utils.analytics_plot import burndown_plot
+from plane.utils.project_version import project_etag
+from plane.utils.query_fanout import run_concurrently
 
 
 class CycleViewSet(BaseViewSet):
@@ -82,6 +84,7 @@ class CycleViewSet(BaseViewSet):
                     "issue_cycle",
                     filter=Q(
                         issue_cycle__issue__archived_at__isnull=True,
+                        issue_cycle__issue__deleted_at__isnull=True,
                         issue_cycle__issue__is_draft=False,
                     ),
                 )
@@ -92,6 +95,7 @@ class CycleViewSet(BaseViewSet):
                     filter=Q(
                         issue_cycle__issue__state__group="completed",
                         issue_cycle__issue__archived_at__isnull=True,
+                        issue_cycle__issue__deleted_at__isnull=True,
                         issue_cycle__issue__is_draft=False,
                     ),
                 )
@@ -102,6 +106,7 @@ class CycleViewSet(BaseViewSet):
                     filter=Q(
                         issue_cycle__issue__state__group="cancelled",
                         issue_cycle__issue__archived_at__isnull=True,
+                        issue_cycle__issue__deleted_at__isnull=True,
                         issue_cycle__issue__is_draft=False,
                     ),
                 )
@@ -112,6 +117,7 @@ class CycleViewSet(BaseViewSet):
                     filter=Q(
                         issue_cycle__issue__state__group="started",
                         issue_cycle__issue__archived_at__isnull=True,
+                        issue_cycle__issue__deleted_at__isnull=True,
                         issue_cycle__issue__is_draft=False,
                     ),
                 )
@@ -122,6 +128,7 @@ class CycleViewSet(BaseViewSet):
                     filter=Q(
                         issue_cycle__issue__state__group="unstarted",
                         issue_cycle__issue__archived_at__isnull=True,
+                        issue_cycle__issue__deleted_at__isnull=True,
                         issue_cycle__issue__is_draft=False,
                     ),
                 )
@@ -132,6 +139,7 @@ class CycleViewSet(BaseViewSet):
                     filter=Q(
                         issue_cycle__issue__state__group="backlog",
                         issue_cycle__issue__archived_at__isnull=True,
+                        issue_cycle__issue__deleted_at__isnull=True,
                         issue_cycle__issue__is_draft=False,
                     ),
                 )
@@ -143,6 +151,7 @@ class CycleViewSet(BaseViewSet):
                     filter=Q(
                         issue_cycle__issue__state__group="completed",
                         issue_cycle__issue__archived_at__isnull=True,
+                        issue_cycle__issue__deleted_at__isnull=True,
                         issue_cycle__issue__is_draft=False,
                     ),
                 )
@@ -153,6 +162,7 @@ class CycleViewSet(BaseViewSet):
                     filter=Q(
                         issue_cycle__issue__state__group="started",
                         issue_cycle__issue__archived_at__isnull=True,
+                        issue_cycle__issue__deleted_at__isnull=True,
                         issue_cycle__issue__is_draft=False,
                     ),
                 )
@@ -160,7 +170,9 @@ class CycleViewSet(BaseViewSet):
             .prefetch_related(
                 Prefetch(
                     "issue_cycle__issue__assignees",
-                    queryset=User.objects.only("avatar", "first_name", "id").distinct(),
+                    queryset=User.objects.only(
+                        "avatar", "first_name", "display_name", "id"
+                    ).distinct(),
                 )
             )
             .prefetch_related(
@@ -173,6 +185,7 @@ class CycleViewSet(BaseViewSet):
             .distinct()
         )
 
+    @method_decorator(condition(etag_func=project_etag))
     def list(self, request, slug, project_id):
         queryset = self.get_queryset()
         cycle_view = request.GET.get("cycle_view", "all")
@@ -194,6 +207,7 @@ class CycleViewSet(BaseViewSet):
                         issue_cycle__cycle_id=data[0]["id"],
                         workspace__slug=slug,
                         project_id=project_id,
+                        deleted_at__isnull=True,
                     )
                     .annotate(display_name=F("assignees__display_name"))
                     .annotate(assignee_id=F("assignees__id"))
@@ -233,6 +247,7 @@ class CycleViewSet(BaseViewSet):
                         issue_cycle__cycle_id=data[0]["id"],
                         workspace__slug=slug,
                         project_id=project_id,
+                        deleted_at__isnull=True,
                     )
                     .annotate(label_name=F("labels__name"))
                     .annotate(color=F("labels__color"))
@@ -378,6 +393,7 @@ class CycleViewSet(BaseViewSet):
                 issue_cycle__cycle_id=pk,
                 workspace__slug=slug,
                 project_id=project_id,
+                deleted_at__isnull=True,
             )
             .annotate(first_name=F("assignees__first_name"))
             .annotate(last_name=F("assignees__last_name"))
@@ -420,6 +436,7 @@ class CycleViewSet(BaseViewSet):
                 issue_cycle__cycle_id=pk,
                 workspace__slug=slug,
                 project_id=project_id,
+                deleted_at__isnull=True,
             )
             .annotate(label_name=F("labels__name"))
             .annotate(color=F("labels__color"))
@@ -454,18 +471,20 @@ class CycleViewSet(BaseViewSet):
             .order_by("label_name")
         )
 
-        data = CycleSerializer(queryset).data
-        data["distribution"] = {
+        queries = {
             "assignees": assignee_distribution,
             "labels": label_distribution,
-            "completion_chart": {},
         }
-
         if queryset.start_date and queryset.end_date:
-            data["distribution"]["completion_chart"] = burndown_plot(
+            queries["completion_chart"] = lambda: burndown_plot(
                 queryset=queryset, slug=slug, project_id=project_id, cycle_id=pk
             )
 
+        data = CycleSerializer(queryset).data
+        # The distributions and the burndown run concurrently
+        data["distribution"] = run_concurrently(queries)
+        data["distribution"].setdefault("completion_chart", {})
+
         return Response(
             data,
             status=status.HTTP_200_OK,
@@ -534,7 +553,7 @@ class CycleIssueViewSet(BaseViewSet):
             .distinct()
         )
 
-    @method_decorator(gzip_page)
+    @method_decorator(condition(etag_func=project_etag))
     def list(self, request, slug, project_id, cycle_id):
         order_by = request.GET.get("order_by", "created_at")
         group_by = request.GET.get("group_by", False)
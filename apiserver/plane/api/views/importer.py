@@ -2,43 +2,37 @@
 import uuid
 
 # Third party imports
+from celery import chain
 from rest_framework import status
 from rest_framework.response import Response
 from sentry_sdk import capture_exception
 
 # Django imports
-from django.db.models import Max, Q
+from django.conf import settings
+from django.db.models import Max
 
 # Module imports
 from plane.api.views import BaseAPIView
 from plane.db.models import (
     WorkspaceIntegration,
     Importer,
+    ImporterChunk,
     APIToken,
     Project,
-    State,
-    IssueSequence,
     Issue,
-    IssueActivity,
-    IssueComment,
-    IssueLink,
-    IssueLabel,
     Workspace,
-    IssueAssignee,
     Module,
-    ModuleLink,
-    ModuleIssue,
     Label,
 )
-from plane.api.serializers import (
-    ImporterSerializer,
-    IssueFlatSerializer,
-    ModuleSerializer,
-)
+from plane.api.serializers import ImporterSerializer
 from plane.utils.integrations.github import get_github_repo_details
 from plane.utils.importers.jira import jira_project_issue_summary
-from plane.bgtasks.importer_task import service_importer
-from plane.utils.html_processor import strip_tags
+from plane.bgtasks.importer_task import (
+    import_issue_chunk,
+    import_issues,
+    import_modules,
+    service_importer,
+)
 from plane.api.permissions import WorkSpaceAdminPermission
 
 
@@ -226,18 +220,24 @@ class ImportServiceEndpoint(BaseAPIView):
             pk=pk, service=service, workspace__slug=slug
         )
 
-        if importer.imported_data is not None:
-            # Delete all imported Issues
-            imported_issues = importer.imported_data.get("issues", [])
-            Issue.issue_objects.filter(id__in=imported_issues).delete()
-
-            # Delete all imported Labels
-            imported_labels = importer.imported_data.get("labels", [])
-            Label.objects.filter(id__in=imported_labels).delete()
-
-            if importer.service == "jira":
-                imported_modules = importer.imported_data.get("modules", [])
-                Module.objects.filter(id__in=imported_modules).delete()
+        imported_data = importer.imported_data or {}
+        # Delete all imported Issues, the bulk loaded ones are in the chunks
+        imported_issues = list(imported_data.get("issues", []))
+        for issues_data in (
+            importer.chunks.filter(processed_at__isnull=False)
+            .values_list("data", flat=True)
+            .iterator()
+        ):
+            imported_issues.extend(issue_data["id"] for issue_data in issues_data)
+        Issue.issue_objects.filter(id__in=imported_issues).delete()
+
+        # Delete all imported Labels
+        imported_labels = imported_data.get("labels", [])
+        Label.objects.filter(id__in=imported_labels).delete()
+
+        if importer.service == "jira":
+            imported_modules = imported_data.get("modules", [])
+            Module.objects.filter(id__in=imported_modules).delete()
         importer.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -265,37 +265,20 @@ class UpdateServiceImportStatusEndpoint(BaseAPIView):
         return Response(status.HTTP_200_OK)
 
 
+def get_importer(request, project, service):
+    """The import of the request, the latest one of the service if not given"""
+    importer_id = request.data.get("importer_id", False)
+    importers = Importer.objects.filter(project=project, service=service)
+    if importer_id:
+        return importers.get(pk=importer_id)
+    return importers.order_by("-created_at").first()
+
+
 class BulkImportIssuesEndpoint(BaseAPIView):
     def post(self, request, slug, project_id, service):
         # Get the project
         project = Project.objects.get(pk=project_id, workspace__slug=slug)
 
-        # Get the default state
-        default_state = State.objects.filter(
-            ~Q(name="Triage"), project_id=project_id, default=True
-        ).first()
-        # if there is no default state assign any random state
-        if default_state is None:
-            default_state = State.objects.filter(
-                ~Q(name="Triage"), project_id=project_id
-            ).first()
-
-        # Get the maximum sequence_id
-        last_id = IssueSequence.objects.filter(project_id=project_id).aggregate(
-            largest=Max("sequence")
-        )["largest"]
-
-        last_id = 1 if last_id is None else last_id + 1
-
-        # Get the maximum sort order
-        largest_sort_order = Issue.objects.filter(
-            project_id=project_id, state=default_state
-        ).aggregate(largest=Max("sort_order"))["largest"]
-
-        largest_sort_order = (
-            65535 if largest_sort_order is None else largest_sort_order + 10000
-        )
-
         # Get the issues_data
         issues_data = request.data.get("issues_data", [])
 
@@ -305,149 +288,70 @@ class BulkImportIssuesEndpoint(BaseAPIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Issues
-        bulk_issues = []
+        # The ids are assigned here so they can be returned right away
         for issue_data in issues_data:
-            bulk_issues.append(
-                Issue(
-                    project_id=project_id,
-                    workspace_id=project.workspace_id,
-                    state_id=issue_data.get("state")
-                    if issue_data.get("state", False)
-                    else default_state.id,
-                    name=issue_data.get("name", "Issue Created through Bulk"),
-                    description_html=issue_data.get("description_html", "<p></p>"),
-                    description_stripped=(
-                        None
-                        if (
-                            issue_data.get("description_html") == ""
-                            or issue_data.get("description_html") is None
-                        )
-                        else strip_tags(issue_data.get("description_html"))
-                    ),
-                    sequence_id=last_id,
-                    sort_order=largest_sort_order,
-                    start_date=issue_data.get("start_date", None),
-                    target_date=issue_data.get("target_date", None),
-                    priority=issue_data.get("priority", "none"),
-                    created_by=request.user,
-                )
-            )
+            issue_data["id"] = str(uuid.uuid4())
 
-            largest_sort_order = largest_sort_order + 10000
-            last_id = last_id + 1
+        importer = get_importer(request, project, service)
+        chunk_size = settings.IMPORT_CHUNK_SIZE
 
-        issues = Issue.objects.bulk_create(
-            bulk_issues,
-            batch_size=100,
-            ignore_conflicts=True,
-        )
+        # Without an import to track them the chunks travel with the tasks
+        if importer is None:
+            chain(
+                [
+                    import_issue_chunk.si(
+                        str(project.id),
+                        str(request.user.id),
+                        service,
+                        issues_data[offset : offset + chunk_size],
+                    )
+                    for offset in range(0, len(issues_data), chunk_size)
+                ]
+            ).delay()
+            return Response(
+                {
+                    "status": "queued",
+                    "issues": [
+                        {"id": issue_data["id"], "name": issue_data.get("name")}
+                        for issue_data in issues_data
+                    ],
+                },
+                status=status.HTTP_202_ACCEPTED,
+            )
 
-        # Sequences
-        _ = IssueSequence.objects.bulk_create(
+        last_sequence = importer.chunks.aggregate(largest=Max("sequence"))[
+            "largest"
+        ]
+        last_sequence = 0 if last_sequence is None else last_sequence + 1
+        ImporterChunk.objects.bulk_create(
             [
-                IssueSequence(
-                    issue=issue,
-                    sequence=issue.sequence_id,
-                    project_id=project_id,
-                    workspace_id=project.workspace_id,
-                )
-                for issue in issues
-            ],
-            batch_size=100,
-        )
-
-        # Attach Labels
-        bulk_issue_labels = []
-        for issue, issue_data in zip(issues, issues_data):
-            labels_list = issue_data.get("labels_list", [])
-            bulk_issue_labels = bulk_issue_labels + [
-                IssueLabel(
-                    issue=issue,
-                    label_id=label_id,
+                ImporterChunk(
+                    importer=importer,
+                    sequence=last_sequence + index,
+                    data=issues_data[offset : offset + chunk_size],
                     project_id=project_id,
                     workspace_id=project.workspace_id,
                     created_by=request.user,
                 )
-                for label_id in labels_list
-            ]
-
-        _ = IssueLabel.objects.bulk_create(
-            bulk_issue_labels, batch_size=100, ignore_conflicts=True
-        )
-
-        # Attach Assignees
-        bulk_issue_assignees = []
-        for issue, issue_data in zip(issues, issues_data):
-            assignees_list = issue_data.get("assignees_list", [])
-            bulk_issue_assignees = bulk_issue_assignees + [
-                IssueAssignee(
-                    issue=issue,
-                    assignee_id=assignee_id,
-                    project_id=project_id,
-                    workspace_id=project.workspace_id,
-                    created_by=request.user,
+                for index, offset in enumerate(
+                    range(0, len(issues_data), chunk_size)
                 )
-                for assignee_id in assignees_list
             ]
-
-        _ = IssueAssignee.objects.bulk_create(
-            bulk_issue_assignees, batch_size=100, ignore_conflicts=True
         )
 
-        # Track the issue activities
-        IssueActivity.objects.bulk_create(
-            [
-                IssueActivity(
-                    issue=issue,
-                    actor=request.user,
-                    project_id=project_id,
-                    workspace_id=project.workspace_id,
-                    comment=f"imported the issue from {service}",
-                    verb="created",
-                    created_by=request.user,
-                )
-                for issue in issues
-            ],
-            batch_size=100,
-        )
-
-        # Create Comments
-        bulk_issue_comments = []
-        for issue, issue_data in zip(issues, issues_data):
-            comments_list = issue_data.get("comments_list", [])
-            bulk_issue_comments = bulk_issue_comments + [
-                IssueComment(
-                    issue=issue,
-                    comment_html=comment.get("comment_html", "<p></p>"),
-                    actor=request.user,
-                    project_id=project_id,
-                    workspace_id=project.workspace_id,
-                    created_by=request.user,
-                )
-                for comment in comments_list
-            ]
-
-        _ = IssueComment.objects.bulk_create(bulk_issue_comments, batch_size=100)
-
-        # Attach Links
-        _ = IssueLink.objects.bulk_create(
-            [
-                IssueLink(
-                    issue=issue,
-                    url=issue_data.get("link", {}).get("url", "https://github.com"),
-                    title=issue_data.get("link", {}).get("title", "Original Issue"),
-                    project_id=project_id,
-                    workspace_id=project.workspace_id,
-                    created_by=request.user,
-                )
-                for issue, issue_data in zip(issues, issues_data)
-            ]
-        )
+        Importer.objects.filter(pk=importer.id).update(status="queued")
+        import_issues.delay(str(importer.id), service)
 
         return Response(
-            {"issues": IssueFlatSerializer(issues, many=True).data},
-            status=status.HTTP_201_CREATED,
+            {
+                "importer": str(importer.id),
+                "status": "queued",
+                "issues": [
+                    {"id": issue_data["id"], "name": issue_data.get("name")}
+                    for issue_data in issues_data
+                ],
+            },
+            status=status.HTTP_202_ACCEPTED,
         )
 
 
@@ -456,71 +360,27 @@ class BulkImportModulesEndpoint(BaseAPIView):
         modules_data = request.data.get("modules_data", [])
         project = Project.objects.get(pk=project_id, workspace__slug=slug)
 
-        modules = Module.objects.bulk_create(
-            [
-                Module(
-                    name=module.get("name", uuid.uuid4().hex),
-                    description=module.get("description", ""),
-                    start_date=module.get("start_date", None),
-                    target_date=module.get("target_date", None),
-                    project_id=project_id,
-                    workspace_id=project.workspace_id,
-                    created_by=request.user,
-                )
-                for module in modules_data
-            ],
-            batch_size=100,
-            ignore_conflicts=True,
-        )
-
-        modules = Module.objects.filter(id__in=[module.id for module in modules])
+        for module_data in modules_data:
+            module_data["id"] = str(uuid.uuid4())
+
+        # The module issues point at the imported issues, the chunks still
+        # pending are loaded first
+        importer = get_importer(request, project, service)
+        if importer is not None:
+            chain(
+                import_issues.si(str(importer.id), service),
+                import_modules.si(str(project.id), str(request.user.id), modules_data),
+            ).delay()
+        else:
+            import_modules.delay(str(project.id), str(request.user.id), modules_data)
 
-        if len(modules) == len(modules_data):
-            _ = ModuleLink.objects.bulk_create(
-                [
-                    ModuleLink(
-                        module=module,
-                        url=module_data.get("link", {}).get(
-                            "url", "https://plane.so"
-                        ),
-                        title=module_data.get("link", {}).get(
-                            "title", "Original Issue"
-                        ),
-                        project_id=project_id,
-                        workspace_id=project.workspace_id,
-                        created_by=request.user,
-                    )
-                    for module, module_data in zip(modules, modules_data)
+        return Response(
+            {
+                "status": "queued",
+                "modules": [
+                    {"id": module_data["id"], "name": module_data.get("name")}
+                    for module_data in modules_data
                 ],
-                batch_size=100,
-                ignore_conflicts=True,
-            )
-
-            bulk_module_issues = []
-            for module, module_data in zip(modules, modules_data):
-                module_issues_list = module_data.get("module_issues_list", [])
-                bulk_module_issues = bulk_module_issues + [
-                    ModuleIssue(
-                        issue_id=issue,
-                        module=module,
-                        project_id=project_id,
-                        workspace_id=project.workspace_id,
-                        created_by=request.user,
-                    )
-                    for issue in module_issues_list
-                ]
-
-            _ = ModuleIssue.objects.bulk_create(
-                bulk_module_issues, batch_size=100, ignore_conflicts=True
-            )
-
-            serializer = ModuleSerializer(modules, many=True)
-            return Response(
-                {"modules": serializer.data}, status=status.HTTP_201_CREATED
-            )
-
-        else:
-            return Response(
-                {"message": "Modules created but issues could not be imported"},
-                status=status.HTTP_200_OK,
-            )
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
@@ -1,6 +1,7 @@
 # Python imports
 import json
 import random
+from datetime import date
 from itertools import chain
 
 # Django imports
@@ -22,8 +23,8 @@ from django.db.models import (
 )
 from django.core.serializers.json import DjangoJSONEncoder
 from django.utils.decorators import method_decorator
-from django.views.decorators.gzip import gzip_page
-from django.db import IntegrityError
+from django.views.decorators.http import condition
+from django.db import IntegrityError, transaction
 
 # Third Party imports
 from rest_framework.response import Response
@@ -54,9 +55,11 @@ from plane.api.serializers import (
     RelatedIssueSerializer,
     IssuePublicSerializer,
 )
+from plane.api.serializers.compiled import serialize_compiled
 from plane.api.permissions import (
     ProjectEntityPermission,
     WorkSpaceAdminPermission,
+    WorkspaceEntityPermission,
     ProjectMemberPermission,
     ProjectLitePermission,
 )
@@ -64,7 +67,9 @@ from plane.db.models import (
     Project,
     Issue,
     IssueActivity,
+    IssueAssignee,
     IssueComment,
+    IssueLabel,
     IssueProperty,
     Label,
     IssueLink,
@@ -78,10 +83,48 @@ from plane.db.models import (
     IssueVote,
     IssueRelation,
     ProjectPublicMember,
+    PageBlock,
 )
-from plane.bgtasks.issue_activites_task import issue_activity
+from plane.bgtasks.issue_activites_task import issue_activity, bulk_issue_activity
+from plane.bgtasks.deletion_task import issue_deletion_task
 from plane.utils.grouper import group_results
 from plane.utils.issue_filters import issue_filters
+from plane.utils.issue_sync import CursorExpired, get_issue_changes
+from plane.utils.project_version import project_etag
+
+
+# What each field of IssueLiteSerializer reads besides the issue columns
+ISSUE_LITE_RELATIONS = {
+    "workspace_detail": lambda queryset: queryset.select_related("workspace"),
+    "project_detail": lambda queryset: queryset.select_related("project"),
+    "state_detail": lambda queryset: queryset.select_related("state"),
+    "labels": lambda queryset: queryset.prefetch_related("labels"),
+    "label_details": lambda queryset: queryset.prefetch_related("labels"),
+    "assignees": lambda queryset: queryset.prefetch_related("assignees"),
+    "assignee_details": lambda queryset: queryset.prefetch_related("assignees"),
+    "issue_reactions": lambda queryset: queryset.prefetch_related(
+        Prefetch(
+            "issue_reactions",
+            queryset=IssueReaction.objects.select_related("actor"),
+        )
+    ),
+    "cycle_id": lambda queryset: queryset.annotate(cycle_id=F("issue_cycle__cycle_id")),
+    "module_id": lambda queryset: queryset.annotate(
+        module_id=F("issue_module__module_id")
+    ),
+    "link_count": lambda queryset: queryset.annotate(
+        link_count=IssueLink.objects.filter(issue=OuterRef("id"))
+        .order_by()
+        .annotate(count=Func(F("id"), function="Count"))
+        .values("count")
+    ),
+    "attachment_count": lambda queryset: queryset.annotate(
+        attachment_count=IssueAttachment.objects.filter(issue=OuterRef("id"))
+        .order_by()
+        .annotate(count=Func(F("id"), function="Count"))
+        .values("count")
+    ),
+}
 
 
 class IssueViewSet(BaseViewSet):
@@ -131,7 +174,7 @@ class IssueViewSet(BaseViewSet):
             )
         ).distinct()
 
-    @method_decorator(gzip_page)
+    @method_decorator(condition(etag_func=project_etag))
     def list(self, request, slug, project_id):
         filters = issue_filters(request.query_params, "GET")
 
@@ -216,7 +259,7 @@ class IssueViewSet(BaseViewSet):
         else:
             issue_queryset = issue_queryset.order_by(order_by_param)
 
-        issues = IssueLiteSerializer(issue_queryset, many=True).data
+        issues = serialize_compiled(IssueLiteSerializer, issue_queryset)
 
         ## Grouping the results
         group_by = request.GET.get("group_by", False)
@@ -265,16 +308,55 @@ class IssueViewSet(BaseViewSet):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     def retrieve(self, request, slug, project_id, pk=None):
-        issue = Issue.issue_objects.annotate(
-            sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-            .order_by()
-            .annotate(count=Func(F("id"), function="Count"))
-            .values("count")
-        ).get(workspace__slug=slug, project_id=project_id, pk=pk)
+        issue = (
+            Issue.issue_objects.annotate(
+                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
+                .order_by()
+                .annotate(count=Func(F("id"), function="Count"))
+                .values("count")
+            )
+            .select_related(
+                "project",
+                "state",
+                "parent__state",
+                "parent__project",
+                "issue_cycle__cycle",
+                "issue_module__module",
+            )
+            .prefetch_related(
+                Prefetch(
+                    "labels",
+                    queryset=Label.objects.select_related("project", "workspace"),
+                ),
+                "assignees",
+                Prefetch(
+                    "issue_relation",
+                    queryset=IssueRelation.objects.select_related(
+                        "related_issue__project"
+                    ),
+                ),
+                Prefetch(
+                    "issue_related",
+                    queryset=IssueRelation.objects.select_related("issue__project"),
+                ),
+                Prefetch(
+                    "issue_link",
+                    queryset=IssueLink.objects.select_related("created_by"),
+                ),
+                "issue_attachment",
+                Prefetch(
+                    "issue_reactions",
+                    queryset=IssueReaction.objects.select_related("actor"),
+                ),
+            )
+            .get(workspace__slug=slug, project_id=project_id, pk=pk)
+        )
         return Response(IssueSerializer(issue).data, status=status.HTTP_200_OK)
 
     def partial_update(self, request, slug, project_id, pk=None):
-        issue = Issue.objects.get(workspace__slug=slug, project_id=project_id, pk=pk)
+        issue = Issue.objects.get(
+            workspace__slug=slug, project_id=project_id, pk=pk, deleted_at__isnull=True
+        )
         current_instance = json.dumps(
             IssueSerializer(issue).data, cls=DjangoJSONEncoder
         )
@@ -295,7 +377,9 @@ class IssueViewSet(BaseViewSet):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     def destroy(self, request, slug, project_id, pk=None):
-        issue = Issue.objects.get(workspace__slug=slug, project_id=project_id, pk=pk)
+        issue = Issue.objects.get(
+            workspace__slug=slug, project_id=project_id, pk=pk, deleted_at__isnull=True
+        )
         current_instance = json.dumps(
             IssueSerializer(issue).data, cls=DjangoJSONEncoder
         )
@@ -317,47 +401,24 @@ class IssueListEndpoint(BaseAPIView):
         ProjectEntityPermission,
     ]
 
+    @method_decorator(condition(etag_func=project_etag))
     def get(self, request, slug, project_id):
         fields = [field for field in request.GET.get("fields", "").split(",") if field]
         filters = issue_filters(request.query_params, "GET")
 
         issue_queryset = (
-            Issue.objects.filter(workspace__slug=slug, project_id=project_id)
-            .select_related("project")
-            .select_related("workspace")
-            .select_related("state")
-            .select_related("parent")
-            .prefetch_related("assignees")
-            .prefetch_related("labels")
-            .prefetch_related(
-                Prefetch(
-                    "issue_reactions",
-                    queryset=IssueReaction.objects.select_related("actor"),
-                )
+            Issue.objects.filter(
+                workspace__slug=slug, project_id=project_id, deleted_at__isnull=True
             )
             .filter(**filters)
-            .annotate(cycle_id=F("issue_cycle__cycle_id"))
-            .annotate(module_id=F("issue_module__module_id"))
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=IssueAttachment.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
             .distinct()
         )
 
-        serializer = IssueLiteSerializer(
-            issue_queryset, many=True, fields=fields if fields else None
+        issues = IssueLiteSerializer.serialize_queryset(
+            issue_queryset, fields, ISSUE_LITE_RELATIONS
         )
 
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(issues, status=status.HTTP_200_OK)
 
 
 class IssueListGroupedEndpoint(BaseAPIView):
@@ -366,43 +427,22 @@ class IssueListGroupedEndpoint(BaseAPIView):
         ProjectEntityPermission,
     ]
 
+    @method_decorator(condition(etag_func=project_etag))
     def get(self, request, slug, project_id):
         filters = issue_filters(request.query_params, "GET")
         fields = [field for field in request.GET.get("fields", "").split(",") if field]
 
         issue_queryset = (
-            Issue.objects.filter(workspace__slug=slug, project_id=project_id)
-            .select_related("project")
-            .select_related("workspace")
-            .select_related("state")
-            .select_related("parent")
-            .prefetch_related("assignees")
-            .prefetch_related("labels")
-            .prefetch_related(
-                Prefetch(
-                    "issue_reactions",
-                    queryset=IssueReaction.objects.select_related("actor"),
-                )
+            Issue.objects.filter(
+                workspace__slug=slug, project_id=project_id, deleted_at__isnull=True
             )
             .filter(**filters)
-            .annotate(cycle_id=F("issue_cycle__cycle_id"))
-            .annotate(module_id=F("issue_module__module_id"))
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=IssueAttachment.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
             .distinct()
         )
 
-        issues = IssueLiteSerializer(issue_queryset, many=True, fields=fields if fields else None).data
+        issues = IssueLiteSerializer.serialize_queryset(
+            issue_queryset, fields, ISSUE_LITE_RELATIONS
+        )
         issue_dict = {str(issue["id"]): issue for issue in issues}
         return Response(
             issue_dict,
@@ -410,8 +450,92 @@ class IssueListGroupedEndpoint(BaseAPIView):
         )
 
 
+class IssueSyncEndpoint(BaseAPIView):
+    """
+    Issues created, updated or removed since an opaque cursor, so that a
+    board loaded once can follow the project with small requests. Removed
+    issues, deleted, archived or turned into drafts, are listed by id.
+    """
+
+    permission_classes = [
+        ProjectEntityPermission,
+    ]
+
+    def sync(self, request, scope):
+        try:
+            changes = get_issue_changes(scope, request.GET.get("cursor"))
+        except CursorExpired:
+            return Response(
+                {"error": "Cursor has expired, the issues need to be loaded again"},
+                status=status.HTTP_410_GONE,
+            )
+        except ValueError:
+            return Response(
+                {"error": "Invalid cursor"}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        fields = [field for field in request.GET.get("fields", "").split(",") if field]
+        issues = IssueLiteSerializer.serialize_queryset(
+            Issue.issue_objects.filter(id__in=changes["issue_ids"])
+            .order_by("updated_at", "id")
+            .distinct(),
+            # The ids tell which of the changed issues are still visible
+            fields + ["id"] if fields else None,
+            {
+                **ISSUE_LITE_RELATIONS,
+                "sub_issues_count": lambda queryset: queryset.annotate(
+                    sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
+                    .order_by()
+                    .annotate(count=Func(F("id"), function="Count"))
+                    .values("count")
+                ),
+            },
+        )
+
+        # Changed issues that are no longer visible are removed as well
+        visible = {str(issue["id"]) for issue in issues}
+        deleted = {str(issue_id) for issue_id in changes["deleted"]}
+        deleted.update(
+            str(issue_id)
+            for issue_id in changes["issue_ids"]
+            if str(issue_id) not in visible
+        )
+
+        return Response(
+            {
+                "issues": issues,
+                "deleted": sorted(deleted),
+                "cursor": changes["cursor"],
+                "has_more": changes["has_more"],
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    def get(self, request, slug, project_id):
+        return self.sync(request, {"project_id": project_id})
+
+
+class WorkspaceIssueSyncEndpoint(IssueSyncEndpoint):
+    """Changes of the issues of every project of the workspace the user is a member of"""
+
+    permission_classes = [
+        WorkspaceEntityPermission,
+    ]
+
+    def get(self, request, slug):
+        return self.sync(
+            request,
+            {
+                "project_id__in": ProjectMember.objects.filter(
+                    workspace__slug=slug,
+                    member=request.user,
+                    project__deleted_at__isnull=True,
+                ).values("project_id")
+            },
+        )
+
+
 class UserWorkSpaceIssues(BaseAPIView):
-    @method_decorator(gzip_page)
     def get(self, request, slug):
         filters = issue_filters(request.query_params, "GET")
         # Custom ordering for priority and state
@@ -519,7 +643,7 @@ class UserWorkSpaceIssues(BaseAPIView):
         else:
             issue_queryset = issue_queryset.order_by(order_by_param)
 
-        issues = IssueLiteSerializer(issue_queryset, many=True).data
+        issues = serialize_compiled(IssueLiteSerializer, issue_queryset)
 
         ## Grouping the results
         group_by = request.GET.get("group_by", False)
@@ -545,7 +669,6 @@ class WorkSpaceIssuesEndpoint(BaseAPIView):
         WorkSpaceAdminPermission,
     ]
 
-    @method_decorator(gzip_page)
     def get(self, request, slug):
         issues = (
             Issue.issue_objects.filter(workspace__slug=slug)
@@ -561,7 +684,6 @@ class IssueActivityEndpoint(BaseAPIView):
         ProjectEntityPermission,
     ]
 
-    @method_decorator(gzip_page)
     def get(self, request, slug, project_id, issue_id):
         issue_activities = (
             IssueActivity.objects.filter(issue_id=issue_id)
@@ -583,7 +705,7 @@ class IssueActivityEndpoint(BaseAPIView):
                 )
             )
         )
-        issue_activities = IssueActivitySerializer(issue_activities, many=True).data
+        issue_activities = serialize_compiled(IssueActivitySerializer, issue_activities)
         issue_comments = IssueCommentSerializer(issue_comments, many=True).data
 
         result_list = sorted(
@@ -776,12 +898,210 @@ class BulkDeleteIssuesEndpoint(BaseAPIView):
             workspace__slug=slug, project_id=project_id, pk__in=issue_ids
         )
 
-        total_issues = len(issues)
+        # Hide the issues right away, the rows are removed in the background
+        deleted_ids = [str(issue_id) for issue_id in issues.values_list("id", flat=True)]
+        # updated_at too, the sync endpoints report the issues as removed
+        now = timezone.now()
+        Issue.objects.filter(pk__in=deleted_ids).update(deleted_at=now, updated_at=now)
+
+        issue_deletion_task.delay(
+            issue_ids=deleted_ids,
+            project_id=str(project_id),
+            actor_id=str(request.user.id),
+            epoch=int(timezone.now().timestamp()),
+        )
+
+        return Response(
+            {"message": f"{len(deleted_ids)} issues were deleted"},
+            status=status.HTTP_200_OK,
+        )
+
+
+class BulkUpdateIssuesEndpoint(BaseAPIView):
+    """
+    Apply the same properties to many issues with a few set based
+    statements. The values before the update are collected in one pass and
+    a single task records the activity and notifications of every issue.
+    """
+
+    permission_classes = [
+        ProjectEntityPermission,
+    ]
+
+    SCALAR_PROPERTIES = [
+        "state",
+        "priority",
+        "start_date",
+        "target_date",
+        "estimate_point",
+    ]
+    RELATION_PROPERTIES = {
+        "assignees": (IssueAssignee, "assignee_id"),
+        "labels": (IssueLabel, "label_id"),
+    }
+
+    def validate(self, project, properties):
+        if not isinstance(properties, dict):
+            return "Properties should be an object"
+
+        if not properties or any(
+            key not in self.SCALAR_PROPERTIES and key not in self.RELATION_PROPERTIES
+            for key in properties
+        ):
+            return "Only the state, priority, dates, estimate, assignees and labels can be updated in bulk"
+
+        if "priority" in properties and (
+            not isinstance(properties["priority"], str)
+            or properties["priority"] not in dict(Issue.PRIORITY_CHOICES)
+        ):
+            return "Priority is not valid"
+
+        for key in ["start_date", "target_date"]:
+            if properties.get(key) is not None:
+                try:
+                    date.fromisoformat(properties[key])
+                except (TypeError, ValueError):
+                    return f"{key} is not a valid date"
+        if (
+            properties.get("start_date") is not None
+            and properties.get("target_date") is not None
+            and properties["start_date"] > properties["target_date"]
+        ):
+            return "Start date cannot exceed target date"
+
+        estimate_point = properties.get("estimate_point")
+        if estimate_point is not None and (
+            not isinstance(estimate_point, int) or not 0 <= estimate_point <= 7
+        ):
+            return "Estimate point is not valid"
+
+        for key in self.RELATION_PROPERTIES:
+            if key in properties and not isinstance(properties[key], list):
+                return f"{key} should be a list"
+
+        if "assignees" in properties and ProjectMember.objects.filter(
+            project=project, member_id__in=properties["assignees"]
+        ).count() != len(set(properties["assignees"])):
+            return "Assignees should be members of the project"
+
+        if "labels" in properties and Label.objects.filter(
+            project=project, pk__in=properties["labels"]
+        ).count() != len(set(properties["labels"])):
+            return "Labels should belong to the project"
+
+        return None
+
+    def patch(self, request, slug, project_id):
+        issue_ids = request.data.get("issue_ids", [])
+        properties = request.data.get("properties", {})
+
+        if not isinstance(issue_ids, list) or not len(issue_ids):
+            return Response(
+                {"error": "Issue IDs are required"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        project = Project.objects.get(pk=project_id, workspace__slug=slug)
+        error = self.validate(project, properties)
+        if error is not None:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+
+        state = None
+        if "state" in properties:
+            state = State.objects.filter(
+                pk=properties["state"], project=project
+            ).first()
+            if state is None:
+                return Response(
+                    {"error": "State should belong to the project"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+        # Values before the update, in the shape of IssueSerializer
+        current_instances = {}
+        for issue in Issue.issue_objects.filter(
+            project=project, pk__in=issue_ids
+        ).values("id", "state_id", *self.SCALAR_PROPERTIES[1:]):
+            issue["state"] = issue.pop("state_id")
+            current_instances[str(issue.pop("id"))] = issue
+
+        if not current_instances:
+            return Response(
+                {"error": "Issues do not exist"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        for key, (model, column) in self.RELATION_PROPERTIES.items():
+            if key not in properties:
+                continue
+            for current_instance in current_instances.values():
+                current_instance[key] = []
+            for issue_id, value in model.objects.filter(
+                issue_id__in=current_instances.keys()
+            ).values_list("issue_id", column):
+                current_instances[str(issue_id)][key].append(str(value))
+
+        now = timezone.now()
+        updates = {
+            key: properties[key] for key in self.SCALAR_PROPERTIES if key in properties
+        }
+        if state is not None:
+            updates["state"] = state
+
+        with transaction.atomic():
+            Issue.objects.filter(pk__in=current_instances.keys()).update(
+                **updates, updated_at=now, updated_by=request.user
+            )
+
+            # Same completion tracking as Issue.save for the moved issues
+            if state is not None:
+                moved = [
+                    issue_id
+                    for issue_id, current_instance in current_instances.items()
+                    if str(current_instance["state"]) != str(state.id)
+                ]
+                completed_at = now if state.group == "completed" else None
+                Issue.objects.filter(pk__in=moved).update(completed_at=completed_at)
+                PageBlock.objects.filter(issue_id__in=moved).update(
+                    completed_at=completed_at
+                )
+
+            for key, (model, column) in self.RELATION_PROPERTIES.items():
+                if key not in properties:
+                    continue
+                requested = set(str(value) for value in properties[key])
+                model.objects.filter(issue_id__in=current_instances.keys()).exclude(
+                    **{f"{column}__in": requested}
+                ).delete()
+                model.objects.bulk_create(
+                    [
+                        model(
+                            issue_id=issue_id,
+                            project_id=project.id,
+                            workspace_id=project.workspace_id,
+                            created_by=request.user,
+                            updated_by=request.user,
+                            **{column: value},
+                        )
+                        for issue_id, current_instance in current_instances.items()
+                        for value in requested - set(current_instance[key])
+                    ],
+                    batch_size=500,
+                )
 
-        issues.delete()
+        bulk_issue_activity.delay(
+            requested_data=json.dumps(properties, cls=DjangoJSONEncoder),
+            current_instances=json.dumps(current_instances, cls=DjangoJSONEncoder),
+            actor_id=str(request.user.id),
+            project_id=str(project.id),
+            epoch=int(now.timestamp()),
+        )
 
         return Response(
-            {"message": f"{total_issues} issues were deleted"},
+            {
+                "message": f"{len(current_instances)} issues were updated",
+                "issue_ids": list(current_instances.keys()),
+            },
             status=status.HTTP_200_OK,
         )
 
@@ -791,7 +1111,6 @@ class SubIssuesEndpoint(BaseAPIView):
         ProjectEntityPermission,
     ]
 
-    @method_decorator(gzip_page)
     def get(self, request, slug, project_id, issue_id):
         sub_issues = (
             Issue.issue_objects.filter(parent_id=issue_id, workspace__slug=slug)
@@ -839,13 +1158,9 @@ class SubIssuesEndpoint(BaseAPIView):
             item["state_group"]: item["state_count"] for item in state_distribution
         }
 
-        serializer = IssueLiteSerializer(
-            sub_issues,
-            many=True,
-        )
         return Response(
             {
-                "sub_issues": serializer.data,
+                "sub_issues": serialize_compiled(IssueLiteSerializer, sub_issues),
                 "state_distribution": result,
             },
             status=status.HTTP_200_OK,
@@ -1064,12 +1379,14 @@ class IssueArchiveViewSet(BaseViewSet):
     def get_queryset(self):
         return (
             Issue.objects.annotate(
-                sub_issues_count=Issue.objects.filter(parent=OuterRef("id"))
+                sub_issues_count=Issue.objects.filter(
+                    parent=OuterRef("id"), deleted_at__isnull=True
+                )
                 .order_by()
                 .annotate(count=Func(F("id"), function="Count"))
                 .values("count")
             )
-            .filter(archived_at__isnull=False)
+            .filter(archived_at__isnull=False, deleted_at__isnull=True)
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(workspace__slug=self.kwargs.get("slug"))
             .select_related("project")
@@ -1080,7 +1397,7 @@ class IssueArchiveViewSet(BaseViewSet):
             .prefetch_related("labels")
         )
 
-    @method_decorator(gzip_page)
+    @method_decorator(condition(etag_func=project_etag))
     def list(self, request, slug, project_id):
         filters = issue_filters(request.query_params, "GET")
         show_sub_issues = request.GET.get("show_sub_issues", "true")
@@ -1172,7 +1489,7 @@ class IssueArchiveViewSet(BaseViewSet):
             else issue_queryset.filter(parent__isnull=True)
         )
 
-        issues = IssueLiteSerializer(issue_queryset, many=True).data
+        issues = serialize_compiled(IssueLiteSerializer, issue_queryset)
 
         ## Grouping the results
         group_by = request.GET.get("group_by", False)
@@ -1186,6 +1503,7 @@ class IssueArchiveViewSet(BaseViewSet):
             workspace__slug=slug,
             project_id=project_id,
             archived_at__isnull=False,
+            deleted_at__isnull=True,
             pk=pk,
         )
         return Response(IssueSerializer(issue).data, status=status.HTTP_200_OK)
@@ -1195,6 +1513,7 @@ class IssueArchiveViewSet(BaseViewSet):
             workspace__slug=slug,
             project_id=project_id,
             archived_at__isnull=False,
+            deleted_at__isnull=True,
             pk=pk,
         )
         issue_activity.delay(
@@ -1966,7 +2285,10 @@ class IssueRetrievePublicEndpoint(BaseAPIView):
 
     def get(self, request, slug, project_id, issue_id):
         issue = Issue.objects.get(
-            workspace__slug=slug, project_id=project_id, pk=issue_id
+            workspace__slug=slug,
+            project_id=project_id,
+            pk=issue_id,
+            deleted_at__isnull=True,
         )
         serializer = IssuePublicSerializer(issue)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -2152,7 +2474,7 @@ class IssueDraftViewSet(BaseViewSet):
             )
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(workspace__slug=self.kwargs.get("slug"))
-            .filter(is_draft=True)
+            .filter(is_draft=True, deleted_at__isnull=True)
             .select_related("project")
             .select_related("workspace")
             .select_related("state")
@@ -2167,7 +2489,6 @@ class IssueDraftViewSet(BaseViewSet):
             )
         )
 
-    @method_decorator(gzip_page)
     def list(self, request, slug, project_id):
         filters = issue_filters(request.query_params, "GET")
 
@@ -2252,7 +2573,7 @@ class IssueDraftViewSet(BaseViewSet):
         else:
             issue_queryset = issue_queryset.order_by(order_by_param)
 
-        issues = IssueLiteSerializer(issue_queryset, many=True).data
+        issues = serialize_compiled(IssueLiteSerializer, issue_queryset)
 
         ## Grouping the results
         group_by = request.GET.get("group_by", False)
@@ -2294,7 +2615,9 @@ class IssueDraftViewSet(BaseViewSet):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     def partial_update(self, request, slug, project_id, pk):
-        issue = Issue.objects.get(workspace__slug=slug, project_id=project_id, pk=pk)
+        issue = Issue.objects.get(
+            workspace__slug=slug, project_id=project_id, pk=pk, deleted_at__isnull=True
+        )
         serializer = IssueSerializer(issue, data=request.data, partial=True)
 
         if serializer.is_valid():
@@ -2321,12 +2644,18 @@ class IssueDraftViewSet(BaseViewSet):
 
     def retrieve(self, request, slug, project_id, pk=None):
         issue = Issue.objects.get(
-            workspace__slug=slug, project_id=project_id, pk=pk, is_draft=True
+            workspace__slug=slug,
+            project_id=project_id,
+            pk=pk,
+            is_draft=True,
+            deleted_at__isnull=True,
         )
         return Response(IssueSerializer(issue).data, status=status.HTTP_200_OK)
 
     def destroy(self, request, slug, project_id, pk=None):
-        issue = Issue.objects.get(workspace__slug=slug, project_id=project_id, pk=pk)
+        issue = Issue.objects.get(
+            workspace__slug=slug, project_id=project_id, pk=pk, deleted_at__isnull=True
+        )
         current_instance = json.dumps(
             IssueSerializer(issue).data, cls=DjangoJSONEncoder
         )
@@ -7,7 +7,7 @@ from django.db import IntegrityError
 from django.db.models import Prefetch, F, OuterRef, Func, Exists, Count, Q
 from django.core import serializers
 from django.utils.decorators import method_decorator
-from django.views.decorators.gzip import gzip_page
+from django.views.decorators.http import condition
 
 # Third party imports
 from rest_framework.response import Response
@@ -39,6 +39,7 @@ from plane.bgtasks.issue_activites_task import issue_activity
 from plane.utils.grouper import group_results
 from plane.utils.issue_filters import issue_filters
 from plane.utils.analytics_plot import burndown_plot
+from plane.utils.project_version import project_etag
 
 
 class ModuleViewSet(BaseViewSet):
@@ -83,6 +84,7 @@ class ModuleViewSet(BaseViewSet):
                     "issue_module",
                     filter=Q(
                         issue_module__issue__archived_at__isnull=True,
+                        issue_module__issue__deleted_at__isnull=True,
                         issue_module__issue__is_draft=False,
                     ),
                 ),
@@ -93,6 +95,7 @@ class ModuleViewSet(BaseViewSet):
                     filter=Q(
                         issue_module__issue__state__group="completed",
                         issue_module__issue__archived_at__isnull=True,
+                        issue_module__issue__deleted_at__isnull=True,
                         issue_module__issue__is_draft=False,
                     ),
                 )
@@ -103,6 +106,7 @@ class ModuleViewSet(BaseViewSet):
                     filter=Q(
                         issue_module__issue__state__group="cancelled",
                         issue_module__issue__archived_at__isnull=True,
+                        issue_module__issue__deleted_at__isnull=True,
                         issue_module__issue__is_draft=False,
                     ),
                 )
@@ -113,6 +117,7 @@ class ModuleViewSet(BaseViewSet):
                     filter=Q(
                         issue_module__issue__state__group="started",
                         issue_module__issue__archived_at__isnull=True,
+                        issue_module__issue__deleted_at__isnull=True,
                         issue_module__issue__is_draft=False,
                     ),
                 )
@@ -123,6 +128,7 @@ class ModuleViewSet(BaseViewSet):
                     filter=Q(
                         issue_module__issue__state__group="unstarted",
                         issue_module__issue__archived_at__isnull=True,
+                        issue_module__issue__deleted_at__isnull=True,
                         issue_module__issue__is_draft=False,
                     ),
                 )
@@ -133,6 +139,7 @@ class ModuleViewSet(BaseViewSet):
                     filter=Q(
                         issue_module__issue__state__group="backlog",
                         issue_module__issue__archived_at__isnull=True,
+                        issue_module__issue__deleted_at__isnull=True,
                         issue_module__issue__is_draft=False,
                     ),
                 )
@@ -140,6 +147,10 @@ class ModuleViewSet(BaseViewSet):
             .order_by("-is_favorite","-created_at")
         )
 
+    @method_decorator(condition(etag_func=project_etag))
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
     def create(self, request, slug, project_id):
         project = Project.objects.get(workspace__slug=slug, pk=project_id)
         serializer = ModuleWriteSerializer(
@@ -162,6 +173,7 @@ class ModuleViewSet(BaseViewSet):
                 issue_module__module_id=pk,
                 workspace__slug=slug,
                 project_id=project_id,
+                deleted_at__isnull=True,
             )
             .annotate(first_name=F("assignees__first_name"))
             .annotate(last_name=F("assignees__last_name"))
@@ -206,6 +218,7 @@ class ModuleViewSet(BaseViewSet):
                 issue_module__module_id=pk,
                 workspace__slug=slug,
                 project_id=project_id,
+                deleted_at__isnull=True,
             )
             .annotate(label_name=F("labels__name"))
             .annotate(color=F("labels__color"))
@@ -320,7 +333,7 @@ class ModuleIssueViewSet(BaseViewSet):
             .distinct()
         )
 
-    @method_decorator(gzip_page)
+    @method_decorator(condition(etag_func=project_etag))
     def list(self, request, slug, project_id, module_id):
         order_by = request.GET.get("order_by", "created_at")
         group_by = request.GET.get("group_by", False)
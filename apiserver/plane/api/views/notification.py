@@ -32,7 +32,7 @@ class NotificationViewSet(BaseViewSet, BasePaginator):
                 workspace__slug=self.kwargs.get("slug"),
                 receiver_id=self.request.user.id,
             )
-            .select_related("workspace", "project," "triggered_by", "receiver")
+            .select_related("workspace", "project", "triggered_by", "receiver")
         )
 
     def list(self, request, slug):
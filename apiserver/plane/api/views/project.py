@@ -1,7 +1,5 @@
 # Python imports
-import jwt
 import boto3
-from datetime import datetime
 
 # Django imports
 from django.core.exceptions import ValidationError
@@ -15,8 +13,8 @@ from django.db.models import (
     Func,
     Subquery,
 )
-from django.core.validators import validate_email
 from django.conf import settings
+from django.utils import timezone
 
 # Third Party imports
 from rest_framework.response import Response
@@ -69,8 +67,15 @@ from plane.db.models import (
     ProjectDeployBoard,
     IssueProperty,
 )
-
-from plane.bgtasks.project_invitation_task import project_invitation
+from plane.db.models.state import invalidate_project_states
+
+from plane.bgtasks.project_invitation_task import project_invitations
+from plane.bgtasks.deletion_task import project_deletion_task
+from plane.utils.invitations import (
+    add_project_members,
+    invite_to_project,
+    normalize_invites,
+)
 
 
 class ProjectViewSet(BaseViewSet):
@@ -86,70 +91,82 @@ class ProjectViewSet(BaseViewSet):
             return ProjectSerializer
         return ProjectDetailSerializer
 
-    def get_queryset(self):
-        return self.filter_queryset(
-            super()
-            .get_queryset()
-            .filter(workspace__slug=self.kwargs.get("slug"))
-            .filter(Q(project_projectmember__member=self.request.user) | Q(network=2))
-            .select_related(
-                "workspace", "workspace__owner", "default_assignee", "project_lead"
-            )
-            .annotate(
+    def get_field_relations(self):
+        """What each field of ProjectListSerializer reads besides the project columns"""
+        slug = self.kwargs.get("slug")
+        return {
+            "is_favorite": lambda queryset: queryset.annotate(
                 is_favorite=Exists(
                     ProjectFavorite.objects.filter(
                         user=self.request.user,
                         project_id=OuterRef("pk"),
-                        workspace__slug=self.kwargs.get("slug"),
+                        workspace__slug=slug,
                     )
                 )
-            )
-            .annotate(
+            ),
+            "is_member": lambda queryset: queryset.annotate(
                 is_member=Exists(
                     ProjectMember.objects.filter(
                         member=self.request.user,
                         project_id=OuterRef("pk"),
-                        workspace__slug=self.kwargs.get("slug"),
+                        workspace__slug=slug,
                     )
                 )
-            )
-            .annotate(
+            ),
+            "total_members": lambda queryset: queryset.annotate(
                 total_members=ProjectMember.objects.filter(
                     project_id=OuterRef("id"), member__is_bot=False
                 )
                 .order_by()
                 .annotate(count=Func(F("id"), function="Count"))
                 .values("count")
-            )
-            .annotate(
+            ),
+            "total_cycles": lambda queryset: queryset.annotate(
                 total_cycles=Cycle.objects.filter(project_id=OuterRef("id"))
                 .order_by()
                 .annotate(count=Func(F("id"), function="Count"))
                 .values("count")
-            )
-            .annotate(
+            ),
+            "total_modules": lambda queryset: queryset.annotate(
                 total_modules=Module.objects.filter(project_id=OuterRef("id"))
                 .order_by()
                 .annotate(count=Func(F("id"), function="Count"))
                 .values("count")
-            )
-            .annotate(
+            ),
+            "member_role": lambda queryset: queryset.annotate(
                 member_role=ProjectMember.objects.filter(
                     project_id=OuterRef("pk"),
                     member_id=self.request.user.id,
                 ).values("role")
-            )
-            .annotate(
+            ),
+            "is_deployed": lambda queryset: queryset.annotate(
                 is_deployed=Exists(
                     ProjectDeployBoard.objects.filter(
                         project_id=OuterRef("pk"),
-                        workspace__slug=self.kwargs.get("slug"),
+                        workspace__slug=slug,
                     )
                 )
-            )
+            ),
+        }
+
+    def get_base_queryset(self):
+        return self.filter_queryset(
+            super()
+            .get_queryset()
+            .filter(workspace__slug=self.kwargs.get("slug"))
+            .filter(Q(project_projectmember__member=self.request.user) | Q(network=2))
+            .filter(deleted_at__isnull=True)
             .distinct()
         )
 
+    def get_queryset(self):
+        queryset = self.get_base_queryset().select_related(
+            "workspace", "workspace__owner", "default_assignee", "project_lead"
+        )
+        for apply in self.get_field_relations().values():
+            queryset = apply(queryset)
+        return queryset
+
     def list(self, request, slug):
         fields = [field for field in request.GET.get("fields", "").split(",") if field]
 
@@ -158,20 +175,26 @@ class ProjectViewSet(BaseViewSet):
             project_id=OuterRef("pk"),
             workspace__slug=self.kwargs.get("slug"),
         ).values("sort_order")
-        projects = (
-            self.get_queryset()
-            .annotate(sort_order=Subquery(sort_order_query))
-            .prefetch_related(
+        relations = {
+            **self.get_field_relations(),
+            "members": lambda queryset: queryset.prefetch_related(
                 Prefetch(
                     "project_projectmember",
                     queryset=ProjectMember.objects.filter(
                         workspace__slug=slug,
                     ).select_related("member"),
+                    to_attr="members_list",
                 )
-            )
+            ),
+        }
+        projects = (
+            self.get_base_queryset()
+            .annotate(sort_order=Subquery(sort_order_query))
             .order_by("sort_order", "name")
         )
         if request.GET.get("per_page", False) and request.GET.get("cursor", False):
+            for apply in relations.values():
+                projects = apply(projects)
             return self.paginate(
                 request=request,
                 queryset=(projects),
@@ -181,9 +204,7 @@ class ProjectViewSet(BaseViewSet):
             )
 
         return Response(
-            ProjectListSerializer(
-                projects, many=True, fields=fields if fields else None
-            ).data
+            ProjectListSerializer.serialize_queryset(projects, fields, relations)
         )
 
     def create(self, request, slug):
@@ -270,6 +291,7 @@ class ProjectViewSet(BaseViewSet):
                         for state in states
                     ]
                 )
+                invalidate_project_states(serializer.instance.id)
 
                 project = self.get_queryset().filter(pk=serializer.data["id"]).first()
                 serializer = ProjectListSerializer(project)
@@ -344,6 +366,15 @@ class ProjectViewSet(BaseViewSet):
                 status=status.HTTP_410_GONE,
             )
 
+    def destroy(self, request, slug, pk=None):
+        project = self.get_object()
+
+        # Hide the project right away, the rows are removed in the background
+        Project.objects.filter(pk=project.id).update(deleted_at=timezone.now())
+        project_deletion_task.delay(project_id=str(project.id))
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
 
 class InviteProjectEndpoint(BaseAPIView):
     permission_classes = [
@@ -351,60 +382,109 @@ class InviteProjectEndpoint(BaseAPIView):
     ]
 
     def post(self, request, slug, project_id):
+        emails = request.data.get("emails", False)
         email = request.data.get("email", False)
-        role = request.data.get("role", False)
 
         # Check if email is provided
-        if not email:
+        if not emails and not email:
             return Response(
                 {"error": "Email is required"}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        validate_email(email)
-        # Check if user is already a member of workspace
-        if ProjectMember.objects.filter(
+        try:
+            invites = normalize_invites(
+                emails or [{"email": email, "role": request.data.get("role", 10)}]
+            )
+        except ValidationError as e:
+            return Response({"error": e.message}, status=status.HTTP_400_BAD_REQUEST)
+
+        # check for role level, workspace admins outside the project are
+        # checked against their workspace role
+        requesting_member = ProjectMember.objects.filter(
+            project_id=project_id, member=request.user
+        ).first() or WorkspaceMember.objects.get(
+            workspace__slug=slug, member=request.user
+        )
+        if any(role > requesting_member.role for role in invites.values()):
+            return Response(
+                {"error": "You cannot invite a user with higher role"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # Check if user is already a member of project
+        project_members = ProjectMember.objects.filter(
             project_id=project_id,
-            member__email=email,
+            member__email__in=list(invites),
             member__is_bot=False,
-        ).exists():
+        ).select_related("member", "project", "workspace")
+        if len(project_members):
+            if not emails:
+                return Response(
+                    {"error": "User is already member of workspace"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
             return Response(
-                {"error": "User is already member of workspace"},
+                {
+                    "error": "Some users are already member of project",
+                    "project_users": ProjectMemberSerializer(
+                        project_members, many=True
+                    ).data,
+                },
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        user = User.objects.filter(email=email).first()
+        project = Project.objects.get(pk=project_id, workspace__slug=slug)
 
-        if user is None:
-            token = jwt.encode(
-                {"email": email, "timestamp": datetime.now().timestamp()},
-                settings.SECRET_KEY,
-                algorithm="HS256",
+        # Users with an account are added, the others invited
+        users = dict(
+            User.objects.filter(email__in=list(invites)).values_list("email", "id")
+        )
+        project_members = add_project_members(
+            project.id,
+            project.workspace_id,
+            {users[email]: role for email, role in invites.items() if email in users},
+            request.user,
+        )
+        invitation_ids = invite_to_project(
+            project,
+            {email: role for email, role in invites.items() if email not in users},
+            request.user,
+        )
+        if invitation_ids:
+            project_invitations.delay(
+                str(project.id),
+                [str(invitation_id) for invitation_id in invitation_ids],
+                settings.WEB_URL,
             )
-            project_invitation_obj = ProjectMemberInvite.objects.create(
-                email=email.strip().lower(),
-                project_id=project_id,
-                token=token,
-                role=role,
+
+        if emails:
+            return Response(
+                {
+                    "message": "Emails sent successfully",
+                    "invited": len(invitation_ids),
+                    "added": len(project_members),
+                },
+                status=status.HTTP_200_OK,
             )
-            domain = settings.WEB_URL
-            project_invitation.delay(email, project_id, token, domain)
 
+        if invitation_ids:
             return Response(
                 {
                     "message": "Email sent successfully",
-                    "id": project_invitation_obj.id,
+                    "id": invitation_ids[0],
                 },
                 status=status.HTTP_200_OK,
             )
 
-        project_member = ProjectMember.objects.create(
-            member=user, project_id=project_id, role=role
-        )
-
-        _ = IssueProperty.objects.create(user=user, project_id=project_id)
+        # A bot is not reported as a member above but is not added again
+        if not project_members:
+            return Response(
+                {"error": "User is already member of workspace"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
         return Response(
-            ProjectMemberSerializer(project_member).data, status=status.HTTP_200_OK
+            ProjectMemberSerializer(project_members[0]).data, status=status.HTTP_200_OK
         )
 
 
@@ -961,7 +1041,7 @@ class WorkspaceProjectDeployBoardEndpoint(BaseAPIView):
 
     def get(self, request, slug):
         projects = (
-            Project.objects.filter(workspace__slug=slug)
+            Project.objects.filter(workspace__slug=slug, deleted_at__isnull=True)
             .annotate(
                 is_public=Exists(
                     ProjectDeployBoard.objects.filter(
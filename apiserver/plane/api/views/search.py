@@ -41,6 +41,7 @@ class GlobalSearchEndpoint(BaseAPIView):
                 q,
                 Q(project_projectmember__member=self.request.user) | Q(network=2),
                 workspace__slug=slug,
+                deleted_at__isnull=True,
             )
             .distinct()
             .values("name", "id", "identifier", "workspace__slug")
@@ -84,6 +85,7 @@ class GlobalSearchEndpoint(BaseAPIView):
         cycles = Cycle.objects.filter(
             q,
             project__project_projectmember__member=self.request.user,
+            project__deleted_at__isnull=True,
             workspace__slug=slug,
         )
 
@@ -107,6 +109,7 @@ class GlobalSearchEndpoint(BaseAPIView):
         modules = Module.objects.filter(
             q,
             project__project_projectmember__member=self.request.user,
+            project__deleted_at__isnull=True,
             workspace__slug=slug,
         )
 
@@ -3,6 +3,8 @@ from itertools import groupby
 
 # Django imports
 from django.db.models import Q
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 
 # Third party imports
 from rest_framework.response import Response
@@ -14,6 +16,8 @@ from . import BaseViewSet, BaseAPIView
 from plane.api.serializers import StateSerializer
 from plane.api.permissions import ProjectEntityPermission
 from plane.db.models import State, Issue
+from plane.db.models.state import invalidate_project_states
+from plane.utils.project_version import project_etag
 
 
 class StateViewSet(BaseViewSet):
@@ -46,6 +50,7 @@ class StateViewSet(BaseViewSet):
             return Response(serializer.data, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+    @method_decorator(condition(etag_func=project_etag))
     def list(self, request, slug, project_id):
         states = StateSerializer(self.get_queryset(), many=True).data
         grouped = request.GET.get("grouped", False)
@@ -67,6 +72,7 @@ class StateViewSet(BaseViewSet):
         _ = State.objects.filter(
             workspace__slug=slug, project_id=project_id, pk=pk
         ).update(default=True)
+        invalidate_project_states(project_id)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     def destroy(self, request, slug, project_id, pk):
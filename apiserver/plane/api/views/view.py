@@ -11,8 +11,6 @@ from django.db.models import (
     Exists,
     Max,
 )
-from django.utils.decorators import method_decorator
-from django.views.decorators.gzip import gzip_page
 from django.db.models import Prefetch, OuterRef, Exists
 
 # Third party imports
@@ -28,6 +26,7 @@ from plane.api.serializers import (
     IssueLiteSerializer,
     IssueViewFavoriteSerializer,
 )
+from plane.api.serializers.compiled import serialize_compiled
 from plane.api.permissions import WorkspaceEntityPermission, ProjectEntityPermission
 from plane.db.models import (
     Workspace,
@@ -93,7 +92,6 @@ class GlobalViewIssuesViewSet(BaseViewSet):
             )
         )
 
-    @method_decorator(gzip_page)
     def list(self, request, slug):
         filters = issue_filters(request.query_params, "GET")
 
@@ -178,7 +176,7 @@ class GlobalViewIssuesViewSet(BaseViewSet):
             )
         else:
             issue_queryset = issue_queryset.order_by(order_by_param)
-        issues = IssueLiteSerializer(issue_queryset, many=True).data
+        issues = serialize_compiled(IssueLiteSerializer, issue_queryset)
 
         ## Grouping the results
         group_by = request.GET.get("group_by", False)
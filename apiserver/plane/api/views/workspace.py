@@ -1,15 +1,12 @@
 # Python imports
-import jwt
-from datetime import date, datetime
+from datetime import date, datetime, time
 from dateutil.relativedelta import relativedelta
-from uuid import uuid4
 
 # Django imports
 from django.db import IntegrityError
 from django.conf import settings
 from django.utils import timezone
 from django.core.exceptions import ValidationError
-from django.core.validators import validate_email
 from django.db.models import (
     Prefetch,
     OuterRef,
@@ -26,7 +23,6 @@ from django.db.models import (
 )
 from django.db.models.functions import ExtractWeek, Cast, ExtractDay
 from django.db.models.fields import DateField
-from django.contrib.auth.hashers import make_password
 
 # Third party modules
 from rest_framework import status
@@ -48,6 +44,7 @@ from plane.api.serializers import (
     WorkspaceMemberAdminSerializer,
     WorkspaceMemberMeSerializer,
 )
+from plane.api.serializers.compiled import serialize_compiled
 from plane.api.views.base import BaseAPIView
 from . import BaseViewSet
 from plane.db.models import (
@@ -82,9 +79,15 @@ from plane.api.permissions import (
     WorkspaceEntityPermission,
     WorkspaceViewerPermission,
 )
-from plane.bgtasks.workspace_invitation_task import workspace_invitation
+from plane.bgtasks.workspace_invitation_task import workspace_invitations
 from plane.utils.issue_filters import issue_filters
 from plane.utils.grouper import group_results
+from plane.utils.invitations import (
+    create_placeholder_users,
+    invite_to_workspace,
+    normalize_invites,
+)
+from plane.utils.query_fanout import run_concurrently
 
 
 class WorkSpaceViewSet(BaseViewSet):
@@ -240,17 +243,16 @@ class InviteWorkspaceEndpoint(BaseAPIView):
                 {"error": "Emails are required"}, status=status.HTTP_400_BAD_REQUEST
             )
 
+        try:
+            invites = normalize_invites(emails)
+        except ValidationError as e:
+            return Response({"error": e.message}, status=status.HTTP_400_BAD_REQUEST)
+
         # check for role level
         requesting_user = WorkspaceMember.objects.get(
             workspace__slug=slug, member=request.user
         )
-        if len(
-            [
-                email
-                for email in emails
-                if int(email.get("role", 10)) > requesting_user.role
-            ]
-        ):
+        if any(role > requesting_user.role for role in invites.values()):
             return Response(
                 {"error": "You cannot invite a user with higher role"},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -261,7 +263,7 @@ class InviteWorkspaceEndpoint(BaseAPIView):
         # Check if user is already a member of workspace
         workspace_members = WorkspaceMember.objects.filter(
             workspace_id=workspace.id,
-            member__email__in=[email.get("email") for email in emails],
+            member__email__in=list(invites),
         ).select_related("member", "workspace", "workspace__owner")
 
         if len(workspace_members):
@@ -275,64 +277,18 @@ class InviteWorkspaceEndpoint(BaseAPIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        workspace_invitations = []
-        for email in emails:
-            try:
-                validate_email(email.get("email"))
-                workspace_invitations.append(
-                    WorkspaceMemberInvite(
-                        email=email.get("email").strip().lower(),
-                        workspace_id=workspace.id,
-                        token=jwt.encode(
-                            {
-                                "email": email,
-                                "timestamp": datetime.now().timestamp(),
-                            },
-                            settings.SECRET_KEY,
-                            algorithm="HS256",
-                        ),
-                        role=email.get("role", 10),
-                        created_by=request.user,
-                    )
-                )
-            except ValidationError:
-                return Response(
-                    {
-                        "error": f"Invalid email - {email} provided a valid email address is required to send the invite"
-                    },
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-        WorkspaceMemberInvite.objects.bulk_create(
-            workspace_invitations, batch_size=10, ignore_conflicts=True
-        )
-
-        workspace_invitations = WorkspaceMemberInvite.objects.filter(
-            email__in=[email.get("email") for email in emails]
-        ).select_related("workspace")
+        invitation_ids = invite_to_workspace(workspace, invites, request.user)
 
         # create the user if signup is disabled
         if settings.DOCKERIZED and not settings.ENABLE_SIGNUP:
-            _ = User.objects.bulk_create(
-                [
-                    User(
-                        username=str(uuid4().hex),
-                        email=invitation.email,
-                        password=make_password(uuid4().hex),
-                        is_password_autoset=True,
-                    )
-                    for invitation in workspace_invitations
-                ],
-                batch_size=100,
-            )
+            create_placeholder_users(list(invites))
 
-        for invitation in workspace_invitations:
-            workspace_invitation.delay(
-                invitation.email,
-                workspace.id,
-                invitation.token,
-                settings.WEB_URL,
-                request.user.email,
-            )
+        workspace_invitations.delay(
+            str(workspace.id),
+            [str(invitation_id) for invitation_id in invitation_ids],
+            settings.WEB_URL,
+            request.user.email,
+        )
 
         return Response(
             {
@@ -734,7 +690,12 @@ class UserActivityGraphEndpoint(BaseAPIView):
             IssueActivity.objects.filter(
                 actor=request.user,
                 workspace__slug=slug,
-                created_at__date__gte=date.today() + relativedelta(months=-6),
+                # A plain range on created_at lets postgres prune partitions
+                created_at__gte=timezone.make_aware(
+                    datetime.combine(
+                        date.today() + relativedelta(months=-6), time.min
+                    )
+                ),
             )
             .annotate(created_date=Cast("created_at", DateField()))
             .values("created_date")
@@ -777,7 +738,12 @@ class UserWorkspaceDashboardEndpoint(BaseAPIView):
             IssueActivity.objects.filter(
                 actor=request.user,
                 workspace__slug=slug,
-                created_at__date__gte=date.today() + relativedelta(months=-3),
+                # A plain range on created_at lets postgres prune partitions
+                created_at__gte=timezone.make_aware(
+                    datetime.combine(
+                        date.today() + relativedelta(months=-3), time.min
+                    )
+                ),
             )
             .annotate(created_date=Cast("created_at", DateField()))
             .values("created_date")
@@ -803,19 +769,19 @@ class UserWorkspaceDashboardEndpoint(BaseAPIView):
 
         assigned_issues = Issue.issue_objects.filter(
             workspace__slug=slug, assignees__in=[request.user]
-        ).count()
+        )
 
         pending_issues_count = Issue.issue_objects.filter(
             ~Q(state__group__in=["completed", "cancelled"]),
             workspace__slug=slug,
             assignees__in=[request.user],
-        ).count()
+        )
 
         completed_issues_count = Issue.issue_objects.filter(
             workspace__slug=slug,
             assignees__in=[request.user],
             state__group="completed",
-        ).count()
+        )
 
         issues_due_week = (
             Issue.issue_objects.filter(
@@ -824,7 +790,6 @@ class UserWorkspaceDashboardEndpoint(BaseAPIView):
             )
             .annotate(target_week=ExtractWeek("target_date"))
             .filter(target_week=timezone.now().date().isocalendar()[1])
-            .count()
         )
 
         state_distribution = (
@@ -853,18 +818,21 @@ class UserWorkspaceDashboardEndpoint(BaseAPIView):
             completed_at__isnull=True,
         ).values("id", "name", "workspace__slug", "project_id", "start_date")
 
+        # The queries are independent, they run concurrently
         return Response(
-            {
-                "issue_activities": issue_activities,
-                "completed_issues": completed_issues,
-                "assigned_issues_count": assigned_issues,
-                "pending_issues_count": pending_issues_count,
-                "completed_issues_count": completed_issues_count,
-                "issues_due_week_count": issues_due_week,
-                "state_distribution": state_distribution,
-                "overdue_issues": overdue_issues,
-                "upcoming_issues": upcoming_issues,
-            },
+            run_concurrently(
+                {
+                    "issue_activities": issue_activities,
+                    "completed_issues": completed_issues,
+                    "assigned_issues_count": assigned_issues.count,
+                    "pending_issues_count": pending_issues_count.count,
+                    "completed_issues_count": completed_issues_count.count,
+                    "issues_due_week_count": issues_due_week.count,
+                    "state_distribution": state_distribution,
+                    "overdue_issues": overdue_issues,
+                    "upcoming_issues": upcoming_issues,
+                }
+            ),
             status=status.HTTP_200_OK,
         )
 
@@ -937,7 +905,6 @@ class WorkspaceUserProfileStatsEndpoint(BaseAPIView):
                 created_by_id=user_id,
             )
             .filter(**filters)
-            .count()
         )
 
         assigned_issues_count = (
@@ -947,7 +914,6 @@ class WorkspaceUserProfileStatsEndpoint(BaseAPIView):
                 project__project_projectmember__member=request.user,
             )
             .filter(**filters)
-            .count()
         )
 
         pending_issues_count = (
@@ -958,7 +924,6 @@ class WorkspaceUserProfileStatsEndpoint(BaseAPIView):
                 project__project_projectmember__member=request.user,
             )
             .filter(**filters)
-            .count()
         )
 
         completed_issues_count = (
@@ -969,7 +934,6 @@ class WorkspaceUserProfileStatsEndpoint(BaseAPIView):
                 project__project_projectmember__member=request.user,
             )
             .filter(**filters)
-            .count()
         )
 
         subscribed_issues_count = (
@@ -977,13 +941,14 @@ class WorkspaceUserProfileStatsEndpoint(BaseAPIView):
                 workspace__slug=slug,
                 subscriber_id=user_id,
                 project__project_projectmember__member=request.user,
+                project__deleted_at__isnull=True,
             )
             .filter(**filters)
-            .count()
         )
 
         upcoming_cycles = CycleIssue.objects.filter(
             workspace__slug=slug,
+            project__deleted_at__isnull=True,
             cycle__start_date__gt=timezone.now().date(),
             issue__assignees__in=[
                 user_id,
@@ -992,6 +957,7 @@ class WorkspaceUserProfileStatsEndpoint(BaseAPIView):
 
         present_cycle = CycleIssue.objects.filter(
             workspace__slug=slug,
+            project__deleted_at__isnull=True,
             cycle__start_date__lt=timezone.now().date(),
             cycle__end_date__gt=timezone.now().date(),
             issue__assignees__in=[
@@ -999,18 +965,21 @@ class WorkspaceUserProfileStatsEndpoint(BaseAPIView):
             ],
         ).values("cycle__name", "cycle__id", "cycle__project_id")
 
+        # The queries are independent, they run concurrently
         return Response(
-            {
-                "state_distribution": state_distribution,
-                "priority_distribution": priority_distribution,
-                "created_issues": created_issues,
-                "assigned_issues": assigned_issues_count,
-                "completed_issues": completed_issues_count,
-                "pending_issues": pending_issues_count,
-                "subscribed_issues": subscribed_issues_count,
-                "present_cycles": present_cycle,
-                "upcoming_cycles": upcoming_cycles,
-            }
+            run_concurrently(
+                {
+                    "state_distribution": state_distribution,
+                    "priority_distribution": priority_distribution,
+                    "created_issues": created_issues.count,
+                    "assigned_issues": assigned_issues_count.count,
+                    "completed_issues": completed_issues_count.count,
+                    "pending_issues": pending_issues_count.count,
+                    "subscribed_issues": subscribed_issues_count.count,
+                    "present_cycles": present_cycle,
+                    "upcoming_cycles": upcoming_cycles,
+                }
+            )
         )
 
 
@@ -1026,6 +995,7 @@ class WorkspaceUserActivityEndpoint(BaseAPIView):
             ~Q(field__in=["comment", "vote", "reaction", "draft"]),
             workspace__slug=slug,
             project__project_projectmember__member=request.user,
+            project__deleted_at__isnull=True,
             actor=user_id,
         ).select_related("actor", "workspace", "issue", "project")
 
@@ -1054,6 +1024,7 @@ class WorkspaceUserProfileEndpoint(BaseAPIView):
                 Project.objects.filter(
                     workspace__slug=slug,
                     project_projectmember__member=request.user,
+                    deleted_at__isnull=True,
                 )
                 .annotate(
                     created_issues=Count(
@@ -1239,7 +1210,7 @@ class WorkspaceUserProfileIssuesEndpoint(BaseAPIView):
         else:
             issue_queryset = issue_queryset.order_by(order_by_param)
 
-        issues = IssueLiteSerializer(issue_queryset, many=True).data
+        issues = serialize_compiled(IssueLiteSerializer, issue_queryset)
 
         ## Grouping the results
         group_by = request.GET.get("group_by", False)
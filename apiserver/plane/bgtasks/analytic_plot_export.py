@@ -1,11 +1,9 @@
 # Python imports
 import csv
 import io
+from uuid import UUID
 
 # Django imports
-from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
-from django.utils.html import strip_tags
 from django.conf import settings
 
 # Third party imports
@@ -13,9 +11,10 @@ from celery import shared_task
 from sentry_sdk import capture_exception
 
 # Module imports
-from plane.db.models import Issue
+from plane.db.models import Cycle, Issue, Label, Module, State, User
 from plane.utils.analytics_plot import build_graph_plot
 from plane.utils.issue_filters import issue_filters
+from plane.utils.mailer import build_email, send_emails
 
 row_mapping = {
     "state__name": "State",
@@ -43,306 +42,96 @@ MODULE_ID = "issue_module__module_id"
 def send_export_email(email, slug, csv_buffer):
     """Helper function to send export email."""
     subject = "Your Export is ready"
-    html_content = render_to_string("emails/exports/analytics.html", {})
-    text_content = strip_tags(html_content)
-
+    msg = build_email(subject, "emails/exports/analytics.html", {}, [email])
     csv_buffer.seek(0)
-    msg = EmailMultiAlternatives(subject, text_content, settings.EMAIL_FROM, [email])
     msg.attach(f"{slug}-analytics.csv", csv_buffer.getvalue())
-    msg.send(fail_silently=False)
+    send_emails([msg])
 
 
-def get_assignee_details(slug, filters):
-    """Fetch assignee details if required."""
-    return (
-        Issue.issue_objects.filter(
-            workspace__slug=slug, **filters, assignees__avatar__isnull=False
-        )
-        .distinct("assignees__id")
-        .order_by("assignees__id")
-        .values(
-            "assignees__avatar",
-            "assignees__display_name",
-            "assignees__first_name",
-            "assignees__last_name",
-            "assignees__id",
+def get_user_names(ids):
+    return {
+        str(pk): f"{first_name} {last_name}"
+        for pk, first_name, last_name in User.objects.filter(pk__in=ids).values_list(
+            "id", "first_name", "last_name"
         )
-    )
+    }
 
 
-def get_label_details(slug, filters):
-    """Fetch label details if required"""
-    return (
-        Issue.objects.filter(workspace__slug=slug, **filters, labels__id__isnull=False)
-        .distinct("labels__id")
-        .order_by("labels__id")
-        .values("labels__id", "labels__color", "labels__name")
-    )
-
+def get_model_names(model):
+    def get_names(ids):
+        return {
+            str(pk): name
+            for pk, name in model.objects.filter(pk__in=ids).values_list("id", "name")
+        }
 
-def get_state_details(slug, filters):
-    return (
-        Issue.issue_objects.filter(
-            workspace__slug=slug,
-            **filters,
-        )
-        .distinct("state_id")
-        .order_by("state_id")
-        .values("state_id", "state__name", "state__color")
-    )
+    return get_names
 
 
-def get_module_details(slug, filters):
-    return (
-        Issue.issue_objects.filter(
-            workspace__slug=slug,
-            **filters,
-            issue_module__module_id__isnull=False,
-        )
-        .distinct("issue_module__module_id")
-        .order_by("issue_module__module_id")
-        .values(
-            "issue_module__module_id",
-            "issue_module__module__name",
-        )
-    )
+# Loaders of the names shown for the ids of an axis
+NAME_LOADERS = {
+    ASSIGNEE_ID: get_user_names,
+    LABEL_ID: get_model_names(Label),
+    STATE_ID: get_model_names(State),
+    CYCLE_ID: get_model_names(Cycle),
+    MODULE_ID: get_model_names(Module),
+}
 
 
-def get_cycle_details(slug, filters):
-    return (
-        Issue.issue_objects.filter(
-            workspace__slug=slug,
-            **filters,
-            issue_cycle__cycle_id__isnull=False,
-        )
-        .distinct("issue_cycle__cycle_id")
-        .order_by("issue_cycle__cycle_id")
-        .values(
-            "issue_cycle__cycle_id",
-            "issue_cycle__cycle__name",
-        )
-    )
+def get_names(axis, values):
+    """id -> name of the values of an id axis, empty for the other axes"""
+    if axis not in NAME_LOADERS:
+        return {}
+    ids = set()
+    for value in values:
+        try:
+            ids.add(UUID(str(value)))
+        except ValueError:
+            pass
+    return NAME_LOADERS[axis](ids) if ids else {}
 
 
 def generate_csv_from_rows(rows):
-    """Generate CSV buffer from rows."""
+    """Generate CSV buffer from rows, written as they are generated."""
     csv_buffer = io.StringIO()
     writer = csv.writer(csv_buffer, delimiter=",", quoting=csv.QUOTE_ALL)
-    [writer.writerow(row) for row in rows]
+    writer.writerows(rows)
     return csv_buffer
 
 
-def generate_segmented_rows(
-    distribution,
-    x_axis,
-    y_axis,
-    segment,
-    key,
-    assignee_details,
-    label_details,
-    state_details,
-    cycle_details,
-    module_details,
-):
+def generate_segmented_rows(distribution, x_axis, y_axis, key, x_names, segment_names):
+    """
+    Header and rows of a segmented distribution, one column per segment.
+    x_names and segment_names map the ids of the axes to their names.
+    """
     segment_zero = list(
-        set(
+        dict.fromkeys(
             item.get("segment") for sublist in distribution.values() for item in sublist
         )
     )
 
-    segmented = segment
-
-    row_zero = [
-        row_mapping.get(x_axis, "X-Axis"),
-        row_mapping.get(y_axis, "Y-Axis"),
-    ] + segment_zero
+    yield tuple(
+        [row_mapping.get(x_axis, "X-Axis"), row_mapping.get(y_axis, "Y-Axis")]
+        + [segment_names.get(str(segment), segment) for segment in segment_zero]
+    )
 
-    rows = []
     for item, data in distribution.items():
-        generated_row = [
-            item,
-            sum(obj.get(key) for obj in data if obj.get(key) is not None),
-        ]
-
-        for segment in segment_zero:
-            value = next((x.get(key) for x in data if x.get("segment") == segment), "0")
-            generated_row.append(value)
-
-        if x_axis == ASSIGNEE_ID:
-            assignee = next(
-                (
-                    user
-                    for user in assignee_details
-                    if str(user[ASSIGNEE_ID]) == str(item)
-                ),
-                None,
-            )
-            if assignee:
-                generated_row[
-                    0
-                ] = f"{assignee['assignees__first_name']} {assignee['assignees__last_name']}"
-
-        if x_axis == LABEL_ID:
-            label = next(
-                (lab for lab in label_details if str(lab[LABEL_ID]) == str(item)),
-                None,
-            )
-
-            if label:
-                generated_row[0] = f"{label['labels__name']}"
-
-        if x_axis == STATE_ID:
-            state = next(
-                (sta for sta in state_details if str(sta[STATE_ID]) == str(item)),
-                None,
-            )
-
-            if state:
-                generated_row[0] = f"{state['state__name']}"
-
-        if x_axis == CYCLE_ID:
-            cycle = next(
-                (cyc for cyc in cycle_details if str(cyc[CYCLE_ID]) == str(item)),
-                None,
-            )
-
-            if cycle:
-                generated_row[0] = f"{cycle['issue_cycle__cycle__name']}"
-
-        if x_axis == MODULE_ID:
-            module = next(
-                (mod for mod in module_details if str(mod[MODULE_ID]) == str(item)),
-                None,
-            )
-
-            if module:
-                generated_row[0] = f"{module['issue_module__module__name']}"
-
-        rows.append(tuple(generated_row))
-
-    if segmented == ASSIGNEE_ID:
-        for index, segm in enumerate(row_zero[2:]):
-            assignee = next(
-                (
-                    user
-                    for user in assignee_details
-                    if str(user[ASSIGNEE_ID]) == str(segm)
-                ),
-                None,
-            )
-            if assignee:
-                row_zero[
-                    index + 2
-                ] = f"{assignee['assignees__first_name']} {assignee['assignees__last_name']}"
-
-    if segmented == LABEL_ID:
-        for index, segm in enumerate(row_zero[2:]):
-            label = next(
-                (lab for lab in label_details if str(lab[LABEL_ID]) == str(segm)),
-                None,
-            )
-            if label:
-                row_zero[index + 2] = label["labels__name"]
-
-    if segmented == STATE_ID:
-        for index, segm in enumerate(row_zero[2:]):
-            state = next(
-                (sta for sta in state_details if str(sta[STATE_ID]) == str(segm)),
-                None,
-            )
-            if state:
-                row_zero[index + 2] = state["state__name"]
-
-    if segmented == MODULE_ID:
-        for index, segm in enumerate(row_zero[2:]):
-            module = next(
-                (mod for mod in label_details if str(mod[MODULE_ID]) == str(segm)),
-                None,
-            )
-            if module:
-                row_zero[index + 2] = module["issue_module__module__name"]
-
-    if segmented == CYCLE_ID:
-        for index, segm in enumerate(row_zero[2:]):
-            cycle = next(
-                (cyc for cyc in cycle_details if str(cyc[CYCLE_ID]) == str(segm)),
-                None,
-            )
-            if cycle:
-                row_zero[index + 2] = cycle["issue_cycle__cycle__name"]
-
-    return [tuple(row_zero)] + rows
+        values = {}
+        for obj in data:
+            values.setdefault(obj.get("segment"), obj.get(key))
+
+        yield tuple(
+            [
+                x_names.get(str(item), item),
+                sum(obj.get(key) for obj in data if obj.get(key) is not None),
+            ]
+            + [values.get(segment, "0") for segment in segment_zero]
+        )
 
 
-def generate_non_segmented_rows(
-    distribution,
-    x_axis,
-    y_axis,
-    key,
-    assignee_details,
-    label_details,
-    state_details,
-    cycle_details,
-    module_details,
-):
-    rows = []
+def generate_non_segmented_rows(distribution, x_axis, y_axis, key, x_names):
+    yield (row_mapping.get(x_axis, "X-Axis"), row_mapping.get(y_axis, "Y-Axis"))
     for item, data in distribution.items():
-        row = [item, data[0].get("count" if y_axis == "issue_count" else "estimate")]
-
-        if x_axis == ASSIGNEE_ID:
-            assignee = next(
-                (
-                    user
-                    for user in assignee_details
-                    if str(user[ASSIGNEE_ID]) == str(item)
-                ),
-                None,
-            )
-            if assignee:
-                row[
-                    0
-                ] = f"{assignee['assignees__first_name']} {assignee['assignees__last_name']}"
-
-        if x_axis == LABEL_ID:
-            label = next(
-                (lab for lab in label_details if str(lab[LABEL_ID]) == str(item)),
-                None,
-            )
-
-            if label:
-                row[0] = f"{label['labels__name']}"
-
-        if x_axis == STATE_ID:
-            state = next(
-                (sta for sta in state_details if str(sta[STATE_ID]) == str(item)),
-                None,
-            )
-
-            if state:
-                row[0] = f"{state['state__name']}"
-
-        if x_axis == CYCLE_ID:
-            cycle = next(
-                (cyc for cyc in cycle_details if str(cyc[CYCLE_ID]) == str(item)),
-                None,
-            )
-
-            if cycle:
-                row[0] = f"{cycle['issue_cycle__cycle__name']}"
-
-        if x_axis == MODULE_ID:
-            module = next(
-                (mod for mod in module_details if str(mod[MODULE_ID]) == str(item)),
-                None,
-            )
-
-            if module:
-                row[0] = f"{module['issue_module__module__name']}"
-
-        rows.append(tuple(row))
-
-    row_zero = [row_mapping.get(x_axis, "X-Axis"), row_mapping.get(y_axis, "Y-Axis")]
-    return [tuple(row_zero)] + rows
+        yield (x_names.get(str(item), item), data[0].get(key))
 
 
 @shared_task
@@ -360,60 +149,18 @@ def analytic_export_task(email, data, slug):
         )
         key = "count" if y_axis == "issue_count" else "estimate"
 
-        assignee_details = (
-            get_assignee_details(slug, filters)
-            if x_axis == ASSIGNEE_ID or segment == ASSIGNEE_ID
-            else {}
-        )
-
-        label_details = (
-            get_label_details(slug, filters)
-            if x_axis == LABEL_ID or segment == LABEL_ID
-            else {}
-        )
-
-        state_details = (
-            get_state_details(slug, filters)
-            if x_axis == STATE_ID or segment == STATE_ID
-            else {}
-        )
-
-        cycle_details = (
-            get_cycle_details(slug, filters)
-            if x_axis == CYCLE_ID or segment == CYCLE_ID
-            else {}
-        )
-
-        module_details = (
-            get_module_details(slug, filters)
-            if x_axis == MODULE_ID or segment == MODULE_ID
-            else {}
-        )
-
+        x_names = get_names(x_axis, distribution.keys())
         if segment:
-            rows = generate_segmented_rows(
-                distribution,
-                x_axis,
-                y_axis,
+            segment_names = get_names(
                 segment,
-                key,
-                assignee_details,
-                label_details,
-                state_details,
-                cycle_details,
-                module_details,
+                (item.get("segment") for data in distribution.values() for item in data),
+            )
+            rows = generate_segmented_rows(
+                distribution, x_axis, y_axis, key, x_names, segment_names
             )
         else:
             rows = generate_non_segmented_rows(
-                distribution,
-                x_axis,
-                y_axis,
-                key,
-                assignee_details,
-                label_details,
-                state_details,
-                cycle_details,
-                module_details,
+                distribution, x_axis, y_axis, key, x_names
             )
 
         csv_buffer = generate_csv_from_rows(rows)
@@ -0,0 +1,108 @@
+# Python imports
+import logging
+from datetime import timedelta
+
+# Django imports
+from django.conf import settings
+from django.utils import timezone
+
+# Third party imports
+from celery import shared_task
+from sentry_sdk import capture_exception
+
+# Module imports
+from plane.db.models import Issue, IssueActivity, IssueTombstone, Project
+from plane.utils.cascade_delete import cascade_delete
+
+logger = logging.getLogger("plane.bgtasks.deletion")
+
+
+def report_progress(task, label):
+    """Progress callback publishing the deleted row counts as task state"""
+
+    def progress(deleted):
+        logger.info("%s: %s", label, dict(deleted))
+        if task.request.id and not task.request.is_eager:
+            task.update_state(
+                state="PROGRESS",
+                meta={"deleted": sum(deleted.values()), "models": dict(deleted)},
+            )
+
+    return progress
+
+
+@shared_task(bind=True, max_retries=5)
+def issue_deletion_task(self, issue_ids, project_id, actor_id, epoch):
+    """
+    Remove issues already marked as deleted by the bulk delete endpoint,
+    with one activity recording the whole batch. A failed run is retried,
+    it carries on from the rows already removed and the activity is only
+    written once they are all gone.
+    """
+    if not issue_ids:
+        return
+    try:
+        deleted = cascade_delete(
+            Issue.objects.filter(
+                project_id=project_id, pk__in=issue_ids, deleted_at__isnull=False
+            ),
+            chunk_size=settings.DELETION_CHUNK_SIZE,
+            progress=report_progress(self, f"issues of project {project_id}"),
+        )
+
+        workspace_id = (
+            Project.objects.filter(pk=project_id)
+            .values_list("workspace_id", flat=True)
+            .get()
+        )
+        # A run retried after the activity was written must not repeat it
+        IssueActivity.objects.get_or_create(
+            project_id=project_id,
+            workspace_id=workspace_id,
+            comment=f"deleted {len(issue_ids)} issues",
+            verb="deleted",
+            actor_id=actor_id,
+            field="issue",
+            epoch=epoch,
+        )
+        return sum(deleted.values())
+    except Exception as e:
+        # Print logs if in DEBUG mode
+        if settings.DEBUG:
+            print(e)
+        capture_exception(e)
+        raise self.retry(exc=e, countdown=60 * 2**self.request.retries)
+
+
+@shared_task(bind=True, max_retries=5)
+def project_deletion_task(self, project_id):
+    """
+    Remove a project marked as deleted and everything belonging to it. The
+    project stays hidden until it is gone, so a failed run is retried, it
+    carries on from the rows already removed.
+    """
+    try:
+        deleted = cascade_delete(
+            Project.objects.filter(pk=project_id, deleted_at__isnull=False),
+            chunk_size=settings.DELETION_CHUNK_SIZE,
+            progress=report_progress(self, f"project {project_id}"),
+        )
+        return sum(deleted.values())
+    except Exception as e:
+        # Print logs if in DEBUG mode
+        if settings.DEBUG:
+            print(e)
+        capture_exception(e)
+        raise self.retry(exc=e, countdown=60 * 2**self.request.retries)
+
+
+@shared_task
+def delete_old_issue_tombstones():
+    """Forget deleted issues older than any sync cursor still accepted"""
+    return cascade_delete(
+        IssueTombstone.objects.filter(
+            created_at__lt=timezone.now()
+            - timedelta(days=settings.ISSUE_TOMBSTONE_RETENTION_DAYS)
+        ),
+        chunk_size=settings.DELETION_CHUNK_SIZE,
+    )[IssueTombstone._meta.label]
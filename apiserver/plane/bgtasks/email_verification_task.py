@@ -1,7 +1,4 @@
 # Django imports
-from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
-from django.utils.html import strip_tags
 from django.conf import settings
 
 # Third party imports
@@ -12,6 +9,7 @@ from sentry_sdk import capture_exception
 
 # Module imports
 from plane.db.models import User
+from plane.utils.mailer import build_email, send_emails
 
 
 @shared_task
@@ -21,8 +19,6 @@ def email_verification(first_name, email, token, current_site):
         realtivelink = "/request-email-verification/" + "?token=" + str(token)
         abs_url = current_site + realtivelink
 
-        from_email_string = settings.EMAIL_FROM
-
         subject = "Verify your Email!"
 
         context = {
@@ -30,13 +26,13 @@ def email_verification(first_name, email, token, current_site):
             "verification_url": abs_url,
         }
 
-        html_content = render_to_string("emails/auth/email_verification.html", context)
-
-        text_content = strip_tags(html_content)
-
-        msg = EmailMultiAlternatives(subject, text_content, from_email_string, [email])
-        msg.attach_alternative(html_content, "text/html")
-        msg.send()
+        send_emails(
+            [
+                build_email(
+                    subject, "emails/auth/email_verification.html", context, [email]
+                )
+            ]
+        )
         return
     except Exception as e:
         # Print logs if in DEBUG mode
@@ -1,5 +1,5 @@
 # Python imports
-import boto3
+import logging
 from datetime import timedelta
 
 # Django imports
@@ -9,41 +9,67 @@ from django.db.models import Q
 
 # Third party imports
 from celery import shared_task
-from botocore.client import Config
 
 # Module imports
-from plane.db.models import ExporterHistory
+from plane.db.models import DeletedFile, ExporterHistory
+from plane.utils.storage_cleanup import delete_keys, get_bucket_name, get_s3_client
+
+logger = logging.getLogger("plane.bgtasks.storage_cleanup")
 
 
 @shared_task
 def delete_old_s3_link():
-    # Get a list of keys and IDs to process
-    expired_exporter_history = ExporterHistory.objects.filter(
-        Q(url__isnull=False) & Q(created_at__lte=timezone.now() - timedelta(days=8))
-    ).values_list("key", "id")
-    if settings.DOCKERIZED and settings.USE_MINIO:
-        s3 = boto3.client(
-            "s3",
-            endpoint_url=settings.AWS_S3_ENDPOINT_URL,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            config=Config(signature_version="s3v4"),
-        )
-    else:
-        s3 = boto3.client(
-            "s3",
-            region_name=settings.AWS_REGION,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            config=Config(signature_version="s3v4"),
-        )
-
-    for file_name, exporter_id in expired_exporter_history:
-        # Delete object from S3
-        if file_name:
-            if settings.DOCKERIZED and settings.USE_MINIO:
-                s3.delete_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=file_name)
-            else:
-                s3.delete_object(Bucket=settings.AWS_S3_BUCKET_NAME, Key=file_name)
-
-        ExporterHistory.objects.filter(id=exporter_id).update(url=None)
+    """
+    Delete the files of the exports older than 8 days and clear their
+    urls. Exports whose file could not be deleted keep their url and are
+    tried again on the next run.
+    """
+    expired_exporter_history = list(
+        ExporterHistory.objects.filter(
+            Q(url__isnull=False) & Q(created_at__lte=timezone.now() - timedelta(days=8))
+        ).values_list("key", "id")
+    )
+    if not expired_exporter_history:
+        return
+
+    failed = delete_keys(
+        [file_name for file_name, _ in expired_exporter_history],
+        get_s3_client(),
+        get_bucket_name(),
+    )
+    cleared = ExporterHistory.objects.filter(
+        pk__in=[
+            exporter_id
+            for file_name, exporter_id in expired_exporter_history
+            if file_name not in failed
+        ]
+    ).update(url=None)
+    logger.info("Expired exports: %d cleared, %d failed", cleared, len(failed))
+
+
+@shared_task
+def delete_orphaned_files():
+    """
+    Delete the files of the attachments and assets removed by cascade
+    deletes, DELETION_CHUNK_SIZE keys at a time. The keys that could not
+    be deleted stay recorded for the next run.
+    """
+    s3, bucket = get_s3_client(), get_bucket_name()
+    deleted = failed = 0
+    last_id = None
+    while True:
+        files = DeletedFile.objects.order_by("id")
+        if last_id is not None:
+            files = files.filter(id__gt=last_id)
+        chunk = list(files.values_list("id", "key")[: settings.DELETION_CHUNK_SIZE])
+        if not chunk:
+            break
+        last_id = chunk[-1][0]
+
+        failed_keys = delete_keys([key for _, key in chunk], s3, bucket)
+        deleted += DeletedFile.objects.filter(
+            pk__in=[pk for pk, key in chunk if key not in failed_keys]
+        ).delete()[0]
+        failed += len(failed_keys)
+
+    logger.info("Orphaned files: %d deleted, %d failed", deleted, failed)
@@ -1,12 +1,14 @@
 # Python imports
 import json
-import requests
 import uuid
+import requests
 
 # Django imports
 from django.conf import settings
+from django.db import transaction
+from django.db.models import Max, Q
+from django.utils import timezone
 from django.core.serializers.json import DjangoJSONEncoder
-from django.contrib.auth.hashers import make_password
 
 # Third Party imports
 from celery import shared_task
@@ -16,6 +18,16 @@ from sentry_sdk import capture_exception
 from plane.api.serializers import ImporterSerializer
 from plane.db.models import (
     Importer,
+    ImporterChunk,
+    Project,
+    State,
+    Issue,
+    IssueSequence,
+    IssueLabel,
+    IssueAssignee,
+    IssueActivity,
+    IssueComment,
+    IssueLink,
     WorkspaceMember,
     GithubRepositorySync,
     GithubRepository,
@@ -23,9 +35,15 @@ from plane.db.models import (
     WorkspaceIntegration,
     Label,
     User,
-    IssueProperty,
+    Module,
+    ModuleLink,
+    ModuleIssue,
 )
 from plane.bgtasks.user_welcome_task import send_welcome_slack
+from plane.utils.bulk_copy import copy_insert
+from plane.utils.html_processor import strip_tags
+from plane.utils.invitations import add_project_members, create_placeholder_users
+from plane.utils.project_version import bump_project_version
 
 
 @shared_task
@@ -40,19 +58,12 @@ def service_importer(service, importer_id):
         # Check if we need to import users as well
         if len(users):
             # For all invited users create the users
-            new_users = User.objects.bulk_create(
+            new_users = create_placeholder_users(
                 [
-                    User(
-                        email=user.get("email").strip().lower(),
-                        username=uuid.uuid4().hex,
-                        password=make_password(uuid.uuid4().hex),
-                        is_password_autoset=True,
-                    )
+                    user.get("email").strip().lower()
                     for user in users
                     if user.get("import", False) == "invite"
-                ],
-                batch_size=10,
-                ignore_conflicts=True,
+                ]
             )
 
             _ = [
@@ -87,32 +98,11 @@ def service_importer(service, importer_id):
                 ignore_conflicts=True,
             )
 
-            ProjectMember.objects.bulk_create(
-                [
-                    ProjectMember(
-                        project_id=importer.project_id,
-                        workspace_id=importer.workspace_id,
-                        member=user,
-                        created_by=importer.created_by,
-                    )
-                    for user in workspace_users
-                ],
-                batch_size=100,
-                ignore_conflicts=True,
-            )
-
-            IssueProperty.objects.bulk_create(
-                [
-                    IssueProperty(
-                        project_id=importer.project_id,
-                        workspace_id=importer.workspace_id,
-                        user=user,
-                        created_by=importer.created_by,
-                    )
-                    for user in workspace_users
-                ],
-                batch_size=100,
-                ignore_conflicts=True,
+            add_project_members(
+                importer.project_id,
+                importer.workspace_id,
+                {user.id: 10 for user in workspace_users},
+                importer.created_by,
             )
 
         # Check if sync config is on for github importers
@@ -192,3 +182,338 @@ def service_importer(service, importer_id):
             print(e)
         capture_exception(e)
         return
+
+
+def get_import_targets(project_id):
+    """The default state, label ids and member ids issues are imported with"""
+    default_state = State.objects.filter(
+        ~Q(name="Triage"), project_id=project_id, default=True
+    ).first()
+    # if there is no default state assign any random state
+    if default_state is None:
+        default_state = State.objects.filter(
+            ~Q(name="Triage"), project_id=project_id
+        ).first()
+
+    labels = set(
+        str(label_id)
+        for label_id in Label.objects.filter(project_id=project_id).values_list(
+            "id", flat=True
+        )
+    )
+    members = set(
+        str(member_id)
+        for member_id in ProjectMember.objects.filter(
+            project_id=project_id
+        ).values_list("member_id", flat=True)
+    )
+    return default_state, labels, members
+
+
+def load_issues(
+    issues_data, project, actor_id, service, default_state, labels, members
+):
+    """
+    Create the issues of issues_data and everything attached to them, in
+    the transaction of the caller. Returns the ids of the issues.
+    """
+    project_id = project.id
+    workspace_id = project.workspace_id
+
+    # Reserve a block of sequence ids, the project row serializes importers
+    Project.objects.select_for_update().filter(pk=project_id).values("id").first()
+    last_id = IssueSequence.objects.filter(project_id=project_id).aggregate(
+        largest=Max("sequence")
+    )["largest"]
+    last_id = 1 if last_id is None else last_id + 1
+
+    largest_sort_order = Issue.objects.filter(
+        project_id=project_id, state=default_state
+    ).aggregate(largest=Max("sort_order"))["largest"]
+    largest_sort_order = (
+        65535 if largest_sort_order is None else largest_sort_order + 10000
+    )
+
+    issues = []
+    sequences = []
+    issue_labels = []
+    issue_assignees = []
+    issue_activities = []
+    issue_comments = []
+    issue_links = []
+    for offset, issue_data in enumerate(issues_data):
+        issue = Issue(
+            id=issue_data.get("id") or uuid.uuid4(),
+            project_id=project_id,
+            workspace_id=workspace_id,
+            state_id=issue_data.get("state") or default_state.id,
+            name=issue_data.get("name", "Issue Created through Bulk"),
+            description_html=issue_data.get("description_html", "<p></p>"),
+            description_stripped=(
+                None
+                if (
+                    issue_data.get("description_html") == ""
+                    or issue_data.get("description_html") is None
+                )
+                else strip_tags(issue_data.get("description_html"))
+            ),
+            sequence_id=last_id + offset,
+            sort_order=largest_sort_order + offset * 10000,
+            start_date=issue_data.get("start_date", None),
+            target_date=issue_data.get("target_date", None),
+            priority=issue_data.get("priority", "none"),
+            created_by_id=actor_id,
+        )
+        issues.append(issue)
+        sequences.append(
+            IssueSequence(
+                issue_id=issue.id,
+                sequence=issue.sequence_id,
+                project_id=project_id,
+                workspace_id=workspace_id,
+            )
+        )
+        issue_labels.extend(
+            IssueLabel(
+                issue_id=issue.id,
+                label_id=label_id,
+                project_id=project_id,
+                workspace_id=workspace_id,
+                created_by_id=actor_id,
+            )
+            for label_id in set(issue_data.get("labels_list", []))
+            if label_id in labels
+        )
+        issue_assignees.extend(
+            IssueAssignee(
+                issue_id=issue.id,
+                assignee_id=assignee_id,
+                project_id=project_id,
+                workspace_id=workspace_id,
+                created_by_id=actor_id,
+            )
+            for assignee_id in set(issue_data.get("assignees_list", []))
+            if assignee_id in members
+        )
+        issue_activities.append(
+            IssueActivity(
+                issue_id=issue.id,
+                actor_id=actor_id,
+                project_id=project_id,
+                workspace_id=workspace_id,
+                comment=f"imported the issue from {service}",
+                verb="created",
+                created_by_id=actor_id,
+            )
+        )
+        issue_comments.extend(
+            IssueComment(
+                issue_id=issue.id,
+                comment_html=comment.get("comment_html", "<p></p>"),
+                actor_id=actor_id,
+                project_id=project_id,
+                workspace_id=workspace_id,
+                created_by_id=actor_id,
+            )
+            for comment in issue_data.get("comments_list", [])
+        )
+        issue_links.append(
+            IssueLink(
+                issue_id=issue.id,
+                url=issue_data.get("link", {}).get("url", "https://github.com"),
+                title=issue_data.get("link", {}).get("title", "Original Issue"),
+                project_id=project_id,
+                workspace_id=workspace_id,
+                created_by_id=actor_id,
+            )
+        )
+
+    for model, objs in [
+        (Issue, issues),
+        (IssueSequence, sequences),
+        (IssueLabel, issue_labels),
+        (IssueAssignee, issue_assignees),
+        (IssueActivity, issue_activities),
+        (IssueComment, issue_comments),
+        (IssueLink, issue_links),
+    ]:
+        copy_insert(model, objs)
+    return [issue.id for issue in issues]
+
+
+def load_pending_chunks(importer_id, service):
+    """
+    Load the pending chunks of an import in order, one transaction per
+    chunk. A loaded chunk is marked processed and its issues are the ones
+    listed in its data, which is how the import keeps track of them. The
+    chunks being loaded elsewhere are skipped.
+    """
+    importer = Importer.objects.select_related("project").get(pk=importer_id)
+    default_state, labels, members = get_import_targets(importer.project_id)
+
+    while True:
+        with transaction.atomic():
+            chunk = (
+                ImporterChunk.objects.select_for_update(skip_locked=True)
+                .filter(importer_id=importer_id, processed_at__isnull=True)
+                .order_by("sequence")
+                .first()
+            )
+            if chunk is None:
+                break
+            load_issues(
+                chunk.data,
+                importer.project,
+                importer.initiated_by_id,
+                service,
+                default_state,
+                labels,
+                members,
+            )
+            chunk.processed_at = timezone.now()
+            chunk.save(update_fields=["processed_at", "updated_at"])
+        # After the commit, the lists must not be cached with old rows
+        bump_project_version(importer.project_id)
+
+    if not ImporterChunk.objects.filter(
+        importer_id=importer_id, processed_at__isnull=True
+    ).exists():
+        Importer.objects.filter(pk=importer_id).update(status="completed")
+
+
+@shared_task(bind=True, max_retries=5)
+def import_issues(self, importer_id, service):
+    """
+    Load the pending chunks of an import. A failed run is retried and
+    resumes from the first chunk that was not loaded, the import is only
+    marked failed once the retries are used up.
+    """
+    try:
+        Importer.objects.filter(pk=importer_id).update(status="processing")
+        load_pending_chunks(importer_id, service)
+    except Exception as e:
+        # Print logs if in DEBUG mode
+        if settings.DEBUG:
+            print(e)
+        capture_exception(e)
+        if self.request.retries >= self.max_retries:
+            Importer.objects.filter(pk=importer_id).update(status="failed")
+            return
+        Importer.objects.filter(pk=importer_id).update(status="queued")
+        raise self.retry(exc=e, countdown=60 * 2**self.request.retries)
+
+
+@shared_task(bind=True, max_retries=5)
+def import_issue_chunk(self, project_id, actor_id, service, issues_data):
+    """
+    Load a chunk of issues posted without an import to track them. The
+    chunks of a request are chained, so they are loaded in order, and a
+    failed chunk is rolled back and retried.
+    """
+    try:
+        project = Project.objects.get(pk=project_id)
+        default_state, labels, members = get_import_targets(project_id)
+        with transaction.atomic():
+            load_issues(
+                issues_data,
+                project,
+                actor_id,
+                service,
+                default_state,
+                labels,
+                members,
+            )
+    except Exception as e:
+        # Print logs if in DEBUG mode
+        if settings.DEBUG:
+            print(e)
+        capture_exception(e)
+        raise self.retry(exc=e, countdown=60 * 2**self.request.retries)
+    bump_project_version(project_id)
+
+
+@shared_task(bind=True, max_retries=5)
+def import_modules(self, project_id, actor_id, modules_data):
+    """
+    Create the modules of an import with their links and issues. The module
+    issues point at imported issues, a run finding some of them missing is
+    retried while they may still be loading, then they are left out.
+    """
+    project = Project.objects.get(pk=project_id)
+    issue_ids = {
+        str(issue_id)
+        for module_data in modules_data
+        for issue_id in module_data.get("module_issues_list", [])
+    }
+    existing_ids = set(
+        str(issue_id)
+        for issue_id in Issue.objects.filter(
+            project_id=project_id, pk__in=issue_ids
+        ).values_list("id", flat=True)
+    )
+    if existing_ids != issue_ids and self.request.retries < self.max_retries:
+        raise self.retry(countdown=10 * 2**self.request.retries)
+
+    with transaction.atomic():
+        Module.objects.bulk_create(
+            [
+                Module(
+                    id=module_data["id"],
+                    name=module_data.get("name", uuid.uuid4().hex),
+                    description=module_data.get("description", ""),
+                    start_date=module_data.get("start_date", None),
+                    target_date=module_data.get("target_date", None),
+                    project_id=project_id,
+                    workspace_id=project.workspace_id,
+                    created_by_id=actor_id,
+                )
+                for module_data in modules_data
+            ],
+            batch_size=100,
+            ignore_conflicts=True,
+        )
+        # A module whose name is already taken is not created, nor linked
+        created_ids = set(
+            str(module_id)
+            for module_id in Module.objects.filter(
+                pk__in=[module_data["id"] for module_data in modules_data]
+            ).values_list("id", flat=True)
+        )
+        modules_data = [
+            module_data
+            for module_data in modules_data
+            if module_data["id"] in created_ids
+        ]
+
+        ModuleLink.objects.bulk_create(
+            [
+                ModuleLink(
+                    module_id=module_data["id"],
+                    url=module_data.get("link", {}).get("url", "https://plane.so"),
+                    title=module_data.get("link", {}).get("title", "Original Issue"),
+                    project_id=project_id,
+                    workspace_id=project.workspace_id,
+                    created_by_id=actor_id,
+                )
+                for module_data in modules_data
+            ],
+            batch_size=100,
+            ignore_conflicts=True,
+        )
+        ModuleIssue.objects.bulk_create(
+            [
+                ModuleIssue(
+                    issue_id=issue_id,
+                    module_id=module_data["id"],
+                    project_id=project_id,
+                    workspace_id=project.workspace_id,
+                    created_by_id=actor_id,
+                )
+                for module_data in modules_data
+                for issue_id in module_data.get("module_issues_list", [])
+                if str(issue_id) in existing_ids
+            ],
+            batch_size=100,
+            ignore_conflicts=True,
+        )
+    bump_project_version(project_id)
@@ -29,7 +29,9 @@ from plane.db.models import (
     IssueComment,
 )
 from plane.api.serializers import IssueActivitySerializer
-from plane.bgtasks.notification_task import notifications
+from plane.bgtasks.notification_task import notifications, bulk_notifications
+from plane.utils.live_updates import publish_issue_changes
+from plane.utils.project_version import ProjectVersionTask
 
 
 # Track Changes in name
@@ -1462,8 +1464,32 @@ def delete_draft_issue_activity(
     )
 
 
+def post_issue_activity_hooks(issue_activities_created, actor_id=None):
+    # Tell the sockets of the project which issues changed
+    publish_issue_changes(issue_activities_created, actor_id)
+
+    # Post the updates to segway for integrations and webhooks
+    if len(issue_activities_created):
+        # Don't send activities if the actor is a bot
+        try:
+            if settings.PROXY_BASE_URL:
+                for issue_activity in issue_activities_created:
+                    headers = {"Content-Type": "application/json"}
+                    issue_activity_json = json.dumps(
+                        IssueActivitySerializer(issue_activity).data,
+                        cls=DjangoJSONEncoder,
+                    )
+                    _ = requests.post(
+                        f"{settings.PROXY_BASE_URL}/hooks/workspaces/{str(issue_activity.workspace_id)}/projects/{str(issue_activity.project_id)}/issues/{str(issue_activity.issue_id)}/issue-activity-hooks/",
+                        json=issue_activity_json,
+                        headers=headers,
+                    )
+        except Exception as e:
+            capture_exception(e)
+
+
 # Receive message from room group
-@shared_task
+@shared_task(base=ProjectVersionTask)
 def issue_activity(
     type,
     requested_data,
@@ -1533,24 +1559,7 @@ def issue_activity(
 
         # Save all the values to database
         issue_activities_created = IssueActivity.objects.bulk_create(issue_activities)
-        # Post the updates to segway for integrations and webhooks
-        if len(issue_activities_created):
-            # Don't send activities if the actor is a bot
-            try:
-                if settings.PROXY_BASE_URL:
-                    for issue_activity in issue_activities_created:
-                        headers = {"Content-Type": "application/json"}
-                        issue_activity_json = json.dumps(
-                            IssueActivitySerializer(issue_activity).data,
-                            cls=DjangoJSONEncoder,
-                        )
-                        _ = requests.post(
-                            f"{settings.PROXY_BASE_URL}/hooks/workspaces/{str(issue_activity.workspace_id)}/projects/{str(issue_activity.project_id)}/issues/{str(issue_activity.issue_id)}/issue-activity-hooks/",
-                            json=issue_activity_json,
-                            headers=headers,
-                        )
-            except Exception as e:
-                capture_exception(e)
+        post_issue_activity_hooks(issue_activities_created, actor_id)
 
         notifications.delay(
             type=type,
@@ -1573,3 +1582,218 @@ def issue_activity(
             print(e)
         capture_exception(e)
         return
+
+
+# Fields of a bulk update whose activity needs no lookups
+BULK_ACTIVITY_MAPPER = {
+    "priority": track_priority,
+    "start_date": track_start_date,
+    "target_date": track_target_date,
+    "estimate_point": track_estimate_points,
+    "archived_at": track_archive_at,
+}
+
+
+def track_bulk_relation(
+    field,
+    requested_data,
+    current_instance,
+    names,
+    issue_id,
+    project_id,
+    workspace_id,
+    actor_id,
+    issue_activities,
+    epoch,
+):
+    """Same activity as track_labels and track_assignees, with preloaded names"""
+    requested = set([str(value) for value in requested_data.get(field, [])])
+    current = set([str(value) for value in current_instance.get(field, [])])
+    noun = "label" if field == "labels" else "assignee"
+
+    for added in requested - current:
+        issue_activities.append(
+            IssueActivity(
+                issue_id=issue_id,
+                actor_id=actor_id,
+                verb="updated",
+                old_value="",
+                new_value=names.get(added, ""),
+                field=field,
+                project_id=project_id,
+                workspace_id=workspace_id,
+                comment=f"added {noun} ",
+                new_identifier=added,
+                epoch=epoch,
+            )
+        )
+
+    for dropped in current - requested:
+        issue_activities.append(
+            IssueActivity(
+                issue_id=issue_id,
+                actor_id=actor_id,
+                verb="updated",
+                old_value=names.get(dropped, ""),
+                new_value="",
+                field=field,
+                project_id=project_id,
+                workspace_id=workspace_id,
+                comment=f"removed {noun} ",
+                old_identifier=dropped,
+                epoch=epoch,
+            )
+        )
+
+
+@shared_task(base=ProjectVersionTask)
+def bulk_issue_activity(
+    requested_data,
+    current_instances,
+    actor_id,
+    project_id,
+    epoch,
+    subscriber=True,
+):
+    """
+    Activity of a bulk update. `current_instances` maps every updated issue
+    to its values before the update, the same `requested_data` was applied
+    to all of them. The states, labels and users named in the diffs are
+    loaded once instead of once per issue.
+    """
+    try:
+        requested_data = json.loads(requested_data)
+        current_instances = json.loads(current_instances)
+        workspace_id = Project.objects.filter(pk=project_id).values_list(
+            "workspace_id", flat=True
+        ).get()
+
+        states = {}
+        state_ids = [
+            requested_data[key]
+            for key in ("state", "closed_to")
+            if requested_data.get(key)
+        ]
+        if state_ids:
+            states = {
+                str(state.id): state
+                for state in State.objects.filter(
+                    pk__in=state_ids
+                    + [
+                        current_instance.get("state")
+                        for current_instance in current_instances.values()
+                        if current_instance.get("state")
+                    ]
+                ).only("id", "name")
+            }
+
+        names = {}
+        for field, model, name in [
+            ("labels", Label, "name"),
+            ("assignees", User, "display_name"),
+        ]:
+            if field not in requested_data:
+                continue
+            ids = set(requested_data[field])
+            for current_instance in current_instances.values():
+                ids.update(current_instance.get(field, []))
+            names[field] = {
+                str(pk): value
+                for pk, value in model.objects.filter(pk__in=ids).values_list(
+                    "id", name
+                )
+            }
+
+        issue_activities = []
+        for issue_id, current_instance in current_instances.items():
+            kwargs = {
+                "requested_data": requested_data,
+                "current_instance": current_instance,
+                "issue_id": issue_id,
+                "project_id": project_id,
+                "workspace_id": workspace_id,
+                "actor_id": actor_id,
+                "issue_activities": issue_activities,
+                "epoch": epoch,
+            }
+            for key in requested_data:
+                if key in BULK_ACTIVITY_MAPPER:
+                    BULK_ACTIVITY_MAPPER[key](**kwargs)
+                elif key in names:
+                    track_bulk_relation(field=key, names=names[key], **kwargs)
+
+            if "state" in requested_data and str(
+                current_instance.get("state")
+            ) != str(requested_data["state"]):
+                old_state = states.get(str(current_instance.get("state")))
+                new_state = states.get(str(requested_data["state"]))
+                issue_activities.append(
+                    IssueActivity(
+                        issue_id=issue_id,
+                        actor_id=actor_id,
+                        verb="updated",
+                        old_value=old_state.name if old_state else "",
+                        new_value=new_state.name if new_state else "",
+                        field="state",
+                        project_id=project_id,
+                        workspace_id=workspace_id,
+                        comment="updated the state to",
+                        old_identifier=old_state.id if old_state else None,
+                        new_identifier=new_state.id if new_state else None,
+                        epoch=epoch,
+                    )
+                )
+
+            # Same activity as track_closed_to
+            closed_to = states.get(str(requested_data.get("closed_to")))
+            if closed_to is not None:
+                issue_activities.append(
+                    IssueActivity(
+                        issue_id=issue_id,
+                        actor_id=actor_id,
+                        verb="updated",
+                        old_value=None,
+                        new_value=closed_to.name,
+                        field="state",
+                        project_id=project_id,
+                        workspace_id=workspace_id,
+                        comment="Plane updated the state to ",
+                        old_identifier=None,
+                        new_identifier=closed_to.id,
+                        epoch=epoch,
+                    )
+                )
+
+        issue_activities_created = IssueActivity.objects.bulk_create(
+            issue_activities, batch_size=500
+        )
+        post_issue_activity_hooks(issue_activities_created, actor_id)
+
+        bulk_notifications.delay(
+            issue_activities_created=json.dumps(
+                [
+                    {
+                        "id": issue_activity.id,
+                        "issue": issue_activity.issue_id,
+                        "verb": issue_activity.verb,
+                        "field": issue_activity.field,
+                        "actor_id": issue_activity.actor_id,
+                        "old_value": issue_activity.old_value,
+                        "new_value": issue_activity.new_value,
+                        "comment": issue_activity.comment,
+                    }
+                    for issue_activity in issue_activities_created
+                ],
+                cls=DjangoJSONEncoder,
+            ),
+            actor_id=actor_id,
+            project_id=project_id,
+            subscriber=subscriber,
+        )
+        return
+    except Exception as e:
+        # Print logs if in DEBUG mode
+        if settings.DEBUG:
+            print(e)
+        capture_exception(e)
+        return
@@ -1,164 +1,163 @@
 # Python imports
 import json
+import logging
+import time
 from datetime import timedelta
 
 # Django imports
 from django.utils import timezone
+from django.db import connection, transaction
 from django.db.models import Q
 from django.conf import settings
 
 # Third party imports
-from celery import shared_task
+from celery import chord, shared_task
 from sentry_sdk import capture_exception
 
 # Module imports
-from plane.db.models import Issue, Project, State
-from plane.bgtasks.issue_activites_task import issue_activity
+from plane.db.models import Issue, PageBlock, Project, State
+from plane.bgtasks.issue_activites_task import bulk_issue_activity
+
+logger = logging.getLogger("plane.bgtasks.issue_automation")
 
 
 @shared_task
 def archive_and_close_old_issues():
-    archive_old_issues()
-    close_old_issues()
+    """
+    Run the automation of every project with auto archive or auto close on
+    as a subtask of its own, the totals are recorded once all are done.
+    """
+    project_ids = Project.objects.filter(
+        Q(archive_in__gt=0) | Q(close_in__gt=0), deleted_at__isnull=True
+    ).values_list("id", flat=True)
+    subtasks = [automate_project_issues.s(str(project_id)) for project_id in project_ids]
+    if subtasks:
+        chord(subtasks)(record_issue_automation.s(time.time()))
 
 
-def archive_old_issues():
+@shared_task
+def automate_project_issues(project_id):
+    started_at = time.perf_counter()
+    result = {"project_id": project_id, "archived": 0, "closed": 0, "failed": False}
     try:
-        # Get all the projects whose archive_in is greater than 0
-        projects = Project.objects.filter(archive_in__gt=0)
-
-        for project in projects:
-            project_id = project.id
-            archive_in = project.archive_in
-
-            # Get all the issues whose updated_at in less that the archive_in month
-            issues = Issue.issue_objects.filter(
-                Q(
-                    project=project_id,
-                    archived_at__isnull=True,
-                    updated_at__lte=(timezone.now() - timedelta(days=archive_in * 30)),
-                    state__group__in=["completed", "cancelled"],
-                ),
-                Q(issue_cycle__isnull=True)
-                | (
-                    Q(issue_cycle__cycle__end_date__lt=timezone.now().date())
-                    & Q(issue_cycle__isnull=False)
-                ),
-                Q(issue_module__isnull=True)
-                | (
-                    Q(issue_module__module__target_date__lt=timezone.now().date())
-                    & Q(issue_module__isnull=False)
-                ),
-            ).filter(
-                Q(issue_inbox__status=1)
-                | Q(issue_inbox__status=-1)
-                | Q(issue_inbox__status=2)
-                | Q(issue_inbox__isnull=True)
-            )
-
-            # Check if Issues
-            if issues:
-                # Set the archive time to current time
-                archive_at = timezone.now().date()
-
-                issues_to_update = []
-                for issue in issues:
-                    issue.archived_at = archive_at
-                    issues_to_update.append(issue)
-
-                # Bulk Update the issues and log the activity
-                if issues_to_update: 
-                    Issue.objects.bulk_update(
-                        issues_to_update, ["archived_at"], batch_size=100
-                    )
-                    _ = [
-                        issue_activity.delay(
-                            type="issue.activity.updated",
-                            requested_data=json.dumps({"archived_at": str(archive_at)}),
-                            actor_id=str(project.created_by_id),
-                            issue_id=issue.id,
-                            project_id=project_id,
-                            current_instance=json.dumps({"archived_at": None}),
-                            subscriber=False,
-                            epoch=int(timezone.now().timestamp())
-                        )
-                        for issue in issues_to_update
-                    ]
-        return
+        project = Project.objects.select_related("default_state").get(pk=project_id)
+        if project.archive_in > 0:
+            result["archived"] = archive_old_issues(project)
+        if project.close_in > 0:
+            result["closed"] = close_old_issues(project)
     except Exception as e:
         if settings.DEBUG:
             print(e)
         capture_exception(e)
-        return
+        result["failed"] = True
 
+    result["duration_ms"] = round((time.perf_counter() - started_at) * 1000, 2)
+    logger.info("Issue automation of project %s: %s", project_id, result)
+    return result
 
-def close_old_issues():
-    try:
-        # Get all the projects whose close_in is greater than 0
-        projects = Project.objects.filter(close_in__gt=0).select_related(
-            "default_state"
-        )
 
-        for project in projects:
-            project_id = project.id
-            close_in = project.close_in
-
-            # Get all the issues whose updated_at in less that the close_in month
-            issues = Issue.issue_objects.filter(
-                Q(
-                    project=project_id,
-                    archived_at__isnull=True,
-                    updated_at__lte=(timezone.now() - timedelta(days=close_in * 30)),
-                    state__group__in=["backlog", "unstarted", "started"],
-                ),
-                Q(issue_cycle__isnull=True)
-                | (
-                    Q(issue_cycle__cycle__end_date__lt=timezone.now().date())
-                    & Q(issue_cycle__isnull=False)
-                ),
-                Q(issue_module__isnull=True)
-                | (
-                    Q(issue_module__module__target_date__lt=timezone.now().date())
-                    & Q(issue_module__isnull=False)
-                ),
-            ).filter(
-                Q(issue_inbox__status=1)
-                | Q(issue_inbox__status=-1)
-                | Q(issue_inbox__status=2)
-                | Q(issue_inbox__isnull=True)
-            )
-
-            # Check if Issues
-            if issues:
-                if project.default_state is None:
-                    close_state = State.objects.filter(group="cancelled").first()
-                else:
-                    close_state = project.default_state
-
-                issues_to_update = []
-                for issue in issues:
-                    issue.state = close_state
-                    issues_to_update.append(issue)
-
-                # Bulk Update the issues and log the activity
-                if issues_to_update:
-                    Issue.objects.bulk_update(issues_to_update, ["state"], batch_size=100)
-                    [
-                        issue_activity.delay(
-                            type="issue.activity.updated",
-                            requested_data=json.dumps({"closed_to": str(issue.state_id)}),
-                            actor_id=str(project.created_by_id),
-                            issue_id=issue.id,
-                            project_id=project_id,
-                            current_instance=None,
-                            subscriber=False,
-                            epoch=int(timezone.now().timestamp())
-                        )
-                        for issue in issues_to_update
-                    ]
-        return
-    except Exception as e:
-        if settings.DEBUG:
-            print(e)
-        capture_exception(e)
-        return
+@shared_task
+def record_issue_automation(results, started_at):
+    totals = {
+        "projects": len(results),
+        "archived": sum(result["archived"] for result in results),
+        "closed": sum(result["closed"] for result in results),
+        "failed": sum(result["failed"] for result in results),
+        "duration_s": round(time.time() - started_at, 2),
+    }
+    logger.info("Issue automation: %s", totals)
+    return totals
+
+
+def old_issues(project, months, state_groups):
+    """
+    Issues of the project untouched for `months` months, in one of
+    state_groups and out of any running cycle or module
+    """
+    now = timezone.now()
+    return Issue.issue_objects.filter(
+        Q(
+            project=project,
+            updated_at__lte=now - timedelta(days=months * 30),
+            state__group__in=state_groups,
+        ),
+        Q(issue_cycle__isnull=True)
+        | Q(issue_cycle__cycle__end_date__lt=now.date()),
+        Q(issue_module__isnull=True)
+        | Q(issue_module__module__target_date__lt=now.date()),
+    )
+
+
+def update_issues(queryset, values):
+    """UPDATE of the issues of queryset in a single statement, returning their ids"""
+    qn = connection.ops.quote_name
+    select, params = queryset.order_by().values("pk").query.sql_with_params()
+    assignments = ", ".join(f"{qn(column)} = %s" for column in values)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {qn(Issue._meta.db_table)} SET {assignments} "
+            f"WHERE {qn('id')} IN ({select}) RETURNING {qn('id')}",
+            [*values.values(), *params],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def automation_actor(project):
+    return str(project.created_by_id) if project.created_by_id else None
+
+
+def archive_old_issues(project):
+    now = timezone.now()
+    archived_at = now.date()
+    issue_ids = update_issues(
+        old_issues(project, project.archive_in, ["completed", "cancelled"]),
+        {"archived_at": archived_at, "updated_at": now},
+    )
+
+    if issue_ids:
+        bulk_issue_activity.delay(
+            requested_data=json.dumps({"archived_at": str(archived_at)}),
+            current_instances=json.dumps(
+                {str(issue_id): {"archived_at": None} for issue_id in issue_ids}
+            ),
+            actor_id=automation_actor(project),
+            project_id=str(project.id),
+            epoch=int(now.timestamp()),
+            subscriber=False,
+        )
+    return len(issue_ids)
+
+
+def close_old_issues(project):
+    close_state = project.default_state
+    if close_state is None:
+        close_state = State.objects.filter(project=project, group="cancelled").first()
+    if close_state is None:
+        return 0
+
+    now = timezone.now()
+    values = {"state_id": close_state.id, "updated_at": now}
+    # Same completion tracking as Issue.save, the issues were not completed
+    if close_state.group == "completed":
+        values["completed_at"] = now
+
+    with transaction.atomic():
+        issue_ids = update_issues(
+            old_issues(project, project.close_in, ["backlog", "unstarted", "started"]),
+            values,
+        )
+        if issue_ids and close_state.group == "completed":
+            PageBlock.objects.filter(issue_id__in=issue_ids).update(completed_at=now)
+
+    if issue_ids:
+        bulk_issue_activity.delay(
+            requested_data=json.dumps({"closed_to": str(close_state.id)}),
+            current_instances=json.dumps(
+                {str(issue_id): {} for issue_id in issue_ids}
+            ),
+            actor_id=automation_actor(project),
+            project_id=str(project.id),
+            epoch=int(now.timestamp()),
+            subscriber=False,
+        )
+    return len(issue_ids)
@@ -1,13 +1,13 @@
 # Django imports
-from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
-from django.utils.html import strip_tags
 from django.conf import settings
 
 # Third party imports
 from celery import shared_task
 from sentry_sdk import capture_exception
 
+# Module imports
+from plane.utils.mailer import build_email, send_emails
+
 
 @shared_task
 def magic_link(email, key, token, current_site):
@@ -15,19 +15,13 @@ def magic_link(email, key, token, current_site):
         realtivelink = f"/magic-sign-in/?password={token}&key={key}"
         abs_url = current_site + realtivelink
 
-        from_email_string = settings.EMAIL_FROM
-
         subject = "Login for Plane"
 
         context = {"magic_url": abs_url, "code": token}
 
-        html_content = render_to_string("emails/auth/magic_signin.html", context)
-
-        text_content = strip_tags(html_content)
-
-        msg = EmailMultiAlternatives(subject, text_content, from_email_string, [email])
-        msg.attach_alternative(html_content, "text/html")
-        msg.send()
+        send_emails(
+            [build_email(subject, "emails/auth/magic_signin.html", context, [email])]
+        )
         return
     except Exception as e:
         capture_exception(e)
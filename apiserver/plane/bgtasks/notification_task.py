@@ -2,6 +2,10 @@
 import json
 import uuid
 
+# Django imports
+from django.db.models import Q
+from django.utils import timezone
+
 # Module imports
 from plane.db.models import (
     IssueMention,
@@ -14,65 +18,13 @@ from plane.db.models import (
     IssueComment,
     IssueActivity
 )
+from plane.utils.live_updates import publish_notifications
 
 # Third Party imports
 from celery import shared_task
-from bs4 import BeautifulSoup
-
-
-    
-# =========== Issue Description Html Parsing and Notification Functions ======================
-
-def update_mentions_for_issue(issue, project, new_mentions, removed_mention):
-    aggregated_issue_mentions = []
-
-    for mention_id in new_mentions:
-        aggregated_issue_mentions.append(
-            IssueMention(
-                mention_id=mention_id,
-                issue=issue,
-                project=project,
-                workspace_id=project.workspace_id
-            )
-        )
-
-    IssueMention.objects.bulk_create(
-        aggregated_issue_mentions, batch_size=100)
-    IssueMention.objects.filter(
-        issue=issue, mention__in=removed_mention).delete()
-
-
-def get_new_mentions(requested_instance, current_instance):
-    # requested_data is the newer instance of the current issue
-    # current_instance is the older instance of the current issue, saved in the database
-
-    # extract mentions from both the instance of data
-    mentions_older = extract_mentions(current_instance)
-    
-    mentions_newer = extract_mentions(requested_instance)
-
-    # Getting Set Difference from mentions_newer
-    new_mentions = [
-        mention for mention in mentions_newer if mention not in mentions_older]
-
-    return new_mentions
-
-# Get Removed Mention
-
-
-def get_removed_mentions(requested_instance, current_instance):
-    # requested_data is the newer instance of the current issue
-    # current_instance is the older instance of the current issue, saved in the database
-
-    # extract mentions from both the instance of data
-    mentions_older = extract_mentions(current_instance)
-    mentions_newer = extract_mentions(requested_instance)
 
-    # Getting Set Difference from mentions_newer
-    removed_mentions = [
-        mention for mention in mentions_older if mention not in mentions_newer]
 
-    return removed_mentions
+# =========== Issue Mention Notification Functions ======================
 
 # Adds mentions as subscribers
 
@@ -105,53 +57,6 @@ def extract_mentions_as_subscribers(project_id, issue_id, mentions):
             ))
     return bulk_mention_subscribers
 
-# Parse Issue Description & extracts mentions
-def extract_mentions(issue_instance):
-    try:
-        # issue_instance has to be a dictionary passed, containing the description_html and other set of activity data.
-        mentions = []
-        # Convert string to dictionary
-        data = json.loads(issue_instance)
-        html = data.get("description_html")
-        soup = BeautifulSoup(html, 'html.parser')
-        mention_tags = soup.find_all(
-            'mention-component', attrs={'target': 'users'})
-
-        mentions = [mention_tag['id'] for mention_tag in mention_tags]
-
-        return list(set(mentions))
-    except Exception as e:
-        return []
-    
-    
-# =========== Comment Parsing and Notification Functions ======================
-def extract_comment_mentions(comment_value):
-    try:
-        mentions = []
-        soup = BeautifulSoup(comment_value, 'html.parser')
-        mentions_tags = soup.find_all(
-            'mention-component', attrs={'target': 'users'}
-        )
-        for mention_tag in mentions_tags:
-            mentions.append(mention_tag['id'])
-        return list(set(mentions))
-    except Exception as e:
-        return []
-    
-def get_new_comment_mentions(new_value, old_value):
-    
-    mentions_newer = extract_comment_mentions(new_value)
-    if old_value is None:
-        return mentions_newer
-    
-    mentions_older = extract_comment_mentions(old_value)
-    # Getting Set Difference from mentions_newer
-    new_mentions = [
-        mention for mention in mentions_newer if mention not in mentions_older]
-
-    return new_mentions
-
-
 def createMentionNotification(project, notification_comment, issue, actor_id, mention_id, issue_id, activity):
     return Notification(
         workspace=project.workspace,
@@ -213,33 +118,35 @@ def notifications(type, issue_id, project_id, actor_id, subscriber, issue_activi
         2. From the latest set of mentions, extract the users which are not a subscribers & make them subscribers
         """
 
-        # Get new mentions from the newer instance
-        new_mentions = get_new_mentions(
-            requested_instance=requested_data, current_instance=current_instance)
-        removed_mention = get_removed_mentions(
-            requested_instance=requested_data, current_instance=current_instance)
-        
-        comment_mentions = []
+        # The mentions are indexed when the description or comment is saved,
+        # the ones without notified_at have not been notified yet
+        mentions = IssueMention.objects.filter(issue_id=issue_id)
+        comment_ids = [
+            issue_activity.get("issue_comment")
+            for issue_activity in issue_activities_created
+            if issue_activity.get("issue_comment") is not None
+        ]
+
+        requested_mentions = []
+        new_mentions = []
         all_comment_mentions = []
+        comment_mentions = []
+        for comment_id, mention_id, notified_at in mentions.filter(
+            Q(comment__isnull=True) | Q(comment_id__in=comment_ids)
+        ).values_list("comment_id", "mention_id", "notified_at"):
+            if comment_id is None:
+                requested_mentions.append(str(mention_id))
+                if notified_at is None:
+                    new_mentions.append(str(mention_id))
+            else:
+                all_comment_mentions.append(str(mention_id))
+                if notified_at is None:
+                    comment_mentions.append(str(mention_id))
 
         # Get New Subscribers from the mentions of the newer instance
-        requested_mentions = extract_mentions(
-            issue_instance=requested_data)
         mention_subscribers = extract_mentions_as_subscribers(
             project_id=project_id, issue_id=issue_id, mentions=requested_mentions)
-        
-        for issue_activity in issue_activities_created:
-            issue_comment = issue_activity.get("issue_comment")
-            issue_comment_new_value = issue_activity.get("new_value")
-            issue_comment_old_value = issue_activity.get("old_value")
-            if issue_comment is not None:
-                # TODO: Maybe save the comment mentions, so that in future, we can filter out the issues based on comment mentions as well.
-                
-                all_comment_mentions = all_comment_mentions + extract_comment_mentions(issue_comment_new_value)
-                
-                new_comment_mentions = get_new_comment_mentions(old_value=issue_comment_old_value, new_value=issue_comment_new_value)
-                comment_mentions = comment_mentions + new_comment_mentions
-                
+
         comment_mention_subscribers = extract_mentions_as_subscribers( project_id=project_id, issue_id=issue_id, mentions=all_comment_mentions)
         """
         We will not send subscription activity notification to the below mentioned user sets
@@ -333,7 +240,10 @@ def notifications(type, issue_id, project_id, actor_id, subscriber, issue_activi
 
         # Add Mentioned as Issue Subscribers
         IssueSubscriber.objects.bulk_create(
-            mention_subscribers + comment_mention_subscribers, batch_size=100)
+            mention_subscribers + comment_mention_subscribers,
+            batch_size=100,
+            ignore_conflicts=True,
+        )
 
         last_activity = (
             IssueActivity.objects.filter(issue_id=issue_id)
@@ -408,11 +318,121 @@ def notifications(type, issue_id, project_id, actor_id, subscriber, issue_activi
                         )
                         bulk_notifications.append(notification)
 
-        # save new mentions for the particular issue and remove the mentions that has been deleted from the description
-        update_mentions_for_issue(issue=issue, project=project, new_mentions=new_mentions, 
-                                  removed_mention=removed_mention)
+        # Mark the mentions as notified
+        mentions.filter(
+            Q(comment__isnull=True) | Q(comment_id__in=comment_ids),
+            notified_at__isnull=True,
+        ).update(notified_at=timezone.now())
         
         # Bulk create notifications
         Notification.objects.bulk_create(bulk_notifications, batch_size=100)
+        publish_notifications(bulk_notifications)
         
         
+
+
+@shared_task
+def bulk_notifications(issue_activities_created, actor_id, project_id, subscriber):
+    """
+    Notifications of a bulk update, the same recipients as `notifications`
+    with the issues, assignees and subscribers of all the updated issues
+    loaded once.
+    """
+    issue_activities_created = json.loads(issue_activities_created)
+    activities_by_issue = {}
+    for issue_activity in issue_activities_created:
+        activities_by_issue.setdefault(issue_activity["issue"], []).append(
+            issue_activity
+        )
+
+    if not activities_by_issue:
+        return
+
+    project = Project.objects.select_related("workspace").get(pk=project_id)
+    issues = Issue.objects.filter(pk__in=activities_by_issue.keys()).select_related(
+        "state"
+    )
+    # Automations have no actor when the project has no creator
+    actor = uuid.UUID(str(actor_id)) if actor_id else None
+
+    assignees = {}
+    for issue_id, assignee_id in IssueAssignee.objects.filter(
+        project_id=project_id, issue_id__in=activities_by_issue.keys()
+    ).values_list("issue_id", "assignee_id"):
+        assignees.setdefault(issue_id, set()).add(assignee_id)
+
+    subscribers = {}
+    for issue_id, subscriber_id in IssueSubscriber.objects.filter(
+        project_id=project_id, issue_id__in=activities_by_issue.keys()
+    ).values_list("issue_id", "subscriber_id"):
+        subscribers.setdefault(issue_id, set()).add(subscriber_id)
+
+    bulk_subscribers = []
+    bulk_notifications = []
+    for issue in issues:
+        issue_assignees = assignees.get(issue.id, set())
+        issue_subscribers = set(subscribers.get(issue.id, set()))
+        if issue.created_by_id is not None:
+            issue_subscribers.add(issue.created_by_id)
+
+        if (
+            subscriber
+            and actor is not None
+            and issue.created_by_id != actor
+            and actor not in issue_assignees
+            and actor not in issue_subscribers
+        ):
+            bulk_subscribers.append(
+                IssueSubscriber(
+                    workspace_id=project.workspace_id,
+                    project_id=project_id,
+                    issue_id=issue.id,
+                    subscriber_id=actor,
+                )
+            )
+
+        for receiver in (issue_subscribers | issue_assignees) - {actor}:
+            sender = "in_app:issue_activities:subscribed"
+            if receiver == issue.created_by_id:
+                sender = "in_app:issue_activities:created"
+            if receiver in issue_assignees:
+                sender = "in_app:issue_activities:assigned"
+
+            for issue_activity in activities_by_issue[str(issue.id)]:
+                bulk_notifications.append(
+                    Notification(
+                        workspace=project.workspace,
+                        sender=sender,
+                        triggered_by_id=actor,
+                        receiver_id=receiver,
+                        entity_identifier=issue.id,
+                        entity_name="issue",
+                        project=project,
+                        title=issue_activity.get("comment"),
+                        data={
+                            "issue": {
+                                "id": str(issue.id),
+                                "name": str(issue.name),
+                                "identifier": str(project.identifier),
+                                "sequence_id": issue.sequence_id,
+                                "state_name": issue.state.name,
+                                "state_group": issue.state.group,
+                            },
+                            "issue_activity": {
+                                "id": str(issue_activity.get("id")),
+                                "verb": str(issue_activity.get("verb")),
+                                "field": str(issue_activity.get("field")),
+                                "actor": str(issue_activity.get("actor_id")),
+                                "new_value": str(issue_activity.get("new_value")),
+                                "old_value": str(issue_activity.get("old_value")),
+                                "issue_comment": "",
+                            },
+                        },
+                    )
+                )
+
+    IssueSubscriber.objects.bulk_create(
+        bulk_subscribers, batch_size=100, ignore_conflicts=True
+    )
+    Notification.objects.bulk_create(bulk_notifications, batch_size=100)
+    publish_notifications(bulk_notifications)
@@ -0,0 +1,46 @@
+# Django imports
+from django.conf import settings
+from django.utils import timezone
+
+# Third party imports
+from celery import shared_task
+from dateutil.relativedelta import relativedelta
+from sentry_sdk import capture_exception
+
+# Module imports
+from plane.utils.partitions import (
+    create_monthly_partitions,
+    drop_expired_partitions,
+    is_partitioned,
+    month_start,
+)
+
+
+@shared_task
+def maintain_partitions():
+    retention = {
+        "issue_activities": settings.ISSUE_ACTIVITY_RETENTION_MONTHS,
+        "notifications": settings.NOTIFICATION_RETENTION_MONTHS,
+    }
+    current_month = month_start(timezone.now())
+
+    for table, retention_months in retention.items():
+        try:
+            if not is_partitioned(table):
+                continue
+
+            # Keep the upcoming months ready so that inserts never fall
+            # through to the default partition
+            create_monthly_partitions(
+                table, current_month, settings.PARTITION_PRECREATE_MONTHS + 1
+            )
+
+            # Retention works on whole partitions instead of deleting rows
+            if retention_months > 0:
+                drop_expired_partitions(
+                    table,
+                    before=current_month - relativedelta(months=retention_months),
+                    detach_only=not settings.PARTITION_RETENTION_DROP,
+                )
+        except Exception as e:
+            capture_exception(e)
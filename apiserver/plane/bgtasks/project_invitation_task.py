@@ -1,7 +1,4 @@
 # Django imports
-from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
-from django.utils.html import strip_tags
 from django.conf import settings
 
 # Third party imports
@@ -10,44 +7,75 @@ from sentry_sdk import capture_exception
 
 # Module imports
 from plane.db.models import Project, User, ProjectMemberInvite
+from plane.utils.mailer import build_email, send_emails
+
+
+def build_invitation_email(project, project_member_invite, current_site):
+    email = project_member_invite.email
+    relativelink = f"/project-member-invitation/{project_member_invite.id}"
+    abs_url = current_site + relativelink
+
+    subject = f"{project.created_by.first_name or project.created_by.email} invited you to join {project.name} on Plane"
+
+    context = {
+        "email": email,
+        "first_name": project.created_by.first_name,
+        "project_name": project.name,
+        "invitation_url": abs_url,
+    }
+
+    return build_email(
+        subject, "emails/invitations/project_invitation.html", context, [email]
+    )
+
+
+def send_invitations(project, invitations, current_site):
+    """
+    Email the invitations over one connection, EMAIL_BATCH_SIZE at a time,
+    and keep the text of each email as the message of its invitation
+    """
+    for start in range(0, len(invitations), settings.EMAIL_BATCH_SIZE):
+        batch = invitations[start : start + settings.EMAIL_BATCH_SIZE]
+        messages = []
+        for project_member_invite in batch:
+            msg = build_invitation_email(project, project_member_invite, current_site)
+            project_member_invite.message = msg.body
+            messages.append(msg)
+        ProjectMemberInvite.objects.bulk_update(batch, ["message"])
+        send_emails(messages)
 
 
 @shared_task
 def project_invitation(email, project_id, token, current_site):
     try:
-        project = Project.objects.get(pk=project_id)
+        project = Project.objects.select_related("created_by").get(pk=project_id)
         project_member_invite = ProjectMemberInvite.objects.get(
             token=token, email=email
         )
+        send_invitations(project, [project_member_invite], current_site)
+        return
+    except (Project.DoesNotExist, ProjectMemberInvite.DoesNotExist) as e:
+        return
+    except Exception as e:
+        # Print logs if in DEBUG mode
+        if settings.DEBUG:
+            print(e)
+        capture_exception(e)
+        return
 
-        relativelink = f"/project-member-invitation/{project_member_invite.id}"
-        abs_url = current_site + relativelink
-
-        from_email_string = settings.EMAIL_FROM
-
-        subject = f"{project.created_by.first_name or project.created_by.email} invited you to join {project.name} on Plane"
-
-        context = {
-            "email": email,
-            "first_name": project.created_by.first_name,
-            "project_name": project.name,
-            "invitation_url": abs_url,
-        }
 
-        html_content = render_to_string(
-            "emails/invitations/project_invitation.html", context
+@shared_task
+def project_invitations(project_id, invitation_ids, current_site):
+    try:
+        project = Project.objects.select_related("created_by").get(pk=project_id)
+        invitations = list(
+            ProjectMemberInvite.objects.filter(
+                project_id=project_id, pk__in=invitation_ids
+            ).order_by("email")
         )
-
-        text_content = strip_tags(html_content)
-
-        project_member_invite.message = text_content
-        project_member_invite.save()
-
-        msg = EmailMultiAlternatives(subject, text_content, from_email_string, [email])
-        msg.attach_alternative(html_content, "text/html")
-        msg.send()
+        send_invitations(project, invitations, current_site)
         return
-    except (Project.DoesNotExist, ProjectMemberInvite.DoesNotExist) as e:
+    except Project.DoesNotExist as e:
         return
     except Exception as e:
         # Print logs if in DEBUG mode
@@ -4,11 +4,11 @@ from django.conf import settings
 # Third party imports
 from celery import shared_task
 from sentry_sdk import capture_exception
-from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
 # Module imports
 from plane.db.models import User
+from plane.utils.slack import get_slack_client
 
 
 @shared_task
@@ -18,8 +18,8 @@ def send_welcome_slack(user_id, created, message):
 
         if created and not instance.is_bot:
             # Send message on slack as well
-            if settings.SLACK_BOT_TOKEN:
-                client = WebClient(token=settings.SLACK_BOT_TOKEN)
+            client = get_slack_client()
+            if client is not None:
                 try:
                     _ = client.chat_postMessage(
                         channel="#trackers",
@@ -1,67 +1,78 @@
 # Django imports
-from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
-from django.utils.html import strip_tags
 from django.conf import settings
 
 # Third party imports
 from celery import shared_task
 from sentry_sdk import capture_exception
-from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
 # Module imports
 from plane.db.models import Workspace, WorkspaceMemberInvite
+from plane.utils.mailer import build_email, send_emails
+from plane.utils.slack import get_slack_client
 
 
-@shared_task
-def workspace_invitation(email, workspace_id, token, current_site, invitor):
-    try:
-        workspace = Workspace.objects.get(pk=workspace_id)
-        workspace_member_invite = WorkspaceMemberInvite.objects.get(
-            token=token, email=email
-        )
+def build_invitation_email(workspace, workspace_member_invite, current_site, invitor):
+    email = workspace_member_invite.email
+    realtivelink = (
+        f"/workspace-member-invitation/?invitation_id={workspace_member_invite.id}&email={email}"
+    )
+    abs_url = current_site + realtivelink
 
-        realtivelink = (
-            f"/workspace-member-invitation/?invitation_id={workspace_member_invite.id}&email={email}"
-        )
-        abs_url = current_site + realtivelink
+    subject = f"{invitor or email} invited you to join {workspace.name} on Plane"
 
-        from_email_string = settings.EMAIL_FROM
+    context = {
+        "email": email,
+        "first_name": invitor,
+        "workspace_name": workspace.name,
+        "invitation_url": abs_url,
+    }
 
-        subject = f"{invitor or email} invited you to join {workspace.name} on Plane"
+    return build_email(
+        subject, "emails/invitations/workspace_invitation.html", context, [email]
+    )
 
-        context = {
-            "email": email,
-            "first_name": invitor,
-            "workspace_name": workspace.name,
-            "invitation_url": abs_url,
-        }
 
-        html_content = render_to_string(
-            "emails/invitations/workspace_invitation.html", context
-        )
-
-        text_content = strip_tags(html_content)
-
-        workspace_member_invite.message = text_content
-        workspace_member_invite.save()
-
-        msg = EmailMultiAlternatives(subject, text_content, from_email_string, [email])
-        msg.attach_alternative(html_content, "text/html")
-        msg.send()
+def send_invitations(workspace, invitations, current_site, invitor):
+    """
+    Email the invitations over one connection, EMAIL_BATCH_SIZE at a time,
+    and keep the text of each email as the message of its invitation
+    """
+    for start in range(0, len(invitations), settings.EMAIL_BATCH_SIZE):
+        batch = invitations[start : start + settings.EMAIL_BATCH_SIZE]
+        messages = []
+        for workspace_member_invite in batch:
+            msg = build_invitation_email(
+                workspace, workspace_member_invite, current_site, invitor
+            )
+            workspace_member_invite.message = msg.body
+            messages.append(msg)
+        WorkspaceMemberInvite.objects.bulk_update(batch, ["message"])
+        send_emails(messages)
 
         # Send message on slack as well
-        if settings.SLACK_BOT_TOKEN:
-            client = WebClient(token=settings.SLACK_BOT_TOKEN)
+        client = get_slack_client()
+        if client is not None:
             try:
                 _ = client.chat_postMessage(
                     channel="#trackers",
-                    text=f"{workspace_member_invite.email} has been invited to {workspace.name} as a {workspace_member_invite.role}",
+                    text="\n".join(
+                        f"{workspace_member_invite.email} has been invited to {workspace.name} as a {workspace_member_invite.role}"
+                        for workspace_member_invite in batch
+                    ),
                 )
             except SlackApiError as e:
                 print(f"Got an error: {e.response['error']}")
 
+
+@shared_task
+def workspace_invitation(email, workspace_id, token, current_site, invitor):
+    try:
+        workspace = Workspace.objects.get(pk=workspace_id)
+        workspace_member_invite = WorkspaceMemberInvite.objects.get(
+            token=token, email=email
+        )
+        send_invitations(workspace, [workspace_member_invite], current_site, invitor)
         return
     except (Workspace.DoesNotExist, WorkspaceMemberInvite.DoesNotExist) as e:
         return
@@ -71,3 +82,24 @@ def workspace_invitation(email, workspace_id, token, current_site, invitor):
             print(e)
         capture_exception(e)
         return
+
+
+@shared_task
+def workspace_invitations(workspace_id, invitation_ids, current_site, invitor):
+    try:
+        workspace = Workspace.objects.get(pk=workspace_id)
+        invitations = list(
+            WorkspaceMemberInvite.objects.filter(
+                workspace_id=workspace_id, pk__in=invitation_ids
+            ).order_by("email")
+        )
+        send_invitations(workspace, invitations, current_site, invitor)
+        return
+    except Workspace.DoesNotExist as e:
+        return
+    except Exception as e:
+        # Print logs if in DEBUG mode
+        if settings.DEBUG:
+            print(e)
+        capture_exception(e)
+        return
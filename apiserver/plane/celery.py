@@ -2,6 +2,10 @@ import os
 from celery import Celery
 from plane.settings.redis import redis_instance
 from celery.schedules import crontab
+from celery.signals import task_prerun, task_postrun
+from kombu import Queue
+from plane.utils.query_tracker import start_task_tracking, stop_task_tracking
+from plane.utils.task_queues import get_queue_names
 
 # Set the default Django settings module for the 'celery' program.
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "plane.settings.production")
@@ -14,6 +18,10 @@ app = Celery("plane")
 # pickle the object when using Windows.
 app.config_from_object("django.conf:settings", namespace="CELERY")
 
+# Workers started without -Q consume every queue tasks are routed to, the
+# interactive ones first
+app.conf.task_queues = [Queue(name) for name in get_queue_names()]
+
 app.conf.beat_schedule = {
     # Executes every day at 12 AM
     "check-every-day-to-archive-and-close": {
@@ -24,9 +32,25 @@ app.conf.beat_schedule = {
         "task": "plane.bgtasks.exporter_expired_task.delete_old_s3_link",
         "schedule": crontab(hour=0, minute=0),
     },
+    "check-every-day-to-delete-orphaned-files": {
+        "task": "plane.bgtasks.exporter_expired_task.delete_orphaned_files",
+        "schedule": crontab(hour=0, minute=30),
+    },
+    "check-every-day-to-maintain-partitions": {
+        "task": "plane.bgtasks.partition_maintenance_task.maintain_partitions",
+        "schedule": crontab(hour=1, minute=0),
+    },
+    "check-every-day-to-delete-issue-tombstones": {
+        "task": "plane.bgtasks.deletion_task.delete_old_issue_tombstones",
+        "schedule": crontab(hour=1, minute=30),
+    },
 }
 
 # Load task modules from all registered Django app configs.
 app.autodiscover_tasks()
 
 app.conf.beat_scheduler = 'django_celery_beat.schedulers.DatabaseScheduler'
+
+# Track the queries of every task
+task_prerun.connect(start_task_tracking)
+task_postrun.connect(stop_task_tracking)
@@ -0,0 +1,138 @@
+# Python imports
+import uuid
+from datetime import timedelta
+
+# Django imports
+from django.core.management import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Count
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import (
+    Issue,
+    IssueActivity,
+    IssueSequence,
+    Notification,
+    Project,
+    Workspace,
+)
+
+# Models whose composite indexes are compared
+INDEXED_MODELS = [Issue, IssueSequence, IssueActivity, Notification]
+
+
+class Command(BaseCommand):
+    """
+    Print the plans of the hot queries with and without the composite
+    indexes. The indexes are dropped inside a transaction that is rolled
+    back, so only run this against a local or benchmark database. The
+    plans are most telling against a seeded workspace, without one the
+    largest project is used, or placeholder ids on an empty database.
+    """
+
+    help = "Compare query plans with and without the composite indexes"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "workspace",
+            nargs="?",
+            help="Slug of the workspace, the one with the most issues by default",
+        )
+        parser.add_argument(
+            "--analyze",
+            action="store_true",
+            help="Run EXPLAIN ANALYZE and report the actual timings",
+        )
+
+    def get_queries(self, workspace):
+        projects = Project.objects.annotate(issue_count=Count("project_issue"))
+        if workspace is not None:
+            projects = projects.filter(workspace=workspace)
+        project = (
+            projects.filter(issue_count__gt=0).order_by("-issue_count").first()
+        )
+        issue = Issue.objects.filter(project=project).first() if project else None
+
+        # The plans only need ids of the right type
+        workspace_id = project.workspace_id if project else uuid.uuid4()
+        project_id = project.id if project else uuid.uuid4()
+        state_id = issue.state_id if issue else uuid.uuid4()
+        sequence_id = issue.sequence_id if issue else 1
+        issue_id = issue.id if issue else uuid.uuid4()
+        user_id = (
+            Workspace.objects.filter(pk=workspace_id)
+            .values_list("owner_id", flat=True)
+            .first()
+            or uuid.uuid4()
+        )
+        if project is None:
+            self.stderr.write(
+                "No issues to explain against, the plans use placeholder ids. "
+                "Seed a workspace for representative plans."
+            )
+
+        return {
+            "Issues of a state": Issue.issue_objects.filter(
+                workspace_id=workspace_id, project_id=project_id, state_id=state_id
+            ),
+            "Issue by sequence id": Issue.objects.filter(
+                project_id=project_id, sequence_id=sequence_id
+            ),
+            "Next sequence id": IssueSequence.objects.filter(project_id=project_id)
+            .order_by("-sequence")
+            .values("sequence")[:1],
+            "Largest sort order": Issue.objects.filter(
+                project_id=project_id, state_id=state_id
+            )
+            .order_by("-sort_order")
+            .values("sort_order")[:1],
+            "Issue activity": IssueActivity.objects.filter(issue_id=issue_id).order_by(
+                "created_at"
+            ),
+            "User activity graph": IssueActivity.objects.filter(
+                actor_id=user_id,
+                workspace_id=workspace_id,
+                created_at__gte=timezone.now() - timedelta(days=180),
+            ),
+            "Unread notifications": Notification.objects.filter(
+                receiver_id=user_id,
+                workspace_id=workspace_id,
+                read_at__isnull=True,
+                archived_at__isnull=True,
+            ),
+        }
+
+    def handle(self, *args, **options):
+        workspace = None
+        if options["workspace"]:
+            try:
+                workspace = Workspace.objects.get(slug=options["workspace"])
+            except Workspace.DoesNotExist:
+                raise CommandError(f"Workspace {options['workspace']} does not exist")
+
+        queries = self.get_queries(workspace)
+        explain_options = {"analyze": True} if options["analyze"] else {}
+        index_names = [
+            index.name for model in INDEXED_MODELS for index in model._meta.indexes
+        ]
+
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                for name in index_names:
+                    cursor.execute(
+                        f"DROP INDEX IF EXISTS {connection.ops.quote_name(name)}"
+                    )
+            before = {
+                label: queryset.explain(**explain_options)
+                for label, queryset in queries.items()
+            }
+            transaction.set_rollback(True)
+
+        for label, queryset in queries.items():
+            self.stdout.write(self.style.MIGRATE_HEADING(label))
+            self.stdout.write("Without indexes:")
+            self.stdout.write(before[label])
+            self.stdout.write("With indexes:")
+            self.stdout.write(queryset.explain(**explain_options))
+            self.stdout.write("")
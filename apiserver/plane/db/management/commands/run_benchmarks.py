@@ -0,0 +1,652 @@
+# Python imports
+import copy
+import json
+import platform
+import socketserver
+import statistics
+import threading
+import time
+import uuid
+from unittest import mock
+
+# Django imports
+import django
+from django.core.management import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.core.mail import EmailMultiAlternatives
+from django.db.models import Count, F, Q
+from django.template.loader import render_to_string
+from django.test import override_settings
+from django.utils import timezone
+from django.utils.html import strip_tags
+
+# Third party imports
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+# Module imports
+from plane.api.serializers import IssueActivitySerializer, IssueLiteSerializer
+from plane.api.serializers.compiled import serialize_compiled
+from plane.api.views import InviteWorkspaceEndpoint, IssueViewSet
+from plane.bgtasks.analytic_plot_export import (
+    generate_csv_from_rows,
+    generate_segmented_rows,
+)
+from plane.bgtasks.export_task import issue_export_task
+from plane.bgtasks.notification_task import notifications
+from plane.db.models import (
+    Cycle,
+    ExporterHistory,
+    Issue,
+    IssueActivity,
+    Module,
+    Project,
+    State,
+    Workspace,
+)
+from plane.utils.analytics_plot import build_graph_plot, burndown_plot
+from plane.utils.grouper import group_results
+from plane.utils import html_processor
+from plane.utils.mailer import build_email, close_mail_connection, send_emails
+from plane.utils.query_tracker import QueryTracker
+
+# group_by values sent by the web app
+GROUP_BY = [
+    None,
+    "state",
+    "priority",
+    "labels",
+    "assignees",
+    "created_by",
+    "state_detail.group",
+]
+
+# (x_axis, y_axis, segment) combinations of the analytics page
+GRAPH_PLOTS = [
+    ("state_id", "issue_count", None),
+    ("priority", "issue_count", "state__group"),
+    ("labels__id", "issue_count", None),
+    ("assignees__id", "estimate", "priority"),
+    ("created_at", "issue_count", None),
+    ("completed_at", "issue_count", "priority"),
+]
+
+EXPORT_PROVIDERS = ["csv", "json", "xlsx"]
+
+# Paragraphs of the generated description, about 200kB of html
+LARGE_DESCRIPTION_PARAGRAPHS = 2000
+
+# Issue saves timed together in a save case
+ISSUE_SAVES = 100
+
+# Activities serialized in a serialize case, about the size of a feed
+ACTIVITY_SERIALIZE_LIMIT = 1000
+
+# Assignees on the x axis and labels in the segments of the analytic export
+ANALYTIC_EXPORT_ASSIGNEES = 1000
+ANALYTIC_EXPORT_LABELS = 200
+
+# Invitations sent in an email case
+EMAIL_MESSAGES = 500
+
+# Emails of the bulk invite request, users are created for them as well
+INVITE_EMAILS = 1000
+
+
+class SMTPSinkHandler(socketserver.StreamRequestHandler):
+    """Accepts and drops every message, the SMTP server of the email cases"""
+
+    def reply(self, line):
+        # Every reply waits for the round trip to the emulated server
+        time.sleep(self.server.latency)
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        self.reply("220 localhost")
+        for line in self.rfile:
+            command = line[:4].upper()
+            if command == b"DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                for data in self.rfile:
+                    if data == b".\r\n":
+                        break
+                self.reply("250 Queued")
+            elif command == b"QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("250 OK")
+
+
+def start_smtp_sink(latency=0):
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), SMTPSinkHandler)
+    server.daemon_threads = True
+    server.latency = latency
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class Command(BaseCommand):
+    """
+    Time the hot paths against a seeded workspace (see seed_workspace) and
+    store the timings and query counts as JSON. Passing the output of an
+    earlier run with --compare reports the regressions between the two.
+    Cases that write run inside a transaction that is rolled back.
+    """
+
+    help = "Benchmark the hot paths against a seeded workspace"
+
+    def add_arguments(self, parser):
+        parser.add_argument("workspace", help="Slug of the seeded workspace")
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument(
+            "--only",
+            action="append",
+            default=[],
+            help="Only run the cases whose name contains this value",
+        )
+        parser.add_argument(
+            "--tag",
+            default="local",
+            help="Version or branch the results are recorded for",
+        )
+        parser.add_argument(
+            "--smtp-latency",
+            type=float,
+            default=0,
+            help="Milliseconds the SMTP sink of the email cases waits before "
+            "every reply, the round trip to a real server",
+        )
+        parser.add_argument("--output", help="Write the results to this file")
+        parser.add_argument(
+            "--compare", help="Results of an earlier run to compare against"
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.2,
+            help="Relative slowdown of the median reported as a regression",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            workspace = Workspace.objects.get(slug=options["workspace"])
+        except Workspace.DoesNotExist:
+            raise CommandError(f"Workspace {options['workspace']} does not exist")
+
+        project = (
+            Project.objects.filter(workspace=workspace)
+            .annotate(issue_count=Count("project_issue"))
+            .order_by("-issue_count")
+            .first()
+        )
+        if project is None or not project.issue_count:
+            raise CommandError("The workspace has no issues to benchmark against")
+
+        results = {}
+        cases = self.get_cases(workspace, project, options["smtp_latency"] / 1000)
+        for name, (setup, case) in cases.items():
+            if options["only"] and not any(
+                value in name for value in options["only"]
+            ):
+                continue
+            results[name] = self.measure(name, setup, case, options["repeat"])
+            self.stdout.write(
+                f"{name:<52} {results[name]['median_ms']:>10.2f} ms "
+                f"{results[name]['queries']:>6} queries"
+            )
+
+        report = {
+            "tag": options["tag"],
+            "created_at": timezone.now(),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "repeat": options["repeat"],
+            "dataset": {
+                "workspace": workspace.slug,
+                "project": str(project.id),
+                "project_issues": project.issue_count,
+                "workspace_issues": Issue.objects.filter(workspace=workspace).count(),
+                "issue_activities": IssueActivity.objects.filter(
+                    workspace=workspace
+                ).count(),
+            },
+            "results": results,
+        }
+
+        if options["output"]:
+            with open(options["output"], "w") as output:
+                json.dump(report, output, indent=2, cls=DjangoJSONEncoder)
+            self.stdout.write(f"Results written to {options['output']}")
+
+        if options["compare"]:
+            with open(options["compare"]) as baseline:
+                self.compare(json.load(baseline), report, options["threshold"])
+
+    def measure(self, name, setup, case, repeat):
+        """Run the case once to warm up, then `repeat` times under a tracker"""
+        context = setup()
+        case(context)
+
+        timings = []
+        for _ in range(max(repeat, 1)):
+            with QueryTracker(name) as tracker:
+                start = time.perf_counter()
+                case(context)
+                timings.append((time.perf_counter() - start) * 1000)
+
+        return {
+            "min_ms": round(min(timings), 2),
+            "median_ms": round(statistics.median(timings), 2),
+            "mean_ms": round(statistics.mean(timings), 2),
+            "max_ms": round(max(timings), 2),
+            "queries": tracker.count,
+            "db_ms": round(tracker.duration * 1000, 2),
+            "duplicate_queries": sum(
+                count for count, _ in tracker.duplicates.values()
+            ),
+        }
+
+    def compare(self, baseline, report, threshold):
+        regressions = []
+        self.stdout.write(
+            self.style.MIGRATE_HEADING(
+                f"Compared with {baseline.get('tag')} ({baseline.get('created_at')})"
+            )
+        )
+        for name, result in report["results"].items():
+            previous = baseline.get("results", {}).get(name)
+            if previous is None:
+                continue
+
+            change = (result["median_ms"] - previous["median_ms"]) / max(
+                previous["median_ms"], 0.01
+            )
+            queries = result["queries"] - previous["queries"]
+            line = (
+                f"{name:<52} {previous['median_ms']:>10.2f} -> "
+                f"{result['median_ms']:>10.2f} ms ({change:+.0%}) "
+                f"queries {queries:+d}"
+            )
+            if change > threshold or queries > 0:
+                regressions.append(name)
+                self.stdout.write(self.style.ERROR(line))
+            else:
+                self.stdout.write(line)
+
+        if regressions:
+            raise CommandError(f"Regressions in {', '.join(regressions)}")
+
+    def get_cases(self, workspace, project, smtp_latency=0):
+        """
+        Return the cases as name -> (setup, case). setup runs once outside
+        of the timings and its return value is passed to every run.
+        """
+        user = workspace.owner
+        slug = workspace.slug
+        cases = {}
+
+        factory = APIRequestFactory()
+        issue_list = IssueViewSet.as_view({"get": "list"})
+
+        def list_issues(params):
+            request = factory.get(
+                f"/api/workspaces/{slug}/projects/{project.id}/issues/", params
+            )
+            force_authenticate(request, user=user)
+            response = issue_list(request, slug=slug, project_id=project.id)
+            if response.status_code != 200:
+                raise CommandError(f"Issue list returned {response.status_code}")
+            return response.render().data
+
+        for group_by in GROUP_BY:
+            params = {"group_by": group_by} if group_by else {}
+            cases[f"issue_list:{group_by or 'ungrouped'}"] = (
+                lambda params=params: params,
+                list_issues,
+            )
+
+        for group_by in GROUP_BY[1:]:
+            cases[f"group_results:{group_by}"] = (
+                lambda: list_issues({}),
+                lambda issues, group_by=group_by: group_results(issues, group_by),
+            )
+
+        issues = Issue.issue_objects.filter(workspace__slug=slug)
+        for x_axis, y_axis, segment in GRAPH_PLOTS:
+            name = f"build_graph_plot:{x_axis}:{y_axis}"
+            cases[f"{name}:{segment}" if segment else name] = (
+                lambda: issues,
+                lambda queryset, x_axis=x_axis, y_axis=y_axis, segment=segment: (
+                    build_graph_plot(
+                        queryset=queryset,
+                        x_axis=x_axis,
+                        y_axis=y_axis,
+                        segment=segment,
+                    )
+                ),
+            )
+
+        cycle = (
+            Cycle.objects.filter(
+                project=project, start_date__isnull=False, end_date__isnull=False
+            )
+            .annotate(
+                total_issues=Count(
+                    "issue_cycle",
+                    filter=Q(
+                        issue_cycle__issue__archived_at__isnull=True,
+                        issue_cycle__issue__is_draft=False,
+                    ),
+                )
+            )
+            .order_by("-total_issues")
+            .first()
+        )
+        if cycle is not None:
+            cases["burndown_plot:cycle"] = (
+                lambda: cycle,
+                lambda cycle: burndown_plot(
+                    queryset=cycle, slug=slug, project_id=project.id, cycle_id=cycle.id
+                ),
+            )
+
+        module = (
+            Module.objects.filter(
+                project=project, start_date__isnull=False, target_date__isnull=False
+            )
+            .annotate(
+                total_issues=Count(
+                    "issue_module",
+                    filter=Q(
+                        issue_module__issue__archived_at__isnull=True,
+                        issue_module__issue__is_draft=False,
+                    ),
+                )
+            )
+            .order_by("-total_issues")
+            .first()
+        )
+        if module is not None:
+            cases["burndown_plot:module"] = (
+                lambda: module,
+                lambda module: burndown_plot(
+                    queryset=module,
+                    slug=slug,
+                    project_id=project.id,
+                    module_id=module.id,
+                ),
+            )
+
+        def export_issues(provider):
+            with transaction.atomic():
+                exporter = ExporterHistory.objects.create(
+                    workspace=workspace,
+                    project=[project.id],
+                    provider=provider,
+                    initiated_by=user,
+                )
+                # Only the file generation is timed, nothing is uploaded
+                with mock.patch("plane.bgtasks.export_task.upload_to_s3"):
+                    issue_export_task(
+                        provider=provider,
+                        workspace_id=workspace.id,
+                        project_ids=[project.id],
+                        token_id=exporter.token,
+                        multiple=False,
+                        slug=slug,
+                    )
+                exporter.refresh_from_db()
+                if exporter.status == "failed":
+                    raise CommandError(f"Export failed: {exporter.reason}")
+                transaction.set_rollback(True)
+
+        for provider in EXPORT_PROVIDERS:
+            cases[f"issue_export_task:{provider}"] = (
+                lambda provider=provider: provider,
+                export_issues,
+            )
+
+        def notification_payload():
+            issue = (
+                Issue.issue_objects.filter(project=project)
+                .annotate(assignee_count=Count("assignees"))
+                .order_by("-assignee_count", "-created_at")
+                .first()
+            )
+            activities = IssueActivity.objects.filter(issue=issue).order_by(
+                "-created_at"
+            )[:3]
+            mentioned = project.project_projectmember.exclude(member=user).first()
+            mention = (
+                f'<mention-component target="users" id="{mentioned.member_id}">'
+                "</mention-component>"
+                if mentioned is not None
+                else ""
+            )
+            return {
+                "type": "issue.activity.updated",
+                "issue_id": str(issue.id),
+                "project_id": str(project.id),
+                "actor_id": str(user.id),
+                "subscriber": False,
+                "issue_activities_created": json.dumps(
+                    IssueActivitySerializer(activities, many=True).data,
+                    cls=DjangoJSONEncoder,
+                ),
+                "requested_data": json.dumps(
+                    {"description_html": f"{issue.description_html}{mention}"}
+                ),
+                "current_instance": json.dumps(
+                    {"description_html": issue.description_html}
+                ),
+            }
+
+        def send_notifications(payload):
+            with transaction.atomic():
+                notifications(**payload)
+                transaction.set_rollback(True)
+
+        cases["notifications"] = (notification_payload, send_notifications)
+
+        def large_description():
+            members = list(
+                project.project_projectmember.values_list("member_id", flat=True)
+            ) or [user.id]
+            return "".join(
+                f"<p>Paragraph {index} with <strong>bold</strong>, <em>emphasis</em>, "
+                f"<a href=\"https://plane.so/{index}\">a link</a> &amp; "
+                f'<mention-component target="users" id="{members[index % len(members)]}">'
+                "</mention-component></p>"
+                for index in range(LARGE_DESCRIPTION_PARAGRAPHS)
+            )
+
+        def process_uncached(html):
+            html_processor.cache.clear()
+            return html_processor.process_html(html)
+
+        cases["process_html:large"] = (large_description, process_uncached)
+        cases["process_html:cached"] = (
+            large_description,
+            html_processor.process_html,
+        )
+
+        def issue_to_save():
+            issue = Issue.issue_objects.filter(project=project).first()
+            states = {
+                state.group: state for state in State.objects.filter(project=project)
+            }
+            return issue, states
+
+        def save_issues(save):
+            def case(context):
+                issue, states = context
+                with transaction.atomic():
+                    for index in range(ISSUE_SAVES):
+                        # A fresh copy of the loaded issue, as in a request
+                        save(copy.copy(issue), states, index)
+                    transaction.set_rollback(True)
+
+            return case
+
+        def move_issue(issue, states, index):
+            issue.state = states["completed" if index % 2 else "started"]
+            issue.save()
+
+        def create_issue(issue, states, index):
+            Issue(name=f"Benchmark {index}", project_id=project.id).save()
+
+        cases["issue_save:updated_at"] = (
+            issue_to_save,
+            save_issues(lambda issue, *_: issue.save(update_fields=["updated_at"])),
+        )
+        cases["issue_save:unchanged"] = (
+            issue_to_save,
+            save_issues(lambda issue, *_: issue.save()),
+        )
+        cases["issue_save:state"] = (issue_to_save, save_issues(move_issue))
+        cases["issue_save:create"] = (issue_to_save, save_issues(create_issue))
+
+        serialized = {
+            "issue_lite": (
+                IssueLiteSerializer,
+                lambda: Issue.issue_objects.filter(project=project)
+                .annotate(cycle_id=F("issue_cycle__cycle_id"))
+                .annotate(module_id=F("issue_module__module_id"))
+                .select_related("project", "workspace", "state", "parent")
+                .prefetch_related("assignees", "labels", "issue_reactions"),
+            ),
+            "issue_activity": (
+                IssueActivitySerializer,
+                lambda: IssueActivity.objects.filter(project=project)
+                .select_related("actor", "workspace", "issue", "project")
+                .order_by("-created_at")[:ACTIVITY_SERIALIZE_LIMIT],
+            ),
+        }
+        for name, (serializer_class, queryset) in serialized.items():
+            cases[f"serialize:{name}:serializer"] = (
+                queryset,
+                lambda queryset, serializer_class=serializer_class: (
+                    serializer_class(queryset.all(), many=True).data
+                ),
+            )
+            cases[f"serialize:{name}:compiled"] = (
+                queryset,
+                lambda queryset, serializer_class=serializer_class: (
+                    serialize_compiled(serializer_class, queryset.all())
+                ),
+            )
+
+        def analytic_distribution():
+            # Generated, the size of the export matters and not the data
+            assignees = [uuid.uuid4() for _ in range(ANALYTIC_EXPORT_ASSIGNEES)]
+            labels = [uuid.uuid4() for _ in range(ANALYTIC_EXPORT_LABELS)]
+            distribution = {
+                str(assignee): [
+                    {"dimension": assignee, "segment": label, "count": index % 7}
+                    for index, label in enumerate(labels)
+                ]
+                for assignee in assignees
+            }
+            return (
+                distribution,
+                {str(assignee): f"User {assignee.hex[:6]}" for assignee in assignees},
+                {str(label): f"Label {label.hex[:6]}" for label in labels},
+            )
+
+        def smtp_sink():
+            server = start_smtp_sink(smtp_latency)
+            return override_settings(
+                EMAIL_BACKEND="django.core.mail.backends.smtp.EmailBackend",
+                EMAIL_HOST="127.0.0.1",
+                EMAIL_PORT=server.server_address[1],
+                EMAIL_HOST_USER="",
+                EMAIL_HOST_PASSWORD="",
+                EMAIL_USE_TLS=False,
+                EMAIL_USE_SSL=False,
+            )
+
+        invitation_template = "emails/invitations/workspace_invitation.html"
+
+        def invitation_context(index):
+            return {
+                "email": f"user-{index}@plane.so",
+                "first_name": user.first_name,
+                "workspace_name": workspace.name,
+                "invitation_url": f"https://plane.so/invitation/{index}",
+            }
+
+        def send_invitations_per_message(settings_override):
+            # A rendered template and an SMTP connection per message
+            with settings_override:
+                for index in range(EMAIL_MESSAGES):
+                    html_content = render_to_string(
+                        invitation_template, invitation_context(index)
+                    )
+                    msg = EmailMultiAlternatives(
+                        "Invitation",
+                        strip_tags(html_content),
+                        "team@plane.so",
+                        [f"user-{index}@plane.so"],
+                    )
+                    msg.attach_alternative(html_content, "text/html")
+                    msg.send()
+
+        def send_invitations_batched(settings_override):
+            with settings_override:
+                close_mail_connection()
+                send_emails(
+                    build_email(
+                        "Invitation",
+                        invitation_template,
+                        invitation_context(index),
+                        [f"user-{index}@plane.so"],
+                    )
+                    for index in range(EMAIL_MESSAGES)
+                )
+                close_mail_connection()
+
+        cases["emails:invitations:per_message"] = (
+            smtp_sink,
+            send_invitations_per_message,
+        )
+        cases["emails:invitations:batched"] = (smtp_sink, send_invitations_batched)
+
+        invite_workspace = InviteWorkspaceEndpoint.as_view()
+
+        def invite_emails():
+            return [
+                {"email": f"invite-{uuid.uuid4().hex[:12]}@plane.so", "role": 10}
+                for _ in range(INVITE_EMAILS)
+            ]
+
+        def send_invites(emails):
+            request = factory.post(
+                f"/api/workspaces/{slug}/invite/", {"emails": emails}, format="json"
+            )
+            force_authenticate(request, user=user)
+            # Only the request is timed, the emails are sent by a worker
+            with transaction.atomic(), override_settings(
+                DOCKERIZED=True, ENABLE_SIGNUP=False
+            ), mock.patch("plane.api.views.workspace.workspace_invitations"):
+                response = invite_workspace(request, slug=slug)
+                if response.status_code != 200:
+                    raise CommandError(f"Invite returned {response.status_code}")
+                transaction.set_rollback(True)
+
+        cases[f"invite_workspace:{INVITE_EMAILS}"] = (invite_emails, send_invites)
+
+        cases["analytic_export_rows:assignees:labels"] = (
+            analytic_distribution,
+            lambda context: generate_csv_from_rows(
+                generate_segmented_rows(
+                    context[0],
+                    "assignees__id",
+                    "issue_count",
+                    "count",
+                    context[1],
+                    context[2],
+                )
+            ),
+        )
+        return cases
@@ -0,0 +1,505 @@
+# Python imports
+import random
+import uuid
+from datetime import timedelta
+
+# Django imports
+from django.core.management import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+# Third party imports
+from dateutil.relativedelta import relativedelta
+from faker import Faker
+
+# Module imports
+from plane.db.models import (
+    Cycle,
+    CycleIssue,
+    Issue,
+    IssueActivity,
+    IssueAssignee,
+    IssueLabel,
+    IssueSequence,
+    Label,
+    Module,
+    ModuleIssue,
+    Notification,
+    Project,
+    ProjectIdentifier,
+    ProjectMember,
+    State,
+    User,
+    Workspace,
+    WorkspaceMember,
+)
+from plane.db.models.state import invalidate_project_states
+
+# Same states as a newly created project, with the share of issues in each
+DEFAULT_STATES = [
+    ("Backlog", "#A3A3A3", 15000, "backlog", 0.2),
+    ("Todo", "#3A3A3A", 25000, "unstarted", 0.25),
+    ("In Progress", "#F59E0B", 35000, "started", 0.15),
+    ("Done", "#16A34A", 45000, "completed", 0.35),
+    ("Cancelled", "#EF4444", 55000, "cancelled", 0.05),
+]
+
+PRIORITIES = ["urgent", "high", "medium", "low", "none"]
+
+MODULE_STATUSES = [
+    "backlog",
+    "planned",
+    "in-progress",
+    "paused",
+    "completed",
+    "cancelled",
+]
+
+ACTIVITY_FIELDS = ["state", "priority", "assignees", "labels", "target_date", "name"]
+
+
+class Command(BaseCommand):
+    """
+    Seed a workspace with synthetic data at a configurable scale so the
+    hot paths can be profiled and benchmarked locally. The data is generated
+    from a fixed seed, the same options always produce the same workspace.
+    Rows are written with bulk_create, so model save hooks and signals
+    don't run and the derived rows (issue sequences, ...) are written here.
+    """
+
+    help = "Seed a workspace with synthetic projects, issues and activity"
+
+    def add_arguments(self, parser):
+        parser.add_argument("slug", help="Slug of the workspace to create")
+        parser.add_argument("--projects", type=int, default=5)
+        parser.add_argument("--members", type=int, default=25)
+        parser.add_argument(
+            "--issues",
+            type=int,
+            default=100000,
+            help="Total number of issues, spread evenly across the projects",
+        )
+        parser.add_argument("--labels", type=int, default=20, help="Per project")
+        parser.add_argument("--cycles", type=int, default=12, help="Per project")
+        parser.add_argument("--modules", type=int, default=10, help="Per project")
+        parser.add_argument(
+            "--activities", type=int, default=5, help="Average per issue"
+        )
+        parser.add_argument(
+            "--notifications", type=int, default=2, help="Average per issue"
+        )
+        parser.add_argument(
+            "--months",
+            type=int,
+            default=12,
+            help="The data is spread over this many past months",
+        )
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        if Workspace.objects.filter(slug=options["slug"]).exists():
+            raise CommandError(f"Workspace {options['slug']} already exists")
+
+        self.random = random.Random(options["seed"])
+        self.fake = Faker()
+        self.fake.seed_instance(options["seed"])
+        self.batch_size = options["batch_size"]
+        self.now = timezone.now()
+        self.start = self.now - relativedelta(months=options["months"])
+
+        with transaction.atomic():
+            workspace, members = self.create_workspace(
+                options["slug"], options["members"]
+            )
+        self.stdout.write(f"Created workspace {workspace.slug}")
+
+        issues_per_project = options["issues"] // max(options["projects"], 1)
+        for index in range(options["projects"]):
+            with transaction.atomic():
+                project = self.create_project(workspace, members, index)
+                self.create_issues(
+                    project,
+                    members,
+                    issues_per_project,
+                    labels=options["labels"],
+                    cycles=options["cycles"],
+                    modules=options["modules"],
+                    activities=options["activities"],
+                    notifications=options["notifications"],
+                )
+            self.stdout.write(
+                f"Created project {project.identifier} with "
+                f"{issues_per_project} issues"
+            )
+
+        self.stdout.write(self.style.SUCCESS(f"Seeded workspace {workspace.slug}"))
+
+    def random_datetime(self, start, end):
+        return start + (end - start) * self.random.random()
+
+    def bulk_create(self, model, objects, backdate=False):
+        """
+        Insert the objects in batches. created_at is auto_now_add so Django
+        overwrites it on insert, backdated rows are updated afterwards.
+        """
+        created_at = [(obj.created_at, obj.id) for obj in objects]
+        model.objects.bulk_create(objects, batch_size=self.batch_size)
+        if backdate and objects:
+            qn = connection.ops.quote_name
+            with connection.cursor() as cursor:
+                cursor.executemany(
+                    f"UPDATE {qn(model._meta.db_table)} SET created_at = %s "
+                    "WHERE id = %s",
+                    created_at,
+                )
+
+    def create_workspace(self, slug, member_count):
+        users = []
+        for index in range(max(member_count, 1)):
+            first_name = self.fake.first_name()
+            last_name = self.fake.last_name()
+            user = User(
+                username=uuid.uuid4().hex,
+                email=f"{slug}-{index}@example.com",
+                first_name=first_name,
+                last_name=last_name,
+                display_name=f"{first_name.lower()}{index}",
+                is_onboarded=True,
+            )
+            user.set_unusable_password()
+            users.append(user)
+        User.objects.bulk_create(users, batch_size=self.batch_size)
+
+        owner = users[0]
+        workspace = Workspace.objects.create(
+            name=slug.replace("-", " ").title(),
+            slug=slug,
+            owner=owner,
+            organization_size="500+",
+        )
+        WorkspaceMember.objects.bulk_create(
+            [
+                WorkspaceMember(
+                    workspace=workspace,
+                    member=user,
+                    role=20 if user == owner else 15 if index < 3 else 10,
+                    created_by=owner,
+                )
+                for index, user in enumerate(users)
+            ],
+            batch_size=self.batch_size,
+        )
+        return workspace, users
+
+    def create_project(self, workspace, members, index):
+        owner = workspace.owner
+        identifier = f"BENCH{index}"[:12]
+        project = Project.objects.create(
+            name=f"{self.fake.catch_phrase()[:200]} {index}",
+            identifier=identifier,
+            workspace=workspace,
+            project_lead=owner,
+            created_by=owner,
+        )
+        ProjectIdentifier.objects.create(
+            workspace=workspace, project=project, name=identifier
+        )
+        ProjectMember.objects.bulk_create(
+            [
+                ProjectMember(
+                    project=project,
+                    workspace=workspace,
+                    member=member,
+                    role=20 if member == owner else 10,
+                    created_by=owner,
+                )
+                for member in members
+            ]
+        )
+        return project
+
+    def project_row(self, model, project, **kwargs):
+        kwargs.setdefault("created_by", project.created_by)
+        return model(project=project, workspace_id=project.workspace_id, **kwargs)
+
+    def create_issues(
+        self,
+        project,
+        members,
+        count,
+        labels,
+        cycles,
+        modules,
+        activities,
+        notifications,
+    ):
+        rng = self.random
+        states = [
+            self.project_row(
+                State,
+                project,
+                name=name,
+                color=color,
+                sequence=sequence,
+                group=group,
+                default=group == "backlog",
+            )
+            for name, color, sequence, group, _ in DEFAULT_STATES
+        ]
+        State.objects.bulk_create(states)
+        invalidate_project_states(project.id)
+        state_weights = [weight for *_, weight in DEFAULT_STATES]
+
+        label_rows = [
+            self.project_row(
+                Label,
+                project,
+                name=f"{self.fake.word()}-{index}",
+                color=self.fake.hex_color(),
+            )
+            for index in range(labels)
+        ]
+        Label.objects.bulk_create(label_rows)
+
+        # Back to back cycles over the whole period
+        cycle_rows = []
+        if cycles:
+            length = (self.now - self.start) / cycles
+            for index in range(cycles):
+                start = self.start + length * index
+                cycle_rows.append(
+                    self.project_row(
+                        Cycle,
+                        project,
+                        name=f"Cycle {index + 1}",
+                        start_date=start.date(),
+                        end_date=(start + length).date(),
+                        owned_by=rng.choice(members),
+                        sort_order=65535 - index * 10000,
+                    )
+                )
+            Cycle.objects.bulk_create(cycle_rows)
+
+        module_rows = []
+        for index in range(modules):
+            start = self.random_datetime(self.start, self.now)
+            module_rows.append(
+                self.project_row(
+                    Module,
+                    project,
+                    name=f"{self.fake.bs()[:200]} {index}",
+                    start_date=start.date(),
+                    target_date=(start + timedelta(days=rng.randint(14, 120))).date(),
+                    status=rng.choice(MODULE_STATUSES),
+                    lead=rng.choice(members),
+                    sort_order=65535 - index * 10000,
+                )
+            )
+        Module.objects.bulk_create(module_rows)
+
+        created = sorted(self.random_datetime(self.start, self.now) for _ in range(count))
+        issue_ids = []
+        for offset in range(0, count, self.batch_size):
+            batch = created[offset : offset + self.batch_size]
+            issues = []
+            related = {
+                IssueSequence: [],
+                IssueAssignee: [],
+                IssueLabel: [],
+                CycleIssue: [],
+                ModuleIssue: [],
+                IssueActivity: [],
+                Notification: [],
+            }
+
+            for position, created_at in enumerate(batch, start=offset + 1):
+                state = rng.choices(states, weights=state_weights)[0]
+                creator = rng.choice(members)
+                mentioned = rng.choice(members) if rng.random() < 0.1 else None
+                description = self.fake.paragraph(nb_sentences=rng.randint(1, 6))
+                description_html = f"<p>{description}</p>"
+                if mentioned is not None:
+                    description_html += (
+                        f'<p><mention-component target="users" '
+                        f'id="{mentioned.id}" label="{mentioned.display_name}">'
+                        "</mention-component></p>"
+                    )
+                target_date = (
+                    (created_at + timedelta(days=rng.randint(1, 60))).date()
+                    if rng.random() < 0.5
+                    else None
+                )
+                issue = self.project_row(
+                    Issue,
+                    project,
+                    name=self.fake.sentence(nb_words=rng.randint(3, 10))[:255],
+                    description_html=description_html,
+                    description_stripped=description,
+                    state=state,
+                    priority=rng.choice(PRIORITIES),
+                    sequence_id=position,
+                    sort_order=65535 + position * 10000,
+                    start_date=created_at.date() if target_date else None,
+                    target_date=target_date,
+                    estimate_point=rng.choice([None, 0, 1, 2, 3, 5]),
+                    parent_id=(
+                        rng.choice(issue_ids)
+                        if issue_ids and rng.random() < 0.1
+                        else None
+                    ),
+                    completed_at=(
+                        min(
+                            created_at + timedelta(hours=rng.randint(1, 720)),
+                            self.now,
+                        )
+                        if state.group == "completed"
+                        else None
+                    ),
+                    created_by=creator,
+                    created_at=created_at,
+                )
+                issues.append(issue)
+                related[IssueSequence].append(
+                    self.project_row(
+                        IssueSequence, project, issue=issue, sequence=position
+                    )
+                )
+
+                assignees = rng.sample(members, k=min(rng.randint(0, 2), len(members)))
+                for assignee in assignees:
+                    related[IssueAssignee].append(
+                        self.project_row(
+                            IssueAssignee, project, issue=issue, assignee=assignee
+                        )
+                    )
+                for label in rng.sample(
+                    label_rows, k=min(rng.randint(0, 3), len(label_rows))
+                ):
+                    related[IssueLabel].append(
+                        self.project_row(IssueLabel, project, issue=issue, label=label)
+                    )
+                if cycle_rows and rng.random() < 0.5:
+                    related[CycleIssue].append(
+                        self.project_row(
+                            CycleIssue,
+                            project,
+                            issue=issue,
+                            cycle=rng.choice(cycle_rows),
+                        )
+                    )
+                if module_rows and rng.random() < 0.4:
+                    related[ModuleIssue].append(
+                        self.project_row(
+                            ModuleIssue,
+                            project,
+                            issue=issue,
+                            module=rng.choice(module_rows),
+                        )
+                    )
+
+                related[IssueActivity].extend(
+                    self.issue_activities(
+                        project, issue, members, rng.randint(0, activities * 2)
+                    )
+                )
+                receivers = (assignees or [creator]) + (
+                    [mentioned] if mentioned else []
+                )
+                related[Notification].extend(
+                    self.issue_notifications(
+                        project,
+                        issue,
+                        members,
+                        receivers,
+                        rng.randint(0, notifications * 2),
+                    )
+                )
+
+            self.bulk_create(Issue, issues, backdate=True)
+            issue_ids.extend(issue.id for issue in issues)
+            for model, rows in related.items():
+                self.bulk_create(
+                    model,
+                    rows,
+                    backdate=model in [IssueActivity, Notification],
+                )
+
+    def issue_activities(self, project, issue, members, count):
+        activities = [
+            self.project_row(
+                IssueActivity,
+                project,
+                issue=issue,
+                actor=issue.created_by,
+                verb="created",
+                comment="created the issue",
+                created_at=issue.created_at,
+                epoch=issue.created_at.timestamp(),
+            )
+        ]
+        for _ in range(count):
+            created_at = self.random_datetime(issue.created_at, self.now)
+            field = self.random.choice(ACTIVITY_FIELDS)
+            activities.append(
+                self.project_row(
+                    IssueActivity,
+                    project,
+                    issue=issue,
+                    actor=self.random.choice(members),
+                    verb="updated",
+                    field=field,
+                    old_value=self.fake.word(),
+                    new_value=self.fake.word(),
+                    comment=f"updated the {field} to",
+                    created_at=created_at,
+                    epoch=created_at.timestamp(),
+                )
+            )
+        return activities
+
+    def issue_notifications(self, project, issue, members, receivers, count):
+        notifications = []
+        for _ in range(count):
+            created_at = self.random_datetime(issue.created_at, self.now)
+            field = self.random.choice(ACTIVITY_FIELDS)
+            actor = self.random.choice(members)
+            notifications.append(
+                Notification(
+                    workspace_id=project.workspace_id,
+                    project=project,
+                    sender="in_app:issue_activities:assigned",
+                    triggered_by=actor,
+                    receiver=self.random.choice(receivers),
+                    entity_identifier=issue.id,
+                    entity_name="issue",
+                    title=f"updated the {field} to",
+                    data={
+                        "issue": {
+                            "id": str(issue.id),
+                            "name": issue.name,
+                            "identifier": project.identifier,
+                            "sequence_id": issue.sequence_id,
+                            "state_name": issue.state.name,
+                            "state_group": issue.state.group,
+                        },
+                        "issue_activity": {
+                            "id": str(uuid.UUID(int=self.random.getrandbits(128))),
+                            "verb": "updated",
+                            "field": field,
+                            "actor": str(actor.id),
+                            "new_value": self.fake.word(),
+                            "old_value": self.fake.word(),
+                            "issue_comment": "",
+                        },
+                    },
+                    read_at=(
+                        self.random_datetime(created_at, self.now)
+                        if self.random.random() < 0.6
+                        else None
+                    ),
+                    created_by=project.created_by,
+                    created_at=created_at,
+                )
+            )
+        return notifications
@@ -0,0 +1,174 @@
+# Generated by Django 4.2.5 on 2023-10-20 10:12
+
+from datetime import timedelta
+
+from django.db import migrations, transaction
+from django.utils import timezone
+from dateutil.relativedelta import relativedelta
+
+from plane.utils.partitions import (
+    PARTITIONED_TABLES,
+    create_monthly_partitions,
+    default_partition_name,
+    is_partitioned,
+    month_start,
+)
+
+# Number of monthly partitions created ahead of the cutover
+PRECREATE_MONTHS = 3
+
+
+def legacy_name(name):
+    # Keep identifiers inside the 63 character postgres limit
+    return f"{name[:55]}_legacy"
+
+
+def partition_table(schema_editor, table, cutover):
+    """
+    Convert the table into a range partitioned table on created_at.
+
+    The existing heap is not rewritten: it is renamed and attached as the
+    partition holding every row before the cutover. The check constraint and
+    the (id, created_at) unique index are built up front without blocking
+    writes, so the swap itself only holds a short exclusive lock.
+    """
+    connection = schema_editor.connection
+    qn = connection.ops.quote_name
+    legacy = legacy_name(table)
+    check = f"{table}_created_at_cutover_check"
+    unique = f"{table}_id_created_at_uniq"
+
+    with connection.cursor() as cursor:
+        # Left behind by an interrupted run
+        cursor.execute(
+            f"ALTER TABLE {qn(table)} DROP CONSTRAINT IF EXISTS {qn(check)}"
+        )
+        cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {qn(unique)}")
+
+        cursor.execute(
+            f"ALTER TABLE {qn(table)} ADD CONSTRAINT {qn(check)} "
+            "CHECK (created_at < %s) NOT VALID",
+            [cutover.isoformat()],
+        )
+        cursor.execute(f"ALTER TABLE {qn(table)} VALIDATE CONSTRAINT {qn(check)}")
+        cursor.execute(
+            f"CREATE UNIQUE INDEX CONCURRENTLY {qn(unique)} "
+            f"ON {qn(table)} (id, created_at)"
+        )
+
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        cursor.execute("SET LOCAL lock_timeout = '10s'")
+        cursor.execute(f"LOCK TABLE {qn(table)} IN ACCESS EXCLUSIVE MODE")
+
+        # Foreign keys and secondary indexes are recreated on the parent
+        cursor.execute(
+            """
+            SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint
+            WHERE conrelid = to_regclass(%s) AND contype = 'f'
+            """,
+            [table],
+        )
+        foreign_keys = cursor.fetchall()
+        cursor.execute(
+            """
+            SELECT indexrelid::regclass::text, pg_get_indexdef(indexrelid),
+                   indisprimary OR indisunique
+            FROM pg_index WHERE indrelid = to_regclass(%s)
+            """,
+            [table],
+        )
+        indexes = cursor.fetchall()
+        cursor.execute(
+            """
+            SELECT conname, contype FROM pg_constraint
+            WHERE conrelid = to_regclass(%s)
+            """,
+            [table],
+        )
+        constraints = cursor.fetchall()
+
+        cursor.execute(f"ALTER TABLE {qn(table)} RENAME TO {qn(legacy)}")
+        for name, kind in constraints:
+            if name == check:
+                continue
+            if kind == "p":
+                # The prebuilt (id, created_at) index becomes the primary key
+                # so attaching matches it instead of building a new one
+                cursor.execute(
+                    f"ALTER TABLE {qn(legacy)} DROP CONSTRAINT {qn(name)}"
+                )
+                cursor.execute(
+                    f"ALTER TABLE {qn(legacy)} ADD CONSTRAINT "
+                    f"{qn(legacy_name(table + '_pkey'))} "
+                    f"PRIMARY KEY USING INDEX {qn(unique)}"
+                )
+                continue
+            cursor.execute(
+                f"ALTER TABLE {qn(legacy)} RENAME CONSTRAINT {qn(name)} "
+                f"TO {qn(legacy_name(name))}"
+            )
+        constraint_indexes = {name for name, _ in constraints} | {unique}
+        for name, _, _ in indexes:
+            if name not in constraint_indexes:
+                cursor.execute(
+                    f"ALTER INDEX {qn(name)} RENAME TO {qn(legacy_name(name))}"
+                )
+
+        cursor.execute(
+            f"CREATE TABLE {qn(table)} (LIKE {qn(legacy)} INCLUDING DEFAULTS) "
+            "PARTITION BY RANGE (created_at)"
+        )
+        cursor.execute(
+            f"ALTER TABLE {qn(table)} ADD CONSTRAINT {qn(table + '_pkey')} "
+            "PRIMARY KEY (id, created_at)"
+        )
+        for name, definition in foreign_keys:
+            cursor.execute(
+                f"ALTER TABLE {qn(table)} ADD CONSTRAINT {qn(name)} {definition}"
+            )
+        for _, definition, is_unique in indexes:
+            # Unique indexes must contain the partition key, the only one
+            # left on these tables is the primary key recreated above
+            if not is_unique:
+                cursor.execute(definition)
+
+        cursor.execute(
+            f"ALTER TABLE {qn(table)} ATTACH PARTITION {qn(legacy)} "
+            "FOR VALUES FROM (MINVALUE) TO (%s)",
+            [cutover.isoformat()],
+        )
+        cursor.execute(f"ALTER TABLE {qn(legacy)} DROP CONSTRAINT {qn(check)}")
+        cursor.execute(
+            f"CREATE TABLE {qn(default_partition_name(table))} "
+            f"PARTITION OF {qn(table)} DEFAULT"
+        )
+
+    create_monthly_partitions(table, cutover, PRECREATE_MONTHS, using=connection)
+
+
+def partition_tables(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    # Leave at least a day between the cutover and now so that rows written
+    # while the check constraint validates never violate it
+    cutover = month_start(timezone.now() + timedelta(days=1)) + relativedelta(
+        months=1
+    )
+    for table in PARTITIONED_TABLES:
+        if not is_partitioned(table, using=schema_editor.connection):
+            partition_table(schema_editor, table, cutover)
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("db", "0046_alter_analyticview_created_by_and_more"),
+    ]
+
+    operations = [
+        # The partitioned tables keep every column the models expect, so the
+        # reverse migration leaves them partitioned
+        migrations.RunPython(partition_tables, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 4.2.5 on 2023-10-23 09:41
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+from plane.utils.partitions import AddPartitionedIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("db", "0047_partition_issue_activities_notifications"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="issue",
+            index=models.Index(
+                condition=models.Q(("archived_at__isnull", True), ("is_draft", False)),
+                fields=["workspace", "project", "state"],
+                name="issue_active_state_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="issue",
+            index=models.Index(
+                fields=["project", "sequence_id"], name="issue_project_sequence_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="issue",
+            index=models.Index(
+                fields=["project", "state", "sort_order"],
+                name="issue_state_sort_order_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="issuesequence",
+            index=models.Index(
+                fields=["project", "sequence"], name="issue_sequence_project_idx"
+            ),
+        ),
+        AddPartitionedIndexConcurrently(
+            model_name="issueactivity",
+            index=models.Index(
+                fields=["issue", "created_at"], name="issue_activity_issue_idx"
+            ),
+        ),
+        AddPartitionedIndexConcurrently(
+            model_name="issueactivity",
+            index=models.Index(
+                fields=["actor", "created_at"], name="issue_activity_actor_idx"
+            ),
+        ),
+        AddPartitionedIndexConcurrently(
+            model_name="notification",
+            index=models.Index(
+                fields=["receiver", "workspace", "read_at", "archived_at"],
+                name="notification_receiver_idx",
+            ),
+        ),
+    ]
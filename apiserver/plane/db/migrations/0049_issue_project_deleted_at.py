@@ -0,0 +1,23 @@
+# Generated by Django 4.2.5 on 2023-10-25 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("db", "0048_issue_activity_notification_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="issue",
+            name="deleted_at",
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="deleted_at",
+            field=models.DateTimeField(null=True),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 4.2.5 on 2023-10-26 08:47
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0049_issue_project_deleted_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImporterChunk',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('sequence', models.PositiveIntegerField(default=0)),
+                ('data', models.JSONField(default=list)),
+                ('processed_at', models.DateTimeField(null=True)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('importer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='chunks', to='db.importer')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_%(class)s', to='db.project')),
+                ('updated_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Last Modified By')),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='workspace_%(class)s', to='db.workspace')),
+            ],
+            options={
+                'verbose_name': 'Importer Chunk',
+                'verbose_name_plural': 'Importer Chunks',
+                'db_table': 'importer_chunks',
+                'ordering': ('sequence',),
+            },
+        ),
+        migrations.AddIndex(
+            model_name='importerchunk',
+            index=models.Index(condition=models.Q(('processed_at__isnull', True)), fields=['importer', 'sequence'], name='importer_chunk_pending_idx'),
+        ),
+    ]
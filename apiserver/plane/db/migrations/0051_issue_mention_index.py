@@ -0,0 +1,57 @@
+# Generated by Django 4.2.5 on 2023-10-27 10:12
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0050_importer_chunks'),
+    ]
+
+    operations = [
+        migrations.RenameModel(
+            old_name='issue_mentions',
+            new_name='IssueMention',
+        ),
+        migrations.AlterModelOptions(
+            name='issuemention',
+            options={'ordering': ('-created_at',), 'verbose_name': 'Issue Mention', 'verbose_name_plural': 'Issue Mentions'},
+        ),
+        migrations.RunSQL(
+            """
+            DELETE FROM issue_mentions a USING issue_mentions b
+            WHERE a.issue_id = b.issue_id
+            AND a.mention_id = b.mention_id
+            AND a.ctid > b.ctid;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddField(
+            model_name='issuemention',
+            name='comment',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='comment_mention', to='db.issuecomment'),
+        ),
+        migrations.AddField(
+            model_name='issuemention',
+            name='notified_at',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.AddConstraint(
+            model_name='issuemention',
+            constraint=models.UniqueConstraint(condition=models.Q(('comment__isnull', True)), fields=('issue', 'mention'), name='issue_mention_description_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='issuemention',
+            constraint=models.UniqueConstraint(condition=models.Q(('comment__isnull', False)), fields=('comment', 'mention'), name='issue_mention_comment_unique'),
+        ),
+        migrations.AddIndex(
+            model_name='issuemention',
+            index=models.Index(fields=['workspace', 'mention'], name='issue_mention_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='issuemention',
+            index=models.Index(condition=models.Q(('notified_at__isnull', True)), fields=['issue'], name='issue_mention_pending_idx'),
+        ),
+    ]
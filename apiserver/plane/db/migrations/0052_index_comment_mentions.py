@@ -0,0 +1,82 @@
+# Generated by Django 4.2.5 on 2023-10-27 10:14
+
+from uuid import UUID
+
+from django.db import migrations
+
+from plane.utils.html_processor import process_html
+
+
+def index_mentions(apps, schema_editor):
+    Issue = apps.get_model("db", "Issue")
+    IssueComment = apps.get_model("db", "IssueComment")
+    IssueMention = apps.get_model("db", "IssueMention")
+    WorkspaceMember = apps.get_model("db", "WorkspaceMember")
+
+    members = set(WorkspaceMember.objects.values_list("workspace_id", "member_id"))
+
+    def mentions(html, workspace_id):
+        for mention in process_html(html).mentions:
+            try:
+                mention = UUID(mention)
+            except ValueError:
+                continue
+            if (workspace_id, mention) in members:
+                yield mention
+
+    # Comment mentions were never stored, the description ones already are
+    IssueMention.objects.bulk_create(
+        (
+            IssueMention(
+                issue_id=comment["issue_id"],
+                comment_id=comment["id"],
+                mention_id=mention,
+                project_id=comment["project_id"],
+                workspace_id=comment["workspace_id"],
+                notified_at=comment["created_at"],
+            )
+            for comment in IssueComment.objects.filter(
+                comment_html__contains="mention-component"
+            )
+            .values("id", "issue_id", "project_id", "workspace_id", "comment_html", "created_at")
+            .iterator()
+            for mention in mentions(comment["comment_html"], comment["workspace_id"])
+        ),
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+    IssueMention.objects.bulk_create(
+        (
+            IssueMention(
+                issue_id=issue["id"],
+                mention_id=mention,
+                project_id=issue["project_id"],
+                workspace_id=issue["workspace_id"],
+                notified_at=issue["updated_at"],
+            )
+            for issue in Issue.objects.filter(
+                description_html__contains="mention-component"
+            )
+            .values("id", "project_id", "workspace_id", "description_html", "updated_at")
+            .iterator()
+            for mention in mentions(issue["description_html"], issue["workspace_id"])
+        ),
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0051_issue_mention_index'),
+    ]
+
+    operations = [
+        # The existing mentions were notified when they were created
+        migrations.RunSQL(
+            "UPDATE issue_mentions SET notified_at = created_at;",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RunPython(index_mentions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 4.2.5 on 2023-10-28 10:12
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0052_index_comment_mentions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IssueTombstone',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('issue_id', models.UUIDField()),
+                ('project_id', models.UUIDField()),
+                ('workspace_id', models.UUIDField()),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('updated_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Last Modified By')),
+            ],
+            options={
+                'verbose_name': 'Issue Tombstone',
+                'verbose_name_plural': 'Issue Tombstones',
+                'db_table': 'issue_tombstones',
+                'ordering': ('-created_at',),
+                'indexes': [
+                    models.Index(fields=['project_id', 'created_at'], name='issue_tombstone_project_idx'),
+                    models.Index(fields=['created_at'], name='issue_tombstone_created_idx'),
+                ],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['project', 'updated_at', 'id'], name='issue_project_updated_idx'),
+        ),
+    ]
@@ -33,6 +33,7 @@ from .issue import (
     IssueBlocker,
     IssueRelation,
     IssueMention,
+    IssueTombstone,
     IssueLink,
     IssueSequence,
     IssueAttachment,
@@ -42,7 +43,7 @@ from .issue import (
     IssueVote,
 )
 
-from .asset import FileAsset
+from .asset import FileAsset, DeletedFile
 
 from .social_connection import SocialLoginConnection
 
@@ -66,7 +67,7 @@ from .integration import (
     SlackProjectSync,
 )
 
-from .importer import Importer
+from .importer import Importer, ImporterChunk
 
 from .page import Page, PageBlock, PageFavorite, PageLabel
 
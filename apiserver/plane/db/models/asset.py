@@ -45,3 +45,41 @@ class FileAsset(BaseModel):
 
     def __str__(self):
         return str(self.asset)
+
+    @classmethod
+    def record_deleted(cls, pks):
+        DeletedFile.record(cls, pks)
+
+
+class DeletedFile(BaseModel):
+    """
+    Storage key of a file whose row was removed without deleting the file,
+    by a cascade delete. delete_orphaned_files removes it from the bucket.
+    """
+
+    key = models.CharField(max_length=800)
+
+    class Meta:
+        verbose_name = "Deleted File"
+        verbose_name_plural = "Deleted Files"
+        db_table = "deleted_files"
+        ordering = ("created_at",)
+
+    def __str__(self):
+        return self.key
+
+    @classmethod
+    def record(cls, model, pks):
+        """
+        Keep the files of the rows of model about to be removed. Called by
+        cascade_delete in the transaction removing the rows, so the file of
+        a row that is kept is never deleted from the bucket.
+        """
+        cls.objects.bulk_create(
+            [
+                cls(key=key)
+                for key in model._base_manager.filter(pk__in=pks)
+                .exclude(asset="")
+                .values_list("asset", flat=True)
+            ]
+        )
@@ -44,3 +44,34 @@ class Importer(ProjectBaseModel):
     def __str__(self):
         """Return name of the service"""
         return f"{self.service} <{self.project.name}>"
+
+
+class ImporterChunk(ProjectBaseModel):
+    """
+    A slice of an import payload waiting to be loaded. The import job works
+    through the unprocessed chunks in order, so a failed import resumes
+    from the first chunk that was not loaded.
+    """
+
+    importer = models.ForeignKey(
+        Importer, on_delete=models.CASCADE, related_name="chunks"
+    )
+    sequence = models.PositiveIntegerField(default=0)
+    data = models.JSONField(default=list)
+    processed_at = models.DateTimeField(null=True)
+
+    class Meta:
+        verbose_name = "Importer Chunk"
+        verbose_name_plural = "Importer Chunks"
+        db_table = "importer_chunks"
+        ordering = ("sequence",)
+        indexes = [
+            models.Index(
+                fields=["importer", "sequence"],
+                name="importer_chunk_pending_idx",
+                condition=models.Q(processed_at__isnull=True),
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.importer_id} <{self.sequence}>"
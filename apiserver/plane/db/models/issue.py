@@ -1,19 +1,21 @@
 # Python import
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 # Django imports
 from django.contrib.postgres.fields import ArrayField
 from django.db import models
 from django.conf import settings
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.core.exceptions import ValidationError
 
 # Module imports
-from . import ProjectBaseModel
-from plane.utils.html_processor import strip_tags
+from . import BaseModel, ProjectBaseModel
+from .asset import DeletedFile
+from .state import State, get_project_states, invalidate_project_states
+from plane.utils.html_processor import process_html, strip_tags
 
 
 def get_default_properties():
@@ -48,6 +50,7 @@ class IssueManager(models.Manager):
             )
             .exclude(archived_at__isnull=False)
             .exclude(is_draft=True)
+            .filter(deleted_at__isnull=True, project__deleted_at__isnull=True)
         )
 
 
@@ -103,6 +106,8 @@ class Issue(ProjectBaseModel):
     completed_at = models.DateTimeField(null=True)
     archived_at = models.DateField(null=True)
     is_draft = models.BooleanField(default=False)
+    # Set when the deletion is requested, the rows are removed in the background
+    deleted_at = models.DateTimeField(null=True)
 
     objects = models.Manager()
     issue_objects = IssueManager()
@@ -112,68 +117,166 @@ class Issue(ProjectBaseModel):
         verbose_name_plural = "Issues"
         db_table = "issues"
         ordering = ("-created_at",)
+        indexes = [
+            # Board and list queries always go through issue_objects
+            models.Index(
+                fields=["workspace", "project", "state"],
+                name="issue_active_state_idx",
+                condition=models.Q(archived_at__isnull=True, is_draft=False),
+            ),
+            models.Index(
+                fields=["project", "sequence_id"], name="issue_project_sequence_idx"
+            ),
+            # Largest sort order lookup when an issue is created
+            models.Index(
+                fields=["project", "state", "sort_order"],
+                name="issue_state_sort_order_idx",
+            ),
+            # Issues changed since a sync cursor
+            models.Index(
+                fields=["project", "updated_at", "id"],
+                name="issue_project_updated_idx",
+            ),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # The save compares with these to skip the work derived from them
+        instance._loaded_values = {
+            attname: instance.__dict__[attname]
+            for attname in ("state_id", "description_html")
+            if attname in instance.__dict__
+        }
+        return instance
+
+    def has_changed(self, attname):
+        loaded_values = getattr(self, "_loaded_values", {})
+        return (
+            attname not in loaded_values
+            or loaded_values[attname] != getattr(self, attname)
+        )
+
+    @classmethod
+    def record_deleted(cls, pks):
+        """
+        Leave tombstones for issues removed without the delete signals. The
+        issues of a deleted project need none, the whole project is gone.
+        """
+        IssueTombstone.objects.bulk_create(
+            [
+                IssueTombstone(
+                    issue_id=issue["id"],
+                    project_id=issue["project_id"],
+                    workspace_id=issue["workspace_id"],
+                )
+                for issue in cls._base_manager.filter(
+                    pk__in=pks, project__deleted_at__isnull=True
+                ).values("id", "project_id", "workspace_id")
+            ]
+        )
+
+    def get_state_group(self, state_id):
+        for state in get_project_states(self.project_id):
+            if state["id"] == state_id:
+                return state["group"]
+        # Not in the cached states of the project
+        invalidate_project_states(self.project_id)
+        return (
+            State.objects.filter(pk=state_id).values_list("group", flat=True).first()
+        )
 
     def save(self, *args, **kwargs):
+        from plane.db.models import PageBlock
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            update_fields = set(update_fields)
+
+        def updates(field):
+            return update_fields is None or bool(
+                {field.name, field.attname} & update_fields
+            )
+
+        state_field = self._meta.get_field("state")
+        description_field = self._meta.get_field("description_html")
+
         # This means that the model isn't saved to the database yet
-        if self.state is None:
-            try:
-                from plane.db.models import State
-
-                default_state = State.objects.filter(
-                    ~models.Q(name="Triage"), project=self.project, default=True
-                ).first()
-                # if there is no default state assign any random state
-                if default_state is None:
-                    random_state = State.objects.filter(
-                        ~models.Q(name="Triage"), project=self.project
-                    ).first()
-                    self.state = random_state
-                else:
-                    self.state = default_state
-            except ImportError:
-                pass
-        else:
-            try:
-                from plane.db.models import State, PageBlock
-
-                # Check if the current issue state and completed state id are same
-                if self.state.group == "completed":
-                    self.completed_at = timezone.now()
-                    # check if there are any page blocks
-                    PageBlock.objects.filter(issue_id=self.id).filter().update(
-                        completed_at=timezone.now()
-                    )
-                else:
-                    PageBlock.objects.filter(issue_id=self.id).filter().update(
-                        completed_at=None
+        if self.state_id is None:
+            states = [
+                state
+                for state in get_project_states(self.project_id)
+                if state["name"] != "Triage"
+            ]
+            # if there is no default state assign any random state
+            default_state = next(
+                (state for state in states if state["default"]), None
+            ) or next(iter(states), None)
+            if default_state is not None:
+                self.state_id = default_state["id"]
+        elif updates(state_field) and (
+            self._state.adding or self.has_changed("state_id")
+        ):
+            completed = self.get_state_group(self.state_id) == "completed"
+            loaded_state_id = getattr(self, "_loaded_values", {}).get("state_id")
+            was_completed = (
+                None
+                if self._state.adding or loaded_state_id is None
+                else self.get_state_group(loaded_state_id) == "completed"
+            )
+            # Page blocks and completed_at only follow the state group
+            if completed != was_completed:
+                self.completed_at = timezone.now() if completed else None
+                if not self._state.adding:
+                    PageBlock.objects.filter(issue_id=self.id).update(
+                        completed_at=self.completed_at
                     )
-                    self.completed_at = None
+                if update_fields is not None:
+                    update_fields.add("completed_at")
 
-            except ImportError:
-                pass
         if self._state.adding:
             # Get the maximum display_id value from the database
-            last_id = IssueSequence.objects.filter(project=self.project).aggregate(
-                largest=models.Max("sequence")
-            )["largest"]
+            last_id = IssueSequence.objects.filter(
+                project_id=self.project_id
+            ).aggregate(largest=models.Max("sequence"))["largest"]
             # aggregate can return None! Check it first.
             # If it isn't none, just use the last ID specified (which should be the greatest) and add one to it
             if last_id is not None:
                 self.sequence_id = last_id + 1
 
             largest_sort_order = Issue.objects.filter(
-                project=self.project, state=self.state
+                project_id=self.project_id, state_id=self.state_id
             ).aggregate(largest=models.Max("sort_order"))["largest"]
             if largest_sort_order is not None:
                 self.sort_order = largest_sort_order + 10000
 
-        # Strip the html tags using html parser
-        self.description_stripped = (
-            None
-            if (self.description_html == "" or self.description_html is None)
-            else strip_tags(self.description_html)
+        description_changed = updates(description_field) and (
+            self._state.adding or self.has_changed("description_html")
         )
+        if description_changed:
+            # Strip the html tags using html parser
+            self.description_stripped = (
+                None
+                if (self.description_html == "" or self.description_html is None)
+                else strip_tags(self.description_html)
+            )
+            if update_fields is not None:
+                update_fields.add("description_stripped")
+
+        if update_fields is not None:
+            kwargs["update_fields"] = update_fields
+        adding = self._state.adding
         super(Issue, self).save(*args, **kwargs)
+        if description_changed:
+            update_mention_index(self, self.id, self.description_html, adding=adding)
+        self._loaded_values = {
+            **getattr(self, "_loaded_values", {}),
+            **{
+                field.attname: getattr(self, field.attname)
+                for field in (state_field, description_field)
+                if updates(field)
+            },
+        }
 
     def __str__(self):
         """Return name of the issue"""
@@ -229,25 +332,129 @@ class IssueRelation(ProjectBaseModel):
         return f"{self.issue.name} {self.related_issue.name}"    
     
 class IssueMention(ProjectBaseModel):
+    """
+    Users mentioned in the description of an issue, or in one of its
+    comments when comment is set. The rows are kept in sync when the issue
+    or comment is saved, notified_at is set once the mention was notified.
+    """
+
     issue = models.ForeignKey(
         Issue, on_delete=models.CASCADE, related_name="issue_mention"
     )
+    comment = models.ForeignKey(
+        "db.IssueComment",
+        on_delete=models.CASCADE,
+        null=True,
+        related_name="comment_mention",
+    )
     mention = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
         related_name="issue_mention",
     )
+    notified_at = models.DateTimeField(null=True)
+
     class Meta:
-        unique_together = ["issue", "mention"]
         verbose_name = "Issue Mention"
         verbose_name_plural = "Issue Mentions"
         db_table = "issue_mentions"
         ordering = ("-created_at",)
+        constraints = [
+            models.UniqueConstraint(
+                fields=["issue", "mention"],
+                condition=models.Q(comment__isnull=True),
+                name="issue_mention_description_unique",
+            ),
+            models.UniqueConstraint(
+                fields=["comment", "mention"],
+                condition=models.Q(comment__isnull=False),
+                name="issue_mention_comment_unique",
+            ),
+        ]
+        indexes = [
+            # Issues mentioning a user
+            models.Index(
+                fields=["workspace", "mention"], name="issue_mention_user_idx"
+            ),
+            # Mentions the notification task has not sent yet
+            models.Index(
+                fields=["issue"],
+                name="issue_mention_pending_idx",
+                condition=models.Q(notified_at__isnull=True),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.issue.name} {self.mention.email}" 
 
 
+def update_mention_index(instance, issue_id, html, comment_id=None, adding=False):
+    """
+    Bring the mentions of a description or comment in line with its html.
+    Only the difference is written and a new document without mentions
+    costs no query at all.
+    """
+    from plane.db.models import WorkspaceMember
+
+    mentions = set()
+    for mention in process_html(html).mentions:
+        try:
+            mentions.add(UUID(mention))
+        except ValueError:
+            pass
+
+    rows = IssueMention.objects.filter(issue_id=issue_id, comment_id=comment_id)
+    existing = set() if adding else set(rows.values_list("mention_id", flat=True))
+
+    if existing - mentions:
+        rows.filter(mention_id__in=existing - mentions).delete()
+
+    if mentions - existing:
+        IssueMention.objects.bulk_create(
+            [
+                IssueMention(
+                    issue_id=issue_id,
+                    comment_id=comment_id,
+                    mention_id=member_id,
+                    project_id=instance.project_id,
+                    workspace_id=instance.workspace_id,
+                )
+                for member_id in WorkspaceMember.objects.filter(
+                    workspace_id=instance.workspace_id,
+                    member_id__in=mentions - existing,
+                ).values_list("member_id", flat=True)
+            ],
+            ignore_conflicts=True,
+        )
+
+
+class IssueTombstone(BaseModel):
+    """
+    Issue removed from the database, kept so that the sync endpoints can
+    report the deletion. Plain ids, the row outlives the issue and can
+    outlive its project until it is pruned.
+    """
+
+    issue_id = models.UUIDField()
+    project_id = models.UUIDField()
+    workspace_id = models.UUIDField()
+
+    class Meta:
+        verbose_name = "Issue Tombstone"
+        verbose_name_plural = "Issue Tombstones"
+        db_table = "issue_tombstones"
+        ordering = ("-created_at",)
+        indexes = [
+            models.Index(
+                fields=["project_id", "created_at"], name="issue_tombstone_project_idx"
+            ),
+            models.Index(fields=["created_at"], name="issue_tombstone_created_idx"),
+        ]
+
+    def __str__(self):
+        return str(self.issue_id)
+
+
 class IssueAssignee(ProjectBaseModel):
     issue = models.ForeignKey(
         Issue, on_delete=models.CASCADE, related_name="issue_assignee"
@@ -318,6 +525,10 @@ class IssueAttachment(ProjectBaseModel):
     def __str__(self):
         return f"{self.issue.name} {self.asset}"
 
+    @classmethod
+    def record_deleted(cls, pks):
+        DeletedFile.record(cls, pks)
+
 
 class IssueActivity(ProjectBaseModel):
     issue = models.ForeignKey(
@@ -353,6 +564,14 @@ class IssueActivity(ProjectBaseModel):
         verbose_name_plural = "Issue Activities"
         db_table = "issue_activities"
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(
+                fields=["issue", "created_at"], name="issue_activity_issue_idx"
+            ),
+            models.Index(
+                fields=["actor", "created_at"], name="issue_activity_actor_idx"
+            ),
+        ]
 
     def __str__(self):
         """Return issue of the comment"""
@@ -387,7 +606,11 @@ class IssueComment(ProjectBaseModel):
         self.comment_stripped = (
             strip_tags(self.comment_html) if self.comment_html != "" else ""
         )
-        return super(IssueComment, self).save(*args, **kwargs)
+        adding = self._state.adding
+        super(IssueComment, self).save(*args, **kwargs)
+        update_mention_index(
+            self, self.issue_id, self.comment_html, comment_id=self.id, adding=adding
+        )
 
     class Meta:
         verbose_name = "Issue Comment"
@@ -473,6 +696,12 @@ class IssueSequence(ProjectBaseModel):
         verbose_name_plural = "Issue Sequences"
         db_table = "issue_sequences"
         ordering = ("-created_at",)
+        indexes = [
+            # Next sequence lookup when an issue is created
+            models.Index(
+                fields=["project", "sequence"], name="issue_sequence_project_idx"
+            ),
+        ]
 
 
 class IssueSubscriber(ProjectBaseModel):
@@ -574,3 +803,12 @@ def create_issue_sequence(sender, instance, created, **kwargs):
         IssueSequence.objects.create(
             issue=instance, sequence=instance.sequence_id, project=instance.project
         )
+
+
+@receiver(post_delete, sender=Issue)
+def create_issue_tombstone(sender, instance, **kwargs):
+    IssueTombstone.objects.create(
+        issue_id=instance.id,
+        project_id=instance.project_id,
+        workspace_id=instance.workspace_id,
+    )
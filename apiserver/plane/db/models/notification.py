@@ -31,6 +31,13 @@ class Notification(BaseModel):
         verbose_name_plural = "Notifications"
         db_table = "notifications"
         ordering = ("-created_at",)
+        indexes = [
+            # Inbox listing and unread counts
+            models.Index(
+                fields=["receiver", "workspace", "read_at", "archived_at"],
+                name="notification_receiver_idx",
+            ),
+        ]
 
     def __str__(self):
         """Return name of the notifications"""
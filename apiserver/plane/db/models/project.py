@@ -5,9 +5,12 @@ from uuid import uuid4
 from django.db import models
 from django.conf import settings
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # Modeule imports
 from plane.db.mixins import AuditModel
+from plane.utils.live_updates import publish_membership_change
 
 # Module imports
 from . import BaseModel
@@ -101,6 +104,8 @@ class Project(BaseModel):
     default_state = models.ForeignKey(
         "db.State", on_delete=models.SET_NULL, null=True, related_name="default_state"
     )
+    # Set when the deletion is requested, the rows are removed in the background
+    deleted_at = models.DateTimeField(null=True)
 
     def __str__(self):
         """Return name of the project"""
@@ -130,7 +135,15 @@ class ProjectBaseModel(BaseModel):
         abstract = True
 
     def save(self, *args, **kwargs):
-        self.workspace = self.project.workspace
+        update_fields = kwargs.get("update_fields")
+        # The workspace follows the project, unless neither of them is saved
+        if update_fields is None or {
+            "project",
+            "project_id",
+            "workspace",
+            "workspace_id",
+        } & set(update_fields):
+            self.workspace_id = self.project.workspace_id
         super(ProjectBaseModel, self).save(*args, **kwargs)
 
 
@@ -279,3 +292,16 @@ class ProjectPublicMember(ProjectBaseModel):
         verbose_name_plural = "Project Public Members"
         db_table = "project_public_members"
         ordering = ("-created_at",)
+
+
+@receiver(post_save, sender=ProjectMember)
+def project_member_added(sender, instance, created, **kwargs):
+    if created and instance.member_id is not None:
+        publish_membership_change(instance.member_id, instance.workspace_id)
+
+
+@receiver(post_delete, sender=ProjectMember)
+def project_member_removed(sender, instance, **kwargs):
+    # The live updates of the project stop for the user
+    if instance.member_id is not None:
+        publish_membership_change(instance.member_id, instance.workspace_id)
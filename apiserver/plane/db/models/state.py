@@ -1,4 +1,5 @@
 # Django imports
+from django.core.cache import cache
 from django.db import models
 from django.template.defaultfilters import slugify
 
@@ -47,4 +48,36 @@ class State(ProjectBaseModel):
             if last_id is not None:
                 self.sequence = last_id + 15000
 
-        return super().save(*args, **kwargs)
+        super().save(*args, **kwargs)
+        invalidate_project_states(self.project_id)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        invalidate_project_states(self.project_id)
+        return result
+
+
+# Seconds the states of a project are cached for
+PROJECT_STATES_CACHE_TIMEOUT = 60 * 60
+
+
+def get_project_states(project_id):
+    """
+    States of a project as dicts ordered by sequence. They are read on
+    every issue save and change rarely, so they are cached until one of
+    them is saved or deleted.
+    """
+    key = f"project_states:{project_id}"
+    states = cache.get(key)
+    if states is None:
+        states = list(
+            State.objects.filter(project_id=project_id).values(
+                "id", "name", "group", "default"
+            )
+        )
+        cache.set(key, states, PROJECT_STATES_CACHE_TIMEOUT)
+    return states
+
+
+def invalidate_project_states(project_id):
+    cache.delete(f"project_states:{project_id}")
@@ -10,13 +10,14 @@ from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.contrib.auth.models import AbstractBaseUser, UserManager, PermissionsMixin
 from django.utils import timezone
-from django.conf import settings
 
 # Third party imports
 from sentry_sdk import capture_exception
-from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
+# Module imports
+from plane.utils.slack import get_slack_client
+
 
 def get_default_onboarding():
     return {
@@ -128,8 +129,8 @@ def send_welcome_slack(sender, instance, created, **kwargs):
     try:
         if created and not instance.is_bot:
             # Send message on slack as well
-            if settings.SLACK_BOT_TOKEN:
-                client = WebClient(token=settings.SLACK_BOT_TOKEN)
+            client = get_slack_client()
+            if client is not None:
                 try:
                     _ = client.chat_postMessage(
                         channel="#trackers",
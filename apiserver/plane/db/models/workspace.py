@@ -1,9 +1,12 @@
 # Django imports
 from django.db import models
 from django.conf import settings
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
 
 # Module imports
 from . import BaseModel
+from plane.utils.live_updates import publish_membership_change
 
 
 ROLE_CHOICES = (
@@ -199,3 +202,9 @@ class WorkspaceTheme(BaseModel):
         verbose_name_plural = "Workspace Themes"
         db_table = "workspace_themes"
         ordering = ("-created_at",)
+
+
+@receiver(post_delete, sender=WorkspaceMember)
+def workspace_member_removed(sender, instance, **kwargs):
+    # The live updates socket of the user in the workspace is closed
+    publish_membership_change(instance.member_id, instance.workspace_id)
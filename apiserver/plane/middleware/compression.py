@@ -0,0 +1,223 @@
+# Python imports
+import zlib
+
+# Django imports
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_sequence, compress_string
+
+# Third party imports
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Mitigation of BREACH on gzip, as in django's GZipMiddleware
+GZIP_MAX_RANDOM_BYTES = 100
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+
+class Encoder:
+    """
+    A content coding. stream_compressor returns the (compress, finish)
+    functions of a stream, compress flushing every chunk so that streams
+    go out as they are written.
+    """
+
+    name = None
+
+    def compress(self, content):
+        raise NotImplementedError
+
+    def stream_compressor(self):
+        raise NotImplementedError
+
+    def compress_stream(self, chunks):
+        compress, finish = self.stream_compressor()
+        for chunk in chunks:
+            data = compress(chunk)
+            if data:
+                yield data
+        yield finish()
+
+    async def acompress_stream(self, chunks):
+        compress, finish = self.stream_compressor()
+        async for chunk in chunks:
+            data = compress(chunk)
+            if data:
+                yield data
+        yield finish()
+
+
+class ZstdEncoder(Encoder):
+    name = "zstd"
+
+    def compressor(self):
+        return zstandard.ZstdCompressor(level=settings.COMPRESSION_ZSTD_LEVEL)
+
+    def compress(self, content):
+        return self.compressor().compress(content)
+
+    def stream_compressor(self):
+        compressor = self.compressor().compressobj()
+        return (
+            lambda chunk: compressor.compress(chunk)
+            + compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK),
+            compressor.flush,
+        )
+
+
+class BrotliEncoder(Encoder):
+    name = "br"
+
+    def compress(self, content):
+        return brotli.compress(content, quality=settings.COMPRESSION_BROTLI_QUALITY)
+
+    def stream_compressor(self):
+        compressor = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+        return (
+            lambda chunk: compressor.process(chunk) + compressor.flush(),
+            compressor.finish,
+        )
+
+
+class GzipEncoder(Encoder):
+    name = "gzip"
+
+    def compress(self, content):
+        return compress_string(content, max_random_bytes=GZIP_MAX_RANDOM_BYTES)
+
+    def compress_stream(self, chunks):
+        return compress_sequence(chunks, max_random_bytes=GZIP_MAX_RANDOM_BYTES)
+
+    def stream_compressor(self):
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        return (
+            lambda chunk: compressor.compress(chunk)
+            + compressor.flush(zlib.Z_SYNC_FLUSH),
+            compressor.flush,
+        )
+
+
+# By preference of the server when the client weighs them the same
+ENCODERS = [
+    encoder
+    for encoder, available in (
+        (ZstdEncoder(), zstandard is not None),
+        (BrotliEncoder(), brotli is not None),
+        (GzipEncoder(), True),
+    )
+    if available
+]
+
+
+def parse_accept_encoding(header):
+    """Accept-Encoding as coding -> q value"""
+    weights = {}
+    for item in header.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        weight = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[coding] = weight
+    return weights
+
+
+def negotiate_encoder(header):
+    """
+    Encoder of the highest q value among the ones the client accepts, the
+    order of ENCODERS breaking ties. None when nothing is acceptable.
+    """
+    weights = parse_accept_encoding(header)
+    best, best_weight = None, 0.0
+    for encoder in ENCODERS:
+        weight = weights.get(encoder.name, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoder, weight
+    return best
+
+
+def is_compressible(content_type):
+    content_type = content_type.split(";")[0].strip().lower()
+    return (
+        content_type.startswith("text/")
+        or content_type in COMPRESSIBLE_TYPES
+        or content_type.endswith("+json")
+        or content_type.endswith("+xml")
+    )
+
+
+class CompressionMiddleware:
+    """
+    Compress the responses with zstd, brotli or gzip, whichever the client
+    prefers and the server has installed. Responses under
+    COMPRESSION_MIN_SIZE bytes, and content types that are already
+    compressed, are sent as they are. Streamed responses are compressed
+    chunk by chunk.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if not settings.COMPRESSION_ENABLED:
+            return response
+
+        if not response.streaming and len(response.content) < (
+            settings.COMPRESSION_MIN_SIZE
+        ):
+            return response
+        if response.has_header("Content-Encoding") or not is_compressible(
+            response.get("Content-Type", "")
+        ):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoder = negotiate_encoder(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if encoder is None:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = encoder.acompress_stream(
+                    response.streaming_content
+                )
+            else:
+                response.streaming_content = encoder.compress_stream(
+                    response.streaming_content
+                )
+            # The compressed size is known once streamed
+            del response.headers["Content-Length"]
+        else:
+            compressed_content = encoder.compress(response.content)
+            if len(compressed_content) >= len(response.content):
+                return response
+            response.content = compressed_content
+            response.headers["Content-Length"] = str(len(response.content))
+
+        # A strong ETag names the exact bytes, the compressed ones differ
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = encoder.name
+        return response
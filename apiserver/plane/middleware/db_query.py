@@ -0,0 +1,34 @@
+# Django imports
+from django.conf import settings
+
+# Module imports
+from plane.utils.query_tracker import QueryTracker
+
+
+class DBQueryTrackingMiddleware:
+    """
+    Track the queries of every request. Staff users get the stats back as
+    response headers, everything else goes to the logs and sentry.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.DB_QUERY_TRACKING:
+            return self.get_response(request)
+
+        with QueryTracker(f"{request.method} {request.path}") as tracker:
+            response = self.get_response(request)
+        stats = tracker.report()
+
+        # DRF copies the authenticated user back onto the django request
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated and user.is_staff:
+            response["X-DB-Query-Count"] = stats["queries"]
+            response["X-DB-Duplicate-Queries"] = sum(stats["duplicates"].values())
+            response["X-DB-N-Plus-One"] = ",".join(
+                item["fingerprint"] for item in stats["n_plus_one"]
+            )
+            response["Server-Timing"] = f"db;dur={stats['duration_ms']}"
+        return response
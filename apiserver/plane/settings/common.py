@@ -48,7 +48,8 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "crum.CurrentRequestUserMiddleware",
-    "django.middleware.gzip.GZipMiddleware",
+    "plane.middleware.db_query.DBQueryTrackingMiddleware",
+    "plane.middleware.compression.CompressionMiddleware",
  ]
 
 REST_FRAMEWORK = {
@@ -56,7 +57,12 @@ REST_FRAMEWORK = {
         "rest_framework_simplejwt.authentication.JWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
-    "DEFAULT_RENDERER_CLASSES": ("rest_framework.renderers.JSONRenderer",),
+    "DEFAULT_RENDERER_CLASSES": ("plane.api.renderers.ORJSONRenderer",),
+    "DEFAULT_PARSER_CLASSES": (
+        "plane.api.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
     "DEFAULT_FILTER_BACKENDS": ("django_filters.rest_framework.DjangoFilterBackend",),
 }
 
@@ -182,6 +188,10 @@ EMAIL_HOST_PASSWORD = os.environ.get("EMAIL_HOST_PASSWORD")
 EMAIL_USE_TLS = os.environ.get("EMAIL_USE_TLS", "1") == "1"
 EMAIL_USE_SSL = os.environ.get("EMAIL_USE_SSL", "0") == "1"
 EMAIL_FROM = os.environ.get("EMAIL_FROM", "Team Plane <team@mailer.plane.so>")
+# Messages sent over an SMTP connection before it is opened again
+EMAIL_BATCH_SIZE = int(os.environ.get("EMAIL_BATCH_SIZE", 100))
+# Seconds a worker keeps an unused SMTP connection open
+EMAIL_CONNECTION_IDLE_TIMEOUT = int(os.environ.get("EMAIL_CONNECTION_IDLE_TIMEOUT", 30))
 
 
 SIMPLE_JWT = {
@@ -214,4 +224,132 @@ SIMPLE_JWT = {
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_ACCEPT_CONTENT = ['application/json']
-CELERY_IMPORTS = ("plane.bgtasks.issue_automation_task","plane.bgtasks.exporter_expired_task")
+CELERY_IMPORTS = ("plane.bgtasks.issue_automation_task","plane.bgtasks.exporter_expired_task","plane.bgtasks.partition_maintenance_task","plane.bgtasks.deletion_task")
+
+# Every workload has its own queue, so that an export or an import never
+# holds back activities and notifications. Workers consume all of them or
+# a profile of them (see bin/worker).
+CELERY_TASK_DEFAULT_QUEUE = "default"
+# With redis a lower number is served first, unset priorities get the default.
+# Long running work is routed at 9 so that a worker consuming every queue
+# takes it after the interactive tasks.
+CELERY_TASK_DEFAULT_PRIORITY = 6
+# Queues by latency class. Within a priority a worker takes the messages of
+# its queues in this order, the queues missing here come last.
+TASK_QUEUE_ORDER = [
+    "activities",
+    "notifications",
+    "emails",
+    "default",
+    "exports",
+    "imports",
+    "maintenance",
+]
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    "priority_steps": [0, 3, 6, 9],
+    "sep": ":",
+    "queue_order_strategy": "priority",
+}
+CELERY_TASK_ROUTES = {
+    # Someone is waiting for these to sign in
+    "plane.bgtasks.magic_link_code_task.*": {"queue": "emails", "priority": 0},
+    "plane.bgtasks.forgot_password_task.*": {"queue": "emails", "priority": 0},
+    "plane.bgtasks.email_verification_task.*": {"queue": "emails", "priority": 0},
+    "plane.bgtasks.workspace_invitation_task.*": {"queue": "emails"},
+    "plane.bgtasks.project_invitation_task.*": {"queue": "emails"},
+    "plane.bgtasks.user_welcome_task.*": {"queue": "emails", "priority": 9},
+    "plane.bgtasks.issue_activites_task.bulk_issue_activity": {
+        "queue": "activities",
+        "priority": 9,
+    },
+    "plane.bgtasks.issue_activites_task.*": {"queue": "activities"},
+    "plane.bgtasks.notification_task.bulk_notifications": {
+        "queue": "notifications",
+        "priority": 9,
+    },
+    "plane.bgtasks.notification_task.*": {"queue": "notifications"},
+    "plane.bgtasks.analytic_plot_export.*": {"queue": "exports", "priority": 9},
+    "plane.bgtasks.export_task.*": {"queue": "exports", "priority": 9},
+    "plane.bgtasks.importer_task.*": {"queue": "imports", "priority": 9},
+    "plane.bgtasks.issue_automation_task.*": {"queue": "maintenance", "priority": 9},
+    "plane.bgtasks.exporter_expired_task.*": {"queue": "maintenance", "priority": 9},
+    "plane.bgtasks.partition_maintenance_task.*": {
+        "queue": "maintenance",
+        "priority": 9,
+    },
+    "plane.bgtasks.deletion_task.*": {"queue": "maintenance", "priority": 9},
+}
+# Seconds a task may run, the soft limit lets it fail cleanly first
+CELERY_TASK_SOFT_TIME_LIMIT = int(os.environ.get("CELERY_TASK_SOFT_TIME_LIMIT", 300))
+CELERY_TASK_TIME_LIMIT = CELERY_TASK_SOFT_TIME_LIMIT + 60
+BULK_TASK_SOFT_TIME_LIMIT = int(os.environ.get("BULK_TASK_SOFT_TIME_LIMIT", 3600))
+CELERY_TASK_ANNOTATIONS = {
+    task: {
+        "soft_time_limit": BULK_TASK_SOFT_TIME_LIMIT,
+        "time_limit": BULK_TASK_SOFT_TIME_LIMIT + 60,
+    }
+    for task in (
+        "plane.bgtasks.export_task.issue_export_task",
+        "plane.bgtasks.analytic_plot_export.analytic_export_task",
+        "plane.bgtasks.importer_task.service_importer",
+        "plane.bgtasks.importer_task.import_issues",
+        "plane.bgtasks.deletion_task.issue_deletion_task",
+        "plane.bgtasks.deletion_task.project_deletion_task",
+        "plane.bgtasks.deletion_task.delete_old_issue_tombstones",
+        "plane.bgtasks.exporter_expired_task.delete_orphaned_files",
+        "plane.bgtasks.partition_maintenance_task.maintain_partitions",
+        "plane.bgtasks.workspace_invitation_task.workspace_invitations",
+        "plane.bgtasks.project_invitation_task.project_invitations",
+    )
+}
+
+# Monthly partitions of issue_activities and notifications
+PARTITION_PRECREATE_MONTHS = int(os.environ.get("PARTITION_PRECREATE_MONTHS", 3))
+# Months of history to keep, 0 keeps every partition
+ISSUE_ACTIVITY_RETENTION_MONTHS = int(os.environ.get("ISSUE_ACTIVITY_RETENTION_MONTHS", 0))
+NOTIFICATION_RETENTION_MONTHS = int(os.environ.get("NOTIFICATION_RETENTION_MONTHS", 0))
+# Expired partitions are only detached unless dropping is enabled
+PARTITION_RETENTION_DROP = os.environ.get("PARTITION_RETENTION_DROP", "0") == "1"
+
+# Query tracking for requests and celery tasks
+DB_QUERY_TRACKING = os.environ.get("DB_QUERY_TRACKING", "1") == "1"
+# Repetitions of the same statement flagged as an N+1
+N_PLUS_ONE_THRESHOLD = int(os.environ.get("N_PLUS_ONE_THRESHOLD", 10))
+# Query count above which a request or task is logged as a warning
+QUERY_COUNT_WARNING_THRESHOLD = int(os.environ.get("QUERY_COUNT_WARNING_THRESHOLD", 100))
+
+# Rows removed per statement by the background deletion jobs
+DELETION_CHUNK_SIZE = int(os.environ.get("DELETION_CHUNK_SIZE", 1000))
+
+# Issues per chunk of a bulk import, each chunk is loaded in one transaction
+IMPORT_CHUNK_SIZE = int(os.environ.get("IMPORT_CHUNK_SIZE", 1000))
+
+# Outgoing requests of the Jira and GitHub importers
+IMPORTER_FETCH_CONCURRENCY = int(os.environ.get("IMPORTER_FETCH_CONCURRENCY", 8))
+IMPORTER_FETCH_TIMEOUT = int(os.environ.get("IMPORTER_FETCH_TIMEOUT", 30))
+GITHUB_API_URL = os.environ.get("GITHUB_API_URL", "https://api.github.com")
+
+# Threads running the independent queries of a dashboard concurrently, each
+# keeps its own database connection open, 0 or 1 runs them one after the other
+QUERY_FANOUT_WORKERS = int(os.environ.get("QUERY_FANOUT_WORKERS", 4))
+# Seconds a worker reuses its connection before opening a new one
+QUERY_FANOUT_CONN_MAX_AGE = int(os.environ.get("QUERY_FANOUT_CONN_MAX_AGE", 60))
+
+# Issues per page of the sync endpoints
+ISSUE_SYNC_PAGE_SIZE = int(os.environ.get("ISSUE_SYNC_PAGE_SIZE", 500))
+# Seconds a sync cursor steps back, for the writes committed after it was made
+ISSUE_SYNC_OVERLAP_SECONDS = int(os.environ.get("ISSUE_SYNC_OVERLAP_SECONDS", 10))
+# Days deleted issues are remembered, older cursors need a full reload
+ISSUE_TOMBSTONE_RETENTION_DAYS = int(os.environ.get("ISSUE_TOMBSTONE_RETENTION_DAYS", 30))
+
+# Change and notification events pushed to the live updates socket
+LIVE_UPDATES_ENABLED = os.environ.get("LIVE_UPDATES_ENABLED", "1") == "1"
+# Events waiting to be sent per socket, a slower socket misses the rest
+LIVE_UPDATES_QUEUE_SIZE = int(os.environ.get("LIVE_UPDATES_QUEUE_SIZE", 100))
+
+# Response compression, zstd and brotli when installed, gzip otherwise
+COMPRESSION_ENABLED = os.environ.get("COMPRESSION_ENABLED", "1") == "1"
+# Bytes under which a response is not worth compressing
+COMPRESSION_MIN_SIZE = int(os.environ.get("COMPRESSION_MIN_SIZE", 1024))
+COMPRESSION_ZSTD_LEVEL = int(os.environ.get("COMPRESSION_ZSTD_LEVEL", 3))
+COMPRESSION_BROTLI_QUALITY = int(os.environ.get("COMPRESSION_BROTLI_QUALITY", 4))
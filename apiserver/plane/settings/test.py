@@ -43,3 +43,7 @@ RQ_QUEUES = {
 }
 
 WEB_URL = "http://localhost:3000"
+
+# Run the tasks in the test process and fail the tests on task errors
+CELERY_TASK_ALWAYS_EAGER = True
+CELERY_TASK_EAGER_PROPAGATES = True
@@ -1,3 +1,6 @@
+# Python imports
+from unittest import mock
+
 # Third party imports
 from rest_framework.test import APITestCase, APIClient
 
@@ -32,3 +35,16 @@ class AuthenticatedAPITest(BaseAPITest):
 
         # Set Up Authentication Token
         self.client.credentials(HTTP_AUTHORIZATION="Bearer " + access_token)
+
+
+def retried_eagerly(task):
+    """
+    Run the task eagerly along with its retries, which the propagated task
+    errors of the test settings would stop at the first one.
+    """
+    apply = task.apply
+    return mock.patch.object(
+        task,
+        "apply",
+        side_effect=lambda *args, **kwargs: apply(*args, **{**kwargs, "throw": False}),
+    )
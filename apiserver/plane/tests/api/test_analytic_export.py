@@ -0,0 +1,70 @@
+# Python imports
+import csv
+import io
+import uuid
+
+# Django imports
+from django.core import mail
+from django.test import TestCase
+
+# Module imports
+from plane.bgtasks.analytic_plot_export import analytic_export_task
+from plane.db.models import (
+    Issue,
+    IssueAssignee,
+    IssueLabel,
+    Label,
+    Project,
+    State,
+    User,
+    Workspace,
+)
+
+
+class AnalyticExportTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(
+            email="user@plane.so",
+            username=uuid.uuid4().hex,
+            first_name="Jane",
+            last_name="Doe",
+        )
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        project = Project.objects.create(
+            name="Plane", identifier="PLN", workspace=self.workspace
+        )
+        State.objects.create(
+            name="Todo", group="unstarted", default=True, project=project
+        )
+        self.bug = Label.objects.create(name="Bug", project=project)
+        self.feature = Label.objects.create(name="Feature", project=project)
+
+        for name, label in [("One", self.bug), ("Two", self.bug), ("Three", None)]:
+            issue = Issue.objects.create(name=name, project=project)
+            IssueAssignee.objects.create(
+                issue=issue, assignee=self.user, project=project
+            )
+            if label is not None:
+                IssueLabel.objects.create(issue=issue, label=label, project=project)
+
+    def export(self, data):
+        mail.outbox = []
+        analytic_export_task(email="user@plane.so", data=data, slug="plane")
+        self.assertEqual(len(mail.outbox), 1)
+        _, content, _ = mail.outbox[0].attachments[0]
+        return list(csv.reader(io.StringIO(content)))
+
+    def test_segmented(self):
+        rows = self.export(
+            {"x_axis": "assignees__id", "y_axis": "issue_count", "segment": "labels__id"}
+        )
+        self.assertEqual(rows[0][:2], ["Assignee Name", "Issue Count"])
+        self.assertEqual(rows[1][:2], ["Jane Doe", "3"])
+        # Issues without label are the empty segment
+        self.assertEqual(dict(zip(rows[0][2:], rows[1][2:])), {"Bug": "2", "": "1"})
+
+    def test_not_segmented(self):
+        rows = self.export({"x_axis": "labels__id", "y_axis": "issue_count"})
+        self.assertEqual(rows, [["Label", "Issue Count"], ["Bug", "2"]])
@@ -0,0 +1,160 @@
+# Python imports
+import uuid
+
+# Django imports
+from django.db.models import F, Func, OuterRef
+from django.test import TestCase
+
+# Third party import
+from rest_framework.renderers import JSONRenderer
+
+# Module imports
+from plane.api.serializers import (
+    IssueActivitySerializer,
+    IssueLiteSerializer,
+    ProjectListSerializer,
+)
+from plane.api.serializers.compiled import get_compiled_serializer, serialize_compiled
+from plane.db.models import (
+    Cycle,
+    CycleIssue,
+    Issue,
+    IssueActivity,
+    IssueAssignee,
+    IssueLabel,
+    IssueLink,
+    IssueReaction,
+    Label,
+    Project,
+    State,
+    User,
+    Workspace,
+)
+
+
+class CompiledSerializerTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(
+            email="user@plane.so", username=uuid.uuid4().hex, first_name="User"
+        )
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        self.project = Project.objects.create(
+            name="Plane",
+            identifier="PLN",
+            workspace=self.workspace,
+            icon_prop={"name": "home"},
+        )
+        state = State.objects.create(
+            name="Todo", group="unstarted", default=True, project=self.project
+        )
+        labels = [
+            Label.objects.create(name=f"Label {i}", project=self.project)
+            for i in range(2)
+        ]
+        cycle = Cycle.objects.create(
+            name="Cycle", project=self.project, owned_by=self.user
+        )
+
+        parent = Issue.objects.create(
+            name="Parent",
+            project=self.project,
+            state=state,
+            priority="high",
+            description={"type": "doc"},
+        )
+        child = Issue.objects.create(
+            name="Child", project=self.project, state=state, parent=parent
+        )
+        # An issue without state or relations
+        Issue.objects.filter(
+            pk=Issue.objects.create(name="Bare", project=self.project).pk
+        ).update(state=None)
+
+        for label in labels:
+            IssueLabel.objects.create(issue=parent, label=label, project=self.project)
+        IssueAssignee.objects.create(
+            issue=parent, assignee=self.user, project=self.project
+        )
+        IssueReaction.objects.create(
+            issue=child, actor=self.user, reaction="+1", project=self.project
+        )
+        IssueLink.objects.create(
+            issue=parent, url="https://plane.so", project=self.project
+        )
+        CycleIssue.objects.create(issue=child, cycle=cycle, project=self.project)
+
+        IssueActivity.objects.create(
+            issue=parent,
+            actor=self.user,
+            verb="updated",
+            field="priority",
+            new_value="high",
+            project=self.project,
+        )
+        # Activities of a deleted issue and of the system
+        IssueActivity.objects.create(verb="deleted", project=self.project)
+
+    def assertParity(self, serializer_class, queryset, fields=None):
+        kwargs = {"fields": fields} if fields else {}
+        self.assertIsNotNone(
+            get_compiled_serializer(serializer_class, queryset, fields)
+        )
+        self.assertEqual(
+            serialize_compiled(serializer_class, queryset, fields),
+            serializer_class(queryset, many=True, **kwargs).data,
+        )
+
+    def test_issue_lite(self):
+        queryset = (
+            Issue.issue_objects.filter(project=self.project)
+            .annotate(cycle_id=F("issue_cycle__cycle_id"))
+            .annotate(module_id=F("issue_module__module_id"))
+            .annotate(
+                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
+                .order_by()
+                .annotate(count=Func(F("id"), function="Count"))
+                .values("count")
+            )
+        )
+        self.assertParity(IssueLiteSerializer, queryset)
+        self.assertParity(
+            IssueLiteSerializer,
+            queryset,
+            ["id", "state_detail", "label_details", "labels", "link_count"],
+        )
+        # Requested annotations missing from the queryset are skipped
+        self.assertParity(
+            IssueLiteSerializer, queryset.order_by("name"), ["id", "sub_issues_count"]
+        )
+
+    def test_cache_key(self):
+        queryset = Issue.issue_objects.filter(project=self.project)
+        compiled = get_compiled_serializer(
+            IssueLiteSerializer, queryset, ["id", "name"]
+        )
+        # Unknown names and another order share the entry of the fields
+        self.assertIs(
+            get_compiled_serializer(
+                IssueLiteSerializer, queryset, ["name", "id", "id", uuid.uuid4().hex]
+            ),
+            compiled,
+        )
+        self.assertParity(IssueLiteSerializer, queryset, ["name", "unknown"])
+        self.assertParity(IssueLiteSerializer, queryset, ["unknown"])
+
+    def test_issue_activity(self):
+        self.assertParity(
+            IssueActivitySerializer,
+            IssueActivity.objects.filter(project=self.project).order_by("created_at"),
+        )
+
+    def test_not_compilable(self):
+        queryset = Project.objects.all()
+        # members is a method field, the serializer is used instead
+        self.assertIsNone(get_compiled_serializer(ProjectListSerializer, queryset))
+        self.assertEqual(
+            JSONRenderer().render(serialize_compiled(ProjectListSerializer, queryset)),
+            JSONRenderer().render(ProjectListSerializer(queryset, many=True).data),
+        )
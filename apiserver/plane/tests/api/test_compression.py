@@ -0,0 +1,117 @@
+# Python imports
+import gzip
+import io
+import json
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+# Django imports
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+# Third party imports
+import brotli
+import zstandard
+
+# Module imports
+from plane.api.parsers import ORJSONParser
+from plane.api.renderers import ORJSONRenderer
+from plane.middleware.compression import CompressionMiddleware, negotiate_encoder
+
+
+class ORJSONTest(SimpleTestCase):
+    def test_render(self):
+        issue_id = uuid.uuid4()
+        data = {
+            "id": issue_id,
+            "created_at": datetime(2023, 10, 1, 12, 30, tzinfo=timezone.utc),
+            "estimate": Decimal("1.5"),
+            None: [1, 2],
+        }
+        self.assertEqual(
+            json.loads(ORJSONRenderer().render(data)),
+            {
+                "id": str(issue_id),
+                "created_at": "2023-10-01T12:30:00Z",
+                "estimate": 1.5,
+                "null": [1, 2],
+            },
+        )
+        # Out of orjson's range, rendered by the JSONRenderer
+        self.assertEqual(ORJSONRenderer().render({"big": 2**70}), b'{"big":%d}' % 2**70)
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+
+    def test_parse(self):
+        parser = ORJSONParser()
+        self.assertEqual(
+            parser.parse(io.BytesIO('{"name": "Tâche"}'.encode())), {"name": "Tâche"}
+        )
+        self.assertEqual(
+            parser.parse(
+                io.BytesIO('{"name": "Tâche"}'.encode("latin-1")),
+                parser_context={"encoding": "latin-1"},
+            ),
+            {"name": "Tâche"},
+        )
+
+
+@override_settings(COMPRESSION_ENABLED=True, COMPRESSION_MIN_SIZE=1024)
+class CompressionMiddlewareTest(SimpleTestCase):
+    content = json.dumps([{"name": f"Issue {i}"} for i in range(200)]).encode()
+
+    def get(self, accept_encoding, response):
+        request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING=accept_encoding)
+        return CompressionMiddleware(lambda request: response)(request)
+
+    def json_response(self, content=None):
+        response = HttpResponse(
+            self.content if content is None else content,
+            content_type="application/json",
+        )
+        response["ETag"] = '"version"'
+        return response
+
+    def test_negotiate(self):
+        self.assertEqual(negotiate_encoder("gzip, deflate, br, zstd").name, "zstd")
+        self.assertEqual(negotiate_encoder("gzip, br").name, "br")
+        self.assertEqual(negotiate_encoder("zstd;q=0.5, br;q=0.8").name, "br")
+        self.assertEqual(negotiate_encoder("*").name, "zstd")
+        self.assertEqual(negotiate_encoder("*, zstd;q=0").name, "br")
+        self.assertIsNone(negotiate_encoder("identity"))
+        self.assertIsNone(negotiate_encoder(""))
+
+    def test_compress(self):
+        decompress = {
+            "zstd": zstandard.ZstdDecompressor().decompressobj().decompress,
+            "br": brotli.decompress,
+            "gzip": gzip.decompress,
+        }
+        for encoding, decompress in decompress.items():
+            response = self.get(encoding, self.json_response())
+            self.assertEqual(response["Content-Encoding"], encoding)
+            self.assertEqual(response["Vary"], "Accept-Encoding")
+            self.assertEqual(response["ETag"], 'W/"version"')
+            self.assertEqual(int(response["Content-Length"]), len(response.content))
+            self.assertEqual(decompress(response.content), self.content)
+
+    def test_not_compressed(self):
+        # Small, not accepted or not compressible
+        response = self.get("br", self.json_response(b"[]"))
+        self.assertFalse(response.has_header("Content-Encoding"))
+        response = self.get("identity", self.json_response())
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(response.content, self.content)
+        response = self.get("br", HttpResponse(self.content, content_type="image/png"))
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_stream(self):
+        chunks = [self.content[i : i + 500] for i in range(0, len(self.content), 500)]
+        response = self.get(
+            "br", StreamingHttpResponse(chunks, content_type="text/csv")
+        )
+        self.assertEqual(response["Content-Encoding"], "br")
+        compressed = list(response.streaming_content)
+        # Every chunk is flushed as it is written
+        self.assertGreater(len(compressed), len(chunks))
+        self.assertEqual(brotli.decompress(b"".join(compressed)), self.content)
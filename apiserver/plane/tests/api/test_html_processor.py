@@ -0,0 +1,24 @@
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.utils.html_processor import ProcessedHTML, ProcessedHTMLCache
+
+
+class ProcessedHTMLCacheTest(SimpleTestCase):
+    def test_bounded_by_text_length(self):
+        cache = ProcessedHTMLCache(10)
+        cache.set("a", ProcessedHTML("a" * 4, ()))
+        cache.set("b", ProcessedHTML("b" * 4, ()))
+        cache.get("a")
+        cache.set("c", ProcessedHTML("c" * 4, ()))
+
+        # The least recently used document made room for the new one
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a").text, "aaaa")
+        self.assertEqual(cache.chars, 8)
+
+        # A document larger than the whole cache is not kept
+        cache.set("d", ProcessedHTML("d" * 11, ()))
+        self.assertIsNone(cache.get("d"))
+        self.assertEqual(cache.chars, 8)
@@ -0,0 +1,402 @@
+# Python imports
+import json
+import os
+import threading
+import time
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+# Django imports
+from django.core.cache import cache
+from django.db import DatabaseError
+from django.test import SimpleTestCase
+from django.urls import reverse
+from django.utils import timezone
+
+# Third party import
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from rest_framework import status
+
+# Module imports
+from .base import AuthenticatedAPITest, retried_eagerly
+from plane.bgtasks import importer_task
+from plane.utils.importers.jira import jira_project_issue_summary
+from plane.utils.integrations import github
+from plane.db.models import (
+    APIToken,
+    Importer,
+    ImporterChunk,
+    Issue,
+    IssueActivity,
+    IssueAssignee,
+    IssueComment,
+    IssueLabel,
+    IssueLink,
+    IssueSequence,
+    Label,
+    Module,
+    ModuleIssue,
+    ModuleLink,
+    Project,
+    ProjectMember,
+    State,
+    Workspace,
+    WorkspaceMember,
+)
+
+
+class BulkImportIssuesTest(AuthenticatedAPITest):
+    def setUp(self):
+        super().setUp()
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        WorkspaceMember.objects.create(
+            workspace=self.workspace, member=self.user, role=20
+        )
+        self.project = Project.objects.create(
+            name="Plane", identifier="PLN", workspace=self.workspace
+        )
+        ProjectMember.objects.create(project=self.project, member=self.user, role=20)
+        self.state = State.objects.create(
+            name="Todo", group="unstarted", default=True, project=self.project
+        )
+        self.label = Label.objects.create(name="Bug", project=self.project)
+        self.importer = Importer.objects.create(
+            service="jira",
+            project=self.project,
+            initiated_by=self.user,
+            token=APIToken.objects.create(user=self.user, workspace=self.workspace),
+        )
+        Issue.objects.create(name="Existing", project=self.project)
+
+    def post_issues(self, data):
+        with self.settings(IMPORT_CHUNK_SIZE=2):
+            return self.client.post(
+                reverse(
+                    "project-issues-bulk",
+                    kwargs={
+                        "slug": self.workspace.slug,
+                        "project_id": self.project.id,
+                        "service": "jira",
+                    },
+                ),
+                data,
+                format="json",
+            )
+
+    def test_bulk_import(self):
+        issues_data = [
+            {
+                "name": f"Imported {i}",
+                "description_html": "<p>Imported <b>issue</b></p>",
+                "labels_list": [str(self.label.id), str(self.label.id)],
+                "assignees_list": [str(self.user.id)],
+                "comments_list": [{"comment_html": "<p>First</p>"}],
+                "link": {"url": f"https://jira.example.com/{i}", "title": "Jira"},
+            }
+            for i in range(5)
+        ]
+        with self.settings(IMPORT_CHUNK_SIZE=2):
+            response = self.client.post(
+                reverse(
+                    "project-issues-bulk",
+                    kwargs={
+                        "slug": self.workspace.slug,
+                        "project_id": self.project.id,
+                        "service": "jira",
+                    },
+                ),
+                {"issues_data": issues_data},
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED, response.data)
+        issue_ids = [issue["id"] for issue in response.data["issues"]]
+
+        issues = Issue.objects.filter(pk__in=issue_ids).order_by("sequence_id")
+        self.assertEqual(
+            [str(issue.id) for issue in issues.order_by("sort_order")], issue_ids
+        )
+        # Sequence ids continue after the existing issue across chunks
+        self.assertEqual(
+            list(issues.values_list("sequence_id", flat=True)), [2, 3, 4, 5, 6]
+        )
+        self.assertEqual(issues.filter(state=self.state).count(), 5)
+        self.assertEqual(issues[0].description_stripped, "Imported issue")
+        self.assertEqual(
+            IssueSequence.objects.filter(issue_id__in=issue_ids).count(), 5
+        )
+        self.assertEqual(IssueLabel.objects.filter(issue_id__in=issue_ids).count(), 5)
+        self.assertEqual(
+            IssueAssignee.objects.filter(issue_id__in=issue_ids).count(), 5
+        )
+        self.assertEqual(
+            IssueComment.objects.filter(issue_id__in=issue_ids).count(), 5
+        )
+        self.assertEqual(IssueLink.objects.filter(issue_id__in=issue_ids).count(), 5)
+        self.assertEqual(
+            IssueActivity.objects.filter(issue_id__in=issue_ids).count(), 5
+        )
+
+        self.importer.refresh_from_db()
+        self.assertEqual(self.importer.status, "completed")
+        self.assertEqual(
+            ImporterChunk.objects.filter(
+                importer=self.importer, processed_at__isnull=True
+            ).count(),
+            0,
+        )
+        self.assertEqual(
+            ImporterChunk.objects.filter(importer=self.importer).count(), 3
+        )
+
+        # The loaded chunks tell which issues to remove with the import
+        response = self.client.delete(
+            reverse(
+                "importer",
+                kwargs={
+                    "slug": self.workspace.slug,
+                    "service": "jira",
+                    "pk": self.importer.id,
+                },
+            )
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Issue.objects.filter(pk__in=issue_ids).exists())
+        self.assertEqual(Issue.objects.count(), 1)
+
+    def test_bulk_import_without_importer(self):
+        self.importer.delete()
+        response = self.post_issues(
+            {"issues_data": [{"name": f"Imported {i}"} for i in range(3)]}
+        )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        issue_ids = [issue["id"] for issue in response.data["issues"]]
+        self.assertEqual(
+            [
+                (str(issue.id), issue.name, issue.sequence_id)
+                for issue in Issue.objects.filter(pk__in=issue_ids).order_by(
+                    "sequence_id"
+                )
+            ],
+            [
+                (issue_ids[0], "Imported 0", 2),
+                (issue_ids[1], "Imported 1", 3),
+                (issue_ids[2], "Imported 2", 4),
+            ],
+        )
+
+    def test_failed_chunk_resumed(self):
+        load_issues = importer_task.load_issues
+        failures = [DatabaseError("canceling statement due to statement timeout")]
+
+        def fail_once(issues_data, *args):
+            if issues_data[0]["name"] == "Imported 2" and failures:
+                raise failures.pop()
+            return load_issues(issues_data, *args)
+
+        with mock.patch.object(
+            importer_task, "load_issues", side_effect=fail_once
+        ), mock.patch.object(
+            importer_task, "capture_exception"
+        ), retried_eagerly(
+            importer_task.import_issues
+        ):
+            response = self.post_issues(
+                {"issues_data": [{"name": f"Imported {i}"} for i in range(5)]}
+            )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+        self.importer.refresh_from_db()
+        self.assertEqual(self.importer.status, "completed")
+        self.assertEqual(
+            sorted(Issue.objects.values_list("sequence_id", flat=True)),
+            [1, 2, 3, 4, 5, 6],
+        )
+
+    def post_modules(self, data):
+        return self.client.post(
+            reverse(
+                "bulk-modules-create",
+                kwargs={
+                    "slug": self.workspace.slug,
+                    "project_id": self.project.id,
+                    "service": "jira",
+                },
+            ),
+            data,
+            format="json",
+        )
+
+    def test_modules_after_pending_chunks(self):
+        with mock.patch.object(importer_task.import_issues, "delay"):
+            response = self.post_issues(
+                {"issues_data": [{"name": f"Imported {i}"} for i in range(3)]}
+            )
+        issue_ids = [issue["id"] for issue in response.data["issues"]]
+        self.assertFalse(Issue.objects.filter(pk__in=issue_ids).exists())
+
+        response = self.post_modules(
+            {"modules_data": [{"name": "Epic", "module_issues_list": issue_ids}]}
+        )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        module = Module.objects.get()
+        self.assertEqual(str(module.id), response.data["modules"][0]["id"])
+        self.assertEqual(
+            sorted(
+                str(issue_id)
+                for issue_id in ModuleIssue.objects.filter(module=module).values_list(
+                    "issue_id", flat=True
+                )
+            ),
+            sorted(issue_ids),
+        )
+        self.assertEqual(ModuleLink.objects.filter(module=module).count(), 1)
+        self.importer.refresh_from_db()
+        self.assertEqual(self.importer.status, "completed")
+
+    def test_modules_without_importer(self):
+        self.importer.delete()
+        issue = Issue.objects.get()
+        Module.objects.create(name="Taken", project=self.project)
+
+        # The retries wait for the issue that never comes, then skip it
+        with retried_eagerly(importer_task.import_modules):
+            response = self.post_modules(
+                {
+                    "modules_data": [
+                        {
+                            "name": "Epic",
+                            "module_issues_list": [str(issue.id), str(self.label.id)],
+                        },
+                        {"name": "Taken", "module_issues_list": [str(issue.id)]},
+                    ]
+                }
+            )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(
+            list(ModuleIssue.objects.values_list("module__name", "issue_id")),
+            [("Epic", issue.id)],
+        )
+        self.assertEqual(Module.objects.count(), 2)
+
+class FakeServiceHandler(BaseHTTPRequestHandler):
+    """Jira and GitHub endpoints used by the importers"""
+
+    delay = 0.2
+
+    def log_message(self, *args):
+        pass
+
+    def respond(self, body, links=None):
+        self.server.requests.append((self.command, self.path))
+        time.sleep(self.delay)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if links:
+            self.send_header(
+                "Link",
+                ", ".join(f'<{url}>; rel="{rel}"' for rel, url in links.items()),
+            )
+        self.end_headers()
+        self.wfile.write(json.dumps(body).encode())
+
+    def paginated(self, path, query, total):
+        page = int(query.get("page", ["1"])[0])
+        pages = (total + 99) // 100
+        last = f"http://{self.headers['Host']}{path}?per_page=100&page={pages}"
+        items = [
+            {"id": index} for index in range((page - 1) * 100, min(page * 100, total))
+        ]
+        self.respond(items, {"last": last} if pages > 1 else None)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if url.path == "/rest/api/3/search":
+            self.respond({"total": 42 if "Story" in query["jql"][0] else 3})
+        elif url.path == "/rest/api/3/status/":
+            self.respond([{"name": "To Do"}, {"name": "Done"}])
+        elif url.path == "/rest/api/3/label/":
+            self.respond({"total": 7})
+        elif url.path == "/rest/api/3/users/search":
+            self.respond([{"accountType": "atlassian"}, {"accountType": "app"}])
+        elif url.path == "/repos/plane/plane":
+            self.respond({"open_issues_count": 12})
+        elif url.path == "/repos/plane/plane/labels":
+            self.paginated(url.path, query, 205)
+        elif url.path == "/repos/plane/plane/collaborators":
+            self.paginated(url.path, query, 101)
+        else:
+            self.send_error(404)
+
+    def do_POST(self):
+        self.respond(
+            {
+                "token": "installation-token",
+                "expires_at": (timezone.now() + timedelta(hours=1)).isoformat(),
+            }
+        )
+
+
+class ImporterFetchTest(SimpleTestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FakeServiceHandler)
+        self.server.requests = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        pem = private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ).decode()
+        patcher = mock.patch.dict(
+            os.environ, {"GITHUB_APP_ID": "1", "GITHUB_APP_PRIVATE_KEY": pem}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        github._jwt_token.update(token=None, expires=0)
+        cache.clear()
+
+    def test_jira_summary(self):
+        start = time.perf_counter()
+        summary = jira_project_issue_summary("user@plane.so", "token", "PLN", self.url)
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(
+            summary,
+            {
+                "issues": 42,
+                "modules": 3,
+                "labels": 7,
+                "states": 2,
+                "users": [{"accountType": "atlassian"}],
+            },
+        )
+        self.assertEqual(len(self.server.requests), 5)
+        # The five requests overlap instead of running one after the other
+        self.assertLess(elapsed, 5 * FakeServiceHandler.delay)
+
+    def test_github_repo_details(self):
+        access_tokens_url = f"{self.url}/app/installations/1/access_tokens"
+        with self.settings(GITHUB_API_URL=self.url):
+            for _ in range(2):
+                issue_count, labels, collaborators = github.get_github_repo_details(
+                    access_tokens_url, "plane", "plane"
+                )
+                self.assertEqual(issue_count, 12)
+                self.assertEqual(labels, 205)
+                self.assertEqual(len(collaborators), 101)
+
+        # The installation token is minted once and then served from the cache
+        self.assertEqual(
+            [path for method, path in self.server.requests if method == "POST"],
+            ["/app/installations/1/access_tokens"],
+        )
@@ -0,0 +1,187 @@
+# Python imports
+import uuid
+
+# Django imports
+from django.core import mail
+from django.test import override_settings
+from django.urls import reverse
+
+# Third party import
+from rest_framework import status
+
+# Module imports
+from .base import AuthenticatedAPITest
+from plane.utils.invitations import create_placeholder_users
+from plane.db.models import (
+    IssueProperty,
+    Project,
+    ProjectMember,
+    ProjectMemberInvite,
+    User,
+    Workspace,
+    WorkspaceMember,
+    WorkspaceMemberInvite,
+)
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class InvitationTest(AuthenticatedAPITest):
+    def setUp(self):
+        super().setUp()
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        WorkspaceMember.objects.create(
+            workspace=self.workspace, member=self.user, role=20
+        )
+        self.project = Project.objects.create(
+            name="Plane", identifier="PLN", workspace=self.workspace
+        )
+        # The project emails are sent in the name of its creator
+        Project.objects.filter(pk=self.project.pk).update(created_by=self.user)
+        ProjectMember.objects.create(project=self.project, member=self.user, role=20)
+
+    def test_invite_workspace(self):
+        url = reverse("invite-workspace", kwargs={"slug": "plane"})
+        emails = [
+            {"email": "One@plane.so", "role": 10},
+            {"email": "two@plane.so", "role": 15},
+            {"email": " one@plane.so ", "role": 15},
+        ]
+        response = self.client.post(url, {"emails": emails}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            list(
+                WorkspaceMemberInvite.objects.order_by("email").values_list(
+                    "email", "role"
+                )
+            ),
+            [("one@plane.so", 15), ("two@plane.so", 15)],
+        )
+        self.assertEqual(
+            sorted(msg.to[0] for msg in mail.outbox), ["one@plane.so", "two@plane.so"]
+        )
+        self.assertFalse(
+            WorkspaceMemberInvite.objects.filter(message__isnull=True).exists()
+        )
+
+        # Invited again with another role
+        response = self.client.post(
+            url, {"emails": [{"email": "two@plane.so", "role": 10}]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(WorkspaceMemberInvite.objects.count(), 2)
+        self.assertEqual(
+            WorkspaceMemberInvite.objects.get(email="two@plane.so").role, 10
+        )
+
+        response = self.client.post(
+            url, {"emails": [{"email": "not-an-email"}]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_invite_project(self):
+        url = reverse(
+            "invite-project", kwargs={"slug": "plane", "project_id": self.project.id}
+        )
+        other = User.objects.create(email="other@plane.so", username=uuid.uuid4().hex)
+        response = self.client.post(
+            url,
+            {
+                "emails": [
+                    {"email": "other@plane.so", "role": 15},
+                    {"email": "new@plane.so", "role": 10},
+                ]
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((response.data["invited"], response.data["added"]), (1, 1))
+
+        # Users with an account are added, the others invited
+        self.assertEqual(
+            ProjectMember.objects.get(project=self.project, member=other).role, 15
+        )
+        self.assertTrue(
+            IssueProperty.objects.filter(project=self.project, user=other).exists()
+        )
+        self.assertEqual(
+            list(ProjectMemberInvite.objects.values_list("email", "role")),
+            [("new@plane.so", 10)],
+        )
+        self.assertEqual([msg.to for msg in mail.outbox], [["new@plane.so"]])
+
+        response = self.client.post(
+            url, {"emails": [{"email": "other@plane.so"}]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_invite_project_single_email(self):
+        url = reverse(
+            "invite-project", kwargs={"slug": "plane", "project_id": self.project.id}
+        )
+        response = self.client.post(
+            url, {"email": "new@plane.so", "role": 10}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["id"], ProjectMemberInvite.objects.get(email="new@plane.so").id
+        )
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_invalid_invites(self):
+        workspace_url = reverse("invite-workspace", kwargs={"slug": "plane"})
+        project_url = reverse(
+            "invite-project", kwargs={"slug": "plane", "project_id": self.project.id}
+        )
+        for emails in [
+            ["new@plane.so"],
+            [{"email": "new@plane.so", "role": "admin"}],
+            [{"email": "new@plane.so", "role": None}],
+            [{"email": "new@plane.so", "role": 12}],
+        ]:
+            for url in [workspace_url, project_url]:
+                response = self.client.post(url, {"emails": emails}, format="json")
+                self.assertEqual(
+                    response.status_code, status.HTTP_400_BAD_REQUEST, emails
+                )
+        self.assertFalse(WorkspaceMemberInvite.objects.exists())
+        self.assertFalse(ProjectMemberInvite.objects.exists())
+
+    def test_invite_project_higher_role(self):
+        ProjectMember.objects.filter(project=self.project, member=self.user).update(
+            role=15
+        )
+        url = reverse(
+            "invite-project", kwargs={"slug": "plane", "project_id": self.project.id}
+        )
+        response = self.client.post(
+            url,
+            {
+                "emails": [
+                    {"email": "one@plane.so", "role": 10},
+                    {"email": "two@plane.so", "role": 20},
+                ]
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(ProjectMemberInvite.objects.exists())
+
+    def test_invite_project_bot(self):
+        bot = User.objects.create(
+            email="bot@plane.so", username=uuid.uuid4().hex, is_bot=True
+        )
+        ProjectMember.objects.create(project=self.project, member=bot)
+        url = reverse(
+            "invite-project", kwargs={"slug": "plane", "project_id": self.project.id}
+        )
+        response = self.client.post(url, {"email": "bot@plane.so"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_create_placeholder_users(self):
+        users = create_placeholder_users(["new@plane.so", self.user.email])
+        self.assertEqual(
+            [(user.email, user.pk) for user in users],
+            [("new@plane.so", User.objects.get(email="new@plane.so").pk)],
+        )
@@ -1 +1,547 @@
-# TODO: Write Test for Issue Endpoints
\ No newline at end of file
+# Python imports
+import uuid
+from datetime import timedelta
+from unittest import mock
+
+# Django imports
+from django.db import DatabaseError
+from django.db.models import QuerySet
+from django.urls import reverse
+from django.utils import timezone
+
+# Third party import
+from rest_framework import status
+
+# Module imports
+from .base import AuthenticatedAPITest, retried_eagerly
+from plane.bgtasks.deletion_task import issue_deletion_task, project_deletion_task
+from plane.utils.cascade_delete import cascade_delete
+from plane.utils.issue_filters import issue_filters
+from plane.utils.issue_sync import encode_cursor
+from plane.utils.query_tracker import QueryTracker
+from plane.db.models import (
+    Issue,
+    IssueActivity,
+    IssueAssignee,
+    IssueComment,
+    IssueLabel,
+    IssueMention,
+    IssueTombstone,
+    Label,
+    Module,
+    ModuleIssue,
+    Notification,
+    Page,
+    PageBlock,
+    Project,
+    ProjectMember,
+    State,
+    User,
+    Workspace,
+    WorkspaceMember,
+)
+
+
+class BulkIssuesTest(AuthenticatedAPITest):
+    def setUp(self):
+        super().setUp()
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        WorkspaceMember.objects.create(
+            workspace=self.workspace, member=self.user, role=20
+        )
+        self.project = Project.objects.create(
+            name="Plane", identifier="PLN", workspace=self.workspace
+        )
+        ProjectMember.objects.create(project=self.project, member=self.user, role=20)
+        self.member = User.objects.create(
+            email="member@plane.so", username=uuid.uuid4().hex
+        )
+        ProjectMember.objects.create(project=self.project, member=self.member)
+        self.todo = State.objects.create(
+            name="Todo", group="unstarted", default=True, project=self.project
+        )
+        self.done = State.objects.create(
+            name="Done", group="completed", project=self.project
+        )
+        self.bug = Label.objects.create(name="Bug", project=self.project)
+        self.feature = Label.objects.create(name="Feature", project=self.project)
+
+    def create_issues(self, count):
+        issues = []
+        for i in range(count):
+            issue = Issue.objects.create(
+                name=f"Issue {i}", project=self.project, state=self.todo
+            )
+            IssueLabel.objects.create(issue=issue, label=self.bug, project=self.project)
+            IssueAssignee.objects.create(
+                issue=issue, assignee=self.member, project=self.project
+            )
+            issues.append(issue)
+        return [str(issue.id) for issue in issues]
+
+
+class BulkUpdateIssuesTest(BulkIssuesTest):
+    def setUp(self):
+        super().setUp()
+        self.url = reverse(
+            "project-issues-bulk-update",
+            kwargs={"slug": self.workspace.slug, "project_id": self.project.id},
+        )
+
+    def update(self, issue_ids, properties):
+        with QueryTracker(self.url) as tracker:
+            response = self.client.patch(
+                self.url,
+                {"issue_ids": issue_ids, "properties": properties},
+                format="json",
+            )
+        return response, tracker
+
+    def test_bulk_update(self):
+        issue_ids = self.create_issues(3)
+        response, _ = self.update(
+            issue_ids,
+            {
+                "state": str(self.done.id),
+                "priority": "high",
+                "labels": [str(self.feature.id)],
+            },
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+
+        issues = Issue.objects.filter(pk__in=issue_ids)
+        self.assertEqual(issues.filter(state=self.done, priority="high").count(), 3)
+        self.assertEqual(issues.filter(completed_at__isnull=True).count(), 0)
+        self.assertEqual(
+            set(
+                IssueLabel.objects.filter(issue_id__in=issue_ids).values_list(
+                    "label_id", flat=True
+                )
+            ),
+            {self.feature.id},
+        )
+        # Unchanged relations are left alone
+        self.assertEqual(
+            IssueAssignee.objects.filter(issue_id__in=issue_ids).count(), 3
+        )
+
+        # state, priority, one label added and one removed on every issue
+        activities = IssueActivity.objects.filter(issue_id__in=issue_ids)
+        self.assertEqual(activities.count(), 12)
+        self.assertEqual(
+            set(activities.values_list("field", flat=True)),
+            {"state", "priority", "labels"},
+        )
+        self.assertEqual(
+            Notification.objects.filter(
+                receiver=self.member, entity_identifier__in=issue_ids
+            ).count(),
+            12,
+        )
+
+    def test_bulk_update_query_count(self):
+        _, small = self.update(
+            self.create_issues(2),
+            {"priority": "low", "assignees": [str(self.user.id)]},
+        )
+        _, large = self.update(
+            self.create_issues(6),
+            {"priority": "low", "assignees": [str(self.user.id)]},
+        )
+        self.assertEqual(small.count, large.count)
+
+    def test_bulk_update_invalid(self):
+        issue_ids = self.create_issues(1)
+        other = Label.objects.create(
+            name="Other",
+            project=Project.objects.create(
+                name="Other", identifier="OTH", workspace=self.workspace
+            ),
+        )
+        for properties in [
+            {},
+            ["priority", "low"],
+            "low",
+            {"name": "Renamed"},
+            {"priority": ["low"]},
+            {"labels": str(other.id)},
+            {"priority": "critical"},
+            {"start_date": "2023-10-10", "target_date": "2023-10-01"},
+            {"estimate_point": 9},
+            {"labels": [str(other.id)]},
+            {"assignees": [str(uuid.uuid4())]},
+        ]:
+            response, _ = self.update(issue_ids, properties)
+            self.assertEqual(
+                response.status_code, status.HTTP_400_BAD_REQUEST, properties
+            )
+        self.assertEqual(IssueActivity.objects.filter(issue_id__in=issue_ids).count(), 0)
+
+
+class BulkDeleteIssuesTest(BulkIssuesTest):
+    def test_bulk_delete(self):
+        issue_ids = self.create_issues(3)
+        kept = self.create_issues(1)
+        sub_issue = Issue.objects.create(
+            name="Sub issue", project=self.project, parent_id=issue_ids[0]
+        )
+        for issue_id in issue_ids:
+            IssueComment.objects.create(
+                issue_id=issue_id, comment_html="<p>Comment</p>", project=self.project
+            )
+        activity = IssueActivity.objects.create(
+            issue_id=issue_ids[0], verb="updated", project=self.project
+        )
+
+        with self.settings(DELETION_CHUNK_SIZE=2):
+            response = self.client.delete(
+                reverse(
+                    "project-issues-bulk",
+                    kwargs={"slug": self.workspace.slug, "project_id": self.project.id},
+                ),
+                {"issue_ids": issue_ids},
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+
+        self.assertEqual(
+            list(Issue.objects.values_list("id", flat=True)), [uuid.UUID(kept[0])]
+        )
+        self.assertFalse(Issue.objects.filter(pk=sub_issue.id).exists())
+        self.assertEqual(IssueComment.objects.count(), 0)
+        self.assertEqual(IssueLabel.objects.count(), 1)
+        self.assertEqual(IssueAssignee.objects.count(), 1)
+        self.assertEqual(
+            set(IssueTombstone.objects.values_list("issue_id", flat=True)),
+            {uuid.UUID(issue_id) for issue_id in issue_ids} | {sub_issue.id},
+        )
+
+        # The history is kept and the batch is recorded once
+        activity.refresh_from_db()
+        self.assertIsNone(activity.issue_id)
+        self.assertEqual(
+            IssueActivity.objects.filter(verb="deleted", field="issue").count(), 1
+        )
+
+    def test_deleted_issues_hidden(self):
+        issue_ids = self.create_issues(3)
+        module = Module.objects.create(name="Module", project=self.project)
+        for issue_id in issue_ids:
+            ModuleIssue.objects.create(
+                module=module, issue_id=issue_id, project=self.project
+            )
+
+        # The rows are still there until the deletion task runs
+        with mock.patch("plane.api.views.issue.issue_deletion_task"):
+            response = self.client.delete(
+                reverse(
+                    "project-issues-bulk",
+                    kwargs={"slug": self.workspace.slug, "project_id": self.project.id},
+                ),
+                {"issue_ids": issue_ids[:2]},
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+
+        project_url = f"workspaces/plane/projects/{self.project.id}"
+        response = self.client.get(f"/api/v2/{project_url}/issues/")
+        self.assertEqual([str(issue["id"]) for issue in response.data], [issue_ids[2]])
+        response = self.client.get(f"/api/v3/{project_url}/issues/")
+        self.assertEqual(list(response.data), [issue_ids[2]])
+        response = self.client.get(f"/api/{project_url}/issues/{issue_ids[0]}/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        response = self.client.get(f"/api/{project_url}/modules/{module.id}/")
+        self.assertEqual(response.data["total_issues"], 1)
+        self.assertEqual(
+            [row["total_issues"] for row in response.data["distribution"]["assignees"]],
+            [1],
+        )
+
+    def test_project_delete(self):
+        self.create_issues(3)
+        response = self.client.delete(
+            reverse(
+                "project",
+                kwargs={"slug": self.workspace.slug, "pk": self.project.id},
+            )
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Project.objects.filter(pk=self.project.id).exists())
+        self.assertEqual(Issue.objects.count(), 0)
+        self.assertEqual(State.objects.count(), 0)
+        self.assertEqual(ProjectMember.objects.count(), 0)
+        self.assertEqual(IssueTombstone.objects.count(), 0)
+
+    def test_failed_delete_leaves_no_tombstone(self):
+        issue_ids = self.create_issues(2)
+        raw_delete = QuerySet._raw_delete
+
+        def fail_on_issues(rows, using):
+            if rows.model is Issue:
+                raise DatabaseError("canceling statement due to statement timeout")
+            return raw_delete(rows, using)
+
+        with mock.patch.object(
+            QuerySet, "_raw_delete", autospec=True, side_effect=fail_on_issues
+        ):
+            with self.assertRaises(DatabaseError):
+                cascade_delete(Issue.objects.filter(pk__in=issue_ids))
+
+        self.assertEqual(Issue.objects.count(), 2)
+        self.assertEqual(IssueTombstone.objects.count(), 0)
+
+    def test_deleted_project_hidden(self):
+        self.create_issues(2)
+        Project.objects.filter(pk=self.project.pk).update(deleted_at=timezone.now())
+
+        # The project is neither readable nor writable
+        url = f"/api/workspaces/plane/projects/{self.project.id}/issues/"
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+        response = self.client.post(url, {"name": "Issue"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(Issue.objects.count(), 2)
+
+        # The workspace lists skip its issues
+        response = self.client.get(
+            reverse("workspace-issue-sync", kwargs={"slug": "plane"})
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["issues"], [])
+        response = self.client.get(
+            reverse("global-search", kwargs={"slug": "plane"}), {"search": "Issue"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(response.data["results"]["issue"]), [])
+        self.assertEqual(list(response.data["results"]["workspace"]), [])
+
+    def test_project_delete_retried(self):
+        self.create_issues(2)
+        failures = [DatabaseError("canceling statement due to statement timeout")]
+
+        def fail_once(*args, **kwargs):
+            if failures:
+                raise failures.pop()
+            return cascade_delete(*args, **kwargs)
+
+        with mock.patch(
+            "plane.bgtasks.deletion_task.cascade_delete", side_effect=fail_once
+        ), mock.patch(
+            "plane.bgtasks.deletion_task.capture_exception"
+        ), retried_eagerly(
+            project_deletion_task
+        ):
+            response = self.client.delete(
+                reverse("project", kwargs={"slug": "plane", "pk": self.project.id})
+            )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Project.objects.filter(pk=self.project.id).exists())
+        self.assertEqual(Issue.objects.count(), 0)
+
+    def test_issue_delete_retried(self):
+        issue_ids = self.create_issues(3)
+        raw_delete = QuerySet._raw_delete
+        failures = [DatabaseError("canceling statement due to statement timeout")]
+
+        def fail_once(rows, using):
+            # The first chunk is removed before the run fails
+            if rows.model is Issue and IssueTombstone.objects.exists() and failures:
+                raise failures.pop()
+            return raw_delete(rows, using)
+
+        with self.settings(DELETION_CHUNK_SIZE=2), mock.patch.object(
+            QuerySet, "_raw_delete", autospec=True, side_effect=fail_once
+        ), mock.patch(
+            "plane.bgtasks.deletion_task.capture_exception"
+        ), retried_eagerly(
+            issue_deletion_task
+        ):
+            response = self.client.delete(
+                reverse(
+                    "project-issues-bulk",
+                    kwargs={"slug": self.workspace.slug, "project_id": self.project.id},
+                ),
+                {"issue_ids": issue_ids},
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertFalse(failures)
+        self.assertEqual(Issue.objects.count(), 0)
+        activities = IssueActivity.objects.filter(verb="deleted", field="issue")
+        self.assertEqual(
+            list(activities.values_list("comment", flat=True)), ["deleted 3 issues"]
+        )
+
+
+class IssueSaveTest(BulkIssuesTest):
+    def test_save(self):
+        issue = Issue.objects.create(name="Save", project=self.project)
+        self.assertEqual(issue.state_id, self.todo.id)
+        page = Page.objects.create(
+            name="Page", project=self.project, owned_by=self.user
+        )
+        block = PageBlock.objects.create(
+            name="Block", page=page, issue=issue, project=self.project
+        )
+
+        issue = Issue.objects.get(pk=issue.pk)
+        # Only the row is updated
+        with self.assertNumQueries(1):
+            issue.save(update_fields=["updated_at"])
+        # The project and the update, the state did not change
+        with self.assertNumQueries(2):
+            issue.save()
+
+        issue.state = self.done
+        issue.save(update_fields=["state"])
+        issue.refresh_from_db()
+        block.refresh_from_db()
+        self.assertIsNotNone(issue.completed_at)
+        self.assertEqual(block.completed_at, issue.completed_at)
+
+        issue.state = self.todo
+        issue.save()
+        issue.refresh_from_db()
+        block.refresh_from_db()
+        self.assertIsNone(issue.completed_at)
+        self.assertIsNone(block.completed_at)
+
+
+class IssueMentionTest(BulkIssuesTest):
+    def mention(self, user):
+        return f'<mention-component id="{user.id}" target="users"></mention-component>'
+
+    def test_mention_index(self):
+        WorkspaceMember.objects.create(workspace=self.workspace, member=self.member)
+        outsider = User.objects.create(
+            email="outsider@plane.so", username=uuid.uuid4().hex
+        )
+        issue = Issue.objects.create(
+            name="Mentions",
+            project=self.project,
+            description_html=f"<p>{self.mention(self.user)} {self.mention(outsider)}</p>",
+        )
+        comment = IssueComment.objects.create(
+            issue=issue,
+            project=self.project,
+            comment_html=f"<p>{self.mention(self.member)} {self.mention(self.member)}</p>",
+        )
+        self.assertEqual(
+            set(IssueMention.objects.values_list("comment_id", "mention_id")),
+            {(None, self.user.id), (comment.id, self.member.id)},
+        )
+
+        issue.description_html = f"<p>{self.mention(self.member)}</p>"
+        issue.save()
+        self.assertEqual(
+            set(IssueMention.objects.values_list("comment_id", "mention_id")),
+            {(None, self.member.id), (comment.id, self.member.id)},
+        )
+
+        # The issue mentions the member twice but is matched once
+        filters = issue_filters({"mentions": str(self.member.id)}, "GET")
+        self.assertEqual(list(Issue.objects.filter(**filters)), [issue])
+
+        comment.delete()
+        self.assertEqual(
+            list(IssueMention.objects.values_list("comment_id", flat=True)), [None]
+        )
+
+
+class IssueSyncTest(BulkIssuesTest):
+    def sync(self, cursor=None, url_name="project-issue-sync"):
+        kwargs = {"slug": self.workspace.slug}
+        if url_name == "project-issue-sync":
+            kwargs["project_id"] = self.project.id
+        return self.client.get(
+            reverse(url_name, kwargs=kwargs), {"cursor": cursor} if cursor else {}
+        )
+
+    def test_sync(self):
+        issue_ids = self.create_issues(3)
+
+        with self.settings(ISSUE_SYNC_PAGE_SIZE=2, ISSUE_SYNC_OVERLAP_SECONDS=0):
+            response = self.sync()
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(len(response.data["issues"]), 2)
+            self.assertTrue(response.data["has_more"])
+
+            response = self.sync(response.data["cursor"])
+            self.assertEqual(len(response.data["issues"]), 1)
+            self.assertFalse(response.data["has_more"])
+            cursor = response.data["cursor"]
+
+            updated, deleted, archived = Issue.objects.filter(
+                pk__in=issue_ids
+            ).order_by("sequence_id")
+            updated.name = "Updated"
+            updated.save()
+            deleted_id = deleted.id
+            deleted.delete()
+            archived.archived_at = timezone.now().date()
+            archived.save()
+
+            for url_name in ["project-issue-sync", "workspace-issue-sync"]:
+                response = self.sync(cursor, url_name)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(
+                    [issue["name"] for issue in response.data["issues"]], ["Updated"]
+                )
+                self.assertEqual(
+                    response.data["deleted"], sorted([str(deleted_id), str(archived.id)])
+                )
+
+    def test_invalid_cursor(self):
+        response = self.sync("invalid")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.sync(encode_cursor(timezone.now() - timedelta(days=31)))
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+
+
+class IssueListFieldsTest(BulkIssuesTest):
+    def get(self, fields=None):
+        response = self.client.get(
+            f"/api/v2/workspaces/{self.workspace.slug}/projects/{self.project.id}/issues/",
+            {"fields": ",".join(fields)} if fields else {},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return sorted(response.json(), key=lambda issue: issue["id"])
+
+    def test_fields(self):
+        self.create_issues(3)
+        full = self.get()
+
+        # Besides the two queries of the permission checks
+        for fields, queries in [
+            # Read with values()
+            (["id", "name", "state", "priority", "completed_at", "link_count"], 1),
+            # Serialized, only the labels and assignees are prefetched
+            (["id", "sort_order", "state_detail", "labels", "assignee_details"], 3),
+        ]:
+            with QueryTracker("fields") as tracker:
+                issues = self.get(fields)
+            self.assertEqual(
+                issues,
+                [{field: issue[field] for field in fields} for issue in full],
+            )
+            self.assertEqual(tracker.count, queries + 2)
+
+    def test_fields_user_timezone(self):
+        User.objects.filter(pk=self.user.pk).update(user_timezone="Asia/Kolkata")
+        self.create_issues(2)
+        full = self.get()
+        issues = self.get(["id", "created_at", "updated_at"])
+
+        # Dates are in the timezone of the user on every path
+        self.assertEqual(
+            issues,
+            [
+                {field: issue[field] for field in ["id", "created_at", "updated_at"]}
+                for issue in full
+            ],
+        )
+        for issue in issues:
+            self.assertTrue(issue["created_at"].endswith("+05:30"), issue)
@@ -0,0 +1,112 @@
+# Python imports
+import uuid
+from datetime import timedelta
+
+# Django imports
+from django.test import TestCase
+from django.utils import timezone
+
+# Module imports
+from plane.bgtasks.issue_automation_task import (
+    archive_and_close_old_issues,
+    automate_project_issues,
+)
+from plane.db.models import (
+    Cycle,
+    CycleIssue,
+    Issue,
+    IssueActivity,
+    Project,
+    State,
+    User,
+    Workspace,
+)
+
+
+class IssueAutomationTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(
+            email="user@plane.so", username=uuid.uuid4().hex, first_name="User"
+        )
+        workspace = Workspace.objects.create(name="Plane", slug="plane", owner=self.user)
+        self.project = Project.objects.create(
+            name="Plane",
+            identifier="PLN",
+            workspace=workspace,
+            archive_in=1,
+            close_in=1,
+        )
+        # The automation acts as the creator of the project
+        Project.objects.filter(pk=self.project.pk).update(created_by=self.user)
+        self.done = State.objects.create(
+            name="Done", group="completed", project=self.project
+        )
+        self.doing = State.objects.create(
+            name="Doing", group="started", project=self.project
+        )
+        self.cancelled = State.objects.create(
+            name="Cancelled", group="cancelled", project=self.project
+        )
+
+        self.completed = Issue.objects.create(
+            name="Completed", project=self.project, state=self.done
+        )
+        self.started = Issue.objects.create(
+            name="Started", project=self.project, state=self.doing
+        )
+        self.in_cycle = Issue.objects.create(
+            name="In a running cycle", project=self.project, state=self.doing
+        )
+        self.recent = Issue.objects.create(
+            name="Recent", project=self.project, state=self.done
+        )
+        cycle = Cycle.objects.create(
+            name="Cycle",
+            project=self.project,
+            owned_by=self.user,
+            end_date=timezone.now() + timedelta(days=7),
+        )
+        CycleIssue.objects.create(
+            issue=self.in_cycle, cycle=cycle, project=self.project
+        )
+        Issue.objects.exclude(pk=self.recent.pk).update(
+            updated_at=timezone.now() - timedelta(days=60)
+        )
+
+    def test_archive_and_close(self):
+        archive_and_close_old_issues()
+
+        self.completed.refresh_from_db()
+        self.assertEqual(self.completed.archived_at, timezone.now().date())
+        self.started.refresh_from_db()
+        self.assertEqual(self.started.state_id, self.cancelled.id)
+        # Changed issues are picked up by the sync
+        self.assertGreater(
+            self.started.updated_at, timezone.now() - timedelta(minutes=1)
+        )
+        for issue in [self.in_cycle, self.recent]:
+            issue.refresh_from_db()
+            self.assertIsNone(issue.archived_at)
+        self.assertEqual(self.in_cycle.state_id, self.doing.id)
+
+        self.assertEqual(
+            list(
+                IssueActivity.objects.filter(project=self.project)
+                .order_by("issue__name")
+                .values_list("issue_id", "field", "new_value", "actor_id")
+            ),
+            [
+                (self.completed.id, "archived_at", "archive", self.user.id),
+                (self.started.id, "state", "Cancelled", self.user.id),
+            ],
+        )
+
+    def test_result(self):
+        result = automate_project_issues(str(self.project.id))
+        self.assertEqual(
+            {key: result[key] for key in ["archived", "closed", "failed"]},
+            {"archived": 1, "closed": 1, "failed": False},
+        )
+        # Nothing is left to do
+        result = automate_project_issues(str(self.project.id))
+        self.assertEqual((result["archived"], result["closed"]), (0, 0))
@@ -0,0 +1,210 @@
+# Python imports
+import asyncio
+import json
+import uuid
+from unittest import mock
+
+# Django imports
+from django.test import SimpleTestCase, TransactionTestCase
+from django.urls import reverse
+
+# Third party import
+from asgiref.sync import async_to_sync
+from asgiref.testing import ApplicationCommunicator
+from channels.db import database_sync_to_async
+from rest_framework import status
+
+# Module imports
+from .base import AuthenticatedAPITest
+from plane.api.consumers import LIVE_UPDATES_PROTOCOL, LiveUpdatesConsumer
+from plane.api.views.authentication import get_tokens_for_user
+from plane.db.models import (
+    Issue,
+    Project,
+    ProjectMember,
+    User,
+    Workspace,
+    WorkspaceMember,
+)
+from plane.utils.live_updates import LiveUpdateHub, project_channel, user_channel
+
+
+class LiveUpdatesConsumerTest(SimpleTestCase):
+    @async_to_sync
+    async def connect(self, subprotocols):
+        communicator = ApplicationCommunicator(
+            LiveUpdatesConsumer.as_asgi(),
+            {
+                "type": "websocket",
+                "path": "/api/workspaces/plane/live/",
+                "subprotocols": subprotocols,
+                "url_route": {"kwargs": {"slug": "plane"}},
+            },
+        )
+        await communicator.send_input({"type": "websocket.connect"})
+        message = await communicator.receive_output()
+        await communicator.wait()
+        return message
+
+    def test_rejected(self):
+        for subprotocols in [[], [LIVE_UPDATES_PROTOCOL], [LIVE_UPDATES_PROTOCOL, "token"]]:
+            self.assertEqual(self.connect(subprotocols)["type"], "websocket.close")
+
+
+class FakePubSub:
+    """The redis subscription of the hub, messages are put on a queue"""
+
+    def __init__(self):
+        self.channels = set()
+        self.messages = asyncio.Queue()
+
+    async def subscribe(self, *channels):
+        self.channels.update(channels)
+
+    async def unsubscribe(self, *channels):
+        self.channels.difference_update(channels)
+
+    async def get_message(self, ignore_subscribe_messages, timeout):
+        try:
+            return await asyncio.wait_for(self.messages.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+# The consumer reads the database from another thread
+class LiveUpdatesSocketTest(TransactionTestCase):
+    def setUp(self):
+        self.user = User.objects.create(email="user@plane.so", username=uuid.uuid4().hex)
+        workspace = Workspace.objects.create(name="Plane", slug="plane", owner=self.user)
+        WorkspaceMember.objects.create(workspace=workspace, member=self.user, role=20)
+        self.project = Project.objects.create(
+            name="Plane", identifier="PLN", workspace=workspace
+        )
+        ProjectMember.objects.create(project=self.project, member=self.user, role=20)
+
+        self.hub = LiveUpdateHub()
+        self.pubsub = FakePubSub()
+        for patcher in [
+            mock.patch("plane.api.consumers.hub", self.hub),
+            mock.patch(
+                "plane.utils.live_updates.async_redis_instance",
+                return_value=mock.Mock(pubsub=mock.Mock(return_value=self.pubsub)),
+            ),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def connect(self):
+        access_token, _ = await database_sync_to_async(get_tokens_for_user)(
+            self.user
+        )
+        communicator = ApplicationCommunicator(
+            LiveUpdatesConsumer.as_asgi(),
+            {
+                "type": "websocket",
+                "path": "/api/workspaces/plane/live/",
+                "subprotocols": [LIVE_UPDATES_PROTOCOL, access_token],
+                "url_route": {"kwargs": {"slug": "plane"}},
+            },
+        )
+        await communicator.send_input({"type": "websocket.connect"})
+        return communicator, await communicator.receive_output()
+
+    async def publish(self, channel, event):
+        await self.pubsub.messages.put(
+            {
+                "type": "message",
+                "channel": channel.encode(),
+                "data": json.dumps(event).encode(),
+            }
+        )
+
+    async def disconnect(self, communicator):
+        await communicator.send_input({"type": "websocket.disconnect", "code": 1000})
+        await communicator.wait()
+        self.hub.reader.cancel()
+
+    @async_to_sync
+    async def receive_event(self, event):
+        communicator, accepted = await self.connect()
+        await self.publish(project_channel(self.project.id), event)
+        message = await communicator.receive_output()
+        await self.disconnect(communicator)
+        return accepted, message
+
+    def test_receive_event(self):
+        event = {"event": "issues.changed", "project_id": str(self.project.id)}
+        accepted, message = self.receive_event(event)
+        self.assertEqual(
+            accepted, {"type": "websocket.accept", "subprotocol": LIVE_UPDATES_PROTOCOL}
+        )
+        self.assertEqual(message["type"], "websocket.send")
+        self.assertEqual(json.loads(message["text"]), event)
+        # The channels of the socket are released once it is closed
+        self.assertEqual(self.pubsub.channels, set())
+
+    @async_to_sync
+    async def test_member_removed(self):
+        communicator, _ = await self.connect()
+        self.assertIn(project_channel(self.project.id), self.pubsub.channels)
+
+        with mock.patch("plane.utils.live_updates.publish") as publish:
+            await database_sync_to_async(
+                ProjectMember.objects.filter(project=self.project).delete
+            )()
+        ((channel, event), _) = publish.call_args
+        self.assertEqual(channel, user_channel(self.user.id))
+        self.assertEqual(event["event"], "memberships.changed")
+
+        # The socket reads its projects again and leaves the project
+        await self.publish(channel, event)
+        await communicator.receive_output()
+        self.assertEqual(self.pubsub.channels, {user_channel(self.user.id)})
+        await self.publish(
+            project_channel(self.project.id), {"event": "issues.changed"}
+        )
+        self.assertTrue(await communicator.receive_nothing())
+
+        await self.disconnect(communicator)
+
+
+class LiveUpdatesPublishTest(AuthenticatedAPITest):
+    def setUp(self):
+        super().setUp()
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        WorkspaceMember.objects.create(
+            workspace=self.workspace, member=self.user, role=20
+        )
+        self.project = Project.objects.create(
+            name="Plane", identifier="PLN", workspace=self.workspace
+        )
+        ProjectMember.objects.create(project=self.project, member=self.user, role=20)
+
+    @mock.patch("plane.utils.live_updates.publish")
+    def test_issue_changes(self, publish):
+        issue = Issue.objects.create(name="Issue", project=self.project)
+        response = self.client.patch(
+            reverse(
+                "project-issue",
+                kwargs={
+                    "slug": self.workspace.slug,
+                    "project_id": str(self.project.id),
+                    "pk": issue.id,
+                },
+            ),
+            {"priority": "high"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        publish.assert_called_once_with(
+            project_channel(self.project.id),
+            {
+                "event": "issues.changed",
+                "project_id": str(self.project.id),
+                "issue_ids": [str(issue.id)],
+                "actor_id": str(self.user.id),
+            },
+        )
@@ -0,0 +1,64 @@
+# Python imports
+import smtplib
+from unittest import mock
+
+# Django imports
+from django.core import mail
+from django.test import TestCase, override_settings
+
+# Module imports
+from plane.bgtasks.magic_link_code_task import magic_link
+from plane.utils import mailer
+from plane.utils.mailer import build_email, close_mail_connection, send_emails
+
+
+@override_settings(
+    EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+    EMAIL_BATCH_SIZE=2,
+)
+class MailerTest(TestCase):
+    def setUp(self):
+        close_mail_connection()
+        self.addCleanup(close_mail_connection)
+
+    def messages(self, count):
+        return [
+            build_email(
+                "Login for Plane",
+                "emails/auth/magic_signin.html",
+                {"magic_url": f"https://plane.so/{index}", "code": index},
+                [f"user-{index}@plane.so"],
+            )
+            for index in range(count)
+        ]
+
+    def test_connection_per_batch(self):
+        with mock.patch.object(
+            mailer, "get_connection", wraps=mailer.get_connection
+        ) as get_connection:
+            self.assertEqual(send_emails(self.messages(5)), 5)
+        self.assertEqual(get_connection.call_count, 3)
+        self.assertEqual(
+            [msg.to for msg in mail.outbox], [[f"user-{i}@plane.so"] for i in range(5)]
+        )
+
+    def test_refused_and_disconnected(self):
+        connection = mock.Mock()
+        connection.send_messages.side_effect = [
+            1,
+            smtplib.SMTPRecipientsRefused({}),
+            smtplib.SMTPServerDisconnected(),
+            1,
+        ]
+        with mock.patch.object(mailer, "get_connection", return_value=connection):
+            # The refused message is skipped, the dropped one sent again
+            self.assertEqual(send_emails(self.messages(3)), 2)
+        self.assertEqual(connection.send_messages.call_count, 4)
+
+    def test_task(self):
+        magic_link("user@plane.so", "key", "token", "https://plane.so")
+        self.assertEqual(len(mail.outbox), 1)
+        msg = mail.outbox[0]
+        self.assertEqual(msg.subject, "Login for Plane")
+        self.assertIn("token", msg.body)
+        self.assertEqual(msg.alternatives[0][1], "text/html")
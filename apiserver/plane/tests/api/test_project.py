@@ -1 +1,44 @@
-# TODO: Write Tests for project endpoints
\ No newline at end of file
+# Django imports
+from django.urls import reverse
+
+# Third party import
+from rest_framework import status
+
+# Module imports
+from .base import AuthenticatedAPITest
+from plane.db.models import Project, ProjectMember, Workspace, WorkspaceMember
+
+
+class ProjectListFieldsTest(AuthenticatedAPITest):
+    def setUp(self):
+        super().setUp()
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        WorkspaceMember.objects.create(
+            workspace=self.workspace, member=self.user, role=20
+        )
+        for identifier in ["PLN", "WEB"]:
+            project = Project.objects.create(
+                name=identifier, identifier=identifier, workspace=self.workspace
+            )
+            ProjectMember.objects.create(project=project, member=self.user, role=20)
+
+    def get(self, fields=None):
+        response = self.client.get(
+            reverse("project", kwargs={"slug": self.workspace.slug}),
+            {"fields": ",".join(fields)} if fields else {},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()
+
+    def test_fields(self):
+        full = self.get()
+        for fields in [
+            ["id", "name", "network", "created_at", "is_member", "sort_order"],
+            ["id", "identifier", "total_members", "members"],
+        ]:
+            self.assertEqual(
+                self.get(fields),
+                [{field: project[field] for field in fields} for project in full],
+            )
@@ -0,0 +1,314 @@
+# Python imports
+import logging
+import uuid
+from datetime import timedelta
+from unittest import mock
+
+# Django imports
+from django.test import SimpleTestCase
+from django.urls import reverse
+from django.utils import timezone
+
+# Third party import
+from rest_framework import status
+
+# Module imports
+from .base import AuthenticatedAPITest
+from plane.utils.query_tracker import QueryTracker
+from plane.db.models import (
+    Cycle,
+    CycleIssue,
+    Issue,
+    IssueActivity,
+    IssueAssignee,
+    IssueComment,
+    IssueLabel,
+    Label,
+    Module,
+    ModuleIssue,
+    Notification,
+    Page,
+    PageBlock,
+    Project,
+    ProjectMember,
+    State,
+    User,
+    Workspace,
+    WorkspaceMember,
+)
+
+
+class QueryCountTest(AuthenticatedAPITest):
+    """
+    The number of queries of the list and retrieve endpoints must not
+    depend on the number of rows they return. Every endpoint is called with
+    SMALL and with LARGE rows in the workspace and both counts must match,
+    they are also pinned so an extra join or prefetch is a conscious change.
+    """
+
+    SMALL = 2
+    LARGE = 6
+
+    def setUp(self):
+        super().setUp()
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        WorkspaceMember.objects.create(
+            workspace=self.workspace, member=self.user, role=20
+        )
+        self.project = Project.objects.create(
+            name="Plane", identifier="PLN", workspace=self.workspace
+        )
+        ProjectMember.objects.create(
+            project=self.project, member=self.user, role=20
+        )
+        self.state = State.objects.create(
+            name="Todo", group="unstarted", default=True, project=self.project
+        )
+        self.cycle = Cycle.objects.create(
+            name="Cycle",
+            project=self.project,
+            owned_by=self.user,
+            start_date=timezone.now().date() - timedelta(days=7),
+            end_date=timezone.now().date() + timedelta(days=7),
+        )
+        self.module = Module.objects.create(
+            name="Module",
+            project=self.project,
+            start_date=timezone.now().date() - timedelta(days=7),
+            target_date=timezone.now().date() + timedelta(days=7),
+        )
+        self.page = Page.objects.create(
+            name="Page", project=self.project, owned_by=self.user
+        )
+        self.issue = None
+        self.rows = 0
+
+    def create_rows(self, count):
+        """
+        Add rows touching every relation the endpoints serialize, each with
+        its own user so per row lookups of users show up as well.
+        """
+        for _ in range(count):
+            self.rows += 1
+            member = User.objects.create(
+                email=f"member-{self.rows}@plane.so", username=uuid.uuid4().hex
+            )
+            WorkspaceMember.objects.create(workspace=self.workspace, member=member)
+            ProjectMember.objects.create(project=self.project, member=member)
+
+            issue = Issue.objects.create(
+                name=f"Issue {self.rows}", project=self.project, state=self.state
+            )
+            # Rows of the retrieve endpoints hang off the first issue
+            self.issue = self.issue or issue
+            label = Label.objects.create(
+                name=f"Label {self.rows}", project=self.project
+            )
+            IssueLabel.objects.create(issue=issue, label=label, project=self.project)
+            IssueLabel.objects.create(
+                issue=self.issue, label=label, project=self.project
+            )
+            IssueAssignee.objects.create(
+                issue=issue, assignee=member, project=self.project
+            )
+            CycleIssue.objects.create(
+                issue=issue, cycle=self.cycle, project=self.project
+            )
+            ModuleIssue.objects.create(
+                issue=issue, module=self.module, project=self.project
+            )
+            comment = IssueComment.objects.create(
+                issue=self.issue,
+                actor=member,
+                comment_html="<p>Comment</p>",
+                project=self.project,
+            )
+            IssueActivity.objects.create(
+                issue=self.issue,
+                actor=member,
+                verb="updated",
+                field="priority",
+                project=self.project,
+            )
+            IssueActivity.objects.create(
+                issue=self.issue,
+                issue_comment=comment,
+                actor=member,
+                verb="created",
+                field="comment",
+                project=self.project,
+            )
+            Notification.objects.create(
+                workspace=self.workspace,
+                project=self.project,
+                entity_identifier=issue.id,
+                entity_name="issue",
+                sender="in_app:issue_activities:assigned",
+                triggered_by=member,
+                receiver=self.user,
+                data={},
+            )
+            Cycle.objects.create(
+                name=f"Cycle {self.rows}", project=self.project, owned_by=member
+            )
+            Module.objects.create(
+                name=f"Module {self.rows}", project=self.project, lead=member
+            )
+            page = Page.objects.create(
+                name=f"Page {self.rows}", project=self.project, owned_by=member
+            )
+            PageBlock.objects.create(
+                name="Block", page=page, issue=issue, project=self.project
+            )
+            PageBlock.objects.create(
+                name="Block", page=self.page, issue=issue, project=self.project
+            )
+            Project.objects.create(
+                name=f"Project {self.rows}",
+                identifier=f"P{self.rows}",
+                workspace=self.workspace,
+                project_lead=member,
+            )
+
+    def get_queries(self, url):
+        with QueryTracker(url) as tracker:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        return tracker
+
+    def assertQueryCount(self, get_url, expected):
+        self.create_rows(self.SMALL)
+        small = self.get_queries(get_url())
+
+        self.create_rows(self.LARGE - self.SMALL)
+        large = self.get_queries(get_url())
+
+        self.assertEqual(
+            small.count,
+            large.count,
+            "Query count grows with the rows, repeated statements:\n"
+            + "\n".join(
+                f"{count}x {sql}" for count, sql in large.duplicates.values()
+            ),
+        )
+        self.assertEqual(
+            large.count, expected, "\n".join(large.statements.elements())
+        )
+
+    def url(self, name, **kwargs):
+        return reverse(name, kwargs={"slug": self.workspace.slug, **kwargs})
+
+    def test_project_list(self):
+        self.assertQueryCount(lambda: self.url("project"), 4)
+
+    def test_project_retrieve(self):
+        self.assertQueryCount(lambda: self.url("project", pk=self.project.id), 3)
+
+    def test_issue_list(self):
+        self.assertQueryCount(
+            lambda: self.url("project-issue", project_id=self.project.id), 6
+        )
+
+    def test_issue_retrieve(self):
+        self.assertQueryCount(
+            lambda: self.url(
+                "project-issue", project_id=self.project.id, pk=self.issue.id
+            ),
+            11,
+        )
+
+    def test_issue_history(self):
+        self.assertQueryCount(
+            lambda: self.url(
+                "project-issue-history",
+                project_id=self.project.id,
+                issue_id=self.issue.id,
+            ),
+            5,
+        )
+
+    def test_cycle_list(self):
+        self.assertQueryCount(
+            lambda: self.url("project-cycle", project_id=self.project.id), 7
+        )
+
+    def test_cycle_retrieve(self):
+        self.assertQueryCount(
+            lambda: self.url(
+                "project-cycle", project_id=self.project.id, pk=self.cycle.id
+            ),
+            10,
+        )
+
+    def test_cycle_issue_list(self):
+        self.assertQueryCount(
+            lambda: self.url(
+                "project-issue-cycle",
+                project_id=self.project.id,
+                cycle_id=self.cycle.id,
+            ),
+            5,
+        )
+
+    def test_module_list(self):
+        self.assertQueryCount(
+            lambda: self.url("project-modules", project_id=self.project.id), 5
+        )
+
+    def test_module_retrieve(self):
+        self.assertQueryCount(
+            lambda: self.url(
+                "project-modules", project_id=self.project.id, pk=self.module.id
+            ),
+            8,
+        )
+
+    def test_module_issue_list(self):
+        self.assertQueryCount(
+            lambda: self.url(
+                "project-module-issues",
+                project_id=self.project.id,
+                module_id=self.module.id,
+            ),
+            5,
+        )
+
+    def test_notification_list(self):
+        self.assertQueryCount(lambda: self.url("notifications"), 2)
+
+    def test_notification_retrieve(self):
+        self.assertQueryCount(
+            lambda: self.url("notifications")
+            + f"{Notification.objects.filter(receiver=self.user).first().id}/",
+            2,
+        )
+
+    def test_page_list(self):
+        self.assertQueryCount(
+            lambda: self.url("project-pages", project_id=self.project.id)
+            + "?page_view=all",
+            5,
+        )
+
+    def test_page_retrieve(self):
+        self.assertQueryCount(
+            lambda: self.url(
+                "project-pages", project_id=self.project.id, pk=self.page.id
+            ),
+            5,
+        )
+
+
+class QueryTrackerReportTest(SimpleTestCase):
+    def test_stats_encoded_only_when_logged(self):
+        tracker = QueryTracker("GET /")
+        with mock.patch("plane.utils.query_tracker.json.dumps") as dumps:
+            with mock.patch.object(
+                logging.getLogger("plane.db.queries"),
+                "isEnabledFor",
+                return_value=False,
+            ):
+                self.assertEqual(tracker.report()["queries"], 0)
+            dumps.assert_not_called()
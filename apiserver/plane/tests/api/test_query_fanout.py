@@ -0,0 +1,114 @@
+# Python imports
+import threading
+import time
+
+# Django imports
+from django.conf import settings
+from django.db import connection, transaction
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+
+# Module imports
+from plane.db.models import User
+from plane.utils.query_fanout import close_connections, run_concurrently
+from plane.utils.query_tracker import QueryTracker
+
+
+class QueryFanoutTest(SimpleTestCase):
+    def test_run_concurrently(self):
+        def query(value):
+            def run():
+                time.sleep(0.2)
+                return value, threading.current_thread().name
+
+            return run
+
+        start = time.perf_counter()
+        results = run_concurrently({key: query(key) for key in range(4)})
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual([value for value, _ in results.values()], [0, 1, 2, 3])
+        self.assertTrue(
+            all(name.startswith("query-fanout") for _, name in results.values())
+        )
+        self.assertLess(elapsed, 0.6)
+
+    def test_disabled(self):
+        with self.settings(QUERY_FANOUT_WORKERS=0):
+            results = run_concurrently(
+                {key: threading.current_thread for key in range(2)}
+            )
+        self.assertEqual(set(results.values()), {threading.current_thread()})
+
+    def test_exception(self):
+        def fail():
+            raise ValueError("failed")
+
+        with self.assertRaises(ValueError):
+            run_concurrently({"ok": dict, "fail": fail})
+
+
+class QueryFanoutDatabaseTest(TransactionTestCase):
+    def tearDown(self):
+        # The workers keep their connections, the test database is dropped
+        close_connections()
+
+    def test_querysets(self):
+        User.objects.create(email="user@plane.so", username="user")
+
+        with QueryTracker("fanout") as tracker:
+            results = run_concurrently(
+                {
+                    "count": User.objects.count,
+                    "emails": User.objects.values_list("email", flat=True),
+                }
+            )
+
+        self.assertEqual(results, {"count": 1, "emails": ["user@plane.so"]})
+        # The queries of the workers are tracked for the caller
+        self.assertEqual(tracker.count, 2)
+
+    def test_atomic_block(self):
+        # Rows of an open transaction are only visible to its connection
+        with transaction.atomic():
+            User.objects.create(email="user@plane.so", username="user")
+            results = run_concurrently(
+                {"count": User.objects.count, "thread": threading.current_thread}
+            )
+        self.assertEqual(results["count"], 1)
+        self.assertEqual(results["thread"], threading.current_thread())
+
+    def backend_pids(self):
+        # Each worker takes one of the queries, it waits for the others
+        barrier = threading.Barrier(settings.QUERY_FANOUT_WORKERS)
+
+        def backend_pid():
+            barrier.wait()
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_backend_pid()")
+                return cursor.fetchone()[0]
+
+        queries = {i: backend_pid for i in range(settings.QUERY_FANOUT_WORKERS)}
+        return set(run_concurrently(queries).values())
+
+    def test_connections_reused(self):
+        first = self.backend_pids()
+        self.assertEqual(len(first), settings.QUERY_FANOUT_WORKERS)
+        self.assertEqual(self.backend_pids(), first)
+
+    @override_settings(QUERY_FANOUT_CONN_MAX_AGE=0)
+    def test_connections_expire(self):
+        first = self.backend_pids()
+        self.assertFalse(self.backend_pids() & first)
+
+    def test_dropped_connections(self):
+        User.objects.create(email="user@plane.so", username="user")
+        queries = {"count": User.objects.count, "exists": User.objects.exists}
+        run_concurrently(queries)
+
+        # The server drops the connections of the idle workers
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+                "WHERE datname = current_database() AND pid <> pg_backend_pid()"
+            )
+        self.assertEqual(run_concurrently(queries), {"count": 1, "exists": True})
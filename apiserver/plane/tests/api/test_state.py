@@ -1 +1,84 @@
-# TODO: Wrote test for state endpoints
\ No newline at end of file
+# Python imports
+from unittest import mock
+
+# Django imports
+from django.urls import reverse
+
+# Third party import
+from rest_framework import status
+
+# Module imports
+from .base import AuthenticatedAPITest
+from plane.bgtasks.issue_activites_task import issue_activity
+from plane.db.models import Project, ProjectMember, State, Workspace, WorkspaceMember
+
+
+class StateListETagTest(AuthenticatedAPITest):
+    def setUp(self):
+        super().setUp()
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        WorkspaceMember.objects.create(
+            workspace=self.workspace, member=self.user, role=20
+        )
+        self.project = Project.objects.create(
+            name="Plane", identifier="PLN", workspace=self.workspace
+        )
+        ProjectMember.objects.create(project=self.project, member=self.user, role=20)
+        State.objects.create(name="Todo", group="unstarted", project=self.project)
+        self.url = reverse(
+            "project-states",
+            kwargs={"slug": self.workspace.slug, "project_id": self.project.id},
+        )
+
+    def test_conditional_get(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response["ETag"]
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # A write under the project changes the ETag
+        response = self.client.post(
+            self.url, {"name": "Done", "group": "completed", "color": "#000000"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 2)
+        etag = response["ETag"]
+
+        # So does enqueuing an activity from a background write
+        issue_activity.delay(
+            type="unknown",
+            requested_data=None,
+            current_instance=None,
+            issue_id=None,
+            project_id=str(self.project.id),
+            actor_id=str(self.user.id),
+            epoch=0,
+        )
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_activity_written(self):
+        etags = []
+
+        def run(**kwargs):
+            # A list read while the activity is being written
+            etags.append(self.client.get(self.url)["ETag"])
+
+        with mock.patch.object(issue_activity, "run", side_effect=run):
+            issue_activity.delay(
+                type="unknown",
+                requested_data=None,
+                current_instance=None,
+                issue_id=None,
+                project_id=str(self.project.id),
+                actor_id=str(self.user.id),
+                epoch=0,
+            )
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etags[0])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -0,0 +1,158 @@
+# Python imports
+import uuid
+from datetime import timedelta
+from unittest import mock
+
+# Django imports
+from django.core.files.base import ContentFile
+from django.db import DatabaseError
+from django.db.models import QuerySet
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+# Third party imports
+from botocore.stub import ANY, Stubber
+
+# Module imports
+from plane.bgtasks.exporter_expired_task import (
+    delete_old_s3_link,
+    delete_orphaned_files,
+)
+from plane.db.models import (
+    DeletedFile,
+    ExporterHistory,
+    FileAsset,
+    Issue,
+    IssueAttachment,
+    Project,
+    User,
+    Workspace,
+)
+from plane.utils.cascade_delete import cascade_delete
+from plane.utils.storage_cleanup import delete_keys, get_s3_client
+
+
+@override_settings(
+    DOCKERIZED=False,
+    AWS_REGION="us-east-1",
+    AWS_ACCESS_KEY_ID="access-key",
+    AWS_SECRET_ACCESS_KEY="secret-key",
+    AWS_S3_BUCKET_NAME="uploads",
+)
+class StorageCleanupTest(TestCase):
+    def setUp(self):
+        self.s3 = get_s3_client()
+        self.stubber = Stubber(self.s3)
+        self.stubber.activate()
+        patcher = mock.patch(
+            "plane.bgtasks.exporter_expired_task.get_s3_client", return_value=self.s3
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.user = User.objects.create(
+            email="user@plane.so", username=uuid.uuid4().hex, first_name="User"
+        )
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+
+    def expect_delete(self, keys, errors=()):
+        self.stubber.add_response(
+            "delete_objects",
+            {"Errors": [{"Key": key, "Message": "Access Denied"} for key in errors]},
+            {
+                "Bucket": "uploads",
+                "Delete": {"Objects": [{"Key": key} for key in keys], "Quiet": True},
+            },
+        )
+
+    def test_delete_keys(self):
+        keys = [f"file-{i}" for i in range(2500)]
+        self.expect_delete(keys[:1000])
+        self.expect_delete(keys[1000:2000], errors=["file-1001"])
+        self.expect_delete(keys[2000:])
+        # Empty and repeated keys are dropped
+        self.assertEqual(delete_keys(keys + ["", "file-1"], self.s3), {"file-1001"})
+        self.stubber.assert_no_pending_responses()
+
+    def test_delete_old_s3_link(self):
+        exports = [
+            ExporterHistory.objects.create(
+                workspace=self.workspace,
+                initiated_by=self.user,
+                provider="csv",
+                key=f"export-{i}.zip",
+                url=f"https://s3/export-{i}.zip",
+            )
+            for i in range(3)
+        ]
+        ExporterHistory.objects.filter(pk__in=[exports[0].pk, exports[1].pk]).update(
+            created_at=timezone.now() - timedelta(days=9)
+        )
+        self.stubber.add_response(
+            "delete_objects",
+            {"Errors": [{"Key": "export-1.zip", "Message": "Access Denied"}]},
+            {"Bucket": "uploads", "Delete": ANY},
+        )
+        delete_old_s3_link()
+
+        self.assertEqual(
+            {
+                export.key: export.url
+                for export in ExporterHistory.objects.order_by("key")
+            },
+            {
+                "export-0.zip": None,
+                "export-1.zip": "https://s3/export-1.zip",
+                "export-2.zip": "https://s3/export-2.zip",
+            },
+        )
+
+    def test_delete_orphaned_files(self):
+        project = Project.objects.create(
+            name="Plane", identifier="PLN", workspace=self.workspace
+        )
+        issue = Issue.objects.create(name="Issue", project=project)
+        attachment = IssueAttachment.objects.create(
+            issue=issue, project=project, asset=ContentFile(b"file", name="file.txt")
+        )
+        asset = FileAsset.objects.create(
+            workspace=self.workspace, asset=ContentFile(b"image", name="image.png")
+        )
+        self.addCleanup(attachment.asset.storage.delete, attachment.asset.name)
+        self.addCleanup(asset.asset.storage.delete, asset.asset.name)
+
+        cascade_delete(Workspace.objects.filter(pk=self.workspace.pk))
+        self.assertEqual(
+            set(DeletedFile.objects.values_list("key", flat=True)),
+            {attachment.asset.name, asset.asset.name},
+        )
+
+        keys = list(DeletedFile.objects.order_by("id").values_list("key", flat=True))
+        self.expect_delete(keys, errors=[keys[0]])
+        delete_orphaned_files()
+        self.assertEqual(
+            list(DeletedFile.objects.values_list("key", flat=True)), [keys[0]]
+        )
+
+    def test_failed_delete_keeps_files(self):
+        asset = FileAsset.objects.create(
+            workspace=self.workspace, asset=ContentFile(b"image", name="image.png")
+        )
+        self.addCleanup(asset.asset.storage.delete, asset.asset.name)
+        raw_delete = QuerySet._raw_delete
+
+        def fail_on_assets(rows, using):
+            if rows.model is FileAsset:
+                raise DatabaseError("canceling statement due to statement timeout")
+            return raw_delete(rows, using)
+
+        with mock.patch.object(
+            QuerySet, "_raw_delete", autospec=True, side_effect=fail_on_assets
+        ):
+            with self.assertRaises(DatabaseError):
+                cascade_delete(Workspace.objects.filter(pk=self.workspace.pk))
+
+        self.assertTrue(FileAsset.objects.filter(pk=asset.pk).exists())
+        self.assertFalse(DeletedFile.objects.exists())
@@ -0,0 +1,45 @@
+# Python imports
+from unittest import mock
+
+# Django imports
+from django.test import TestCase
+
+# Module imports
+from plane.celery import app
+from plane.utils.task_queues import get_queue_depths, get_queue_names
+
+
+class TaskQueuesTest(TestCase):
+    def route(self, name):
+        return app.amqp.router.route({}, name)
+
+    def test_routes(self):
+        route = self.route("plane.bgtasks.email_verification_task.email_verification")
+        self.assertEqual((route["queue"].name, route["priority"]), ("emails", 0))
+        route = self.route("plane.bgtasks.issue_activites_task.issue_activity")
+        self.assertEqual(route["queue"].name, "activities")
+        route = self.route("plane.bgtasks.export_task.issue_export_task")
+        self.assertEqual((route["queue"].name, route["priority"]), ("exports", 9))
+        # Long running work never comes before the interactive tasks
+        route = self.route("plane.bgtasks.analytic_plot_export.analytic_export_task")
+        self.assertEqual((route["queue"].name, route["priority"]), ("exports", 9))
+        # Tasks without a route go to the default queue
+        self.assertEqual(self.route("plane.unknown.task")["queue"].name, "default")
+
+    def test_workers_consume_every_queue(self):
+        queues = [queue.name for queue in app.conf.task_queues]
+        self.assertEqual(queues, get_queue_names())
+        # Interactive queues are served first within a priority
+        self.assertEqual(queues[:3], ["activities", "notifications", "emails"])
+
+    def test_queue_depths(self):
+        queues = get_queue_names()
+        pipeline = mock.Mock()
+        # A list of 1 message for every priority step of every queue
+        pipeline.execute.return_value = [1] * (len(queues) * 4)
+        with mock.patch("plane.utils.task_queues.redis_instance") as redis_instance:
+            redis_instance.return_value.pipeline.return_value = pipeline
+            depths = get_queue_depths()
+        self.assertEqual(depths, {queue: 4 for queue in queues})
+        pipeline.llen.assert_any_call("emails")
+        pipeline.llen.assert_any_call("emails:9")
@@ -0,0 +1,35 @@
+# Django imports
+from django.db import connections, router
+
+
+def copy_insert(model, objs):
+    """
+    Insert model instances with COPY instead of multi row INSERTs. Values go
+    through the same pre_save and get_db_prep_save as bulk_create, so
+    defaults, auto_now fields and JSON are stored the same way, but model
+    save() and signals are skipped just as with bulk_create. Primary keys
+    must be set on the instances already, nothing is returned by COPY.
+    """
+    objs = list(objs)
+    if not objs:
+        return objs
+
+    connection = connections[router.db_for_write(model)]
+    quote_name = connection.ops.quote_name
+    fields = model._meta.concrete_fields
+    columns = ", ".join(quote_name(field.column) for field in fields)
+
+    with connection.cursor() as cursor:
+        with cursor.copy(
+            f"COPY {quote_name(model._meta.db_table)} ({columns}) FROM STDIN"
+        ) as copy:
+            for obj in objs:
+                copy.write_row(
+                    [
+                        field.get_db_prep_save(
+                            field.pre_save(obj, add=True), connection
+                        )
+                        for field in fields
+                    ]
+                )
+    return objs
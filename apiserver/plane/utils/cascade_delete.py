@@ -0,0 +1,72 @@
+# Python imports
+from collections import Counter
+
+# Django imports
+from django.conf import settings
+from django.db import transaction
+from django.db.models import CASCADE, DO_NOTHING, SET_NULL
+from django.db.models.deletion import get_candidate_relations_to_delete
+
+
+def iterate_pks(queryset, chunk_size):
+    """Primary keys of the queryset in ascending chunks of chunk_size"""
+    last_pk = None
+    while True:
+        chunk = queryset.order_by("pk")
+        if last_pk is not None:
+            chunk = chunk.filter(pk__gt=last_pk)
+        pks = list(chunk.values_list("pk", flat=True)[:chunk_size])
+        if not pks:
+            return
+        yield pks
+        last_pk = pks[-1]
+
+
+def cascade_delete(queryset, chunk_size=None, progress=None):
+    """
+    Delete the rows of the queryset and every row depending on them without
+    loading any of them. The on_delete of each reverse relation is applied
+    with set based statements, dependents are removed before the rows they
+    point to and every statement is bounded by a chunk of primary keys, so
+    no long transaction is held and an interrupted run can simply be
+    started again. progress is called with the counts after every chunk.
+    No delete signal is sent, models keeping a trace of their deleted rows
+    get their primary keys through a record_deleted classmethod.
+    Returns the number of deleted rows per model.
+    """
+    chunk_size = chunk_size or settings.DELETION_CHUNK_SIZE
+    deleted = Counter()
+    for pks in iterate_pks(queryset, chunk_size):
+        delete_rows(queryset.model, pks, chunk_size, deleted, progress)
+    return deleted
+
+
+def delete_rows(model, pks, chunk_size, deleted, progress=None):
+    for relation in get_candidate_relations_to_delete(model._meta):
+        field = relation.field
+        on_delete = field.remote_field.on_delete
+        related = relation.related_model._base_manager.filter(
+            **{f"{field.name}__in": pks}
+        )
+
+        if on_delete is DO_NOTHING:
+            continue
+        elif on_delete is SET_NULL:
+            related.update(**{field.name: None})
+        elif on_delete is CASCADE:
+            for related_pks in iterate_pks(related, chunk_size):
+                delete_rows(
+                    relation.related_model, related_pks, chunk_size, deleted, progress
+                )
+        else:
+            # PROTECT, RESTRICT and SET() need the collector to decide
+            deleted.update(related.delete()[1])
+
+    rows = model._base_manager.filter(pk__in=pks)
+    # The trace of the rows is only kept if the rows are removed with it
+    with transaction.atomic(using=rows.db):
+        if hasattr(model, "record_deleted"):
+            model.record_deleted(pks)
+        deleted[model._meta.label] += rows._raw_delete(rows.db)
+    if progress is not None:
+        progress(deleted)
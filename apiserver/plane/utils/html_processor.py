@@ -1,24 +1,115 @@
+import hashlib
+import threading
+from collections import OrderedDict, namedtuple
 from io import StringIO
 from html.parser import HTMLParser
 
-class MLStripper(HTMLParser):
+ProcessedHTML = namedtuple("ProcessedHTML", ["text", "mentions"])
+
+# Characters of processed text kept in memory per process, a document
+# processing to more than this is not kept
+CACHE_MAX_CHARS = 8 * 1024 * 1024
+
+
+class HTMLProcessor(HTMLParser):
     """
-    Markup Language Stripper
+    Single streaming pass over a document collecting its text content and
+    the users referenced by <mention-component target="users"> tags.
     """
+
     def __init__(self):
-        super().__init__()
-        self.reset()
-        self.strict = False
-        self.convert_charrefs= True
+        super().__init__(convert_charrefs=True)
         self.text = StringIO()
+        # Insertion ordered set of the mentioned user ids
+        self.mentions = {}
 
     def handle_data(self, d):
         self.text.write(d)
 
+    def handle_starttag(self, tag, attrs):
+        if tag != "mention-component":
+            return
+        attrs = dict(attrs)
+        mention = attrs.get("id")
+        if attrs.get("target") == "users" and mention:
+            self.mentions[mention] = None
+
     def get_data(self):
         return self.text.getvalue()
 
+
+class ProcessedHTMLCache:
+    """
+    Least recently used results keyed by the hash of the document, bounded
+    by the length of their text rather than their number, as a description
+    can be a few hundred kilobytes.
+    """
+
+    def __init__(self, max_chars):
+        self.max_chars = max_chars
+        self.chars = 0
+        self.results = OrderedDict()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def weight(result):
+        return len(result.text) + sum(len(mention) for mention in result.mentions)
+
+    def get(self, key):
+        with self.lock:
+            result = self.results.get(key)
+            if result is not None:
+                self.results.move_to_end(key)
+            return result
+
+    def set(self, key, result):
+        weight = self.weight(result)
+        if weight > self.max_chars:
+            return
+        with self.lock:
+            previous = self.results.pop(key, None)
+            if previous is not None:
+                self.chars -= self.weight(previous)
+            self.results[key] = result
+            self.chars += weight
+            while self.chars > self.max_chars:
+                _, evicted = self.results.popitem(last=False)
+                self.chars -= self.weight(evicted)
+
+    def clear(self):
+        with self.lock:
+            self.results.clear()
+            self.chars = 0
+
+
+cache = ProcessedHTMLCache(CACHE_MAX_CHARS)
+
+
+def process_html(html):
+    """
+    Text content and mentioned user ids of a document in one parse. A save
+    reads both from the same document, and a document is often saved again
+    unchanged along with other fields, so the results are memoized by
+    content hash. Each process has its own cache.
+    """
+    if not html:
+        return ProcessedHTML("", ())
+
+    key = hashlib.blake2b(html.encode(), digest_size=16).digest()
+    result = cache.get(key)
+    if result is None:
+        processor = HTMLProcessor()
+        processor.feed(html)
+        processor.close()
+        result = ProcessedHTML(processor.get_data(), tuple(processor.mentions))
+        cache.set(key, result)
+    return result
+
+
 def strip_tags(html):
-    s = MLStripper()
-    s.feed(html)
-    return s.get_data()
+    return process_html(html).text
+
+
+def extract_mentions(html):
+    """Ids of the users mentioned in the document, without duplicates"""
+    return list(process_html(html).mentions)
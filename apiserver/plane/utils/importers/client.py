@@ -0,0 +1,94 @@
+# Python imports
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlparse
+
+# Django imports
+from django.conf import settings
+
+# Third party imports
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """
+    Session shared by the importers of this process. Connections to the
+    same host are kept alive in a pool sized for the concurrent fetches,
+    rate limits and gateway errors are retried with a backoff.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=10,
+                    pool_maxsize=settings.IMPORTER_FETCH_CONCURRENCY,
+                    max_retries=Retry(
+                        total=3,
+                        backoff_factor=0.5,
+                        status_forcelist=[429, 502, 503, 504],
+                        allowed_methods=["GET"],
+                    ),
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+
+def fetch(method, url, **kwargs):
+    kwargs.setdefault("timeout", settings.IMPORTER_FETCH_TIMEOUT)
+    return get_session().request(method, url, **kwargs)
+
+
+def fetch_concurrently(calls):
+    """
+    Run the callables of a dict on a bounded thread pool and return their
+    results under the same keys. The first exception is raised.
+    """
+    if not calls:
+        return {}
+    with ThreadPoolExecutor(
+        max_workers=min(len(calls), settings.IMPORTER_FETCH_CONCURRENCY)
+    ) as executor:
+        futures = {key: executor.submit(call) for key, call in calls.items()}
+        return {key: future.result() for key, future in futures.items()}
+
+
+def last_page(response):
+    """Number of the last page announced by a Link header, 1 without one"""
+    last = response.links.get("last")
+    if last is None:
+        return 1
+    return int(parse_qs(urlparse(last["url"]).query)["page"][0])
+
+
+def fetch_pages(url, headers, params=None, per_page=100):
+    """
+    Every item of a Link header paginated list. The first page announces
+    the last page number, the remaining pages are fetched concurrently.
+    """
+    params = {**(params or {}), "per_page": per_page}
+
+    def get_page(page):
+        response = fetch("GET", url, headers=headers, params={**params, "page": page})
+        response.raise_for_status()
+        return response
+
+    first = get_page(1)
+    pages = fetch_concurrently(
+        {
+            page: lambda page=page: get_page(page)
+            for page in range(2, last_page(first) + 1)
+        }
+    )
+    items = first.json()
+    for page in sorted(pages):
+        items.extend(pages[page].json())
+    return items
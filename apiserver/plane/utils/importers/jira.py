@@ -1,49 +1,53 @@
-import requests
 from requests.auth import HTTPBasicAuth
 from sentry_sdk import capture_exception
 
+from plane.utils.importers.client import fetch, fetch_concurrently
+
 
 def jira_project_issue_summary(email, api_token, project_key, hostname):
     try:
         auth = HTTPBasicAuth(email, api_token)
         headers = {"Accept": "application/json"}
-
-        issue_url = f"https://{hostname}/rest/api/3/search?jql=project={project_key} AND issuetype=Story"
-        issue_response = requests.request(
-            "GET", issue_url, headers=headers, auth=auth
-        ).json()["total"]
-
-        module_url = f"https://{hostname}/rest/api/3/search?jql=project={project_key} AND issuetype=Epic"
-        module_response = requests.request(
-            "GET", module_url, headers=headers, auth=auth
-        ).json()["total"]
-
-        status_url = f"https://{hostname}/rest/api/3/status/?jql=project={project_key}"
-        status_response = requests.request(
-            "GET", status_url, headers=headers, auth=auth
-        ).json()
-
-        labels_url = f"https://{hostname}/rest/api/3/label/?jql=project={project_key}"
-        labels_response = requests.request(
-            "GET", labels_url, headers=headers, auth=auth
-        ).json()["total"]
-
-        users_url = (
-            f"https://{hostname}/rest/api/3/users/search?jql=project={project_key}"
+        # Jira cloud is always on https, a server install can give its scheme
+        base_url = hostname if "://" in hostname else f"https://{hostname}"
+
+        def get(path, **params):
+            return fetch(
+                "GET",
+                f"{base_url}/rest/api/3/{path}",
+                params=params,
+                headers=headers,
+                auth=auth,
+            ).json()
+
+        # Only the totals of the searches are used, no issue is returned
+        responses = fetch_concurrently(
+            {
+                "issues": lambda: get(
+                    "search",
+                    jql=f"project={project_key} AND issuetype=Story",
+                    maxResults=0,
+                ),
+                "modules": lambda: get(
+                    "search",
+                    jql=f"project={project_key} AND issuetype=Epic",
+                    maxResults=0,
+                ),
+                "states": lambda: get("status/", jql=f"project={project_key}"),
+                "labels": lambda: get("label/", jql=f"project={project_key}"),
+                "users": lambda: get("users/search", jql=f"project={project_key}"),
+            }
         )
-        users_response = requests.request(
-            "GET", users_url, headers=headers, auth=auth
-        ).json()
 
         return {
-            "issues": issue_response,
-            "modules": module_response,
-            "labels": labels_response,
-            "states": len(status_response),
+            "issues": responses["issues"]["total"],
+            "modules": responses["modules"]["total"],
+            "labels": responses["labels"]["total"],
+            "states": len(responses["states"]),
             "users": (
                 [
                     user
-                    for user in users_response
+                    for user in responses["users"]
                     if user.get("accountType") == "atlassian"
                 ]
             ),
@@ -1,134 +1,153 @@
 import os
+import time
+import hashlib
+import threading
 import jwt
-import requests
-from urllib.parse import urlparse, parse_qs
 from datetime import datetime, timedelta
 from cryptography.hazmat.primitives.serialization import load_pem_private_key
 from cryptography.hazmat.backends import default_backend
 from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
+from plane.utils.importers.client import (
+    fetch,
+    fetch_concurrently,
+    fetch_pages,
+    last_page,
+)
 
-def get_jwt_token():
-    app_id = os.environ.get("GITHUB_APP_ID", "")
-    secret = bytes(os.environ.get("GITHUB_APP_PRIVATE_KEY", ""), encoding="utf8")
-    current_timestamp = int(datetime.now().timestamp())
-    due_date = datetime.now() + timedelta(minutes=10)
-    expiry = int(due_date.timestamp())
-    payload = {
-        "iss": app_id,
-        "sub": app_id,
-        "exp": expiry,
-        "iat": current_timestamp,
-        "aud": "https://github.com/login/oauth/access_token",
-    }
+# The app token is valid for 10 minutes and reused for 8 of them
+JWT_TOKEN_REUSE = 8 * 60
+_jwt_token = {"token": None, "expires": 0}
+_jwt_token_lock = threading.Lock()
 
-    priv_rsakey = load_pem_private_key(secret, None, default_backend())
-    token = jwt.encode(payload, priv_rsakey, algorithm="RS256")
-    return token
 
+def get_jwt_token():
+    with _jwt_token_lock:
+        if _jwt_token["token"] is not None and _jwt_token["expires"] > time.time():
+            return _jwt_token["token"]
+
+        app_id = os.environ.get("GITHUB_APP_ID", "")
+        secret = bytes(os.environ.get("GITHUB_APP_PRIVATE_KEY", ""), encoding="utf8")
+        current_timestamp = int(datetime.now().timestamp())
+        due_date = datetime.now() + timedelta(minutes=10)
+        expiry = int(due_date.timestamp())
+        payload = {
+            "iss": app_id,
+            "sub": app_id,
+            "exp": expiry,
+            "iat": current_timestamp,
+            "aud": "https://github.com/login/oauth/access_token",
+        }
 
-def get_github_metadata(installation_id):
-    token = get_jwt_token()
+        priv_rsakey = load_pem_private_key(secret, None, default_backend())
+        token = jwt.encode(payload, priv_rsakey, algorithm="RS256")
+        _jwt_token.update(token=token, expires=current_timestamp + JWT_TOKEN_REUSE)
+        return token
+
+
+def get_installation_token(access_tokens_url):
+    """
+    Access token of an installation. The tokens are valid for an hour, so
+    they are cached until five minutes before they expire instead of
+    minting a new one for every call.
+    """
+    key = (
+        "github_installation_token:"
+        + hashlib.md5(access_tokens_url.encode()).hexdigest()
+    )
+    token = cache.get(key)
+    if token is not None:
+        return token
 
-    url = f"https://api.github.com/app/installations/{installation_id}"
     headers = {
-        "Authorization": "Bearer " + str(token),
+        "Authorization": "Bearer " + str(get_jwt_token()),
         "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28",
     }
-    response = requests.get(url, headers=headers).json()
-    return response
+    oauth_response = fetch("POST", access_tokens_url, headers=headers).json()
+    token = oauth_response.get("token", "")
+
+    expires_at = parse_datetime(oauth_response.get("expires_at") or "")
+    timeout = (
+        (expires_at - timezone.now()).total_seconds() - 300
+        if expires_at is not None
+        else 3000
+    )
+    if token and timeout > 0:
+        cache.set(key, token, timeout)
+    return token
 
 
-def get_github_repos(access_tokens_url, repositories_url):
+def get_github_metadata(installation_id):
     token = get_jwt_token()
 
+    url = f"{settings.GITHUB_API_URL}/app/installations/{installation_id}"
     headers = {
         "Authorization": "Bearer " + str(token),
         "Accept": "application/vnd.github+json",
     }
+    response = fetch("GET", url, headers=headers).json()
+    return response
 
-    oauth_response = requests.post(
-        access_tokens_url,
-        headers=headers,
-    ).json()
 
-    oauth_token = oauth_response.get("token", "")
+def get_github_repos(access_tokens_url, repositories_url):
+    oauth_token = get_installation_token(access_tokens_url)
     headers = {
         "Authorization": "Bearer " + str(oauth_token),
         "Accept": "application/vnd.github+json",
     }
-    response = requests.get(
-        repositories_url,
-        headers=headers,
-    ).json()
+    response = fetch("GET", repositories_url, headers=headers).json()
     return response
 
 
 def delete_github_installation(installation_id):
     token = get_jwt_token()
 
-    url = f"https://api.github.com/app/installations/{installation_id}"
+    url = f"{settings.GITHUB_API_URL}/app/installations/{installation_id}"
     headers = {
         "Authorization": "Bearer " + str(token),
         "Accept": "application/vnd.github+json",
     }
-    response = requests.delete(url, headers=headers)
+    response = fetch("DELETE", url, headers=headers)
     return response
 
 
-def get_github_repo_details(access_tokens_url, owner, repo):
-    token = get_jwt_token()
+def count_github_items(url, headers):
+    """Count a paginated list from its first and last page only"""
+    response = fetch("GET", url, headers=headers, params={"per_page": 100, "page": 1})
+    pages = last_page(response)
+    if pages == 1:
+        return len(response.json())
 
-    headers = {
-        "Authorization": "Bearer " + str(token),
-        "Accept": "application/vnd.github+json",
-        "X-GitHub-Api-Version": "2022-11-28",
-    }
-
-    oauth_response = requests.post(
-        access_tokens_url,
-        headers=headers,
+    last_page_items = fetch(
+        "GET", url, headers=headers, params={"per_page": 100, "page": pages}
     ).json()
+    return 100 * (pages - 1) + len(last_page_items)
+
 
-    oauth_token = oauth_response.get("token")
+def get_github_repo_details(access_tokens_url, owner, repo):
+    oauth_token = get_installation_token(access_tokens_url)
     headers = {
         "Authorization": "Bearer " + oauth_token,
         "Accept": "application/vnd.github+json",
     }
-    open_issues = requests.get(
-        f"https://api.github.com/repos/{owner}/{repo}",
-        headers=headers,
-    ).json()["open_issues_count"]
-
-    total_labels = 0
-
-    labels_response = requests.get(
-        f"https://api.github.com/repos/{owner}/{repo}/labels?per_page=100&page=1",
-        headers=headers,
+    repo_url = f"{settings.GITHUB_API_URL}/repos/{owner}/{repo}"
+
+    details = fetch_concurrently(
+        {
+            "open_issues": lambda: fetch("GET", repo_url, headers=headers).json()[
+                "open_issues_count"
+            ],
+            "labels": lambda: count_github_items(f"{repo_url}/labels", headers),
+            "collaborators": lambda: fetch_pages(
+                f"{repo_url}/collaborators", headers
+            ),
+        }
     )
-
-    # Check if there are more pages
-    if len(labels_response.links.keys()):
-        # get the query parameter of last
-        last_url = labels_response.links.get("last").get("url")
-        parsed_url = urlparse(last_url)
-        last_page_value = parse_qs(parsed_url.query)["page"][0]
-        total_labels = total_labels + 100 * (int(last_page_value) - 1)
-
-        # Get labels in last page
-        last_page_labels = requests.get(last_url, headers=headers).json()
-        total_labels = total_labels + len(last_page_labels)
-    else:
-        total_labels = len(labels_response.json())
-
-    # Currently only supporting upto 100 collaborators
-    # TODO: Update this function to fetch all collaborators
-    collaborators = requests.get(
-        f"https://api.github.com/repos/{owner}/{repo}/collaborators?per_page=100&page=1",
-        headers=headers,
-    ).json()
-
-    return open_issues, total_labels, collaborators
+    return details["open_issues"], details["labels"], details["collaborators"]
 
 
 def get_release_notes():
@@ -144,7 +163,7 @@ def get_release_notes():
             "Accept": "application/vnd.github.v3+json",
         }
     url = "https://api.github.com/repos/makeplane/plane/releases?per_page=5&page=1"
-    response = requests.get(url, headers=headers)
+    response = fetch("GET", url, headers=headers)
 
     if response.status_code != 200:
         return {"error": "Unable to render information from Github Repository"}
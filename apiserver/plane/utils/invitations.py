@@ -0,0 +1,216 @@
+# Python imports
+import uuid
+from datetime import datetime
+
+# Django imports
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db.models import Min
+
+# Third party imports
+import jwt
+
+# Module imports
+from plane.db.models import (
+    IssueProperty,
+    ProjectMember,
+    ProjectMemberInvite,
+    User,
+    WorkspaceMemberInvite,
+)
+from plane.db.models.project import ROLE_CHOICES
+
+# Rows written per statement by the bulk invitations
+INVITATION_BATCH_SIZE = 1000
+
+
+def normalize_invites(entries, default_role=10):
+    """
+    Map the {"email", "role"} entries of an invite request to email -> role,
+    with the emails stripped and lower cased. A repeated email keeps its
+    last role. Raises ValidationError for the first invalid entry.
+    """
+    invites = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            raise ValidationError("Each invite should be an object with an email")
+        email = str(entry.get("email") or "").strip().lower()
+        try:
+            validate_email(email)
+        except ValidationError:
+            raise ValidationError(
+                f"Invalid email - {entry.get('email')} provided a valid email address is required to send the invite"
+            )
+        try:
+            role = int(entry.get("role", default_role))
+        except (TypeError, ValueError):
+            role = None
+        if role not in dict(ROLE_CHOICES):
+            raise ValidationError(f"Invalid role - {entry.get('role')} for {email}")
+        invites[email] = role
+    return invites
+
+
+def invitation_token(email):
+    return jwt.encode(
+        {"email": email, "timestamp": datetime.now().timestamp()},
+        settings.SECRET_KEY,
+        algorithm="HS256",
+    )
+
+
+def create_placeholder_users(emails):
+    """
+    Create the users of the emails without an account. Nobody knows their
+    password, so it is stored unusable instead of hashing a random one,
+    which takes longer than the rest of the import. Returns the users
+    created, read back as bulk_create leaves them without ids when
+    conflicts are ignored.
+    """
+    existing = set(
+        User.objects.filter(email__in=emails).values_list("email", flat=True)
+    )
+    missing = [email for email in dict.fromkeys(emails) if email not in existing]
+    User.objects.bulk_create(
+        [
+            User(
+                username=uuid.uuid4().hex,
+                email=email,
+                password=make_password(None),
+                is_password_autoset=True,
+            )
+            for email in missing
+        ],
+        batch_size=INVITATION_BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+    return list(User.objects.filter(email__in=missing))
+
+
+def invite_to_workspace(workspace, invites, invited_by):
+    """
+    Create the invitations of `invites`, a map of email -> role, and update
+    the role of the emails already invited. Returns the ids of the
+    invitations.
+    """
+    WorkspaceMemberInvite.objects.bulk_create(
+        [
+            WorkspaceMemberInvite(
+                workspace=workspace,
+                email=email,
+                role=role,
+                token=invitation_token(email),
+                created_by=invited_by,
+            )
+            for email, role in invites.items()
+        ],
+        batch_size=INVITATION_BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=["email", "workspace"],
+        update_fields=["role", "updated_at"],
+    )
+    return list(
+        WorkspaceMemberInvite.objects.filter(
+            workspace=workspace, email__in=list(invites)
+        ).values_list("id", flat=True)
+    )
+
+
+def invite_to_project(project, invites, invited_by):
+    """
+    Create the invitations of `invites`, a map of email -> role, and update
+    the role of the emails already invited. Project invitations are not
+    unique per email, so the existing ones are looked up first. Returns the
+    ids of the invitations.
+    """
+    existing = {
+        invitation.email: invitation
+        for invitation in ProjectMemberInvite.objects.filter(
+            project=project, email__in=list(invites)
+        )
+    }
+    for email, invitation in existing.items():
+        invitation.role = invites[email]
+    ProjectMemberInvite.objects.bulk_update(
+        existing.values(), ["role"], batch_size=INVITATION_BATCH_SIZE
+    )
+    created = ProjectMemberInvite.objects.bulk_create(
+        [
+            ProjectMemberInvite(
+                project=project,
+                workspace_id=project.workspace_id,
+                email=email,
+                role=role,
+                token=invitation_token(email),
+                created_by=invited_by,
+            )
+            for email, role in invites.items()
+            if email not in existing
+        ],
+        batch_size=INVITATION_BATCH_SIZE,
+    )
+    return [invitation.id for invitation in existing.values()] + [
+        invitation.id for invitation in created
+    ]
+
+
+def add_project_members(project_id, workspace_id, members, created_by=None):
+    """
+    Add the users of `members`, a map of user id -> role, to the project
+    with their issue properties. Users already in the project are left as
+    they are. As in ProjectMember.save, the project is put first in the
+    projects of each member. Returns the project members created.
+    """
+    existing = set(
+        ProjectMember.objects.filter(
+            project_id=project_id, member_id__in=list(members)
+        ).values_list("member_id", flat=True)
+    )
+    members = {
+        member_id: role
+        for member_id, role in members.items()
+        if member_id not in existing
+    }
+    smallest_sort_orders = dict(
+        ProjectMember.objects.filter(
+            workspace_id=workspace_id, member_id__in=list(members)
+        )
+        .values("member_id")
+        .annotate(smallest=Min("sort_order"))
+        .values_list("member_id", "smallest")
+    )
+    project_members = ProjectMember.objects.bulk_create(
+        [
+            ProjectMember(
+                project_id=project_id,
+                workspace_id=workspace_id,
+                member_id=member_id,
+                role=role,
+                sort_order=(
+                    smallest_sort_orders[member_id] - 10000
+                    if member_id in smallest_sort_orders
+                    else 65535
+                ),
+                created_by=created_by,
+            )
+            for member_id, role in members.items()
+        ],
+        batch_size=INVITATION_BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+    IssueProperty.objects.bulk_create(
+        [
+            IssueProperty(
+                project_id=project_id,
+                workspace_id=workspace_id,
+                user_id=member_id,
+                created_by=created_by,
+            )
+            for member_id in members
+        ],
+        batch_size=INVITATION_BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+    return project_members
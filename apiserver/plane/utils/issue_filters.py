@@ -3,6 +3,8 @@ import uuid
 from datetime import timedelta
 from django.utils import timezone
 
+from plane.db.models import IssueMention
+
 
 # The date from pattern
 pattern = re.compile(r"\d+_(weeks|months)$")
@@ -151,14 +153,19 @@ def filter_assignees(params, filter, method):
     return filter
 
 def filter_mentions(params, filter, method):
+    # Mentions in the description or any comment, one row per issue
     if method == "GET":
         mentions = [item for item in params.get("mentions").split(",") if item != 'null']
         mentions = filter_valid_uuids(mentions)
         if len(mentions) and "" not in mentions:
-            filter["issue_mention__mention__id__in"] = mentions
+            filter["id__in"] = IssueMention.objects.filter(
+                mention_id__in=mentions
+            ).values("issue_id")
     else:
         if params.get("mentions", None) and len(params.get("mentions")) and params.get("mentions") != 'null':
-            filter["issue_mention__mention__id__in"] = params.get("mentions")
+            filter["id__in"] = IssueMention.objects.filter(
+                mention_id__in=params.get("mentions")
+            ).values("issue_id")
     return filter
 
 
@@ -0,0 +1,100 @@
+# Python imports
+import base64
+import json
+from datetime import datetime, timedelta
+from uuid import UUID
+
+# Django imports
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import Issue, IssueTombstone
+
+
+class CursorExpired(Exception):
+    pass
+
+
+def encode_cursor(timestamp, issue_id=None):
+    data = {"t": timestamp.isoformat(), "i": str(issue_id) if issue_id else None}
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        timestamp = datetime.fromisoformat(data["t"])
+        issue_id = UUID(data["i"]) if data["i"] else None
+    except (ValueError, TypeError, KeyError):
+        raise ValueError("Invalid cursor")
+    if timezone.is_naive(timestamp):
+        raise ValueError("Invalid cursor")
+    return timestamp, issue_id
+
+
+def get_issue_changes(scope, cursor=None):
+    """
+    Page of the issues of scope, filter kwargs on project_id, changed since
+    the cursor, ordered by (updated_at, id). Without a cursor the page
+    starts with the oldest issue and holds only the visible ones, the
+    client has nothing to remove yet.
+
+    A cursor in the middle of the changes points at the last issue of the
+    page. Once the changes are read, it steps back a few seconds from the
+    time of the request instead: an issue is stamped before its
+    transaction commits, so a write in flight would otherwise be missed.
+    The issues of those seconds are sent again, clients apply them
+    idempotently. Deleted issues are the tombstones in the same window.
+    """
+    until = timezone.now()
+    page_size = settings.ISSUE_SYNC_PAGE_SIZE
+
+    if cursor is None:
+        since = None
+        issues = Issue.issue_objects.filter(**scope)
+    else:
+        since, since_id = decode_cursor(cursor)
+        if since < until - timedelta(days=settings.ISSUE_TOMBSTONE_RETENTION_DAYS):
+            raise CursorExpired
+        # Archived, draft and deleted issues are changes too, they are removed
+        issues = Issue.objects.filter(**scope).filter(
+            Q(updated_at__gt=since) | Q(updated_at=since, id__gt=since_id)
+            if since_id
+            else Q(updated_at__gte=since)
+        )
+
+    page = list(
+        issues.filter(updated_at__lte=until)
+        .order_by("updated_at", "id")
+        .values_list("id", "updated_at")[: page_size + 1]
+    )
+    has_more = len(page) > page_size
+    page = page[:page_size]
+
+    if has_more:
+        issue_id, upper = page[-1]
+        next_cursor = encode_cursor(upper, issue_id)
+    else:
+        upper = until
+        next_cursor = encode_cursor(
+            until - timedelta(seconds=settings.ISSUE_SYNC_OVERLAP_SECONDS)
+        )
+
+    deleted = []
+    if since is not None:
+        deleted = list(
+            IssueTombstone.objects.filter(
+                **scope, created_at__gte=since, created_at__lte=upper
+            )
+            .values_list("issue_id", flat=True)
+            .distinct()
+        )
+
+    return {
+        "issue_ids": [issue_id for issue_id, _ in page],
+        "deleted": deleted,
+        "cursor": next_cursor,
+        "has_more": has_more,
+    }
@@ -0,0 +1,157 @@
+# Python imports
+import asyncio
+import json
+import logging
+from collections import defaultdict
+
+# Django imports
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+
+# Module imports
+from plane.settings.redis import async_redis_instance, redis_instance
+
+logger = logging.getLogger("plane.live_updates")
+
+_client = None
+
+
+def project_channel(project_id):
+    return f"live:project:{project_id}"
+
+
+def user_channel(user_id):
+    return f"live:user:{user_id}"
+
+
+def publish(channel, event):
+    """
+    Send an event to the sockets listening to the channel. Events are hints
+    to refetch, a lost one only delays the client until its next sync, so
+    a failure is logged instead of failing the task.
+    """
+    global _client
+    if not settings.LIVE_UPDATES_ENABLED or not settings.REDIS_URL:
+        return
+    try:
+        if _client is None:
+            _client = redis_instance()
+        _client.publish(channel, json.dumps(event, cls=DjangoJSONEncoder))
+    except Exception as e:
+        logger.warning("Could not publish to %s: %s", channel, e)
+
+
+def publish_issue_changes(issue_activities, actor_id=None):
+    """One event per project naming the issues of the new activities"""
+    issue_ids = defaultdict(set)
+    for issue_activity in issue_activities:
+        if issue_activity.issue_id is not None:
+            project_id = str(issue_activity.project_id)
+            issue_ids[project_id].add(str(issue_activity.issue_id))
+
+    for project_id, ids in issue_ids.items():
+        publish(
+            project_channel(project_id),
+            {
+                "event": "issues.changed",
+                "project_id": project_id,
+                "issue_ids": sorted(ids),
+                "actor_id": actor_id,
+            },
+        )
+
+
+def publish_notifications(notifications):
+    """One event per receiver, unread counts can be refreshed from it"""
+    notification_ids = defaultdict(list)
+    for notification in notifications:
+        notification_ids[(notification.receiver_id, notification.workspace_id)].append(
+            notification.id
+        )
+
+    for (receiver_id, workspace_id), ids in notification_ids.items():
+        publish(
+            user_channel(receiver_id),
+            {
+                "event": "notifications.created",
+                "workspace_id": workspace_id,
+                "notification_ids": ids,
+            },
+        )
+
+
+def publish_membership_change(user_id, workspace_id):
+    """
+    Tell the sockets of a user that the projects they may follow changed.
+    It is sent once the change is committed, the sockets read it again.
+    """
+    transaction.on_commit(
+        lambda: publish(
+            user_channel(user_id),
+            {"event": "memberships.changed", "workspace_id": str(workspace_id)},
+        )
+    )
+
+
+class LiveUpdateHub:
+    """
+    The redis subscription of a server process, shared by all its sockets.
+    Each socket registers a queue for its channels and the messages of a
+    channel are put on the queues listening to it, along with the channel.
+    A socket too slow to empty its queue misses events rather than holding
+    the others back.
+    """
+
+    def __init__(self):
+        self.queues = defaultdict(set)
+        self.pubsub = None
+        self.reader = None
+
+    async def subscribe(self, channels, queue):
+        if self.pubsub is None:
+            self.pubsub = async_redis_instance().pubsub()
+        new_channels = [channel for channel in channels if not self.queues[channel]]
+        for channel in channels:
+            self.queues[channel].add(queue)
+        if new_channels:
+            await self.pubsub.subscribe(*new_channels)
+        if self.reader is None or self.reader.done():
+            self.reader = asyncio.create_task(self.read())
+
+    async def unsubscribe(self, channels, queue):
+        unused_channels = []
+        for channel in channels:
+            self.queues[channel].discard(queue)
+            if not self.queues[channel]:
+                del self.queues[channel]
+                unused_channels.append(channel)
+        if unused_channels:
+            await self.pubsub.unsubscribe(*unused_channels)
+
+    async def read(self):
+        while True:
+            try:
+                message = await self.pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # The connection is opened again with its subscriptions
+                logger.warning("Live updates subscription failed: %s", e)
+                await asyncio.sleep(1)
+                continue
+
+            if message is None or message["type"] != "message":
+                continue
+            channel = message["channel"].decode()
+            data = message["data"].decode()
+            for queue in list(self.queues.get(channel, ())):
+                try:
+                    queue.put_nowait((channel, data))
+                except asyncio.QueueFull:
+                    pass
+
+
+hub = LiveUpdateHub()
@@ -0,0 +1,106 @@
+# Python imports
+import logging
+import smtplib
+import threading
+import time
+from contextlib import suppress
+from functools import lru_cache
+
+# Django imports
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.template.loader import get_template
+from django.utils.html import strip_tags
+
+logger = logging.getLogger("plane.mailer")
+
+# Errors that only concern the message being sent, the others are raised
+MESSAGE_ERRORS = (
+    smtplib.SMTPRecipientsRefused,
+    smtplib.SMTPSenderRefused,
+    smtplib.SMTPDataError,
+)
+
+_local = threading.local()
+
+
+@lru_cache(maxsize=None)
+def get_email_template(template_name):
+    """The compiled template, looked up once per process"""
+    return get_template(template_name)
+
+
+def build_email(subject, template_name, context, to):
+    """An email with the rendered template as html and its text as body"""
+    html_content = get_email_template(template_name).render(context)
+    msg = EmailMultiAlternatives(
+        subject, strip_tags(html_content), settings.EMAIL_FROM, to
+    )
+    msg.attach_alternative(html_content, "text/html")
+    return msg
+
+
+def close_mail_connection():
+    connection = getattr(_local, "connection", None)
+    _local.connection = None
+    if connection is not None:
+        with suppress(smtplib.SMTPException, OSError):
+            connection.close()
+
+
+def get_mail_connection():
+    """
+    The SMTP connection kept by the current thread. It is opened again
+    once it has sent EMAIL_BATCH_SIZE messages or has not been used for
+    EMAIL_CONNECTION_IDLE_TIMEOUT seconds, before the server drops it.
+    """
+    connection = getattr(_local, "connection", None)
+    if connection is not None and (
+        _local.remaining <= 0
+        or time.monotonic() - _local.used_at > settings.EMAIL_CONNECTION_IDLE_TIMEOUT
+    ):
+        close_mail_connection()
+        connection = None
+
+    if connection is None:
+        connection = get_connection()
+        connection.open()
+        _local.connection = connection
+        _local.remaining = settings.EMAIL_BATCH_SIZE
+    return connection
+
+
+def send_message(message):
+    try:
+        try:
+            get_mail_connection().send_messages([message])
+        except smtplib.SMTPServerDisconnected:
+            # The server dropped the kept connection, send again over a new one
+            close_mail_connection()
+            get_mail_connection().send_messages([message])
+    except MESSAGE_ERRORS:
+        raise
+    except Exception:
+        close_mail_connection()
+        raise
+    finally:
+        _local.remaining = getattr(_local, "remaining", 0) - 1
+        _local.used_at = time.monotonic()
+
+
+def send_emails(messages):
+    """
+    Send the messages over the connection kept by the worker instead of
+    a connection per message. A message refused by the server is logged
+    and skipped, the other errors are raised. Returns the number of
+    messages sent.
+    """
+    sent = 0
+    for message in messages:
+        try:
+            send_message(message)
+        except MESSAGE_ERRORS as e:
+            logger.warning("Could not send %r to %s: %s", message.subject, message.to, e)
+            continue
+        sent += 1
+    return sent
@@ -0,0 +1,207 @@
+# Python imports
+import re
+
+# Django imports
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import connection, transaction
+from django.utils.dateparse import parse_datetime
+
+# Third party imports
+from dateutil.relativedelta import relativedelta
+
+
+# Append only tables stored as monthly range partitions on created_at
+PARTITIONED_TABLES = ["issue_activities", "notifications"]
+
+PARTITION_BOUNDS = re.compile(
+    r"FROM \((?:'([^']+)'|MINVALUE)\) TO \('([^']+)'\)"
+)
+
+
+def month_start(value):
+    """Truncate a datetime to the first instant of its month"""
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def partition_name(table, month):
+    return f"{table}_p{month:%Y_%m}"
+
+
+def default_partition_name(table):
+    return f"{table}_default"
+
+
+def is_partitioned(table, using=connection):
+    if using.vendor != "postgresql":
+        return False
+
+    with using.cursor() as cursor:
+        cursor.execute(
+            "SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", [table]
+        )
+        row = cursor.fetchone()
+    return row is not None and row[0] == "p"
+
+
+def get_partitions(table, using=connection):
+    """
+    Return a list of (partition name, lower bound, upper bound) for the
+    table. A MINVALUE lower bound is None, both are None for the default
+    partition.
+    """
+    with using.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.oid = to_regclass(%s)
+            ORDER BY child.relname
+            """,
+            [table],
+        )
+        rows = cursor.fetchall()
+
+    partitions = []
+    for name, bound in rows:
+        match = PARTITION_BOUNDS.search(bound or "")
+        lower, upper = match.groups() if match else (None, None)
+        partitions.append(
+            (
+                name,
+                parse_datetime(lower) if lower else None,
+                parse_datetime(upper) if upper else None,
+            )
+        )
+    return partitions
+
+
+def create_monthly_partitions(table, start, months, using=connection):
+    """
+    Create the monthly partitions covering `months` months from `start`.
+    Rows that already landed in the default partition for a missing month
+    are moved into the new partition so the default stays empty.
+    """
+    qn = using.ops.quote_name
+    default = default_partition_name(table)
+    partitions = get_partitions(table, using=using)
+    existing = {name for name, _, _ in partitions}
+    created = []
+
+    for offset in range(months):
+        lower = month_start(start) + relativedelta(months=offset)
+        upper = lower + relativedelta(months=1)
+        name = partition_name(table, lower)
+        # Already covered, either by this month's or the legacy partition
+        if name in existing or any(
+            upper_bound is not None
+            and lower < upper_bound
+            and (lower_bound is None or lower_bound < upper)
+            for _, lower_bound, upper_bound in partitions
+        ):
+            continue
+
+        with transaction.atomic(using=using.alias), using.cursor() as cursor:
+            has_default_rows = False
+            if default in existing:
+                cursor.execute(
+                    f"SELECT EXISTS (SELECT 1 FROM {qn(default)} "
+                    "WHERE created_at >= %s AND created_at < %s)",
+                    [lower, upper],
+                )
+                has_default_rows = cursor.fetchone()[0]
+
+            if has_default_rows:
+                cursor.execute(
+                    f"ALTER TABLE {qn(table)} DETACH PARTITION {qn(default)}"
+                )
+
+            cursor.execute(
+                f"CREATE TABLE {qn(name)} PARTITION OF {qn(table)} "
+                "FOR VALUES FROM (%s) TO (%s)",
+                [lower.isoformat(), upper.isoformat()],
+            )
+
+            if has_default_rows:
+                cursor.execute(
+                    f"WITH moved AS (DELETE FROM {qn(default)} "
+                    "WHERE created_at >= %s AND created_at < %s RETURNING *) "
+                    f"INSERT INTO {qn(name)} SELECT * FROM moved",
+                    [lower, upper],
+                )
+                cursor.execute(
+                    f"ALTER TABLE {qn(table)} ATTACH PARTITION {qn(default)} DEFAULT"
+                )
+        created.append(name)
+
+    return created
+
+
+def drop_expired_partitions(table, before, detach_only=False, using=connection):
+    """
+    Detach (and unless `detach_only` drop) every partition whose rows are
+    all older than `before`. This replaces row by row retention deletes.
+    """
+    qn = using.ops.quote_name
+    removed = []
+
+    for name, _, upper in get_partitions(table, using=using):
+        if upper is None or upper > before:
+            continue
+
+        with transaction.atomic(using=using.alias), using.cursor() as cursor:
+            cursor.execute(f"ALTER TABLE {qn(table)} DETACH PARTITION {qn(name)}")
+            if not detach_only:
+                cursor.execute(f"DROP TABLE {qn(name)}")
+        removed.append(name)
+
+    return removed
+
+
+class AddPartitionedIndexConcurrently(AddIndexConcurrently):
+    """
+    AddIndexConcurrently for tables that may be partitioned. Postgres can't
+    build an index concurrently on a partitioned table, so the index is
+    created invalid on the parent only, built concurrently on every
+    partition and then attached, which makes the parent index valid.
+    Partitions created afterwards inherit it.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        table = model._meta.db_table
+        connection = schema_editor.connection
+        if not self.allow_migrate_model(connection.alias, model) or not (
+            is_partitioned(table, using=connection)
+        ):
+            return super().database_forwards(
+                app_label, schema_editor, from_state, to_state
+            )
+
+        self._ensure_not_in_transaction(schema_editor)
+        qn = connection.ops.quote_name
+        parent = str(self.index.create_sql(model, schema_editor)).replace(
+            f" ON {qn(table)} ", f" ON ONLY {qn(table)} ", 1
+        )
+        schema_editor.execute(parent)
+
+        for name, _, _ in get_partitions(table, using=connection):
+            child = f"{self.index.name}_{name[len(table) + 1:]}"
+            statement = self.index.create_sql(model, schema_editor, concurrently=True)
+            statement.rename_table_references(table, name)
+            statement.parts["name"] = qn(child)
+            schema_editor.execute(statement)
+            schema_editor.execute(
+                f"ALTER INDEX {qn(self.index.name)} ATTACH PARTITION {qn(child)}"
+            )
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(
+            schema_editor.connection.alias, model
+        ) and is_partitioned(model._meta.db_table, using=schema_editor.connection):
+            # Dropping the parent index drops every attached partition index
+            schema_editor.remove_index(model, self.index)
+            return
+        super().database_backwards(app_label, schema_editor, from_state, to_state)
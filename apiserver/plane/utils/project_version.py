@@ -0,0 +1,74 @@
+# Python imports
+import hashlib
+from uuid import uuid4
+
+# Django imports
+from django.core.cache import cache
+from django.utils import timezone
+
+# Third party imports
+from celery import Task
+
+
+def project_version_key(project_id):
+    return f"project_version:{project_id}"
+
+
+def get_project_version(project_id):
+    """
+    Token that changes whenever something in the project is written. A
+    random token instead of a counter, so a version lost from the cache
+    never repeats one that clients still hold.
+    """
+    key = project_version_key(project_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid4().hex, None)
+        version = cache.get(key)
+    return version
+
+
+def bump_project_version(project_id):
+    cache.set(project_version_key(project_id), uuid4().hex, None)
+
+
+def project_etag(request, *args, **kwargs):
+    """
+    ETag of a project list, computed before the list is queried. The same
+    url gives different results per user, representation and day (the
+    cycle and module lists depend on the date), so they are part of it.
+    """
+    project_id = kwargs.get("project_id")
+    if project_id is None:
+        return None
+    return hashlib.blake2b(
+        "\n".join(
+            [
+                get_project_version(project_id),
+                str(request.user.id),
+                request.get_full_path(),
+                request.META.get("HTTP_ACCEPT", ""),
+                timezone.now().date().isoformat(),
+            ]
+        ).encode(),
+        digest_size=16,
+    ).hexdigest()
+
+
+class ProjectVersionTask(Task):
+    """
+    Task enqueued by the writes of a project. The version is bumped when the
+    task is sent, the lists change before the task runs, and again once it
+    returned, so a list read while it ran is not served afterwards.
+    """
+
+    def apply_async(self, args=None, kwargs=None, **options):
+        project_id = (kwargs or {}).get("project_id")
+        if project_id is not None:
+            bump_project_version(project_id)
+        return super().apply_async(args, kwargs, **options)
+
+    def after_return(self, status, retval, task_id, args, kwargs, einfo):
+        project_id = (kwargs or {}).get("project_id")
+        if project_id is not None:
+            bump_project_version(project_id)
@@ -0,0 +1,141 @@
+# Python imports
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+
+# Django imports
+from django.conf import settings
+from django.db import InterfaceError, OperationalError, connection, connections
+from django.db.models.query import QuerySet
+
+_executor = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+_worker = threading.local()
+
+
+def get_executor():
+    global _executor, _executor_workers
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor_workers = settings.QUERY_FANOUT_WORKERS
+                _executor = ThreadPoolExecutor(
+                    max_workers=_executor_workers,
+                    thread_name_prefix="query-fanout",
+                )
+    return _executor
+
+
+def close_connections():
+    """
+    Close the connections of all the workers, they reconnect on their next
+    query. Every worker takes exactly one of the tasks, as each of them
+    waits for the others before closing.
+    """
+    if _executor is None:
+        return
+    barrier = threading.Barrier(_executor_workers)
+
+    def close():
+        barrier.wait()
+        connections.close_all()
+
+    for future in [_executor.submit(close) for _ in range(_executor_workers)]:
+        future.result()
+
+
+def evaluate(query):
+    # Querysets are read here instead of when the response is rendered
+    if isinstance(query, QuerySet):
+        return list(query)
+    return query()
+
+
+def expire_connections():
+    """
+    Close the connections of the worker opened more than
+    QUERY_FANOUT_CONN_MAX_AGE seconds ago, the others are reused as they
+    are without a round trip to check them. CONN_MAX_AGE is not used here, its default of 0 would reconnect
+    for every query.
+    """
+    opened = getattr(_worker, "opened", {})
+    now = time.monotonic()
+    for conn in connections.all(initialized_only=True):
+        if conn.connection is None:
+            continue
+        if opened.get(conn.alias, (None,))[0] is not conn.connection:
+            opened[conn.alias] = (conn.connection, now)
+        elif now - opened[conn.alias][1] >= settings.QUERY_FANOUT_CONN_MAX_AGE:
+            conn.close()
+    _worker.opened = opened
+
+
+def run_with_wrappers(query, execute_wrappers):
+    with ExitStack() as stack:
+        for alias, wrappers in execute_wrappers.items():
+            for wrapper in wrappers:
+                stack.enter_context(connections[alias].execute_wrapper(wrapper))
+        return evaluate(query)
+
+
+def evaluate_in_worker(query, execute_wrappers):
+    """
+    Run a query on the connection of the worker thread, the query trackers
+    of the caller see its queries. A connection dropped by the server while
+    the worker was idle fails the first query, which is then run once more
+    on a new connection. The queries only read, so the retry is safe.
+    """
+    _worker.active = True
+    try:
+        expire_connections()
+        reused = any(
+            conn.connection is not None
+            for conn in connections.all(initialized_only=True)
+        )
+        try:
+            return run_with_wrappers(query, execute_wrappers)
+        except (InterfaceError, OperationalError):
+            if not reused:
+                raise
+            connections.close_all()
+            return run_with_wrappers(query, execute_wrappers)
+    except Exception:
+        # The connection can be left unusable, the next query reconnects
+        connections.close_all()
+        raise
+    finally:
+        # Notes when a connection opened by the query was opened
+        expire_connections()
+        _worker.active = False
+
+
+def run_concurrently(queries):
+    """
+    Evaluate independent querysets or callables of a dict on the bounded
+    query pool and return their results under the same keys, so the
+    latency is the one of the slowest query instead of their sum. The
+    first exception is raised.
+
+    Other connections cannot see the rows of an open transaction, so inside
+    an atomic block, in a worker or with the pool disabled the queries run
+    one after the other on the current connection.
+    """
+    if (
+        settings.QUERY_FANOUT_WORKERS < 2
+        or len(queries) < 2
+        or connection.in_atomic_block
+        or getattr(_worker, "active", False)
+    ):
+        return {key: evaluate(query) for key, query in queries.items()}
+
+    execute_wrappers = {
+        alias: list(connections[alias].execute_wrappers) for alias in connections
+    }
+    executor = get_executor()
+    futures = {
+        key: executor.submit(evaluate_in_worker, query, execute_wrappers)
+        for key, query in queries.items()
+    }
+    return {key: future.result() for key, future in futures.items()}
@@ -0,0 +1,126 @@
+# Python imports
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+# Django imports
+from django.conf import settings
+from django.db import connections
+
+# Third party imports
+import sentry_sdk
+
+logger = logging.getLogger("plane.db.queries")
+
+
+class QueryTracker:
+    """
+    Execute wrapper recording the number of queries, the time spent in the
+    database and how often each statement ran. ORM statements keep their
+    parameters out of the sql, so the sql text itself is the fingerprint
+    and a statement repeated within one unit of work is an N+1 candidate.
+    """
+
+    def __init__(self, label):
+        self.label = label
+        self.count = 0
+        self.duration = 0.0
+        self.statements = Counter()
+        self._stack = None
+        # The workers of run_concurrently record their queries at once
+        self._lock = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start
+            with self._lock:
+                self.duration += duration
+                self.count += 1
+                self.statements[sql] += 1
+
+    def __enter__(self):
+        self._stack = ExitStack()
+        for alias in connections:
+            self._stack.enter_context(connections[alias].execute_wrapper(self))
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stack.close()
+        self._stack = None
+
+    @property
+    def duplicates(self):
+        """Fingerprints of the statements that ran more than once"""
+        return {
+            hashlib.md5(sql.encode()).hexdigest()[:12]: (count, sql)
+            for sql, count in self.statements.most_common()
+            if count > 1
+        }
+
+    @property
+    def n_plus_one(self):
+        threshold = settings.N_PLUS_ONE_THRESHOLD
+        return {
+            fingerprint: (count, sql)
+            for fingerprint, (count, sql) in self.duplicates.items()
+            if count >= threshold
+        }
+
+    def as_dict(self):
+        return {
+            "label": self.label,
+            "queries": self.count,
+            "duration_ms": round(self.duration * 1000, 2),
+            "duplicates": {
+                fingerprint: count
+                for fingerprint, (count, _) in self.duplicates.items()
+            },
+            "n_plus_one": [
+                {"fingerprint": fingerprint, "count": count, "sql": sql[:500]}
+                for fingerprint, (count, sql) in self.n_plus_one.items()
+            ],
+        }
+
+    def report(self):
+        """Send the stats to the logs and the current sentry transaction"""
+        stats = self.as_dict()
+        flagged = bool(stats["n_plus_one"]) or (
+            self.count >= settings.QUERY_COUNT_WARNING_THRESHOLD
+        )
+        level = logging.WARNING if flagged else logging.DEBUG
+        # Most requests are only logged at debug level, skip the encoding
+        if logger.isEnabledFor(level):
+            logger.log(level, json.dumps(stats))
+
+        sentry_sdk.set_measurement("db.query_count", self.count)
+        sentry_sdk.set_measurement(
+            "db.query_duration", stats["duration_ms"], "millisecond"
+        )
+        if stats["n_plus_one"]:
+            sentry_sdk.set_tag("db.n_plus_one", True)
+        return stats
+
+
+# Trackers of the celery tasks running in this worker
+_task_trackers = {}
+
+
+def start_task_tracking(task_id=None, task=None, **kwargs):
+    if not settings.DB_QUERY_TRACKING:
+        return
+    tracker = QueryTracker(task.name if task is not None else task_id)
+    _task_trackers[task_id] = tracker.__enter__()
+
+
+def stop_task_tracking(task_id=None, **kwargs):
+    tracker = _task_trackers.pop(task_id, None)
+    if tracker is not None:
+        tracker.__exit__(None, None, None)
+        tracker.report()
@@ -0,0 +1,20 @@
+# Python imports
+from functools import lru_cache
+
+# Django imports
+from django.conf import settings
+
+# Third party imports
+from slack_sdk import WebClient
+
+
+@lru_cache(maxsize=None)
+def _get_client(token):
+    return WebClient(token=token)
+
+
+def get_slack_client():
+    """The client of the configured bot, shared by the process, or None"""
+    if not settings.SLACK_BOT_TOKEN:
+        return None
+    return _get_client(settings.SLACK_BOT_TOKEN)
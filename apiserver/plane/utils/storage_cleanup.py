@@ -0,0 +1,71 @@
+# Python imports
+import logging
+
+# Django imports
+from django.conf import settings
+
+# Third party imports
+import boto3
+from botocore.client import Config
+from botocore.exceptions import BotoCoreError, ClientError
+
+logger = logging.getLogger("plane.storage_cleanup")
+
+# Most keys a single delete_objects request takes
+S3_DELETE_BATCH_SIZE = 1000
+
+
+def get_s3_client():
+    if settings.DOCKERIZED and settings.USE_MINIO:
+        return boto3.client(
+            "s3",
+            endpoint_url=settings.AWS_S3_ENDPOINT_URL,
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            config=Config(signature_version="s3v4"),
+        )
+    return boto3.client(
+        "s3",
+        region_name=settings.AWS_REGION,
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        config=Config(signature_version="s3v4"),
+    )
+
+
+def get_bucket_name():
+    if settings.DOCKERIZED and settings.USE_MINIO:
+        return settings.AWS_STORAGE_BUCKET_NAME
+    return settings.AWS_S3_BUCKET_NAME
+
+
+def delete_keys(keys, s3=None, bucket=None):
+    """
+    Delete the keys from the bucket, S3_DELETE_BATCH_SIZE per request.
+    Returns the set of keys that could not be deleted, a key that does not
+    exist counts as deleted. A failed request fails its whole batch, the
+    other batches are still sent.
+    """
+    s3 = s3 or get_s3_client()
+    bucket = bucket or get_bucket_name()
+    keys = list(dict.fromkeys(key for key in keys if key))
+
+    failed = set()
+    for start in range(0, len(keys), S3_DELETE_BATCH_SIZE):
+        batch = keys[start : start + S3_DELETE_BATCH_SIZE]
+        try:
+            response = s3.delete_objects(
+                Bucket=bucket,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+            )
+        except (BotoCoreError, ClientError) as e:
+            logger.warning("Could not delete %d keys: %s", len(batch), e)
+            failed.update(batch)
+            continue
+
+        for error in response.get("Errors", []):
+            logger.warning(
+                "Could not delete %s: %s", error.get("Key"), error.get("Message")
+            )
+            failed.add(error.get("Key"))
+    return failed
@@ -0,0 +1,35 @@
+# Django imports
+from django.conf import settings
+
+# Module imports
+from plane.settings.redis import redis_instance
+
+
+def get_queue_names():
+    """
+    The default queue and every queue a task is routed to, in the order of
+    TASK_QUEUE_ORDER
+    """
+    queues = {settings.CELERY_TASK_DEFAULT_QUEUE} | {
+        route["queue"] for route in settings.CELERY_TASK_ROUTES.values()
+    }
+    ordered = [queue for queue in settings.TASK_QUEUE_ORDER if queue in queues]
+    return ordered + sorted(queues - set(ordered))
+
+
+def get_queue_depths():
+    """
+    Messages waiting in each queue. The redis transport keeps a list per
+    priority step, named after the queue and the step except for step 0.
+    """
+    options = settings.CELERY_BROKER_TRANSPORT_OPTIONS
+    queues = get_queue_names()
+    pipeline = redis_instance().pipeline()
+    for queue in queues:
+        for step in options["priority_steps"]:
+            pipeline.llen(f"{queue}{options['sep']}{step}" if step else queue)
+    lengths = iter(pipeline.execute())
+    return {
+        queue: sum(next(lengths) for _ in options["priority_steps"])
+        for queue in queues
+    }